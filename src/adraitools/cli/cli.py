@@ -1,24 +1,81 @@
 """Command-line interface for ADR AI Tools."""
 
+import os
 import sys
+import tempfile
+import time
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, Literal, cast
 
 import typer
+from pydantic import ValidationError
 
 from adraitools import __version__
 from adraitools.cli.utils.cli_error_handling import handle_command_errors
+from adraitools.exceptions import BaseError
 from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.constants import (
+    AnalysisConstants,
+    AskConstants,
+    PathConstants,
+    ResourceConstants,
+)
+from adraitools.infrastructure.content_cache import ContentCache
 from adraitools.infrastructure.file_system_service import FileSystemService
-from adraitools.infrastructure.logging_service import LoggingService
-from adraitools.infrastructure.user_interaction_service import UserInteractionService
-from adraitools.services.adr_initializer import AdrInitializer
-from adraitools.services.doctor_service import DoctorService
-from adraitools.services.models.result import InitializationResult
+from adraitools.infrastructure.git_index_file_system import GitIndexFileSystem
+from adraitools.infrastructure.git_service import GitService
+from adraitools.infrastructure.logging_service import (
+    DEFAULT_LOG_QUEUE_SIZE,
+    LogFormat,
+    LoggingService,
+    OverflowPolicy,
+)
+from adraitools.services.adr_chunker import (
+    DEFAULT_MAX_TOKENS,
+    DEFAULT_OVERLAP_TOKENS,
+)
+from adraitools.services.adr_linter import AdrLinter
+from adraitools.services.link_checker import LinkChecker
+from adraitools.services.models.lint import LintReport
+from adraitools.services.models.log_file import LogFileSettings
+
+if TYPE_CHECKING:
+    # Modules of the other commands are imported on use: the pre-commit
+    # hook runs lint --staged and must not pay for them
+    from adraitools.services.adr_corpus_loader import AdrCorpusLoader
+    from adraitools.services.models.analysis import (
+        CorpusStatistics,
+        HistoryStatistics,
+    )
+    from adraitools.services.models.memory import MemoryProfile
+    from adraitools.services.models.resources import ResourceUsage
+    from adraitools.services.models.result import InitializationResult
+    from adraitools.services.models.timing import SpanTiming
+    from adraitools.services.supersession_graph import SupersessionGraph
+    from adraitools.services.supersession_graph_service import (
+        SupersessionGraphService,
+    )
 
 app = typer.Typer(help="ADR AI Tools - Architecture Decision Records toolkit")
 config_app = typer.Typer(help="Configuration management commands")
 app.add_typer(config_app, name="config")
+bench_app = typer.Typer(help="Benchmark commands")
+app.add_typer(bench_app, name="bench")
+graph_app = typer.Typer(help="Supersession graph queries")
+app.add_typer(graph_app, name="graph")
+
+DEFAULT_BENCH_QUESTION = "Which tools did we decide to use and why?"
+DEFAULT_GENERATED_DIRECTORY = Path("synthetic-adrs")
+DEFAULT_SUITE_RESULTS = Path("bench-results.json")
+
+ReportFormat = Literal["text", "json"]
+
+Revision = Annotated[
+    str | None,
+    typer.Option(
+        "--rev", help="Read the ADRs at a git commit or tag instead of the files"
+    ),
+]
 
 
 def version_callback(*, value: bool) -> None:
@@ -29,7 +86,8 @@ def version_callback(*, value: bool) -> None:
 
 
 @app.callback()
-def callback(
+def callback(  # noqa: PLR0913
+    ctx: typer.Context,
     *,
     version: Annotated[  # noqa: ARG001
         bool,
@@ -49,17 +107,308 @@ def callback(
         str | None,
         typer.Option("--log-file", help="Log to file"),
     ] = None,
+    log_queue: Annotated[
+        int | None,
+        typer.Option(
+            "--log-queue",
+            min=1,
+            help="Write the log file from a background thread, queueing up to "
+            "this many records",
+        ),
+    ] = None,
+    log_overflow: Annotated[
+        OverflowPolicy,
+        typer.Option(
+            "--log-overflow",
+            help="When the log queue is full, wait for room or drop the record",
+        ),
+    ] = "block",
+    log_format: Annotated[
+        LogFormat,
+        typer.Option(
+            "--log-format", help="Write log records as text or as JSON objects"
+        ),
+    ] = "text",
+    log_max_bytes: Annotated[
+        int | None,
+        typer.Option(
+            "--log-max-bytes",
+            min=0,
+            help="Rotate the log file at this size, 0 to never [default: "
+            "log_max_bytes setting]",
+        ),
+    ] = None,
+    log_backups: Annotated[
+        int | None,
+        typer.Option(
+            "--log-backups",
+            min=0,
+            help="Rotated log files to keep [default: log_backup_count setting]",
+        ),
+    ] = None,
+    log_compress: Annotated[
+        bool | None,
+        typer.Option(
+            "--log-compress/--no-log-compress",
+            help="Gzip rotated log files [default: log_compress setting]",
+        ),
+    ] = None,
+    log_buffer: Annotated[
+        int | None,
+        typer.Option(
+            "--log-buffer",
+            min=0,
+            help="Hold up to this many records in memory between log file "
+            "writes, 0 to write each one [default: log_buffer_records setting]",
+        ),
+    ] = None,
+    log_flush_interval: Annotated[
+        float | None,
+        typer.Option(
+            "--log-flush-interval",
+            min=0.001,
+            help="Write buffered records at least this often, in seconds "
+            "[default: log_flush_interval_seconds setting]",
+        ),
+    ] = None,
+    log_rate_limit: Annotated[
+        int | None,
+        typer.Option(
+            "--log-rate-limit",
+            min=0,
+            help="Log at most this many records per message key and minute, "
+            "then a count of the suppressed ones",
+        ),
+    ] = None,
+    log_debug_sample: Annotated[
+        float,
+        typer.Option(
+            "--log-debug-sample",
+            min=0.0,
+            max=1.0,
+            help="Share of debug records to log, picked at random",
+        ),
+    ] = 1.0,
+    timings: Annotated[
+        bool,
+        typer.Option("--timings", help="Print where the time went at exit"),
+    ] = False,
+    resource_report: Annotated[
+        ReportFormat | None,
+        typer.Option(
+            "--resource-report",
+            help="Print the CPU, memory, I/O and GC usage of the command at exit",
+        ),
+    ] = None,
+    trace_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--trace-file",
+            help="Append the spans of the command to a file as OTLP/JSON",
+        ),
+    ] = None,
+    profile_memory: Annotated[
+        bool,
+        typer.Option(
+            "--profile-memory",
+            help="Trace allocations and print the memory held by module and "
+            "pipeline stage at exit; slows the command down",
+        ),
+    ] = False,
 ) -> None:
     """ADR AI Tools - Architecture Decision Records toolkit."""
+    started = time.perf_counter()
+    if resource_report is not None:
+        from adraitools.infrastructure.resource_monitor import (  # noqa: PLC0415
+            ResourceMonitor,
+        )
+
+        monitor = ResourceMonitor()
+        monitor.start()
+        # Registered first, so it runs last and covers the other exit work
+        ctx.call_on_close(
+            lambda: _print_resource_usage(monitor.stop(), resource_report, err=True)
+        )
+    if profile_memory:
+        from adraitools.infrastructure.memory_profiler import (  # noqa: PLC0415
+            PROFILER,
+        )
+
+        PROFILER.start()
+        ctx.call_on_close(lambda: _print_memory_profile(PROFILER.stop()))
     # Configure logging using LoggingService
     logging_service = LoggingService()
     logging_service.configure_logging(
         level="DEBUG" if verbose else "INFO",
         log_file=Path(log_file) if log_file else None,
         quiet=quiet,
+        queue_size=log_queue,
+        overflow=log_overflow,
+        log_format=log_format,
+        file_settings=_log_file_settings(
+            max_bytes=log_max_bytes,
+            backup_count=log_backups,
+            compress=log_compress,
+            buffer_records=log_buffer,
+            flush_interval_seconds=log_flush_interval,
+        )
+        if log_file
+        else None,
+    )
+    logging_service.set_context("command", ctx.invoked_subcommand)
+    if log_rate_limit is not None or log_debug_sample < 1.0:
+        logging_service.configure_limits(
+            log_rate_limit, debug_sample_rate=log_debug_sample
+        )
+        ctx.call_on_close(logging_service.report_suppressed)
+    if timings:
+        logging_service.enable_timings()
+        ctx.call_on_close(lambda: _print_timings(logging_service.timings()))
+    if trace_file is not None:
+        from adraitools.infrastructure.otlp_trace_exporter import (  # noqa: PLC0415
+            OtlpJsonFileExporter,
+        )
+
+        exporter = OtlpJsonFileExporter(
+            trace_file,
+            logging_service.span_recorder.trace_id,
+            resource={
+                "service.name": "adr-ai-tools",
+                "service.version": __version__,
+                "process.pid": os.getpid(),
+                "adraitools.command": ctx.invoked_subcommand or "",
+            },
+        )
+        logging_service.enable_tracing(exporter)
+        ctx.call_on_close(exporter.flush)
+        # Registered last, so the root span ends before the spans are written
+        ctx.with_resource(logging_service.span(f"command {ctx.invoked_subcommand}"))
+    ctx.call_on_close(
+        lambda: logging_service.log_debug(
+            "Command finished",
+            fields={
+                "duration_ms": lambda: round((time.perf_counter() - started) * 1000, 3)
+            },
+        )
+    )
+    # Share the configured service with the subcommands
+    ctx.obj = logging_service
+
+
+def _log_file_settings(**options: float | bool | None) -> LogFileSettings:
+    """Get the configured log file settings, overridden by the given options.
+
+    Options left as None keep the configured value. A configuration that
+    cannot be read gives the defaults; the command reports it.
+    """
+    try:
+        settings = ConfigurationService().get_configuration().log_file_settings()
+    except (BaseError, ValidationError):
+        settings = LogFileSettings()
+    return settings.model_copy(
+        update={name: value for name, value in options.items() if value is not None}
     )
 
 
+def _print_timings(timings: "list[SpanTiming]") -> None:
+    """Print span durations as an indented tree on standard error."""
+    if not timings:
+        return
+    labels = ["  " * timing.depth + timing.name for timing in timings]
+    width = max(len("span"), *(len(label) for label in labels))
+    typer.echo(f"{'span':<{width}}{'count':>8}{'total ms':>12}", err=True)
+    for label, timing in zip(labels, timings, strict=True):
+        typer.echo(
+            f"{label:<{width}}{timing.count:>8}{timing.total_ms:>12.2f}", err=True
+        )
+
+
+def _format_bytes(value: int | None) -> str:
+    """Format a byte count in MiB, n/a if it was not measured."""
+    return "n/a" if value is None else f"{value / 1_048_576:.1f} MiB"
+
+
+def _print_resource_usage(
+    usage: "ResourceUsage", report_format: ReportFormat, *, err: bool = False
+) -> None:
+    """Print resource usage as a table or as one JSON object."""
+    if report_format == "json":
+        typer.echo(usage.model_dump_json(), err=err)
+        return
+    rows = [
+        ("wall time", f"{usage.wall_ms:.1f} ms"),
+        (
+            "cpu time",
+            (
+                f"{usage.cpu_ms:.1f} ms ({usage.cpu_user_ms:.1f} user, "
+                f"{usage.cpu_system_ms:.1f} system, {usage.cpu_utilization:.0%})"
+            ),
+        ),
+        ("peak rss", _format_bytes(usage.peak_rss_bytes)),
+        (
+            "read",
+            (
+                f"{_format_bytes(usage.read_chars)} "
+                f"({_format_bytes(usage.read_bytes)} from storage)"
+            ),
+        ),
+        (
+            "written",
+            (
+                f"{_format_bytes(usage.write_chars)} "
+                f"({_format_bytes(usage.write_bytes)} to storage)"
+            ),
+        ),
+        (
+            "gc collections",
+            " / ".join(str(count) for count in usage.gc_collections)
+            + " (by generation)",
+        ),
+        ("gc pause", f"{usage.gc_pause_ms:.1f} ms"),
+    ]
+    width = max(len(name) for name, _ in rows)
+    for name, value in rows:
+        typer.echo(f"{name:<{width}}  {value}", err=err)
+
+
+def _print_memory_profile(profile: "MemoryProfile") -> None:
+    """Print the memory held after every stage and the modules holding it."""
+    typer.echo(
+        f"Traced memory peak: {_format_bytes(profile.peak_bytes)}\n"
+        f"{'stage':<10}{'held':>12}{'change':>12}{'peak':>12}",
+        err=True,
+    )
+    for stage in profile.stages:
+        typer.echo(
+            f"{stage.stage:<10}{_format_bytes(stage.traced_bytes):>12}"
+            f"{stage.change_bytes / 1_048_576:>+8.1f} MiB"
+            f"{_format_bytes(stage.peak_bytes):>12}",
+            err=True,
+        )
+        for module in stage.growth:
+            typer.echo(
+                f"  {module.size_bytes / 1_048_576:>+8.1f} MiB  "
+                f"{module.module}:{module.line}",
+                err=True,
+            )
+    typer.echo(
+        f"Memory held after {profile.fullest_stage}, by module:\n"
+        f"{'held':>12}{'blocks':>10}  module",
+        err=True,
+    )
+    for module in profile.top_modules:
+        typer.echo(
+            f"{_format_bytes(module.size_bytes):>12}{module.blocks:>10}  "
+            f"{module.module}:{module.line}",
+            err=True,
+        )
+
+
+def _get_logging_service(ctx: typer.Context) -> LoggingService:
+    """Get the logging service configured by the global options."""
+    return cast("LoggingService", ctx.obj)
+
+
 def main() -> None:
     """Main entry point for the CLI."""
     app()
@@ -68,6 +417,11 @@ def main() -> None:
 @app.command()
 def init() -> None:
     """Initialize ADR directory structure."""
+    from adraitools.infrastructure.user_interaction_service import (  # noqa: PLC0415
+        UserInteractionService,
+    )
+    from adraitools.services.adr_initializer import AdrInitializer  # noqa: PLC0415
+
     # Dependency injection - create service instances
     file_system_service = FileSystemService()
     user_interaction_service = UserInteractionService()
@@ -84,7 +438,7 @@ def init() -> None:
 
 
 def _handle_init_result(
-    result: InitializationResult, configuration_service: ConfigurationService
+    result: "InitializationResult", configuration_service: ConfigurationService
 ) -> None:
     """Handle initialization result and provide appropriate user feedback."""
     if result.success:
@@ -111,6 +465,9 @@ def list_config() -> None:
     typer.echo(f"adr_directory: {config.adr_directory}")
     typer.echo(f"template_file: {config.template_file}")
     typer.echo(f"author_name: {config.author_name}")
+    typer.echo(f"llm_base_url: {config.llm_base_url}")
+    typer.echo(f"llm_model: {config.llm_model}")
+    typer.echo(f"llm_provider: {config.llm_provider}")
 
 
 @config_app.command()
@@ -142,8 +499,32 @@ def set_config(
 
 
 @app.command()
-def doctor() -> None:
+@handle_command_errors
+def doctor(
+    *,
+    links: Annotated[
+        bool,
+        typer.Option("--links", help="Also check links and ADR references"),
+    ] = False,
+    staged: Annotated[
+        bool,
+        typer.Option("--staged", help="Check the links of the ADRs staged in git only"),
+    ] = False,
+    resources: Annotated[
+        bool,
+        typer.Option(
+            "--resources",
+            help="Also report the resources used by a canned workload of "
+            f"{ResourceConstants.DEFAULT_WORKLOAD_ADRS} ADRs",
+        ),
+    ] = False,
+    json_output: Annotated[
+        bool, typer.Option("--json", help="Print the resource report as JSON")
+    ] = False,
+) -> None:
     """Run doctor commands."""
+    from adraitools.services.doctor_service import DoctorService  # noqa: PLC0415
+
     configuration_service = ConfigurationService()
     doctor_service = DoctorService(configuration_service=configuration_service)
     result = doctor_service.diagnose()
@@ -154,6 +535,811 @@ def doctor() -> None:
         typer.echo(result.message)
         sys.exit(1)
 
+    if resources:
+        from adraitools.infrastructure.resource_monitor import (  # noqa: PLC0415
+            ResourceMonitor,
+        )
+        from adraitools.services.adr_chunker import AdrChunker  # noqa: PLC0415
+        from adraitools.services.adr_corpus_loader import (  # noqa: PLC0415
+            AdrCorpusLoader,
+        )
+        from adraitools.services.adr_parser import AdrParser  # noqa: PLC0415
+        from adraitools.services.resource_workload import (  # noqa: PLC0415
+            ResourceWorkload,
+        )
+
+        workload = ResourceWorkload(
+            corpus_loader=AdrCorpusLoader(FileSystemService(), AdrParser()),
+            chunker=AdrChunker(),
+            resource_monitor=ResourceMonitor(),
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            usage = workload.run(Path(directory))
+        _print_resource_usage(usage, "json" if json_output else "text")
+
+    if staged:
+        _check_links(configuration_service, *_staged_adrs(configuration_service))
+    elif links:
+        _check_links(configuration_service, None, FileSystemService())
+
+
+def _check_links(
+    configuration_service: ConfigurationService,
+    paths: list[Path] | None,
+    file_system_service: FileSystemService,
+) -> None:
+    """Check the links of ADRs, every one if None, exiting with 1 if broken."""
+    link_checker = LinkChecker(
+        configuration_service=configuration_service,
+        file_system_service=file_system_service,
+        content_cache=ContentCache(PathConstants.get_local_cache_file()),
+    )
+    report = link_checker.check(paths)
+    for problem in report.problems:
+        typer.echo(
+            f"{problem.path}:{problem.line}: {problem.target} ({problem.reason})"
+        )
+    typer.echo(
+        f"Checked {report.links} links in {report.files} ADRs "
+        f"({report.cached} cached): {len(report.problems)} problem(s)"
+    )
+    if not report.success:
+        sys.exit(1)
+
+
+def _staged_adrs(
+    configuration_service: ConfigurationService,
+) -> tuple[list[Path], GitIndexFileSystem]:
+    """Get the ADR files staged in git, from a single read of the index.
+
+    Returns:
+        Staged ADR files and a file system view reading their staged content
+    """
+    config = configuration_service.get_paths()
+    directory = config.adr_directory.resolve()
+    template = config.template_file.resolve()
+    git_service = GitService()
+    blobs = {
+        path: sha
+        for path, sha in git_service.staged_blobs(config.adr_directory).items()
+        if path.suffix == ".md"
+        and path.resolve().parent == directory
+        and path.resolve() != template
+    }
+    return list(blobs), GitIndexFileSystem(git_service, blobs)
+
+
+@app.command()
+@handle_command_errors
+def ask(
+    ctx: typer.Context,
+    question: Annotated[str, typer.Argument(help="Question about the ADRs")],
+    top_k: Annotated[
+        int,
+        typer.Option("--top-k", min=1, help="Number of ADRs used as context"),
+    ] = AskConstants.DEFAULT_TOP_K,
+    deadline: Annotated[
+        float | None,
+        typer.Option("--deadline", min=0, help="Seconds allowed for the answer"),
+    ] = None,
+    revision: Revision = None,
+) -> None:
+    """Answer a question from the ADRs, citing the ADRs used."""
+    from adraitools.infrastructure.llm_provider_factory import (  # noqa: PLC0415
+        LlmProviderFactory,
+    )
+    from adraitools.services.ask_service import AskService  # noqa: PLC0415
+
+    expires_at = time.monotonic() + deadline if deadline is not None else None
+    logging_service = _get_logging_service(ctx)
+    configuration_service = ConfigurationService()
+    ask_service = AskService(
+        configuration_service=configuration_service,
+        corpus_loader=_corpus_loader(revision),
+        llm_provider=LlmProviderFactory.create(
+            configuration_service.get_configuration(), logging_service
+        ),
+    )
+
+    session = ask_service.ask(question, top_k=top_k, deadline=expires_at)
+    if not session.sources:
+        typer.echo("No relevant ADRs found.")
+        return
+
+    typer.echo("Sources:")
+    for hit in session.sources:
+        typer.echo(f"  [{hit.document.identifier}] {hit.document.title}")
+    typer.echo()
+    for chunk in session.stream():
+        typer.echo(chunk, nl=False)
+    typer.echo()
+
+    if session.timings is not None:
+        logging_service.log_debug("Ask timings", fields=session.timings.model_dump())
+
+
+@app.command()
+@handle_command_errors
+def index(
+    ctx: typer.Context,
+    max_tokens: Annotated[
+        int,
+        typer.Option("--max-tokens", min=1, help="Maximum words per chunk"),
+    ] = DEFAULT_MAX_TOKENS,
+    overlap: Annotated[
+        int,
+        typer.Option("--overlap", min=0, help="Words repeated between chunks"),
+    ] = DEFAULT_OVERLAP_TOKENS,
+    workers: Annotated[
+        int | None,
+        typer.Option("--workers", min=1, help="Embedding processes [default: CPUs]"),
+    ] = None,
+    revision: Revision = None,
+) -> None:
+    """Build the embedding index of the ADR corpus."""
+    # NumPy-backed modules are imported on use to keep start-up fast
+    from adraitools.infrastructure.embedding_cache import (  # noqa: PLC0415
+        EmbeddingCache,
+    )
+    from adraitools.infrastructure.hashing_embedder import (  # noqa: PLC0415
+        HashingEmbedder,
+    )
+    from adraitools.infrastructure.process_pool_embedder import (  # noqa: PLC0415
+        ProcessPoolEmbedder,
+    )
+    from adraitools.infrastructure.vector_index_store import (  # noqa: PLC0415
+        VectorIndexStore,
+    )
+    from adraitools.services.adr_chunker import AdrChunker  # noqa: PLC0415
+    from adraitools.services.embedding_indexer import (  # noqa: PLC0415
+        EmbeddingIndexer,
+    )
+
+    configuration_service = ConfigurationService()
+    corpus_loader = _corpus_loader(revision)
+    indexer = EmbeddingIndexer(
+        configuration_service=configuration_service,
+        corpus_loader=corpus_loader,
+        chunker=AdrChunker(max_tokens=max_tokens, overlap_tokens=overlap),
+        embedder=ProcessPoolEmbedder(HashingEmbedder(), workers=workers),
+        embedding_cache=EmbeddingCache(
+            ContentCache(PathConstants.get_local_cache_file())
+        ),
+        vector_index_store=VectorIndexStore(_index_dir(corpus_loader)),
+        logging_service=_get_logging_service(ctx),
+    )
+    result = indexer.build()
+
+    typer.echo(f"Indexed {result.documents} ADRs into {result.chunks} chunks")
+    typer.echo(
+        f"Embeddings reused: {result.reused_chunks}, "
+        f"recomputed: {result.recomputed_chunks}"
+    )
+
+
+@app.command()
+@handle_command_errors
+def analyze(  # noqa: PLR0913
+    ctx: typer.Context,
+    *,
+    json_output: Annotated[
+        bool, typer.Option("--json", help="Print the statistics as JSON")
+    ] = False,
+    duplicates: Annotated[
+        bool,
+        typer.Option("--duplicates", help="Report near-duplicate ADRs instead"),
+    ] = False,
+    threshold: Annotated[
+        float,
+        typer.Option(
+            "--threshold",
+            min=0.0,
+            max=1.0,
+            help="Minimum similarity of reported duplicates",
+        ),
+    ] = AnalysisConstants.DEFAULT_DUPLICATE_THRESHOLD,
+    conflicts: Annotated[
+        bool,
+        typer.Option(
+            "--conflicts", help="Report contradicting decisions instead, using the LLM"
+        ),
+    ] = False,
+    deadline: Annotated[
+        float | None,
+        typer.Option(
+            "--deadline",
+            min=0,
+            help="Seconds allowed for the model calls of --conflicts",
+        ),
+    ] = None,
+    history: Annotated[
+        bool,
+        typer.Option("--history", help="Add staleness and churn from git history"),
+    ] = False,
+    revision: Revision = None,
+) -> None:
+    """Report statistics of the ADR corpus."""
+    expires_at = time.monotonic() + deadline if deadline is not None else None
+    if history and revision is not None:
+        message = "--history follows the checked out commit, not --rev"
+        raise typer.BadParameter(message)
+    if duplicates or conflicts:
+        corpus_loader = _corpus_loader(revision)
+        if duplicates:
+            _report_duplicates(corpus_loader, threshold, json_output=json_output)
+        if conflicts:
+            _report_conflicts(ctx, corpus_loader, expires_at, json_output=json_output)
+        return
+    from adraitools.services.corpus_analyzer import CorpusAnalyzer  # noqa: PLC0415
+    from adraitools.services.git_history_miner import (  # noqa: PLC0415
+        GitHistoryMiner,
+    )
+
+    configuration_service = ConfigurationService()
+    analyzer = CorpusAnalyzer(
+        configuration_service=configuration_service,
+        corpus_loader=_corpus_loader(revision),
+        history_miner=GitHistoryMiner(
+            configuration_service=configuration_service,
+            git_service=GitService(),
+            content_cache=ContentCache(PathConstants.get_local_cache_file()),
+        )
+        if history
+        else None,
+    )
+    statistics = analyzer.analyze()
+
+    if json_output:
+        typer.echo(statistics.model_dump_json(indent=2))
+    else:
+        _print_statistics(statistics)
+
+
+def _report_duplicates(
+    corpus_loader: "AdrCorpusLoader", threshold: float, *, json_output: bool
+) -> None:
+    """Print the near-duplicate ADR pairs of the corpus."""
+    from adraitools.infrastructure.minhash_store import MinHashStore  # noqa: PLC0415
+    from adraitools.services.duplicate_detector import (  # noqa: PLC0415
+        DuplicateDetector,
+    )
+
+    detector = DuplicateDetector(
+        configuration_service=ConfigurationService(),
+        corpus_loader=corpus_loader,
+        minhash_store=MinHashStore(_index_dir(corpus_loader)),
+    )
+    report = detector.find_duplicates(threshold)
+
+    if json_output:
+        typer.echo(report.model_dump_json(indent=2))
+        return
+    for pair in report.duplicates:
+        typer.echo(f"{pair.similarity:.2f}  {pair.first}  {pair.second}")
+    typer.echo(
+        f"{len(report.duplicates)} near-duplicate pair(s) among {report.total} "
+        f"ADRs ({report.signed} signed, {report.verified} candidate pair(s) "
+        "verified)"
+    )
+
+
+def _report_conflicts(
+    ctx: typer.Context,
+    corpus_loader: "AdrCorpusLoader",
+    deadline: float | None,
+    *,
+    json_output: bool,
+) -> None:
+    """Print the contradicting decisions of the corpus."""
+    from adraitools.infrastructure.hashing_embedder import (  # noqa: PLC0415
+        HashingEmbedder,
+    )
+    from adraitools.infrastructure.llm_provider_factory import (  # noqa: PLC0415
+        LlmProviderFactory,
+    )
+    from adraitools.services.conflict_detector import (  # noqa: PLC0415
+        ConflictDetector,
+    )
+
+    configuration_service = ConfigurationService()
+    detector = ConflictDetector(
+        configuration_service=configuration_service,
+        corpus_loader=corpus_loader,
+        embedder=HashingEmbedder(),
+        llm_provider=LlmProviderFactory.create(
+            configuration_service.get_configuration(), _get_logging_service(ctx)
+        ),
+        content_cache=ContentCache(PathConstants.get_local_cache_file()),
+    )
+    report = detector.find_conflicts(deadline)
+
+    if json_output:
+        typer.echo(report.model_dump_json(indent=2))
+        return
+    for conflict in report.conflicts:
+        typer.echo(f"{conflict.first}  {conflict.second}\n  {conflict.reason}")
+    rows = [
+        ("Pairs of ADRs", report.total_pairs),
+        ("Pruned: not accepted or proposed", report.total_pairs - report.active_pairs),
+        (
+            "Pruned: no shared key term or neighbour",
+            report.active_pairs - report.candidate_pairs,
+        ),
+        ("Answered from cache", report.cached_pairs),
+        (f"Verified by the model ({report.llm_calls} calls)", report.verified_pairs),
+        ("Without verdict", report.unanswered_pairs),
+        ("Conflicts", len(report.conflicts)),
+    ]
+    width = max(len(label) for label, _ in rows)
+    for label, value in rows:
+        typer.echo(f"{label:<{width}}  {value:>10}")
+
+
+def _corpus_loader(revision: str | None) -> "AdrCorpusLoader":
+    """Create a corpus loader reading the ADR files or a git revision."""
+    from adraitools.infrastructure.git_revision_file_system import (  # noqa: PLC0415
+        GitRevisionFileSystem,
+    )
+    from adraitools.services.adr_corpus_loader import (  # noqa: PLC0415
+        AdrCorpusLoader,
+    )
+    from adraitools.services.adr_parser import AdrParser  # noqa: PLC0415
+
+    if revision is None:
+        return AdrCorpusLoader(FileSystemService(), AdrParser())
+    return AdrCorpusLoader(GitRevisionFileSystem(GitService(), revision), AdrParser())
+
+
+def _index_dir(corpus_loader: "AdrCorpusLoader") -> Path:
+    """Get the index directory of the corpus a loader reads."""
+    from adraitools.infrastructure.git_revision_file_system import (  # noqa: PLC0415
+        GitRevisionFileSystem,
+    )
+
+    file_system_service = corpus_loader.file_system_service
+    if isinstance(file_system_service, GitRevisionFileSystem):
+        return PathConstants.get_revision_index_dir(file_system_service.commit)
+    return PathConstants.get_local_index_dir()
+
+
+def _print_statistics(statistics: "CorpusStatistics") -> None:
+    """Print corpus statistics as aligned text tables."""
+    typer.echo(f"ADRs: {statistics.total}")
+    tables: list[tuple[str, dict[str, int] | dict[str, float]]] = [
+        ("Status", statistics.status_counts),
+        ("Age", statistics.age_histogram),
+        ("Decisions per month", statistics.decisions_per_month),
+        ("Average section length (words)", statistics.average_section_words),
+        ("Missing sections", statistics.missing_sections),
+    ]
+    for title, rows in tables:
+        typer.echo(f"\n{title}:")
+        width = max((len(label) for label in rows), default=0)
+        for label, value in rows.items():
+            typer.echo(f"  {label:<{width}}  {value:>8}")
+    typer.echo(f"\nUndated ADRs: {statistics.undated}")
+    typer.echo(f"ADRs missing sections: {statistics.incomplete}")
+    if statistics.history is not None:
+        _print_history(statistics.history)
+
+
+def _print_history(history: "HistoryStatistics") -> None:
+    """Print git staleness and churn statistics."""
+    typer.echo(
+        f"\nGit history: {history.tracked} tracked ADRs, {history.untracked} "
+        f"never committed, {history.authors} authors, "
+        f"{history.average_revisions} revisions per ADR on average"
+    )
+    typer.echo("\nTime since last commit:")
+    width = max(len(label) for label in history.staleness_histogram)
+    for label, value in history.staleness_histogram.items():
+        typer.echo(f"  {label:<{width}}  {value:>8}")
+    for title, activities in (
+        ("Stalest ADRs", history.stalest),
+        ("Most revised ADRs", history.most_revised),
+    ):
+        typer.echo(f"\n{title}:")
+        for activity in activities:
+            typer.echo(
+                f"  {activity.last_touched}  {activity.revisions:>5} revision(s)  "
+                f"{activity.authors:>3} author(s)  {activity.path}"
+            )
+
+
+@app.command()
+@handle_command_errors
+def lint(
+    *,
+    all_files: Annotated[
+        bool,
+        typer.Option("--all", help="Lint every ADR, not only the changed ones"),
+    ] = False,
+    staged: Annotated[
+        bool,
+        typer.Option("--staged", help="Lint only the ADRs staged in git"),
+    ] = False,
+    json_output: Annotated[
+        bool, typer.Option("--json", help="Print the diagnostics as JSON")
+    ] = False,
+) -> None:
+    """Check ADRs against the sections and values of the template."""
+    configuration_service = ConfigurationService()
+    paths: list[Path] | None
+    file_system_service: FileSystemService
+    if staged:
+        paths, file_system_service = _staged_adrs(configuration_service)
+    else:
+        paths, file_system_service = None, FileSystemService()
+    linter = AdrLinter(
+        configuration_service=configuration_service,
+        file_system_service=file_system_service,
+        content_cache=ContentCache(PathConstants.get_local_cache_file()),
+    )
+    if paths is not None:
+        report = linter.lint_files(paths)
+    else:
+        report = linter.lint(all_files=all_files)
+    _print_lint_report(report, json_output=json_output)
+
+
+def _print_lint_report(report: LintReport, *, json_output: bool) -> None:
+    """Print lint diagnostics, exiting with 1 if there are any."""
+    if json_output:
+        typer.echo(report.model_dump_json(indent=2))
+    else:
+        for diagnostic in report.diagnostics:
+            typer.echo(
+                f"{diagnostic.path}:{diagnostic.line}: "
+                f"{diagnostic.code} {diagnostic.message}"
+            )
+        typer.echo(
+            f"Linted {report.linted} of {report.files} ADRs ({report.cached} "
+            f"cached): {len(report.diagnostics)} problem(s)"
+        )
+    if not report.success:
+        sys.exit(1)
+
+
+def _graph_service() -> "SupersessionGraphService":
+    """Create the supersession graph service."""
+    from adraitools.services.adr_corpus_loader import (  # noqa: PLC0415
+        AdrCorpusLoader,
+    )
+    from adraitools.services.adr_parser import AdrParser  # noqa: PLC0415
+    from adraitools.services.supersession_graph_service import (  # noqa: PLC0415
+        SupersessionGraphService,
+    )
+
+    return SupersessionGraphService(
+        configuration_service=ConfigurationService(),
+        corpus_loader=AdrCorpusLoader(FileSystemService(), AdrParser()),
+        content_cache=ContentCache(PathConstants.get_local_cache_file()),
+    )
+
+
+def _graph_node(graph: "SupersessionGraph", reference: str) -> str:
+    """Resolve an ADR reference to a graph node, exiting if it is unknown."""
+    from adraitools.services.supersession_graph_service import (  # noqa: PLC0415
+        normalize_identifier,
+    )
+
+    identifier = normalize_identifier(reference)
+    if identifier not in graph.nodes:
+        typer.echo(f"Error: {identifier} not found")
+        sys.exit(1)
+    return identifier
+
+
+def _describe(graph: "SupersessionGraph", identifier: str) -> str:
+    """Format an ADR as identifier, title and status."""
+    links = graph.nodes.get(identifier)
+    if links is None:
+        return f"{identifier} (missing)"
+    return f"{identifier} {links.title} ({links.status})"
+
+
+@graph_app.command(name="current")
+@handle_command_errors
+def graph_current(
+    adr: Annotated[str, typer.Argument(help="ADR reference, e.g. ADR-0007 or 7")],
+) -> None:
+    """Show the current decision replacing an ADR."""
+    service = _graph_service()
+    graph = service.load()
+    identifier = _graph_node(graph, adr)
+    replacements = graph.current(identifier)
+    if replacements:
+        typer.echo(f"{identifier} is superseded by:")
+        for replacement in replacements:
+            typer.echo(f"  {_describe(graph, replacement)}")
+    elif graph.superseded_by(identifier):
+        typer.echo(f"{identifier} is superseded within a cycle, no current decision")
+    else:
+        typer.echo(f"{_describe(graph, identifier)} is current")
+    service.save(graph)
+
+
+@graph_app.command(name="supersedes")
+@handle_command_errors
+def graph_supersedes(
+    adr: Annotated[str, typer.Argument(help="ADR reference, e.g. ADR-0021 or 21")],
+) -> None:
+    """List every ADR an ADR transitively supersedes."""
+    service = _graph_service()
+    graph = service.load()
+    identifier = _graph_node(graph, adr)
+    superseded = sorted(graph.supersedes(identifier) - {identifier})
+    if not superseded:
+        typer.echo(f"{identifier} supersedes no ADR")
+    for old in superseded:
+        typer.echo(_describe(graph, old))
+    service.save(graph)
+
+
+@graph_app.command(name="cycles")
+@handle_command_errors
+def graph_cycles() -> None:
+    """Detect ADRs that supersede each other in a cycle."""
+    service = _graph_service()
+    graph = service.load()
+    cycles = graph.cycles()
+    service.save(graph)
+    if not cycles:
+        typer.echo("No supersession cycles found.")
+        return
+    for members in cycles:
+        typer.echo(f"Cycle: {', '.join(members)}")
+    sys.exit(1)
+
+
+@bench_app.command(name="llm")
+@handle_command_errors
+def bench_llm(
+    requests: Annotated[
+        int,
+        typer.Option("--requests", "-n", min=1, help="Questions per concurrency level"),
+    ] = 50,
+    concurrency: Annotated[
+        list[int] | None,
+        typer.Option(
+            "--concurrency",
+            min=1,
+            help="Concurrency level, repeatable [default: 1 4 16]",
+        ),
+    ] = None,
+    question: Annotated[
+        list[str] | None,
+        typer.Option("--question", help="Question to ask, repeatable"),
+    ] = None,
+) -> None:
+    """Measure ask throughput against the offline mock LLM provider."""
+    from adraitools.infrastructure.mock_llm_provider import (  # noqa: PLC0415
+        MockLlmProvider,
+    )
+    from adraitools.services.adr_corpus_loader import (  # noqa: PLC0415
+        AdrCorpusLoader,
+    )
+    from adraitools.services.adr_parser import AdrParser  # noqa: PLC0415
+    from adraitools.services.ask_service import AskService  # noqa: PLC0415
+    from adraitools.services.llm_benchmark import LlmBenchmark  # noqa: PLC0415
+
+    configuration_service = ConfigurationService()
+    settings = configuration_service.get_configuration().mock_llm_settings()
+    questions = question or [DEFAULT_BENCH_QUESTION]
+
+    typer.echo(
+        f"{'workflow':<10}{'concurrency':>12}{'requests':>10}{'errors':>8}"
+        f"{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'ttft p50':>10}"
+    )
+    for level in concurrency or [1, 4, 16]:
+        # A fresh provider per level keeps every level reproducible
+        benchmark = LlmBenchmark(
+            AskService(
+                configuration_service=configuration_service,
+                corpus_loader=AdrCorpusLoader(FileSystemService(), AdrParser()),
+                llm_provider=MockLlmProvider(settings),
+            )
+        )
+        result = benchmark.run_ask(questions, requests=requests, concurrency=level)
+        typer.echo(
+            f"{result.workflow:<10}{result.concurrency:>12}{result.requests:>10}"
+            f"{result.errors:>8}{result.throughput_per_second:>10.1f}"
+            f"{result.latency_p50_ms:>10.1f}{result.latency_p95_ms:>10.1f}"
+            f"{result.first_token_p50_ms:>10.1f}"
+        )
+
+
+@bench_app.command(name="logging")
+@handle_command_errors
+def bench_logging(
+    records: Annotated[
+        int,
+        typer.Option("--records", "-n", min=1, help="Debug records per mode"),
+    ] = 100_000,
+    queue_size: Annotated[
+        int,
+        typer.Option("--queue-size", min=1, help="Size of the log queue"),
+    ] = DEFAULT_LOG_QUEUE_SIZE,
+) -> None:
+    """Measure the per-record cost of synchronous and queued file logging."""
+    from adraitools.services.logging_benchmark import (  # noqa: PLC0415
+        LoggingBenchmark,
+    )
+
+    benchmark = LoggingBenchmark(LoggingService())
+    modes: list[tuple[int | None, OverflowPolicy]] = [
+        (None, "block"),
+        (queue_size, "block"),
+        (queue_size, "drop"),
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        results = [
+            benchmark.run(
+                Path(directory) / f"bench-{number}.log",
+                records,
+                queue_size=size,
+                overflow=overflow,
+            )
+            for number, (size, overflow) in enumerate(modes)
+        ]
+
+    typer.echo(
+        f"{'mode':<12}{'records':>10}{'us/record':>12}{'drain ms':>10}{'dropped':>9}"
+    )
+    for result in results:
+        typer.echo(
+            f"{result.mode:<12}{result.records:>10}{result.per_record_us:>12.2f}"
+            f"{result.drain_ms:>10.1f}{result.dropped:>9}"
+        )
+
+
+@bench_app.command(name="generate")
+@handle_command_errors
+def bench_generate(
+    count: Annotated[
+        int,
+        typer.Option("--count", "-n", min=1, help="Number of ADRs to generate"),
+    ] = 1_000,
+    output: Annotated[
+        Path,
+        typer.Option("--output", "-o", help="Directory the ADRs are written to"),
+    ] = DEFAULT_GENERATED_DIRECTORY,
+    seed: Annotated[
+        int,
+        typer.Option("--seed", help="Seed of the generated content"),
+    ] = 0,
+    workers: Annotated[
+        int | None,
+        typer.Option("--workers", min=1, help="Writer processes [default: CPUs]"),
+    ] = None,
+) -> None:
+    """Write a synthetic ADR corpus for scale testing."""
+    from adraitools.services.corpus_generator import CorpusGenerator  # noqa: PLC0415
+
+    started = time.perf_counter()
+    corpus = CorpusGenerator(workers=workers).generate(output, count, seed=seed)
+    elapsed = time.perf_counter() - started
+    typer.echo(
+        f"Generated {corpus.files} ADRs ({corpus.bytes / 1_048_576:.1f} MiB, "
+        f"{corpus.superseded} superseded) in {output} in {elapsed:.1f}s"
+    )
+
+
+@bench_app.command(name="suite")
+@handle_command_errors
+def bench_suite(  # noqa: PLR0913
+    ctx: typer.Context,
+    *,
+    corpus: Annotated[
+        Path | None,
+        typer.Option(
+            "--corpus",
+            exists=True,
+            file_okay=False,
+            help="ADR directory to benchmark [default: a generated corpus]",
+        ),
+    ] = None,
+    count: Annotated[
+        int,
+        typer.Option("--count", "-n", min=1, help="ADRs of the generated corpus"),
+    ] = 1_000,
+    seed: Annotated[
+        int,
+        typer.Option("--seed", help="Seed of the generated corpus"),
+    ] = 0,
+    repeats: Annotated[
+        int,
+        typer.Option("--repeats", min=1, help="Runs of every scenario"),
+    ] = 3,
+    output: Annotated[
+        Path,
+        typer.Option("--output", "-o", help="JSON file the results are written to"),
+    ] = DEFAULT_SUITE_RESULTS,
+    baseline: Annotated[
+        Path | None,
+        typer.Option(
+            "--baseline",
+            exists=True,
+            dir_okay=False,
+            help="Results of a previous run to compare with",
+        ),
+    ] = None,
+    threshold: Annotated[
+        float,
+        typer.Option(
+            "--threshold",
+            min=0.0,
+            help="Relative slowdown tolerated against the baseline",
+        ),
+    ] = 0.2,
+    workers: Annotated[
+        int | None,
+        typer.Option("--workers", min=1, help="Worker processes [default: CPUs]"),
+    ] = None,
+) -> None:
+    """Run the standard benchmark suite, failing on regressions."""
+    # NumPy-backed modules are imported on use to keep start-up fast
+    from adraitools.services.adr_parser import AdrParser  # noqa: PLC0415
+    from adraitools.services.benchmark_suite import (  # noqa: PLC0415
+        BenchmarkSuite,
+        find_regressions,
+    )
+    from adraitools.services.corpus_generator import CorpusGenerator  # noqa: PLC0415
+    from adraitools.services.models.benchmark import (  # noqa: PLC0415
+        BenchmarkSuiteResult,
+    )
+
+    suite = BenchmarkSuite(
+        file_system_service=FileSystemService(),
+        adr_parser=AdrParser(),
+        logging_service=_get_logging_service(ctx),
+        repeats=repeats,
+        workers=workers,
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        scratch = Path(directory)
+        if corpus is None:
+            generated = scratch / "corpus"
+            CorpusGenerator(workers=workers).generate(generated, count, seed=seed)
+            result = suite.run(
+                generated,
+                scratch / "runs",
+                description=f"synthetic, {count} ADRs, seed {seed}",
+            )
+        else:
+            result = suite.run(corpus, scratch / "runs")
+    output.write_text(result.model_dump_json(indent=2) + "\n", encoding="utf-8")
+
+    previous = (
+        BenchmarkSuiteResult.model_validate_json(baseline.read_bytes())
+        if baseline is not None
+        else None
+    )
+    typer.echo(f"{result.corpus}: {result.adrs} ADRs, adr-ai-tools {result.version}")
+    if previous is not None and previous.adrs != result.adrs:
+        typer.echo(
+            f"Warning: the baseline was measured on {previous.adrs} ADRs "
+            f"({previous.corpus})"
+        )
+    typer.echo(f"{'metric':<20}{'value':>12}{'baseline':>12}{'change':>9}")
+    for metric, value in result.metrics.items():
+        before = previous.metrics.get(metric) if previous is not None else None
+        change = f"{(value - before) / before:>+9.0%}" if before else f"{'':>9}"
+        reference = f"{before:>12.2f}" if before is not None else f"{'-':>12}"
+        typer.echo(f"{metric:<20}{value:>12.2f}{reference}{change}")
+    typer.echo(f"Results written to {output}")
+
+    if previous is None:
+        return
+    regressions = find_regressions(result, previous, threshold=threshold)
+    for regression in regressions:
+        typer.echo(
+            f"Regression: {regression.metric} {regression.baseline:.2f} -> "
+            f"{regression.current:.2f} ({regression.change:+.0%})"
+        )
+    if regressions:
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     app()
@@ -7,6 +7,8 @@ from typing import Any, TypeVar
 
 import typer
 
+from adraitools.exceptions import BaseError
+
 F = TypeVar("F", bound=Callable[..., Any])
 
 
@@ -36,6 +38,9 @@ def handle_command_errors(func: F) -> F:
         except PermissionError as e:
             typer.echo(f"Error: Permission denied - {e}")
             sys.exit(1)
+        except BaseError as e:
+            typer.echo(f"Error: {e}")
+            sys.exit(1)
         except (ValueError, TypeError, OSError) as e:
             typer.echo(f"Error: An unexpected error occurred - {e}")
             sys.exit(1)
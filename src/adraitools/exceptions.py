@@ -13,3 +13,42 @@ class ConfigurationFileCorruptedError(BaseError):
     def __init__(self, file_path: Path) -> None:
         """Initialize the exception."""
         super().__init__(f"Configuration file {file_path} is corrupted.")
+
+
+class LlmProviderError(BaseError):
+    """Exception for failed LLM provider calls."""
+
+    def __init__(self, detail: str, status_code: int | None = None) -> None:
+        """Initialize the exception."""
+        self.status_code = status_code
+        prefix = "LLM provider request failed"
+        if status_code is not None:
+            prefix = f"{prefix} with status {status_code}"
+        super().__init__(f"{prefix}: {detail}")
+
+
+class LlmDeadlineExceededError(LlmProviderError):
+    """Exception for LLM calls abandoned because their deadline passed."""
+
+    def __init__(self) -> None:
+        """Initialize the exception."""
+        super().__init__("deadline exceeded")
+
+
+class CircuitOpenError(LlmProviderError):
+    """Exception for LLM calls rejected by an open circuit breaker."""
+
+    def __init__(self, endpoint: str, retry_after: float) -> None:
+        """Initialize the exception."""
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+        super().__init__(f"circuit open for {endpoint}, retry in {retry_after:.1f}s")
+
+
+class GitCommandError(BaseError):
+    """Exception for failed git commands."""
+
+    def __init__(self, command: str, detail: str) -> None:
+        """Initialize the exception."""
+        self.command = command
+        super().__init__(f"git {command} failed: {detail}")
@@ -0,0 +1,164 @@
+"""Grouping of tracemalloc snapshots by the adraitools code that allocated."""
+
+import tracemalloc
+from collections.abc import Sequence
+from pathlib import Path
+
+from adraitools.services.models.memory import (
+    MemoryProfile,
+    ModuleAllocations,
+    StageMemory,
+)
+
+PACKAGE_DIRECTORY = Path(__file__).resolve().parent.parent
+OTHER_MODULE = "(other)"
+IMPORT_MODULE = "(import)"
+_IMPORT_FRAME_PREFIX = "<frozen importlib"
+
+SiteKey = tuple[str, int]
+# Allocated bytes and blocks by module and line
+Sites = dict[SiteKey, tuple[int, int]]
+
+
+def module_name(filename: str, package_directory: Path = PACKAGE_DIRECTORY) -> str:
+    """Get the dotted module of an adraitools source file.
+
+    Examples:
+        >>> module_name(str(PACKAGE_DIRECTORY / "services" / "adr_parser.py"))
+        'adraitools.services.adr_parser'
+        >>> module_name(str(PACKAGE_DIRECTORY / "__init__.py"))
+        'adraitools'
+        >>> module_name("/usr/lib/python3.12/json/decoder.py")
+        '(other)'
+    """
+    path = Path(filename).resolve()
+    if not path.is_relative_to(package_directory):
+        return OTHER_MODULE
+    parts = path.relative_to(package_directory).with_suffix("").parts
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join((package_directory.name, *parts))
+
+
+class AllocationSites:
+    """Attribution of traced allocations to adraitools modules.
+
+    An allocation belongs to the innermost adraitools frame of its
+    traceback, so memory allocated inside the standard library or a
+    dependency counts for the line that called into it. Allocations
+    without such a frame are imports when the import system is on the
+    stack, and other allocations otherwise.
+    """
+
+    def __init__(self, ignored_module: str | None = None) -> None:
+        """Initialize the attribution.
+
+        Args:
+            ignored_module: Module whose allocations are left out, e.g. the
+                profiler taking the snapshots
+        """
+        self.ignored_module = ignored_module
+        # Tracebacks recur between snapshots, so their sites are kept
+        self._sites: dict[tracemalloc.Traceback, SiteKey | None] = {}
+        self._modules: dict[str, str] = {}
+
+    def profile(
+        self,
+        snapshots: Sequence[tuple[str, Path, int]],
+        top: int,
+    ) -> MemoryProfile:
+        """Group snapshots of consecutive stages and diff each with the last.
+
+        Args:
+            snapshots: Stage name, snapshot file and traced peak of every
+                stage, in order
+            top: Modules listed per stage and for the fullest stage
+
+        Returns:
+            Memory per stage and the modules holding the most
+        """
+        stages: list[StageMemory] = []
+        previous: Sites = {}
+        fullest: tuple[str, Sites] = ("", {})
+        for name, path, peak_bytes in snapshots:
+            current = self.group(tracemalloc.Snapshot.load(str(path)))
+            traced = sum(size for size, _ in current.values())
+            growth = self.by_module(self.diff(previous, current))[:top]
+            stages.append(
+                StageMemory(
+                    stage=name,
+                    traced_bytes=traced,
+                    change_bytes=traced - (stages[-1].traced_bytes if stages else 0),
+                    peak_bytes=peak_bytes,
+                    growth=[module for module in growth if module.size_bytes > 0],
+                )
+            )
+            if traced >= max(stage.traced_bytes for stage in stages):
+                fullest = (name, current)
+            previous = current
+        return MemoryProfile(
+            peak_bytes=max(stage.peak_bytes for stage in stages),
+            stages=stages,
+            fullest_stage=fullest[0],
+            top_modules=self.by_module(fullest[1])[:top],
+        )
+
+    def group(self, snapshot: tracemalloc.Snapshot) -> Sites:
+        """Group the allocations of a snapshot by site."""
+        grouped: Sites = {}
+        # Allocations sharing a traceback are summed up by tracemalloc first
+        for statistic in snapshot.statistics("traceback"):
+            traceback = statistic.traceback
+            if traceback not in self._sites:
+                self._sites[traceback] = self._site(traceback)
+            key = self._sites[traceback]
+            if key is None:
+                continue
+            size, blocks = grouped.get(key, (0, 0))
+            grouped[key] = (size + statistic.size, blocks + statistic.count)
+        return grouped
+
+    @staticmethod
+    def diff(before: Sites, after: Sites) -> Sites:
+        """Get the change of every site between two snapshots."""
+        change: Sites = {}
+        for key in before.keys() | after.keys():
+            size, blocks = after.get(key, (0, 0))
+            size_before, blocks_before = before.get(key, (0, 0))
+            change[key] = (size - size_before, blocks - blocks_before)
+        return change
+
+    @staticmethod
+    def by_module(sites: Sites) -> list[ModuleAllocations]:
+        """Sum sites per module, largest first, naming each largest line."""
+        totals: dict[str, list[int]] = {}
+        for (module, line), (size, blocks) in sites.items():
+            total = totals.setdefault(module, [0, 0, line, size])
+            total[0] += size
+            total[1] += blocks
+            if size > total[3]:
+                total[2:] = [line, size]
+        modules = [
+            ModuleAllocations(module=module, size_bytes=size, blocks=blocks, line=line)
+            for module, (size, blocks, line, _) in totals.items()
+        ]
+        return sorted(modules, key=lambda module: module.size_bytes, reverse=True)
+
+    def _site(self, traceback: tracemalloc.Traceback) -> SiteKey | None:
+        """Get the innermost adraitools module and line of a traceback.
+
+        Returns:
+            None for allocations of the ignored module
+        """
+        imported = False
+        # Tracebacks iterate from the outermost frame
+        for frame in reversed(traceback):
+            module = self._modules.get(frame.filename)
+            if module is None:
+                module = self._modules[frame.filename] = module_name(frame.filename)
+            if module == self.ignored_module:
+                return None
+            if module != OTHER_MODULE:
+                return module, frame.lineno
+            imported = imported or frame.filename.startswith(_IMPORT_FRAME_PREFIX)
+        return (IMPORT_MODULE if imported else OTHER_MODULE), 0
@@ -0,0 +1,115 @@
+"""Circuit breaker guarding calls to one upstream endpoint."""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Literal
+
+from adraitools.exceptions import CircuitOpenError
+from adraitools.infrastructure.constants import LlmConstants
+from adraitools.infrastructure.logging_service import LoggingService
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreaker:
+    """Circuit breaker with closed, open and half-open states.
+
+    Closed lets every call through and counts consecutive failures. Reaching
+    the threshold opens the circuit, which rejects calls immediately until
+    the reset timeout has passed. The circuit then goes half-open and lets a
+    single probe through: its success closes the circuit, its failure opens
+    it again. Every transition is logged.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        logging_service: LoggingService,
+        failure_threshold: int = LlmConstants.DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = LlmConstants.DEFAULT_CIRCUIT_RESET_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the circuit breaker.
+
+        Args:
+            endpoint: Name of the guarded endpoint, used in logs and errors
+            logging_service: Service logging the state transitions
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a probe
+            clock: Monotonic clock, replaceable in tests
+        """
+        self.endpoint = endpoint
+        self.logging_service = logging_service
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._state: CircuitState = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the circuit."""
+        with self._lock:
+            return self._state
+
+    def before_call(self) -> None:
+        """Admit a call or reject it while the circuit is open.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with the
+                probe already in flight
+        """
+        with self._lock:
+            if self._state == "open":
+                retry_after = self._opened_at + self.reset_timeout - self.clock()
+                if retry_after > 0:
+                    raise CircuitOpenError(self.endpoint, retry_after)
+                self._transition("half_open")
+            if self._state == "half_open":
+                if self._probe_in_flight:
+                    raise CircuitOpenError(self.endpoint, 0.0)
+                self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        """Record a successful call, closing a half-open circuit."""
+        with self._lock:
+            self._failures = 0
+            self._probe_in_flight = False
+            if self._state != "closed":
+                self._transition("closed")
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit when warranted."""
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == "half_open" or (
+                self._state == "closed" and self._failures >= self.failure_threshold
+            ):
+                self._opened_at = self.clock()
+                self._transition("open")
+
+    def release(self) -> None:
+        """Record a call abandoned before its outcome was known.
+
+        Neither failures nor successes are counted; a half-open circuit lets
+        the next call through as its probe.
+        """
+        with self._lock:
+            self._probe_in_flight = False
+
+    def _transition(self, state: CircuitState) -> None:
+        """Move to a new state and log the transition; lock must be held."""
+        message = f"Circuit for {self.endpoint}: {self._state} -> {state}"
+        self._state = state
+        if state == "open":
+            self.logging_service.log_warning(
+                f"{message} after {self._failures} failure(s), "
+                f"retrying in {self.reset_timeout:.0f}s"
+            )
+        else:
+            self.logging_service.log_info(message)
@@ -0,0 +1,309 @@
+"""Single-flight request coalescing for LLM providers."""
+
+import threading
+import time
+from collections.abc import Generator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from adraitools.exceptions import LlmDeadlineExceededError
+from adraitools.infrastructure.llm_provider import LlmProvider
+from adraitools.services.models.llm import CoalescingMetrics, LlmRequest, LlmResponse
+
+
+class _InFlightCall:
+    """Upstream completion shared by all waiters with the same request key."""
+
+    def __init__(self, key: str, future: "Future[LlmResponse]") -> None:
+        self.key = key
+        self.future = future
+        self.waiters = 0
+
+
+class _InFlightStream:
+    """Upstream stream whose chunks are fanned out to all subscribers."""
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.chunks: list[str] = []
+        self.condition = threading.Condition()
+        self.subscribers = 0
+        self.done = False
+        self.abandoned = False
+        self.error: Exception | None = None
+
+
+class CoalescedCall:
+    """Handle held by one waiter of a coalesced completion."""
+
+    def __init__(self, owner: "CoalescingLlmProvider", call: _InFlightCall) -> None:
+        """Initialize the handle."""
+        self._owner = owner
+        self._call = call
+        self._released = False
+
+    def result(self, timeout: float | None = None) -> LlmResponse:
+        """Wait for the shared upstream call and return its response.
+
+        Args:
+            timeout: Seconds to wait before giving up, forever if None
+
+        Returns:
+            Response produced by the upstream provider
+
+        Raises:
+            TimeoutError: If the call does not finish within the timeout
+            CancelledError: If every waiter cancelled before the call started
+        """
+        return self._call.future.result(timeout)
+
+    def cancel(self) -> None:
+        """Leave the call without affecting the other waiters.
+
+        The upstream call itself is only cancelled once its last waiter has
+        left and it has not started running yet. Calling this more than once
+        or after the result was retrieved is harmless.
+        """
+        if self._released:
+            return
+        self._released = True
+        self._owner._leave_call(self._call)  # noqa: SLF001
+
+
+class CoalescedStream(Iterator[str]):
+    """Iterator held by one subscriber of a coalesced stream."""
+
+    def __init__(
+        self,
+        owner: "CoalescingLlmProvider",
+        stream: _InFlightStream,
+        deadline: float | None = None,
+    ) -> None:
+        """Initialize the subscription.
+
+        Args:
+            owner: Provider the stream is shared through
+            stream: Shared upstream stream
+            deadline: time.monotonic() value after which this subscriber
+                stops waiting for chunks, never if None
+        """
+        self._owner = owner
+        self._stream = stream
+        self._chunks = owner._read_stream(stream, deadline)  # noqa: SLF001
+        self._released = False
+
+    def __next__(self) -> str:
+        """Get the next chunk, leaving the stream once it is exhausted."""
+        try:
+            return next(self._chunks)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Leave the stream without affecting the other subscribers.
+
+        Works whether or not iteration has started; calling this more than
+        once or after the last chunk is harmless.
+        """
+        if self._released:
+            return
+        self._released = True
+        self._chunks.close()
+        self._owner._leave_stream(self._stream)  # noqa: SLF001
+
+    def __del__(self) -> None:
+        """Leave the stream when the subscription is dropped unclosed."""
+        self.close()
+
+
+class CoalescingLlmProvider:
+    """LLM provider wrapper that shares identical in-flight requests.
+
+    Requests are identified by ``LlmRequest.normalized_key``. While a request
+    is in flight, identical requests wait on the same upstream call instead of
+    issuing a new one, and the result is fanned out to every waiter. The
+    upstream call is sent without a deadline: waiters joining it may have
+    another deadline or none, so each enforces its own while waiting.
+    """
+
+    def __init__(self, provider: LlmProvider, max_workers: int = 8) -> None:
+        """Initialize the coalescing provider.
+
+        Args:
+            provider: Upstream provider receiving deduplicated calls
+            max_workers: Maximum number of concurrent upstream calls
+        """
+        self.provider = provider
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="llm-coalescing"
+        )
+        # Re-entrant because done callbacks may run inline while it is held
+        self._lock = threading.RLock()
+        self._calls: dict[str, _InFlightCall] = {}
+        self._streams: dict[str, _InFlightStream] = {}
+        self._issued_calls = 0
+        self._coalesced_calls = 0
+        self._cancelled_waiters = 0
+
+    @property
+    def metrics(self) -> CoalescingMetrics:
+        """Get a snapshot of the coalescing counters."""
+        with self._lock:
+            return CoalescingMetrics(
+                issued_calls=self._issued_calls,
+                coalesced_calls=self._coalesced_calls,
+                cancelled_waiters=self._cancelled_waiters,
+                in_flight=len(self._calls) + len(self._streams),
+            )
+
+    def submit(self, request: LlmRequest) -> CoalescedCall:
+        """Join or start the upstream call for a request.
+
+        Args:
+            request: Request to send
+
+        Returns:
+            Handle used to wait for the result or to cancel this waiter
+        """
+        key = request.normalized_key()
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                future = self._executor.submit(
+                    self.provider.complete, _without_deadline(request)
+                )
+                call = _InFlightCall(key, future)
+                self._calls[key] = call
+                self._issued_calls += 1
+                future.add_done_callback(lambda _: self._forget_call(call))
+            else:
+                self._coalesced_calls += 1
+            call.waiters += 1
+        return CoalescedCall(self, call)
+
+    def complete(self, request: LlmRequest) -> LlmResponse:
+        """Send a request, sharing the upstream call with identical requests.
+
+        Raises:
+            LlmDeadlineExceededError: If the request deadline passes while
+                waiting for the shared call
+        """
+        handle = self.submit(request)
+        remaining = request.remaining_seconds()
+        try:
+            return handle.result(None if remaining is None else max(remaining, 0.0))
+        except TimeoutError as e:
+            raise LlmDeadlineExceededError from e
+        finally:
+            handle.cancel()
+
+    def stream(self, request: LlmRequest) -> CoalescedStream:
+        """Stream a response, sharing the upstream stream with identical requests.
+
+        Subscribers joining late first receive the chunks produced so far.
+        Closing the returned stream early, or dropping it, only detaches this
+        subscriber; the upstream stream is abandoned once no subscriber is
+        left. Iterating raises ``LlmDeadlineExceededError`` once the request
+        deadline passes while waiting for a chunk.
+        """
+        key = request.normalized_key()
+        with self._lock:
+            stream = self._streams.get(key)
+            if stream is None:
+                stream = _InFlightStream(key)
+                self._streams[key] = stream
+                self._issued_calls += 1
+                self._executor.submit(
+                    self._pump_stream, stream, _without_deadline(request)
+                )
+            else:
+                self._coalesced_calls += 1
+            stream.subscribers += 1
+        return CoalescedStream(self, stream, request.deadline)
+
+    def close(self) -> None:
+        """Stop accepting calls and cancel upstream calls that have not started."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _read_stream(
+        stream: _InFlightStream, deadline: float | None
+    ) -> Generator[str, None, None]:
+        """Yield the chunks of a shared stream to one subscriber."""
+        position = 0
+        while True:
+            with stream.condition:
+                while position >= len(stream.chunks) and not stream.done:
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        raise LlmDeadlineExceededError
+                    stream.condition.wait(remaining)
+                pending = stream.chunks[position:]
+                position += len(pending)
+                finished = stream.done and position >= len(stream.chunks)
+                error = stream.error
+            yield from pending
+            if finished:
+                if error is not None:
+                    raise error
+                return
+
+    def _pump_stream(self, stream: _InFlightStream, request: LlmRequest) -> None:
+        """Read the upstream stream and publish its chunks to subscribers."""
+        upstream: Iterator[str] | None = None
+        error: Exception | None = None
+        try:
+            upstream = self.provider.stream(request)
+            for chunk in upstream:
+                with stream.condition:
+                    if stream.abandoned:
+                        break
+                    stream.chunks.append(chunk)
+                    stream.condition.notify_all()
+        except Exception as e:  # noqa: BLE001 - re-raised in every subscriber
+            error = e
+        finally:
+            if isinstance(upstream, Generator):
+                upstream.close()
+            with stream.condition:
+                stream.error = error
+                stream.done = True
+                stream.condition.notify_all()
+            with self._lock:
+                if self._streams.get(stream.key) is stream:
+                    del self._streams[stream.key]
+
+    def _leave_call(self, call: _InFlightCall) -> None:
+        """Detach one waiter from a shared completion."""
+        with self._lock:
+            call.waiters -= 1
+            if call.future.done():
+                return
+            self._cancelled_waiters += 1
+            if call.waiters == 0 and call.future.cancel():
+                self._forget_call(call)
+
+    def _leave_stream(self, stream: _InFlightStream) -> None:
+        """Detach one subscriber from a shared stream."""
+        with self._lock, stream.condition:
+            stream.subscribers -= 1
+            if stream.done:
+                return
+            self._cancelled_waiters += 1
+            if stream.subscribers == 0:
+                stream.abandoned = True
+                if self._streams.get(stream.key) is stream:
+                    del self._streams[stream.key]
+
+    def _forget_call(self, call: _InFlightCall) -> None:
+        """Remove a finished or cancelled call from the in-flight table."""
+        with self._lock:
+            if self._calls.get(call.key) is call:
+                del self._calls[call.key]
+
+
+def _without_deadline(request: LlmRequest) -> LlmRequest:
+    """Get the request sent upstream on behalf of every waiter."""
+    return request.model_copy(update={"deadline": None})
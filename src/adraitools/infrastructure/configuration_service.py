@@ -1,29 +1,97 @@
 """Configuration management service."""
 
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+import tomli
+
+from adraitools.exceptions import ConfigurationFileCorruptedError
 from adraitools.infrastructure.constants import ErrorMessages, PathConstants
+from adraitools.infrastructure.span_recorder import span
 from adraitools.infrastructure.toml_file_handler import TomlFileHandler
-from adraitools.infrastructure.type_converter import TypeConverter
-from adraitools.services.models.configuration import AdrConfiguration
+
+if TYPE_CHECKING:
+    # pydantic-settings is slow to import; the pre-commit hook only needs paths
+    from adraitools.services.models.configuration import AdrConfiguration
+
+ENV_PREFIX = "ADRAI_"
+
+
+class AdrPaths(NamedTuple):
+    """Configured locations of the ADRs."""
+
+    adr_directory: Path
+    template_file: Path
 
 
 class ConfigurationService:
     """Service for managing application configuration."""
 
-    def __init__(self) -> None:
-        """Initialize the configuration service."""
-        self._configuration: AdrConfiguration | None = None
+    def __init__(self, configuration: "AdrConfiguration | None" = None) -> None:
+        """Initialize the configuration service.
+
+        Args:
+            configuration: Fixed configuration to serve instead of resolving
+                it from the environment and the configuration files
+        """
+        self._configuration = configuration
 
     @property
-    def configuration(self) -> AdrConfiguration:
+    def configuration(self) -> "AdrConfiguration":
         """Get the complete configuration."""
         if self._configuration is None:
-            self._configuration = AdrConfiguration()
+            from adraitools.services.models.configuration import (  # noqa: PLC0415
+                AdrConfiguration,
+            )
+
+            with span("config.resolve"):
+                self._configuration = AdrConfiguration()
         return self._configuration
 
-    def get_configuration(self) -> AdrConfiguration:
+    def get_configuration(self) -> "AdrConfiguration":
         """Get the complete configuration."""
         return self.configuration
 
+    def get_paths(self) -> AdrPaths:
+        """Get the ADR directory and template without the configuration model.
+
+        The two settings are resolved with the precedence of
+        ``get_configuration``: environment, project-local file, global file,
+        default. The other settings are neither read nor validated.
+        """
+        if self._configuration is not None:
+            return AdrPaths(
+                self._configuration.adr_directory, self._configuration.template_file
+            )
+        with span("config.resolve_paths"):
+            sources: list[Mapping[str, object]] = [
+                {
+                    name.lower().removeprefix(ENV_PREFIX.lower()): value
+                    for name, value in os.environ.items()
+                    if name.upper().startswith(ENV_PREFIX)
+                }
+            ]
+            for config_file in (
+                PathConstants.get_local_config_file(),
+                PathConstants.get_global_config_file(),
+            ):
+                try:
+                    sources.append(TomlFileHandler.load_config(config_file))
+                except tomli.TOMLDecodeError as err:
+                    raise ConfigurationFileCorruptedError(
+                        file_path=config_file
+                    ) from err
+            return AdrPaths(
+                _first_path(
+                    sources, "adr_directory", PathConstants.DEFAULT_ADR_DIRECTORY
+                ),
+                _first_path(
+                    sources, "template_file", PathConstants.DEFAULT_TEMPLATE_FILE
+                ),
+            )
+
     def get_value(self, key: str) -> str:
         """Get a specific configuration value as string for CLI display."""
         if not hasattr(self.configuration, key):
@@ -38,6 +106,10 @@ class ConfigurationService:
             msg = ErrorMessages.UNKNOWN_CONFIG_KEY.format(key=key)
             raise KeyError(msg)
 
+        from adraitools.infrastructure.type_converter import (  # noqa: PLC0415
+            TypeConverter,
+        )
+
         # Convert string value to appropriate type and back to string for storage
         converted_value = TypeConverter.convert_config_value(key, value)
 
@@ -50,3 +122,12 @@ class ConfigurationService:
 
         # Save to TOML file
         TomlFileHandler.update_config_value(key, str(converted_value), config_file)
+
+
+def _first_path(sources: list[Mapping[str, object]], key: str, default: Path) -> Path:
+    """Get a path setting from the first source defining it."""
+    for source in sources:
+        value = source.get(key)
+        if value is not None:
+            return Path(str(value).strip())
+    return default
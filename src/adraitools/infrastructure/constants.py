@@ -15,6 +15,12 @@ class PathConstants:
     GLOBAL_CONFIG_DIR = Path(".config") / "adr-ai-tools"
     CONFIG_FILE = "config.toml"
 
+    # Cache paths
+    CACHE_DIR = "cache"
+    CACHE_FILE = "cache.sqlite3"
+    INDEX_DIR = "index"
+    REVISIONS_DIR = "revisions"
+
     @classmethod
     def get_local_config_dir(cls, project_root: Path | None = None) -> Path:
         """Get project-local configuration directory."""
@@ -32,6 +38,28 @@ class PathConstants:
         """Get project-local configuration file path."""
         return cls.get_local_config_dir(project_root) / cls.CONFIG_FILE
 
+    @classmethod
+    def get_local_cache_dir(cls, project_root: Path | None = None) -> Path:
+        """Get project-local cache directory."""
+        return cls.get_local_config_dir(project_root) / cls.CACHE_DIR
+
+    @classmethod
+    def get_local_cache_file(cls, project_root: Path | None = None) -> Path:
+        """Get project-local cache database path."""
+        return cls.get_local_cache_dir(project_root) / cls.CACHE_FILE
+
+    @classmethod
+    def get_local_index_dir(cls, project_root: Path | None = None) -> Path:
+        """Get project-local vector index directory."""
+        return cls.get_local_cache_dir(project_root) / cls.INDEX_DIR
+
+    @classmethod
+    def get_revision_index_dir(
+        cls, commit: str, project_root: Path | None = None
+    ) -> Path:
+        """Get the vector index directory of the ADRs at a git commit."""
+        return cls.get_local_index_dir(project_root) / cls.REVISIONS_DIR / commit
+
     @classmethod
     def get_global_config_file(cls, home_dir: Path | None = None) -> Path:
         """Get global configuration file path."""
@@ -42,3 +70,97 @@ class ErrorMessages:
     """Standard error message templates."""
 
     UNKNOWN_CONFIG_KEY = "Unknown configuration key '{key}'"
+
+
+class LlmConstants:
+    """LLM provider defaults."""
+
+    DEFAULT_BASE_URL = "https://api.openai.com/v1"
+    DEFAULT_MODEL = "gpt-4o-mini"
+    DEFAULT_TIMEOUT_SECONDS = 60.0
+    DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 5
+    DEFAULT_CIRCUIT_RESET_SECONDS = 30.0
+    HEDGE_QUANTILE = 0.95
+    HEDGE_MIN_SAMPLES = 20
+    LATENCY_WINDOW = 200
+
+
+class AskConstants:
+    """Question answering defaults."""
+
+    DEFAULT_TOP_K = 4
+
+
+class AnalysisConstants:
+    """Corpus analysis defaults."""
+
+    DEFAULT_DUPLICATE_THRESHOLD = 0.8
+
+
+class ResourceConstants:
+    """Resource report defaults."""
+
+    DEFAULT_WORKLOAD_ADRS = 500
+
+
+class TemplateConstants:
+    """ADR template defaults."""
+
+    ADR_TEMPLATE = """# Architecture Decision Record (ADR)
+
+## Title
+Short title of the architectural decision
+
+## Status
+[Proposed | Accepted | Deprecated | Superseded]
+<!-- If superseded, include a reference to the new ADR -->
+
+## Date
+YYYY-MM-DD
+
+## Context
+Describe the context and problem statement. What is the architectural challenge
+that needs to be addressed? Include any relevant constraints or requirements
+that influenced the decision.
+
+## Decision
+State the architectural decision clearly and concisely. What specific approach,
+technology, pattern, or solution was chosen?
+
+## Rationale
+Explain the reasoning that led to this decision. Why was this particular option
+selected among the alternatives? Include relevant factors such as:
+- Technical considerations
+- Business requirements
+- Team capabilities
+- Time constraints
+- Cost implications
+
+## Implications
+### Positive Implications
+List the benefits and positive outcomes expected from this decision.
+
+### Concerns
+List potential challenges, risks, or negative consequences along with possible
+mitigation strategies.
+
+## Alternatives
+Describe other options that were considered and why they were not selected.
+For each alternative, briefly explain:
+- Key characteristics
+- Pros and cons relative to the chosen solution
+- Reasons for rejection
+
+## Future Direction
+Outline any follow-up actions, future considerations, or potential changes
+that might be necessary as a result of this decision. Include potential
+triggers for revisiting this decision.
+
+## References
+List any relevant documents, articles, books, or other resources that
+supported this decision:
+- Links to relevant documentation
+- Research materials
+- Benchmarks or performance data
+- Team discussions or meeting notes
+"""
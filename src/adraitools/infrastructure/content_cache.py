@@ -0,0 +1,90 @@
+"""Persistent key-value cache for content-addressed results."""
+
+import sqlite3
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+# Stay well below SQLite's limit on bound parameters per statement
+_MAX_KEYS_PER_QUERY = 500
+
+
+class ContentCache:
+    """SQLite-backed cache of binary values grouped by namespace.
+
+    Keys are expected to be content hashes, so entries never go stale: a
+    changed input simply produces a different key. The database is opened
+    lazily on first use and created with its parent directory if needed.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+
+    def get(self, namespace: str, key: str) -> bytes | None:
+        """Get a single cached value, None if absent."""
+        return self.get_many(namespace, [key]).get(key)
+
+    def get_many(self, namespace: str, keys: Iterable[str]) -> dict[str, bytes]:
+        """Get the cached values of several keys.
+
+        Args:
+            namespace: Cache namespace, e.g. ``embeddings:hashing-256``
+            keys: Keys to look up
+
+        Returns:
+            Values of the keys that are cached
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        found: dict[str, bytes] = {}
+        connection = self._connect()
+        for start in range(0, len(unique_keys), _MAX_KEYS_PER_QUERY):
+            batch = unique_keys[start : start + _MAX_KEYS_PER_QUERY]
+            placeholders = ",".join("?" * len(batch))
+            rows = connection.execute(
+                "SELECT key, value FROM entries "  # noqa: S608 - placeholders only
+                f"WHERE namespace = ? AND key IN ({placeholders})",
+                (namespace, *batch),
+            )
+            found.update(rows)
+        return found
+
+    def put(self, namespace: str, key: str, value: bytes) -> None:
+        """Store a single value."""
+        self.put_many(namespace, {key: value})
+
+    def put_many(self, namespace: str, values: Mapping[str, bytes]) -> None:
+        """Store several values in one transaction."""
+        if not values:
+            return
+        connection = self._connect()
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO entries (namespace, key, value) "
+                "VALUES (?, ?, ?)",
+                ((namespace, key, value) for key, value in values.items()),
+            )
+
+    def close(self) -> None:
+        """Close the database connection if open."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use."""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, "
+                "PRIMARY KEY (namespace, key)) WITHOUT ROWID"
+            )
+            self._connection = connection
+        return self._connection
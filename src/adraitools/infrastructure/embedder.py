@@ -0,0 +1,22 @@
+"""Text embedding interface."""
+
+from collections.abc import Sequence
+from typing import Protocol
+
+
+class Embedder(Protocol):
+    """Interface implemented by text embedding models."""
+
+    @property
+    def name(self) -> str:
+        """Identifier of the model and its settings, used in cache keys."""
+        ...
+
+    @property
+    def dimensions(self) -> int:
+        """Length of the produced vectors."""
+        ...
+
+    def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed texts into unit-length vectors, one per text."""
+        ...
@@ -0,0 +1,56 @@
+"""Embedding cache keyed by chunk content hash."""
+
+from collections.abc import Iterable, Mapping, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from adraitools.infrastructure.content_cache import ContentCache
+
+_NAMESPACE_PREFIX = "embeddings"
+
+
+class EmbeddingCache:
+    """Service storing float32 embeddings per model and chunk hash."""
+
+    def __init__(self, content_cache: ContentCache) -> None:
+        """Initialize the embedding cache."""
+        self.content_cache = content_cache
+
+    def get_many(
+        self, model_name: str, content_hashes: Iterable[str]
+    ) -> dict[str, NDArray[np.float32]]:
+        """Get the cached embeddings of several chunks.
+
+        Args:
+            model_name: Name of the embedder that produced the vectors
+            content_hashes: Chunk content hashes to look up
+
+        Returns:
+            Vectors of the chunks that are cached, by content hash
+        """
+        stored = self.content_cache.get_many(
+            self._namespace(model_name), content_hashes
+        )
+        return {
+            key: np.frombuffer(value, dtype=np.float32) for key, value in stored.items()
+        }
+
+    def put_many(
+        self,
+        model_name: str,
+        vectors: Mapping[str, NDArray[np.float32] | Sequence[float]],
+    ) -> None:
+        """Store the embeddings of several chunks by content hash."""
+        self.content_cache.put_many(
+            self._namespace(model_name),
+            {
+                key: np.asarray(vector, dtype=np.float32).tobytes()
+                for key, vector in vectors.items()
+            },
+        )
+
+    @staticmethod
+    def _namespace(model_name: str) -> str:
+        """Get the cache namespace of an embedder."""
+        return f"{_NAMESPACE_PREFIX}:{model_name}"
@@ -1,7 +1,10 @@
 """File system operations service."""
 
+import os
 from pathlib import Path
 
+from adraitools.infrastructure.constants import TemplateConstants
+
 
 class FileSystemService:
     """Service for file system operations."""
@@ -10,68 +13,82 @@ class FileSystemService:
         """Check if directory exists."""
         return path.exists() and path.is_dir()
 
+    def path_exists(self, path: Path) -> bool:
+        """Check if a file or directory exists."""
+        return path.exists()
+
     def create_directory(self, path: Path) -> None:
         """Create directory."""
         path.mkdir(parents=True, exist_ok=True)
 
+    def list_markdown_files(self, directory: Path) -> list[Path]:
+        """List markdown files directly inside a directory, sorted by name."""
+        if not self.directory_exists(directory):
+            return []
+        # Sorting names is much cheaper than sorting Path objects
+        with os.scandir(directory) as entries:
+            names = sorted(
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".md") and entry.is_file()
+            )
+        return [directory / name for name in names]
+
+    def fingerprint_markdown_files(self, directory: Path) -> dict[str, str]:
+        """Get a cheap change fingerprint of each markdown file in a directory.
+
+        Returns:
+            Modification time and size of each file, keyed by file name
+        """
+        if not self.directory_exists(directory):
+            return {}
+        with os.scandir(directory) as entries:
+            return {
+                entry.name: f"{stat.st_mtime_ns}-{stat.st_size}"
+                for entry in entries
+                if entry.name.endswith(".md")
+                and entry.is_file()
+                and (stat := entry.stat())
+            }
+
+    def snapshot_tree(
+        self, root: Path, skipped: frozenset[str] = frozenset()
+    ) -> frozenset[str]:
+        """List every file and directory under a root in one walk.
+
+        Args:
+            root: Directory to walk
+            skipped: Directory names not descended into, e.g. ``.git``
+
+        Returns:
+            POSIX paths relative to the root, directories included
+        """
+        paths: set[str] = set()
+        pending = [(root, "")]
+        while pending:
+            directory, prefix = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        relative = prefix + entry.name
+                        paths.add(relative)
+                        if (
+                            entry.is_dir(follow_symlinks=False)
+                            and entry.name not in skipped
+                        ):
+                            pending.append((Path(entry.path), relative + "/"))
+            except OSError:
+                continue
+        return frozenset(paths)
+
+    def read_text(self, path: Path) -> str:
+        """Read a UTF-8 text file."""
+        return path.read_text(encoding="utf-8")
+
+    def read_bytes(self, path: Path) -> bytes:
+        """Read a file without decoding it."""
+        return path.read_bytes()
+
     def create_template_file(self, path: Path) -> None:
         """Create ADR template file."""
-        template_content = """# Architecture Decision Record (ADR)
-
-## Title
-Short title of the architectural decision
-
-## Status
-[Proposed | Accepted | Deprecated | Superseded]
-<!-- If superseded, include a reference to the new ADR -->
-
-## Date
-YYYY-MM-DD
-
-## Context
-Describe the context and problem statement. What is the architectural challenge
-that needs to be addressed? Include any relevant constraints or requirements
-that influenced the decision.
-
-## Decision
-State the architectural decision clearly and concisely. What specific approach,
-technology, pattern, or solution was chosen?
-
-## Rationale
-Explain the reasoning that led to this decision. Why was this particular option
-selected among the alternatives? Include relevant factors such as:
-- Technical considerations
-- Business requirements
-- Team capabilities
-- Time constraints
-- Cost implications
-
-## Implications
-### Positive Implications
-List the benefits and positive outcomes expected from this decision.
-
-### Concerns
-List potential challenges, risks, or negative consequences along with possible
-mitigation strategies.
-
-## Alternatives
-Describe other options that were considered and why they were not selected.
-For each alternative, briefly explain:
-- Key characteristics
-- Pros and cons relative to the chosen solution
-- Reasons for rejection
-
-## Future Direction
-Outline any follow-up actions, future considerations, or potential changes
-that might be necessary as a result of this decision. Include potential
-triggers for revisiting this decision.
-
-## References
-List any relevant documents, articles, books, or other resources that
-supported this decision:
-- Links to relevant documentation
-- Research materials
-- Benchmarks or performance data
-- Team discussions or meeting notes
-"""
-        path.write_text(template_content)
+        path.write_text(TemplateConstants.ADR_TEMPLATE)
@@ -0,0 +1,50 @@
+"""View of ADR files as they are staged in the git index."""
+
+import threading
+from pathlib import Path
+
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.infrastructure.git_service import GitService
+from adraitools.infrastructure.span_recorder import span
+
+
+class GitIndexFileSystem(FileSystemService):
+    """File system service reading staged files from the git index.
+
+    Pre-commit checks must see what will be committed: a partially staged
+    file differs from its working-tree copy. Staged files are read from
+    their index blobs, all through one ``git cat-file --batch`` on the
+    first read; every other path, such as link targets, is read from the
+    working tree.
+    """
+
+    def __init__(self, git_service: GitService, blobs: dict[Path, str]) -> None:
+        """Initialize the index view.
+
+        Args:
+            git_service: Git service of the working tree the paths are in
+            blobs: Index blob SHA of each staged file, as from
+                ``GitService.staged_blobs``
+        """
+        self.git_service = git_service
+        self._staged = {path.resolve(): sha for path, sha in blobs.items()}
+        self._blobs: dict[str, bytes] | None = None
+        self._lock = threading.Lock()
+
+    def read_text(self, path: Path) -> str:
+        """Read a UTF-8 text file, staged content for a staged file."""
+        return self.read_bytes(path).decode("utf-8")
+
+    def read_bytes(self, path: Path) -> bytes:
+        """Read a file without decoding it, staged content for a staged file."""
+        sha = self._staged.get(path.resolve())
+        if sha is None:
+            return super().read_bytes(path)
+        with self._lock:
+            if self._blobs is None:
+                with span("git.read_blobs") as current:
+                    self._blobs = dict(
+                        self.git_service.read_blobs(sorted(set(self._staged.values())))
+                    )
+                    current.set_attribute("git.blobs", len(self._blobs))
+            return self._blobs[sha]
@@ -0,0 +1,101 @@
+"""Read-only view of ADR files as they were at a git revision."""
+
+import threading
+from pathlib import Path
+
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.infrastructure.git_service import GitService
+from adraitools.infrastructure.span_recorder import span
+
+
+class GitRevisionFileSystem(FileSystemService):
+    """File system service reading markdown files from a git commit.
+
+    Nothing is checked out: directory listings come from ``git ls-tree``
+    and contents are streamed from the object database through one
+    ``git cat-file --batch`` process per directory. The fingerprint of a
+    file is its blob SHA, so caches keyed by fingerprint are shared by
+    every revision in which an ADR is unchanged.
+    """
+
+    def __init__(self, git_service: GitService, revision: str) -> None:
+        """Initialize the revision view.
+
+        Args:
+            git_service: Git service of the working tree the paths are in
+            revision: Commit, tag or branch to read
+
+        Raises:
+            GitCommandError: If the revision names no commit
+        """
+        self.git_service = git_service
+        self.commit = git_service.resolve_commit(revision)
+        self._trees: dict[Path, dict[str, str]] = {}
+        self._blobs: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def directory_exists(self, path: Path) -> bool:
+        """Check if a directory has files at the revision."""
+        return bool(self._tree(path))
+
+    def path_exists(self, path: Path) -> bool:
+        """Check if a file exists at the revision."""
+        return path.name in self._tree(path.parent)
+
+    def list_markdown_files(self, directory: Path) -> list[Path]:
+        """List markdown files directly inside a directory, sorted by name."""
+        names = sorted(name for name in self._tree(directory) if name.endswith(".md"))
+        return [directory / name for name in names]
+
+    def fingerprint_markdown_files(self, directory: Path) -> dict[str, str]:
+        """Get the blob SHA of each markdown file in a directory."""
+        return {
+            name: sha
+            for name, sha in self._tree(directory).items()
+            if name.endswith(".md")
+        }
+
+    def read_text(self, path: Path) -> str:
+        """Read a UTF-8 text file at the revision."""
+        return self.read_bytes(path).decode("utf-8")
+
+    def read_bytes(self, path: Path) -> bytes:
+        """Read a file at the revision without decoding it.
+
+        The first read in a directory streams every markdown blob of that
+        directory at once; identical blobs are held only once.
+
+        Raises:
+            FileNotFoundError: If the file does not exist at the revision
+        """
+        tree = self._tree(path.parent)
+        sha = tree.get(path.name)
+        if sha is None:
+            msg = f"{path} at {self.commit[:12]}"
+            raise FileNotFoundError(msg)
+        with self._lock:
+            if sha not in self._blobs:
+                wanted = sorted(
+                    {
+                        blob
+                        for name, blob in tree.items()
+                        if name.endswith(".md") and blob not in self._blobs
+                    }
+                    | {sha}
+                )
+                with span("git.read_blobs") as current:
+                    blobs = dict(self.git_service.read_blobs(wanted))
+                    current.set_attribute("git.blobs", len(blobs))
+                    current.set_attribute(
+                        "git.bytes", sum(len(blob) for blob in blobs.values())
+                    )
+                self._blobs.update(blobs)
+            return self._blobs[sha]
+
+    def _tree(self, directory: Path) -> dict[str, str]:
+        """Get the blob SHAs of a directory at the revision, listing it once."""
+        key = directory.resolve()
+        with self._lock:
+            if key not in self._trees:
+                self._trees[key] = self.git_service.list_tree(self.commit, directory)
+            return self._trees[key]
@@ -0,0 +1,376 @@
+"""Git repository access through the git command line."""
+
+import os
+import subprocess
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, NamedTuple
+
+from adraitools.exceptions import GitCommandError
+
+READ_CHUNK = 1 << 16
+# Separators of the log records, written by --format and -z
+_RECORD = b"\x1e"
+_FIELD = b"\x1f"
+_NUL = b"\0"
+_LOG_FORMAT = "--format=%x1e%H%x1f%an%x1f%ct"
+_COPY_OR_RENAME = (b"C", b"R")
+_BLOB = b"blob"
+_MISSING = b"missing"
+
+
+class GitChange(NamedTuple):
+    """A file changed by a commit."""
+
+    status: str
+    path: str
+    previous_path: str | None
+
+
+class GitCommit(NamedTuple):
+    """A commit with the files it changed."""
+
+    sha: str
+    author: str
+    timestamp: int
+    changes: list[GitChange]
+
+
+def _parse_commit(record: bytes) -> GitCommit:
+    r"""Parse one record of ``git log --name-status -z``.
+
+    Examples:
+        >>> record = b"abc\x1fAnn\x1f1700000000\0\nM\0a.md\0R100\0b.md\0c.md\0"
+        >>> commit = _parse_commit(record)
+        >>> commit.sha, commit.author, commit.timestamp
+        ('abc', 'Ann', 1700000000)
+        >>> commit.changes[1]
+        GitChange(status='R', path='c.md', previous_path='b.md')
+    """
+    header, _, body = record.partition(_NUL)
+    sha, author, timestamp = header.split(_FIELD)
+    tokens = body.lstrip(b"\n").split(_NUL)
+    changes = []
+    position = 0
+    while position < len(tokens) - 1:
+        status = tokens[position][:1]
+        if status in _COPY_OR_RENAME:
+            previous, path = tokens[position + 1], tokens[position + 2]
+            changes.append(
+                GitChange(status.decode(), os.fsdecode(path), os.fsdecode(previous))
+            )
+            position += 3
+        else:
+            path = tokens[position + 1]
+            changes.append(GitChange(status.decode(), os.fsdecode(path), None))
+            position += 2
+    return GitCommit(
+        sha.decode(), author.decode(errors="replace"), int(timestamp), changes
+    )
+
+
+class GitService:
+    """Service running git commands in a working tree."""
+
+    def __init__(self, working_directory: Path | None = None) -> None:
+        """Initialize the git service.
+
+        Args:
+            working_directory: Directory git runs in, the current directory
+                if None
+        """
+        self.working_directory = working_directory
+
+    def staged_files(self, pathspec: Path | None = None) -> list[Path]:
+        """List the files added, copied, modified or renamed in the index.
+
+        Args:
+            pathspec: Only list files under this path
+
+        Returns:
+            Staged paths relative to the working directory
+
+        Raises:
+            GitCommandError: If git is missing or the command fails
+        """
+        return list(self.staged_blobs(pathspec))
+
+    def staged_blobs(self, pathspec: Path | None = None) -> dict[Path, str]:
+        """Get the index blob of every added, copied, modified or renamed file.
+
+        Runs a single ``git diff --cached --raw``; deleted files are left
+        out. The blob is the content that will be committed, which differs
+        from the working tree for a partially staged file.
+
+        Args:
+            pathspec: Only list files under this path
+
+        Returns:
+            Blob SHA of each staged path, relative to the working directory
+
+        Raises:
+            GitCommandError: If git is missing or the command fails
+        """
+        arguments = [
+            "diff",
+            "--cached",
+            "--raw",
+            "--no-abbrev",
+            "--no-renames",
+            "-z",
+            "--relative",
+            "--diff-filter=d",
+        ]
+        if pathspec is not None:
+            arguments += ["--", str(pathspec)]
+        tokens = self._run(arguments).split(_NUL)
+        # Records are ":<modes> <source> <destination> <status>" then the path
+        return {
+            Path(os.fsdecode(path)): header.split()[3].decode()
+            for header, path in zip(tokens[0:-1:2], tokens[1::2], strict=True)
+        }
+
+    def head(self, directory: Path | None = None) -> str | None:
+        """Get the commit checked out in the repository of a directory.
+
+        Args:
+            directory: Directory inside the repository, the working
+                directory if None
+
+        Returns:
+            Full SHA of HEAD, None if the repository has no commit yet
+
+        Raises:
+            GitCommandError: If git is missing or the directory is not in a
+                repository
+        """
+        completed = self._execute(
+            ["rev-parse", "--verify", "--quiet", "HEAD^{commit}"], directory
+        )
+        if completed.returncode == 0:
+            return completed.stdout.decode().strip()
+        # --verify --quiet fails silently only for an unborn HEAD
+        if not completed.stderr:
+            return None
+        raise self._error(completed)
+
+    def is_ancestor(
+        self, commit: str, descendant: str, directory: Path | None = None
+    ) -> bool:
+        """Check whether a commit exists and is an ancestor of another."""
+        completed = self._execute(
+            ["merge-base", "--is-ancestor", commit, descendant], directory
+        )
+        return completed.returncode == 0
+
+    def log_changes(
+        self, directory: Path, since: str | None = None
+    ) -> Iterator[GitCommit]:
+        """Stream the commits that changed files under a directory.
+
+        A single ``git log --name-status`` runs for the whole directory and
+        its output is parsed while it is being produced. Merge commits are
+        not listed, as their changes are already in the merged commits.
+
+        Args:
+            directory: Directory whose files are followed; changed paths are
+                relative to it
+            since: Only list commits after this one, every commit if None
+
+        Yields:
+            Commits from oldest to newest
+
+        Raises:
+            GitCommandError: If git is missing or the command fails
+        """
+        arguments = [
+            "log",
+            "--reverse",
+            "--name-status",
+            "-z",
+            "--relative",
+            _LOG_FORMAT,
+            f"{since}..HEAD" if since else "HEAD",
+            "--",
+            ".",
+        ]
+        with self._spawn(arguments, directory) as process:
+            yield from self._read_records(process.stdout)
+            self._wait(process)
+
+    def resolve_commit(self, revision: str, directory: Path | None = None) -> str:
+        """Get the full SHA of the commit a revision names.
+
+        Args:
+            revision: Commit, tag, branch or any other git revision
+            directory: Directory inside the repository, the working
+                directory if None
+
+        Raises:
+            GitCommandError: If the revision names no commit
+        """
+        arguments = ["rev-parse", "--verify", "--quiet", f"{revision}^{{commit}}"]
+        completed = self._execute(arguments, directory)
+        if completed.returncode == 0:
+            return completed.stdout.decode().strip()
+        if completed.stderr:
+            raise self._error(completed)
+        raise GitCommandError(arguments[0], f"unknown revision {revision!r}")
+
+    def list_tree(self, revision: str, directory: Path) -> dict[str, str]:
+        """List the files directly inside a directory at a revision.
+
+        Args:
+            revision: Commit whose tree is read
+            directory: Directory to list, as in the working tree
+
+        Returns:
+            Blob SHA of each file, keyed by file name; empty if the
+            directory does not exist at the revision
+
+        Raises:
+            GitCommandError: If git is missing or the command fails
+        """
+        output = self._run(["ls-tree", "-z", revision, "--", f"{directory}/"])
+        files = {}
+        for entry in output.split(_NUL):
+            metadata, _, path = entry.partition(b"\t")
+            if not path:
+                continue
+            _, kind, sha = metadata.split(b" ")
+            if kind == _BLOB:
+                files[os.fsdecode(path).rpartition("/")[2]] = sha.decode()
+        return files
+
+    def read_blobs(
+        self, shas: list[str], directory: Path | None = None
+    ) -> Iterator[tuple[str, bytes]]:
+        """Stream the content of blobs from a single ``git cat-file --batch``.
+
+        Object names are fed to the process from a background thread while
+        its output is read, so neither side waits on a full pipe.
+
+        Args:
+            shas: Blob SHAs to read
+            directory: Directory inside the repository, the working
+                directory if None
+
+        Yields:
+            SHA and content of each blob, in the order of ``shas``
+
+        Raises:
+            GitCommandError: If git is missing, the command fails or a blob
+                does not exist
+        """
+        arguments = ["cat-file", "--batch"]
+        with self._spawn(arguments, directory, feed=shas) as process:
+            stdout = process.stdout
+            if stdout is None:
+                return
+            for header in iter(stdout.readline, b""):
+                sha, kind, *size = header.split()
+                if kind == _MISSING:
+                    raise GitCommandError(arguments[0], f"{sha.decode()} missing")
+                content = stdout.read(int(size[0]))
+                stdout.read(1)
+                yield sha.decode(), content
+            self._wait(process)
+
+    def _spawn(
+        self,
+        arguments: list[str],
+        directory: Path | None,
+        feed: list[str] | None = None,
+    ) -> "subprocess.Popen[bytes]":
+        """Start a git command whose output is read as it is produced.
+
+        Args:
+            arguments: Git command and its arguments
+            directory: Directory git runs in, the working directory if None
+            feed: Lines written to the standard input from a background
+                thread, no standard input if None
+        """
+        try:
+            process = subprocess.Popen(  # noqa: S603
+                ["git", *arguments],  # noqa: S607
+                cwd=directory or self.working_directory,
+                stdin=subprocess.DEVNULL if feed is None else subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        except FileNotFoundError as e:
+            raise GitCommandError(arguments[0], "git is not installed") from e
+        if feed is not None:
+            threading.Thread(
+                target=self._feed, args=(process.stdin, feed), daemon=True
+            ).start()
+        return process
+
+    @staticmethod
+    def _feed(stream: IO[bytes] | None, lines: list[str]) -> None:
+        """Write lines to a process and close its input."""
+        if stream is None:
+            return
+        try:
+            with stream:
+                for line in lines:
+                    stream.write(f"{line}\n".encode())
+        except (BrokenPipeError, ValueError):
+            # The reader stopped early and the process went away
+            return
+
+    def _wait(self, process: "subprocess.Popen[bytes]") -> None:
+        """Wait for a spawned command and raise if it failed."""
+        stderr = process.stderr.read() if process.stderr else b""
+        if process.wait() != 0:
+            raise self._error(
+                subprocess.CompletedProcess(
+                    process.args, process.returncode, b"", stderr
+                )
+            )
+
+    @staticmethod
+    def _read_records(stream: IO[bytes] | None) -> Iterator[GitCommit]:
+        """Parse log records as chunks of output arrive."""
+        if stream is None:
+            return
+        pending = b""
+        for chunk in iter(lambda: stream.read(READ_CHUNK), b""):
+            records = (pending + chunk).split(_RECORD)
+            pending = records.pop()
+            for record in records:
+                if record:
+                    yield _parse_commit(record)
+        if pending:
+            yield _parse_commit(pending)
+
+    def _run(self, arguments: list[str]) -> bytes:
+        """Run a git command and return its standard output."""
+        completed = self._execute(arguments, self.working_directory)
+        if completed.returncode != 0:
+            raise self._error(completed)
+        return completed.stdout
+
+    def _execute(
+        self, arguments: list[str], directory: Path | None
+    ) -> "subprocess.CompletedProcess[bytes]":
+        """Run a git command, whatever its exit status."""
+        try:
+            return subprocess.run(  # noqa: S603
+                ["git", *arguments],  # noqa: S607
+                cwd=directory or self.working_directory,
+                capture_output=True,
+                check=False,
+            )
+        except FileNotFoundError as e:
+            raise GitCommandError(arguments[0], "git is not installed") from e
+
+    @staticmethod
+    def _error(completed: "subprocess.CompletedProcess[bytes]") -> GitCommandError:
+        """Describe a failed command by the first line of its error output."""
+        # Usage text may follow the line naming the problem
+        lines = completed.stderr.decode(errors="replace").strip().splitlines()
+        return GitCommandError(
+            completed.args[1], lines[0] if lines else f"exit {completed.returncode}"
+        )
@@ -0,0 +1,64 @@
+"""Offline feature-hashing text embedder."""
+
+import itertools
+import math
+import re
+import zlib
+from collections.abc import Sequence
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+DEFAULT_DIMENSIONS = 256
+
+
+class HashingEmbedder:
+    """Deterministic embedder hashing unigrams and bigrams into a vector.
+
+    It needs no model download or network access, which makes it suitable
+    as the default offline embedder and for tests. Terms are mapped to a
+    signed bucket with CRC32, so results are stable across processes.
+    """
+
+    def __init__(self, dimensions: int = DEFAULT_DIMENSIONS) -> None:
+        """Initialize the embedder.
+
+        Args:
+            dimensions: Length of the produced vectors
+        """
+        self._dimensions = dimensions
+
+    @property
+    def name(self) -> str:
+        """Identifier of the model and its settings, used in cache keys."""
+        return f"hashing-{self._dimensions}"
+
+    @property
+    def dimensions(self) -> int:
+        """Length of the produced vectors."""
+        return self._dimensions
+
+    def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed texts into unit-length vectors, one per text."""
+        return [self.embed_one(text) for text in texts]
+
+    def embed_one(self, text: str) -> list[float]:
+        """Embed a single text.
+
+        Examples:
+            >>> vector = HashingEmbedder(dimensions=8).embed_one("use uv")
+            >>> round(sum(value * value for value in vector), 6)
+            1.0
+            >>> HashingEmbedder(dimensions=8).embed_one("")
+            [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+        """
+        vector = [0.0] * self._dimensions
+        tokens = _TOKEN_PATTERN.findall(text.lower())
+        terms = tokens + [f"{a} {b}" for a, b in itertools.pairwise(tokens)]
+        for term in terms:
+            digest = zlib.crc32(term.encode())
+            sign = 1.0 if digest & 0x80000000 else -1.0
+            vector[digest % self._dimensions] += sign
+
+        norm = math.sqrt(sum(value * value for value in vector))
+        if norm == 0:
+            return vector
+        return [value / norm for value in vector]
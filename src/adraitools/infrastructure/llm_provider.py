@@ -0,0 +1,18 @@
+"""LLM provider interface."""
+
+from collections.abc import Iterator
+from typing import Protocol
+
+from adraitools.services.models.llm import LlmRequest, LlmResponse
+
+
+class LlmProvider(Protocol):
+    """Interface implemented by LLM providers and provider wrappers."""
+
+    def complete(self, request: LlmRequest) -> LlmResponse:
+        """Send a request and return the complete response."""
+        ...
+
+    def stream(self, request: LlmRequest) -> Iterator[str]:
+        """Send a request and yield response text chunks as they arrive."""
+        ...
@@ -0,0 +1,62 @@
+"""Factory for configured LLM providers."""
+
+from adraitools.infrastructure.circuit_breaker import CircuitBreaker
+from adraitools.infrastructure.coalescing_llm_provider import CoalescingLlmProvider
+from adraitools.infrastructure.llm_provider import LlmProvider
+from adraitools.infrastructure.logging_service import LoggingService
+from adraitools.infrastructure.openai_llm_provider import OpenAiCompatibleLlmProvider
+from adraitools.infrastructure.resilient_llm_provider import ResilientLlmProvider
+from adraitools.services.models.configuration import AdrConfiguration
+
+
+class LlmProviderFactory:
+    """Service for creating the LLM provider selected by the configuration."""
+
+    @staticmethod
+    def create(
+        configuration: AdrConfiguration, logging_service: LoggingService | None = None
+    ) -> LlmProvider:
+        """Create the LLM provider for a configuration.
+
+        The provider is wrapped with a circuit breaker for its endpoint and,
+        unless disabled, request hedging. In front of both, identical
+        concurrent requests share a single upstream call.
+
+        Args:
+            configuration: Application configuration
+            logging_service: Service logging circuit transitions and hedges
+
+        Returns:
+            Provider ready to send requests
+        """
+        provider: LlmProvider
+        if configuration.llm_provider == "mock":
+            from adraitools.infrastructure.mock_llm_provider import (  # noqa: PLC0415
+                MOCK_MODEL,
+                MockLlmProvider,
+            )
+
+            provider = MockLlmProvider(configuration.mock_llm_settings())
+            endpoint = MOCK_MODEL
+        else:
+            provider = OpenAiCompatibleLlmProvider(
+                base_url=configuration.llm_base_url,
+                model=configuration.llm_model,
+                api_key=configuration.llm_api_key,
+            )
+            endpoint = provider.endpoint
+
+        logging_service = logging_service or LoggingService()
+        return CoalescingLlmProvider(
+            ResilientLlmProvider(
+                provider,
+                CircuitBreaker(
+                    endpoint,
+                    logging_service,
+                    failure_threshold=configuration.llm_circuit_failure_threshold,
+                    reset_timeout=configuration.llm_circuit_reset_seconds,
+                ),
+                logging_service,
+                hedging=configuration.llm_hedging,
+            )
+        )
@@ -1,8 +1,196 @@
 """Logging service for application-wide logging operations."""
 
+import atexit
+import gzip
+import json
 import logging
+import queue
+import random
+import shutil
 import sys
+import threading
+import time
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
 from pathlib import Path
+from typing import Literal
+
+from adraitools.infrastructure.span_recorder import RECORDER, Span, SpanExporter
+from adraitools.services.models.log_file import LogFileSettings
+from adraitools.services.models.timing import SpanTiming
+
+OverflowPolicy = Literal["block", "drop"]
+LogFormat = Literal["text", "json"]
+# Field values that are zero-argument callables are called once the record
+# passes the level filter, so they cost nothing while their level is disabled
+LogFields = Mapping[str, object]
+DEFAULT_LOG_QUEUE_SIZE = 10_000
+DEFAULT_RATE_LIMIT_PERIOD_SECONDS = 60.0
+FIELDS_ATTRIBUTE = "fields"
+_SUPPRESSED_NOUNS = {
+    logging.DEBUG: "debug records",
+    logging.INFO: "info records",
+    logging.WARNING: "warnings",
+    logging.ERROR: "errors",
+    logging.CRITICAL: "critical errors",
+}
+
+
+def _resolve_fields(fields: LogFields) -> dict[str, object]:
+    """Call the lazy values of fields.
+
+    Examples:
+        >>> _resolve_fields({"adr": "0001", "chunks": lambda: 3})
+        {'adr': '0001', 'chunks': 3}
+    """
+    return {
+        name: value() if callable(value) else value for name, value in fields.items()
+    }
+
+
+def _record_fields(record: logging.LogRecord) -> LogFields:
+    """Get the fields attached to a record, resolved when it was logged."""
+    return getattr(record, FIELDS_ATTRIBUTE, None) or {}
+
+
+class _TextFormatter(logging.Formatter):
+    """Formatter appending the fields of a record as ``name=value`` pairs."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record and its fields on one line."""
+        text = super().format(record)
+        fields = _record_fields(record)
+        if not fields:
+            return text
+        return " ".join([text, *(f"{name}={value}" for name, value in fields.items())])
+
+
+class _JsonFormatter(logging.Formatter):
+    """Formatter writing every record as one JSON object.
+
+    Objects carry the time, level, logger, message and milliseconds since
+    start-up, then the context fields of the service and the fields of the
+    record. Values JSON cannot represent are written as strings.
+    """
+
+    def __init__(self, context: Mapping[str, object]) -> None:
+        """Initialize the formatter.
+
+        Args:
+            context: Fields added to every record, read when formatting
+        """
+        super().__init__()
+        self.context = context
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as a JSON object."""
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, UTC)
+            .isoformat(timespec="milliseconds")
+            .replace("+00:00", "Z"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "elapsed_ms": round(record.relativeCreated, 3),
+            **self.context,
+            **_record_fields(record),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def _gzip_name(name: str) -> str:
+    """Name a rotated log file as compressed."""
+    return f"{name}.gz"
+
+
+def _gzip_rotator(source: str, destination: str) -> None:
+    """Rotate a log file by compressing it instead of renaming it."""
+    with Path(source).open("rb") as f_in, gzip.open(destination, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    Path(source).unlink()
+
+
+class _BufferingHandler(MemoryHandler):
+    """Memory handler that also writes its buffer at a fixed interval.
+
+    Records are written when the buffer is full, when an ERROR or worse
+    record arrives, and from a background thread at least once per
+    interval, so records of a quiet long-running process still reach the
+    file. Closing the handler writes what is left.
+    """
+
+    def __init__(
+        self, target: logging.Handler, capacity: int, interval_seconds: float
+    ) -> None:
+        """Initialize the handler and start the interval flushes."""
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target)
+        self.interval_seconds = interval_seconds
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="adraitools-log-flush", daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_periodically(self) -> None:
+        """Write the buffer every interval until the handler is closed."""
+        while not self._closed.wait(self.interval_seconds):
+            self.flush()
+
+    def close(self) -> None:
+        """Stop the interval flushes and write the remaining records."""
+        self._closed.set()
+        super().close()
+
+
+class _BoundedQueueHandler(QueueHandler):
+    """Queue handler applying an overflow policy when the queue is full.
+
+    With "block" the logging thread waits for the listener to make room,
+    so no record is lost; with "drop" the record is discarded and counted.
+    """
+
+    def __init__(
+        self, log_queue: "queue.Queue[logging.LogRecord]", overflow: OverflowPolicy
+    ) -> None:
+        """Initialize the handler."""
+        super().__init__(log_queue)
+        self.log_queue = log_queue
+        self.overflow = overflow
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Pass the record on as is, to be formatted by the listener thread.
+
+        The queue never leaves the process, so the record does not need to
+        be flattened into a picklable message first.
+        """
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put a record on the queue according to the overflow policy."""
+        if self.overflow == "block":
+            self.log_queue.put(record)
+            return
+        try:
+            self.log_queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _DrainingQueueListener(QueueListener):
+    """Queue listener whose stop waits for room in a full queue."""
+
+    def enqueue_sentinel(self) -> None:
+        """Queue the stop marker behind every pending record."""
+        self.queue.put(self._sentinel)  # type: ignore[attr-defined]
 
 
 class LoggingService:
@@ -12,14 +200,31 @@ class LoggingService:
         """Initialize the logging service."""
         self._configured = False
         self._default_logger: logging.Logger
+        self._queue_handler: _BoundedQueueHandler | None = None
+        self._listener: QueueListener | None = None
+        self._file_handler: logging.Handler | None = None
+        self.context: dict[str, object] = {}
+        self.span_recorder = RECORDER
+        self.rate_limit: int | None = None
+        self.rate_limit_period_seconds = DEFAULT_RATE_LIMIT_PERIOD_SECONDS
+        self.debug_sample_rate = 1.0
+        self._random = random.Random()  # noqa: S311
+        # Message key -> [end of the current window, records left in it]
+        self._windows: dict[str, list[float]] = {}
+        self._suppressed: dict[tuple[str, int], int] = {}
+        self._sampled_out = 0
 
-    def configure_logging(
+    def configure_logging(  # noqa: PLR0913
         self,
         level: str = "INFO",
         log_file: Path | None = None,
         format_string: str | None = None,
         *,
         quiet: bool = False,
+        queue_size: int | None = None,
+        overflow: OverflowPolicy = "block",
+        log_format: LogFormat = "text",
+        file_settings: LogFileSettings | None = None,
     ) -> None:
         """Configure application logging settings.
 
@@ -28,7 +233,17 @@ class LoggingService:
             log_file: Optional file path for log output
             format_string: Optional custom log format
             quiet: Whether to suppress most log output
+            queue_size: Write the log file from a background thread through
+                a queue of at most this many records; synchronous if None
+            overflow: What logging does when the queue is full, wait for
+                room ("block") or discard the record ("drop")
+            log_format: Write records as text lines or as JSON objects
+                with the context fields
+            file_settings: Rotation and buffering of the log file; a single
+                file written record by record if None
         """
+        self.shutdown()
+
         # Determine logging level
         if quiet:
             numeric_level = logging.CRITICAL
@@ -45,17 +260,23 @@ class LoggingService:
         # Always add console handler
         console_handler = logging.StreamHandler(sys.stderr)
         console_handler.setLevel(numeric_level)
-        console_handler.setFormatter(logging.Formatter(format_string))
+        console_handler.setFormatter(self._formatter(log_format, format_string))
         handlers.append(console_handler)
 
         # Add file handler if specified
         if log_file:
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setLevel(logging.DEBUG)  # Always log debug to file
-            file_handler.setFormatter(
-                logging.Formatter("%(asctime)s - %(levelname)s: %(message)s")
+            file_handler = self._open_log_file(
+                log_file,
+                file_settings or LogFileSettings(),
+                self._formatter(log_format, "%(asctime)s - %(levelname)s: %(message)s"),
             )
-            handlers.append(file_handler)
+            file_handler.setLevel(logging.DEBUG)  # Always log debug to file
+            if queue_size is None:
+                handlers.append(file_handler)
+            else:
+                handlers.append(
+                    self._start_listener(file_handler, queue_size, overflow)
+                )
 
         # Configure root logger
         logging.basicConfig(
@@ -71,6 +292,176 @@ class LoggingService:
         if level.upper() == "DEBUG":
             self._default_logger.debug("Debug logging enabled")
 
+    @staticmethod
+    def _open_log_file(
+        log_file: Path, settings: LogFileSettings, formatter: logging.Formatter
+    ) -> logging.Handler:
+        """Create the handler writing the log file.
+
+        Returns:
+            Handler writing to the file, rotating by size and buffering
+            records in memory as set
+        """
+        file_handler: logging.FileHandler
+        if settings.rotates:
+            file_handler = RotatingFileHandler(
+                log_file,
+                maxBytes=settings.max_bytes,
+                backupCount=settings.backup_count,
+            )
+            if settings.compress:
+                file_handler.namer = _gzip_name
+                file_handler.rotator = _gzip_rotator
+        else:
+            file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(formatter)
+        if not settings.buffers:
+            return file_handler
+        return _BufferingHandler(
+            file_handler, settings.buffer_records, settings.flush_interval_seconds
+        )
+
+    def _formatter(
+        self, log_format: LogFormat, format_string: str
+    ) -> logging.Formatter:
+        """Create the formatter of a handler."""
+        if log_format == "json":
+            return _JsonFormatter(self.context)
+        return _TextFormatter(format_string)
+
+    def configure_limits(
+        self,
+        rate_limit: int | None = None,
+        *,
+        period_seconds: float = DEFAULT_RATE_LIMIT_PERIOD_SECONDS,
+        debug_sample_rate: float = 1.0,
+        seed: int | None = None,
+    ) -> None:
+        """Limit the records of bulk operations.
+
+        Args:
+            rate_limit: Records written per message key and period; records
+                logged with a key beyond it are suppressed and counted.
+                Records without a key are never limited. Unlimited if None
+            period_seconds: Length of a rate limit window
+            debug_sample_rate: Share of DEBUG records written, picked at
+                random; the others are counted
+            seed: Seed of the sampling, for reproducible logs
+        """
+        self.rate_limit = rate_limit
+        self.rate_limit_period_seconds = period_seconds
+        self.debug_sample_rate = debug_sample_rate
+        self._random = random.Random(seed)  # noqa: S311
+        self._windows.clear()
+
+    @property
+    def suppressed(self) -> int:
+        """Number of records suppressed by rate limiting or sampling."""
+        return sum(self._suppressed.values()) + self._sampled_out
+
+    def report_suppressed(self) -> None:
+        """Log a summary line per message key that had records suppressed.
+
+        The summaries are written at the level of the suppressed records,
+        bypassing the limits, and the counts start again from zero.
+        """
+        self._ensure_configured()
+        suppressed, self._suppressed = self._suppressed, {}
+        for (key, level), count in suppressed.items():
+            self._default_logger.log(
+                level,
+                "Suppressed %s similar %s",
+                f"{count:,}",
+                _SUPPRESSED_NOUNS.get(level, "records"),
+                extra={FIELDS_ATTRIBUTE: {"key": key}},
+            )
+        if self._sampled_out:
+            self._default_logger.debug(
+                "Sampled out %s debug records", f"{self._sampled_out:,}"
+            )
+            self._sampled_out = 0
+
+    def enable_timings(self) -> None:
+        """Start recording the durations of instrumented spans."""
+        self.span_recorder.enabled = True
+
+    def enable_tracing(self, exporter: SpanExporter) -> None:
+        """Start handing every finished span to an exporter."""
+        self.span_recorder.exporter = exporter
+        self.span_recorder.enabled = True
+
+    def span(self, name: str) -> Span:
+        """Time a block of code as a span; does nothing unless enabled."""
+        return self.span_recorder.span(name)
+
+    def timings(self) -> list[SpanTiming]:
+        """Get the recorded span durations as a tree in depth-first order."""
+        return self.span_recorder.report()
+
+    def set_context(self, name: str, value: object) -> None:
+        """Add a field to every record written as JSON, e.g. the command."""
+        self.context[name] = value
+
+    def _start_listener(
+        self, file_handler: logging.Handler, queue_size: int, overflow: OverflowPolicy
+    ) -> logging.Handler:
+        """Move a handler behind a queue drained by a background thread.
+
+        Returns:
+            Handler putting records on the queue
+        """
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue(queue_size)
+        self._queue_handler = _BoundedQueueHandler(log_queue, overflow)
+        # The handler must not get basicConfig's formatter, which would
+        # format records on the logging thread
+        self._queue_handler.setFormatter(logging.Formatter("%(message)s"))
+        self._file_handler = file_handler
+        self._listener = _DrainingQueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self.shutdown)
+        return self._queue_handler
+
+    @property
+    def dropped(self) -> int:
+        """Number of records discarded because the log queue was full."""
+        return self._queue_handler.dropped if self._queue_handler else 0
+
+    def shutdown(self) -> None:
+        """Write out queued records and stop the background log writer.
+
+        Registered to run at exit; does nothing without a log queue. The
+        number of dropped records, if any, is written to the log file, and
+        records logged afterwards are written synchronously.
+        """
+        if (
+            self._listener is None
+            or self._queue_handler is None
+            or self._file_handler is None
+        ):
+            return
+        self._listener.stop()
+        root = logging.getLogger()
+        root.removeHandler(self._queue_handler)
+        root.addHandler(self._file_handler)
+        dropped = self.dropped
+        if dropped:
+            self._file_handler.handle(
+                logging.makeLogRecord(
+                    {
+                        "name": "adraitools",
+                        "levelno": logging.WARNING,
+                        "levelname": logging.getLevelName(logging.WARNING),
+                        "msg": f"Dropped {dropped} log records: the queue was full",
+                    }
+                )
+            )
+        self._file_handler.flush()
+        atexit.unregister(self.shutdown)
+        self._listener = None
+        self._file_handler = None
+
     def get_logger(self, name: str) -> logging.Logger:
         """Get a logger instance for the specified name.
 
@@ -90,27 +481,76 @@ class LoggingService:
         if not self._configured:
             self.configure_logging()
 
-    def log_debug(self, message: str) -> None:
-        """Log a debug message."""
-        self._ensure_configured()
-        self._default_logger.debug(message)
+    def _log(
+        self, level: int, message: str, fields: LogFields | None, key: str | None
+    ) -> None:
+        """Log a message, skipping all work when the level is disabled.
 
-    def log_info(self, message: str) -> None:
-        """Log an info message."""
+        Records over the rate limit of their key or sampled out are only
+        counted, before any record is created. Lazy fields are resolved
+        here, so they see the moment of logging even when the record is
+        written later by the log queue or the buffered file handler.
+        """
         self._ensure_configured()
-        self._default_logger.info(message)
+        if not self._default_logger.isEnabledFor(level):
+            return
+        if (
+            key is not None
+            and self.rate_limit is not None
+            and not self._admit(key, level)
+        ):
+            return
+        if (
+            level == logging.DEBUG
+            and self.debug_sample_rate < 1.0
+            and self._random.random() >= self.debug_sample_rate
+        ):
+            self._sampled_out += 1
+            return
+        extra = {FIELDS_ATTRIBUTE: _resolve_fields(fields)} if fields else None
+        self._default_logger.log(level, message, extra=extra)
 
-    def log_warning(self, message: str) -> None:
-        """Log a warning message."""
-        self._ensure_configured()
-        self._default_logger.warning(message)
+    def _admit(self, key: str, level: int) -> bool:
+        """Check the rate limit of a message key, counting suppressed records."""
+        window = self._windows.get(key)
+        if window is None or (window[1] <= 0 and time.monotonic() >= window[0]):
+            window = self._windows[key] = [
+                time.monotonic() + self.rate_limit_period_seconds,
+                self.rate_limit or 0,
+            ]
+        if window[1] > 0:
+            window[1] -= 1
+            return True
+        suppressed = (key, level)
+        self._suppressed[suppressed] = self._suppressed.get(suppressed, 0) + 1
+        return False
 
-    def log_error(self, message: str) -> None:
-        """Log an error message."""
-        self._ensure_configured()
-        self._default_logger.error(message)
+    def log_debug(
+        self, message: str, *, fields: LogFields | None = None, key: str | None = None
+    ) -> None:
+        """Log a debug message with optional context fields and message key."""
+        self._log(logging.DEBUG, message, fields, key)
 
-    def log_critical(self, message: str) -> None:
-        """Log a critical message."""
-        self._ensure_configured()
-        self._default_logger.critical(message)
+    def log_info(
+        self, message: str, *, fields: LogFields | None = None, key: str | None = None
+    ) -> None:
+        """Log an info message with optional context fields and message key."""
+        self._log(logging.INFO, message, fields, key)
+
+    def log_warning(
+        self, message: str, *, fields: LogFields | None = None, key: str | None = None
+    ) -> None:
+        """Log a warning message with optional context fields and message key."""
+        self._log(logging.WARNING, message, fields, key)
+
+    def log_error(
+        self, message: str, *, fields: LogFields | None = None, key: str | None = None
+    ) -> None:
+        """Log an error message with optional context fields and message key."""
+        self._log(logging.ERROR, message, fields, key)
+
+    def log_critical(
+        self, message: str, *, fields: LogFields | None = None, key: str | None = None
+    ) -> None:
+        """Log a critical message with optional context fields and message key."""
+        self._log(logging.CRITICAL, message, fields, key)
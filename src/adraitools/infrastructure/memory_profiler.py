@@ -0,0 +1,112 @@
+"""Allocation profiling of commands with tracemalloc."""
+
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    # Every pipeline stage imports this module; the models wait for stop()
+    from adraitools.services.models.memory import MemoryProfile
+
+DEFAULT_FRAMES = 16
+DEFAULT_TOP_MODULES = 10
+START_STAGE = "start"
+EXIT_STAGE = "exit"
+
+
+class _Checkpoint(NamedTuple):
+    """Snapshot file of the memory held at the end of a stage."""
+
+    stage: str
+    path: Path
+    peak_bytes: int
+
+
+class MemoryProfiler:
+    """Profiler snapshotting the traced memory between pipeline stages.
+
+    While started, tracemalloc records a traceback of every allocation.
+    A checkpoint only dumps a snapshot to a scratch file: attributing the
+    allocations to adraitools modules waits until tracing stopped, where
+    that work is not traced itself and cannot inflate the stages. While
+    stopped, ``checkpoint`` returns after one attribute check and
+    tracemalloc is not even imported, so normal runs pay nothing.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a stopped profiler."""
+        self.enabled = False
+        self._directory: Path | None = None
+        self._checkpoints: list[_Checkpoint] = []
+
+    def start(self, frames: int = DEFAULT_FRAMES) -> None:
+        """Start tracing allocations.
+
+        Args:
+            frames: Frames kept per allocation; call stacks deeper than this
+                may not reach an adraitools frame
+        """
+        import tracemalloc  # noqa: PLC0415
+
+        self._directory = Path(tempfile.mkdtemp(prefix="adraitools-memory-"))
+        self._checkpoints = []
+        tracemalloc.start(frames)
+        self.enabled = True
+        self.checkpoint(START_STAGE)
+
+    def checkpoint(self, stage: str) -> None:
+        """Snapshot the memory held at the end of a stage."""
+        if not self.enabled or self._directory is None:
+            return
+        import tracemalloc  # noqa: PLC0415
+
+        _, peak = tracemalloc.get_traced_memory()
+        path = self._directory / f"{len(self._checkpoints):04d}.snapshot"
+        snapshot = tracemalloc.take_snapshot()
+        snapshot.dump(str(path))
+        del snapshot
+        self._checkpoints.append(_Checkpoint(stage, path, peak))
+        # Snapshotting allocates; the next stage starts its own peak
+        tracemalloc.reset_peak()
+
+    def stop(self, top: int = DEFAULT_TOP_MODULES) -> "MemoryProfile":
+        """Stop tracing and get the profile of the stages.
+
+        Args:
+            top: Modules listed per stage and for the fullest stage
+
+        Returns:
+            Memory per stage and the modules holding the most, leaving out
+            the allocations of the profiler
+        """
+        import tracemalloc  # noqa: PLC0415
+
+        from adraitools.infrastructure.allocation_sites import (  # noqa: PLC0415
+            AllocationSites,
+        )
+
+        self.checkpoint(EXIT_STAGE)
+        tracemalloc.stop()
+        self.enabled = False
+        try:
+            return AllocationSites(ignored_module=__name__).profile(
+                self._checkpoints, top
+            )
+        finally:
+            if self._directory is not None:
+                shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+            self._checkpoints = []
+
+
+PROFILER = MemoryProfiler()
+
+
+def checkpoint(stage: str) -> None:
+    """Mark the end of a pipeline stage for the process-wide profiler.
+
+    Examples:
+        >>> checkpoint("load")
+    """
+    PROFILER.checkpoint(stage)
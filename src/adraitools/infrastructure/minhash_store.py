@@ -0,0 +1,56 @@
+"""MinHash signature persistence."""
+
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+from adraitools.services.models.index import MinHashState
+
+SIGNATURES_FILE = "minhash.npy"
+STATE_FILE = "minhash.json"
+
+
+class MinHashStore:
+    """Service persisting MinHash signatures next to the vector index.
+
+    Signatures are stored in NumPy ``.npy`` format, one row per ADR; the
+    row metadata and verified pairs live next to them as JSON.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize the store.
+
+        Args:
+            directory: Directory holding the index files
+        """
+        self.directory = directory
+
+    def exists(self) -> bool:
+        """Check whether signatures have been saved."""
+        return (self.directory / SIGNATURES_FILE).exists() and (
+            self.directory / STATE_FILE
+        ).exists()
+
+    def save(self, state: MinHashState, signatures: NDArray[np.uint32]) -> None:
+        """Replace the saved signatures.
+
+        Files are written next to their destination and renamed into place,
+        so concurrent readers never see partially written signatures.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        signatures_tmp = self.directory / f"{SIGNATURES_FILE}.tmp"
+        state_tmp = self.directory / f"{STATE_FILE}.tmp"
+        with signatures_tmp.open("wb") as f:
+            np.save(f, np.ascontiguousarray(signatures, dtype=np.uint32))
+        state_tmp.write_text(state.model_dump_json())
+        signatures_tmp.replace(self.directory / SIGNATURES_FILE)
+        state_tmp.replace(self.directory / STATE_FILE)
+
+    def load(self) -> tuple[MinHashState, NDArray[np.uint32]]:
+        """Read the saved state and signature matrix."""
+        signatures = np.load(self.directory / SIGNATURES_FILE)
+        state = MinHashState.model_validate_json(
+            (self.directory / STATE_FILE).read_bytes()
+        )
+        return state, signatures
@@ -0,0 +1,116 @@
+"""Deterministic offline LLM provider for tests and benchmarks."""
+
+import hashlib
+import math
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+
+from adraitools.exceptions import LlmProviderError
+from adraitools.services.models.llm import LlmRequest, LlmResponse, MockLlmSettings
+
+MOCK_MODEL = "mock"
+LOGNORMAL_SIGMA = 0.5
+HTTP_TOO_MANY_REQUESTS = 429
+HTTP_INTERNAL_SERVER_ERROR = 500
+_VOCABULARY = (  # noqa: SIM905 - reads as prose
+    "the decision keeps the architecture simple while the team adopts "
+    "consistent tooling for builds tests and releases because the context "
+    "favours maintainable services with clear ownership and documented "
+    "tradeoffs across every component"
+).split()
+
+
+class MockLlmProvider:
+    """LLM provider simulating a remote model without any network access.
+
+    Every request draws its latency, failure and answer from a random
+    generator seeded with the configured seed, the normalized request and
+    how often that request was seen before. Runs are therefore reproducible
+    regardless of how concurrent callers interleave.
+    """
+
+    def __init__(
+        self,
+        settings: MockLlmSettings,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the mock provider.
+
+        Args:
+            settings: Simulated latency, token rate and error behaviour
+            sleep: Function used to wait, replaceable in tests
+        """
+        self.settings = settings
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._occurrences: Counter[str] = Counter()
+
+    def complete(self, request: LlmRequest) -> LlmResponse:
+        """Simulate a request and return the complete response."""
+        tokens = self._start(request)
+        self.sleep(len(tokens) / self.settings.tokens_per_second)
+        return LlmResponse(text="".join(tokens).rstrip(), model=MOCK_MODEL)
+
+    def stream(self, request: LlmRequest) -> Iterator[str]:
+        """Simulate a request and yield the response token by token."""
+        tokens = self._start(request)
+        interval = 1 / self.settings.tokens_per_second
+        for position, token in enumerate(tokens):
+            if position:
+                self.sleep(interval)
+            yield token.rstrip() if position == len(tokens) - 1 else token
+
+    def _start(self, request: LlmRequest) -> list[str]:
+        """Wait for the first token, inject failures and draw the answer.
+
+        Raises:
+            LlmProviderError: If the request was chosen to fail
+        """
+        rng = self._random(request)
+        self._fail(rng)
+        self.sleep(self._latency_seconds(rng))
+        count = min(request.max_tokens, self.settings.response_tokens)
+        return [f"{rng.choice(_VOCABULARY)} " for _ in range(count)]
+
+    def _random(self, request: LlmRequest) -> random.Random:
+        """Create the generator of one request occurrence."""
+        key = request.normalized_key()
+        with self._lock:
+            occurrence = self._occurrences[key]
+            self._occurrences[key] += 1
+        material = f"{self.settings.seed}:{key}:{occurrence}".encode()
+        return random.Random(hashlib.sha256(material).digest())  # noqa: S311
+
+    def _fail(self, rng: random.Random) -> None:
+        """Raise the error a request was chosen to fail with, if any."""
+        draw = rng.random()
+        settings = self.settings
+        if draw < settings.rate_limit_rate:
+            msg = "simulated rate limit"
+            raise LlmProviderError(msg, status_code=HTTP_TOO_MANY_REQUESTS)
+        draw -= settings.rate_limit_rate
+        if draw < settings.server_error_rate:
+            msg = "simulated server error"
+            raise LlmProviderError(msg, status_code=HTTP_INTERNAL_SERVER_ERROR)
+        draw -= settings.server_error_rate
+        if draw < settings.timeout_rate:
+            self.sleep(settings.timeout_ms / 1000)
+            msg = "simulated timeout"
+            raise LlmProviderError(msg)
+
+    def _latency_seconds(self, rng: random.Random) -> float:
+        """Draw the time to first token from the configured distribution."""
+        mean = self.settings.latency_ms / 1000
+        distribution = self.settings.latency_distribution
+        if mean == 0 or distribution == "constant":
+            return mean
+        if distribution == "uniform":
+            return rng.uniform(0, 2 * mean)
+        if distribution == "exponential":
+            return rng.expovariate(1 / mean)
+        # Parameters chosen so the lognormal mean equals the configured mean
+        mu = math.log(mean) - LOGNORMAL_SIGMA**2 / 2
+        return rng.lognormvariate(mu, LOGNORMAL_SIGMA)
@@ -0,0 +1,122 @@
+"""LLM provider for OpenAI-compatible chat completion APIs."""
+
+import json
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from http.client import HTTPResponse
+from typing import Any
+
+from adraitools.exceptions import LlmDeadlineExceededError, LlmProviderError
+from adraitools.infrastructure.constants import LlmConstants
+from adraitools.services.models.llm import LlmRequest, LlmResponse
+
+_SSE_DATA_PREFIX = "data:"
+_SSE_DONE = "[DONE]"
+
+
+class OpenAiCompatibleLlmProvider:
+    """LLM provider speaking the OpenAI chat completions protocol.
+
+    Works with any gateway exposing ``POST {base_url}/chat/completions``,
+    including self-hosted model servers. Only the standard library is used.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        model: str,
+        api_key: str = "",
+        timeout: float = LlmConstants.DEFAULT_TIMEOUT_SECONDS,
+    ) -> None:
+        """Initialize the provider.
+
+        Args:
+            base_url: API base URL, e.g. ``https://api.openai.com/v1``
+            model: Model used when the request does not name one
+            api_key: Bearer token, omitted from requests when empty
+            timeout: Socket timeout in seconds
+
+        Raises:
+            ValueError: If the base URL is not an http(s) URL
+        """
+        if not base_url.startswith(("http://", "https://")):
+            msg = f"LLM base URL must start with http:// or https://: {base_url}"
+            raise ValueError(msg)
+        self.endpoint = f"{base_url.rstrip('/')}/chat/completions"
+        self.model = model
+        self.api_key = api_key
+        self.timeout = timeout
+
+    def complete(self, request: LlmRequest) -> LlmResponse:
+        """Send a request and return the complete response."""
+        with self._post(self._payload(request, stream=False), request) as response:
+            body = json.load(response)
+        try:
+            text = body["choices"][0]["message"]["content"] or ""
+        except (KeyError, IndexError, TypeError) as e:
+            msg = f"unexpected response body {body!r}"
+            raise LlmProviderError(msg) from e
+        return LlmResponse(text=text, model=body.get("model", self.model))
+
+    def stream(self, request: LlmRequest) -> Iterator[str]:
+        """Send a request and yield text deltas from the server-sent events."""
+        with self._post(self._payload(request, stream=True), request) as response:
+            for raw_line in response:
+                line = raw_line.decode("utf-8").strip()
+                if not line.startswith(_SSE_DATA_PREFIX):
+                    continue
+                data = line[len(_SSE_DATA_PREFIX) :].strip()
+                if data == _SSE_DONE:
+                    return
+                choices = json.loads(data).get("choices") or [{}]
+                delta = choices[0].get("delta", {}).get("content")
+                if delta:
+                    yield delta
+
+    def _payload(self, request: LlmRequest, *, stream: bool) -> dict[str, Any]:
+        """Build the chat completion payload for a request."""
+        messages = []
+        if request.system_prompt:
+            messages.append({"role": "system", "content": request.system_prompt})
+        messages.append({"role": "user", "content": request.prompt})
+        return {
+            "model": request.model or self.model,
+            "messages": messages,
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+            "stream": stream,
+        }
+
+    def _post(self, payload: dict[str, Any], request: LlmRequest) -> HTTPResponse:
+        """POST a payload and return the open response.
+
+        The socket timeout is shortened to the time left until the request
+        deadline, if that comes first.
+        """
+        timeout = self.timeout
+        remaining = request.remaining_seconds()
+        if remaining is not None:
+            if remaining <= 0:
+                raise LlmDeadlineExceededError
+            timeout = min(timeout, remaining)
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        http_request = urllib.request.Request(  # noqa: S310 - scheme validated
+            self.endpoint,
+            data=json.dumps(payload).encode("utf-8"),
+            headers=headers,
+            method="POST",
+        )
+        try:
+            response: HTTPResponse = urllib.request.urlopen(  # noqa: S310
+                http_request, timeout=timeout
+            )
+        except urllib.error.HTTPError as e:
+            raise LlmProviderError(str(e.reason), status_code=e.code) from e
+        except urllib.error.URLError as e:
+            raise LlmProviderError(str(e.reason)) from e
+        except TimeoutError as e:
+            raise LlmProviderError(str(e) or "timed out") from e
+        return response
@@ -0,0 +1,128 @@
+"""Span export to local files in the OTLP/JSON format."""
+
+import json
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+
+from adraitools import __version__
+from adraitools.infrastructure.span_recorder import AttributeValue, FinishedSpan
+
+DEFAULT_BATCH_SIZE = 512
+SCOPE_NAME = "adraitools"
+_SPAN_KIND_INTERNAL = 1
+_STATUS_ERROR = 2
+
+
+def otlp_attributes(
+    attributes: Mapping[str, AttributeValue],
+) -> list[dict[str, object]]:
+    """Encode attributes as OTLP/JSON key-value pairs.
+
+    Examples:
+        >>> otlp_attributes({"adr.files": 3, "cached": True})
+        [{'key': 'adr.files', 'value': {'intValue': '3'}}, \
+{'key': 'cached', 'value': {'boolValue': True}}]
+    """
+    encoded: list[dict[str, object]] = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            typed: dict[str, object] = {"boolValue": value}
+        elif isinstance(value, int):
+            # 64-bit integers are strings in the JSON mapping of protobuf
+            typed = {"intValue": str(value)}
+        elif isinstance(value, float):
+            typed = {"doubleValue": value}
+        else:
+            typed = {"stringValue": value}
+        encoded.append({"key": key, "value": typed})
+    return encoded
+
+
+class OtlpJsonFileExporter:
+    """Span exporter appending OTLP/JSON trace requests to a file.
+
+    The file follows the OpenTelemetry file exporter layout: one
+    ``ExportTraceServiceRequest`` JSON object per line, so traces of many
+    runs can share a file and be replayed into any OTLP-capable backend
+    without a collector. Spans are buffered and encoded in batches; the
+    file is only opened when a batch is written.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        trace_id: str,
+        resource: Mapping[str, AttributeValue],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Initialize the exporter.
+
+        Args:
+            path: Trace file, created with its parent directory if missing
+            trace_id: 32 hex digit trace ID shared by the exported spans
+            resource: Attributes of the process producing the spans
+            batch_size: Spans buffered before a batch is written
+        """
+        self.path = path
+        self.trace_id = trace_id
+        self.resource = resource
+        self.batch_size = batch_size
+        self._buffer: list[FinishedSpan] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: FinishedSpan) -> None:
+        """Buffer a finished span, writing a batch when the buffer is full."""
+        with self._lock:
+            self._buffer.append(span)
+            if len(self._buffer) < self.batch_size:
+                return
+            batch, self._buffer = self._buffer, []
+        self._write(batch)
+
+    def flush(self) -> None:
+        """Write the buffered spans, if any, as one request line."""
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+        if batch:
+            self._write(batch)
+
+    def encode(self, batch: list[FinishedSpan]) -> dict[str, object]:
+        """Build the OTLP/JSON trace request of a batch of spans."""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": otlp_attributes(self.resource)},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": SCOPE_NAME, "version": __version__},
+                            "spans": [self._encode_span(span) for span in batch],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def _encode_span(self, span: FinishedSpan) -> dict[str, object]:
+        """Encode one span; IDs are hex strings and times decimal strings."""
+        encoded: dict[str, object] = {
+            "traceId": self.trace_id,
+            "spanId": f"{span.span_id:016x}",
+            "name": span.name,
+            "kind": _SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(span.start_unix_ns),
+            "endTimeUnixNano": str(span.end_unix_ns),
+            "attributes": otlp_attributes(span.attributes),
+        }
+        if span.parent_id is not None:
+            encoded["parentSpanId"] = f"{span.parent_id:016x}"
+        if span.error is not None:
+            encoded["status"] = {"code": _STATUS_ERROR, "message": span.error}
+        return encoded
+
+    def _write(self, batch: list[FinishedSpan]) -> None:
+        """Append one request line to the trace file."""
+        line = json.dumps(self.encode(batch), separators=(",", ":"))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, self.path.open("a", encoding="utf-8") as f:
+            f.write(line + "\n")
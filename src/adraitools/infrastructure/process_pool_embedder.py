@@ -0,0 +1,129 @@
+"""Multi-process embedding with results in shared memory."""
+
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+from numpy.typing import NDArray
+
+from adraitools.infrastructure.embedder import Embedder
+
+DEFAULT_BATCH_SIZE = 256
+_FLOAT32_BYTES = 4
+
+# Per-process state of pool workers, set by _attach_worker
+_worker_embedder: Embedder | None = None
+_worker_memory: SharedMemory | None = None
+
+
+def _attach_worker(embedder: Embedder, memory_name: str) -> None:
+    """Attach a pool worker to the embedder and the shared result matrix."""
+    global _worker_embedder, _worker_memory  # noqa: PLW0603
+    _worker_embedder = embedder
+    # Workers share the parent's resource tracker, whatever the start
+    # method, so the parent's unlink() is the only cleanup the segment needs
+    _worker_memory = SharedMemory(name=memory_name)
+
+
+def _embed_rows(first_row: int, texts: list[str]) -> int:
+    """Embed texts and write the vectors into rows of the shared matrix."""
+    if _worker_embedder is None or _worker_memory is None:
+        msg = "embedding worker is not attached to shared memory"
+        raise RuntimeError(msg)
+    dimensions = _worker_embedder.dimensions
+    rows: NDArray[np.float32] = np.ndarray(
+        (len(texts), dimensions),
+        dtype=np.float32,
+        buffer=_worker_memory.buf,
+        offset=first_row * dimensions * _FLOAT32_BYTES,
+    )
+    rows[:] = _worker_embedder.embed(texts)
+    del rows
+    return len(texts)
+
+
+class ProcessPoolEmbedder:
+    """Embedder running another embedder across a pool of processes.
+
+    Workers write their vectors straight into a float32 matrix in
+    ``multiprocessing.shared_memory`` and only return row counts, so no
+    vectors are pickled back to the parent process. The wrapped embedder
+    must be picklable.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        workers: int | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Initialize the pool embedder.
+
+        Args:
+            embedder: Embedder run inside every worker
+            workers: Number of worker processes, CPU count if None
+            batch_size: Texts sent to a worker per task
+        """
+        self.embedder = embedder
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+
+    @property
+    def name(self) -> str:
+        """Identifier of the wrapped model, used in cache keys."""
+        return self.embedder.name
+
+    @property
+    def dimensions(self) -> int:
+        """Length of the produced vectors."""
+        return self.embedder.dimensions
+
+    def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed texts into unit-length vectors, one per text."""
+        return self.embed_matrix(texts).tolist()  # type: ignore[no-any-return]
+
+    def embed_matrix(self, texts: Sequence[str]) -> NDArray[np.float32]:
+        """Embed texts into a float32 matrix with one row per text.
+
+        Inputs that fit into a single batch are embedded in-process, since
+        starting workers would cost more than it saves.
+        """
+        shape = (len(texts), self.dimensions)
+        if self.workers <= 1 or len(texts) <= self.batch_size:
+            matrix = np.zeros(shape, dtype=np.float32)
+            if texts:
+                matrix[:] = self.embedder.embed(texts)
+            return matrix
+
+        memory = SharedMemory(create=True, size=shape[0] * shape[1] * _FLOAT32_BYTES)
+        try:
+            self._run_workers(texts, memory.name)
+            shared: NDArray[np.float32] = np.ndarray(
+                shape, dtype=np.float32, buffer=memory.buf
+            )
+            matrix = shared.copy()
+            # The view must be released before the segment can be closed
+            del shared
+        finally:
+            memory.close()
+            memory.unlink()
+        return matrix
+
+    def _run_workers(self, texts: Sequence[str], memory_name: str) -> None:
+        """Embed all texts into the shared segment using the process pool."""
+        batches = range(0, len(texts), self.batch_size)
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(batches)),
+            initializer=_attach_worker,
+            initargs=(self.embedder, memory_name),
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _embed_rows, start, list(texts[start : start + self.batch_size])
+                )
+                for start in batches
+            ]
+            for future in futures:
+                future.result()
@@ -0,0 +1,339 @@
+"""LLM provider wrapper adding a circuit breaker, hedging and deadlines."""
+
+import math
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Generic, TypeVar
+
+from adraitools.exceptions import (
+    CircuitOpenError,
+    LlmDeadlineExceededError,
+    LlmProviderError,
+)
+from adraitools.infrastructure.circuit_breaker import CircuitBreaker
+from adraitools.infrastructure.constants import LlmConstants
+from adraitools.infrastructure.llm_provider import LlmProvider
+from adraitools.infrastructure.logging_service import LoggingService
+from adraitools.infrastructure.span_recorder import span
+from adraitools.services.models.llm import LlmRequest, LlmResponse
+
+DEFAULT_MAX_WORKERS = 8
+HTTP_TOO_MANY_REQUESTS = 429
+HTTP_SERVER_ERROR = 500
+
+T = TypeVar("T")
+_Work = tuple[Future[Any], Callable[[], Any]]
+
+
+def counts_as_upstream_failure(error: LlmProviderError) -> bool:
+    """Check whether an error says the endpoint is unhealthy.
+
+    Rate limiting, server errors and transport failures count; other client
+    errors (e.g. 400 or 401) are the caller's fault and do not, and neither
+    does a caller deadline passing, however short it was.
+    """
+    if isinstance(error, CircuitOpenError | LlmDeadlineExceededError):
+        return False
+    status = error.status_code
+    return (
+        status is None
+        or status == HTTP_TOO_MANY_REQUESTS
+        or status >= HTTP_SERVER_ERROR
+    )
+
+
+class LatencyWindow:
+    """Rolling window of recent call latencies in seconds."""
+
+    def __init__(
+        self,
+        size: int = LlmConstants.LATENCY_WINDOW,
+        min_samples: int = LlmConstants.HEDGE_MIN_SAMPLES,
+    ) -> None:
+        """Initialize the window.
+
+        Args:
+            size: Number of latencies kept
+            min_samples: Latencies needed before quantiles are reported
+        """
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """Add a latency to the window."""
+        with self._lock:
+            self._samples.append(seconds)
+
+    def quantile(self, fraction: float) -> float | None:
+        """Get a nearest-rank quantile, None until enough samples exist."""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+class _DaemonThreadPool:
+    """Thread pool whose idle and abandoned workers never block exit.
+
+    ``ThreadPoolExecutor`` joins its workers at interpreter exit, so an
+    attempt that lost a hedge race or outlived its deadline would keep the
+    process alive until the upstream call returns. These workers are
+    daemon threads, started on demand up to a maximum.
+    """
+
+    def __init__(self, max_workers: int, name: str) -> None:
+        """Initialize the pool without starting any worker."""
+        self.max_workers = max_workers
+        self.name = name
+        # Queued futures and their calls; None stops a worker
+        self._work: queue.SimpleQueue[_Work | None] = queue.SimpleQueue()
+        self._idle = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._workers = 0
+        self._shutdown = False
+
+    def submit(self, call: Callable[[], T]) -> "Future[T]":
+        """Queue a call, starting a worker if none is idle."""
+        future: Future[T] = Future()
+        with self._lock:
+            if self._shutdown:
+                msg = "cannot submit after shutdown"
+                raise RuntimeError(msg)
+            self._work.put((future, call))
+            if not self._idle.acquire(blocking=False) and (
+                self._workers < self.max_workers
+            ):
+                self._workers += 1
+                threading.Thread(
+                    target=self._run,
+                    name=f"{self.name}-{self._workers}",
+                    daemon=True,
+                ).start()
+        return future
+
+    def shutdown(self) -> None:
+        """Cancel queued calls and stop the workers once running calls end."""
+        with self._lock:
+            self._shutdown = True
+            while True:
+                try:
+                    item = self._work.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[0].cancel()
+            for _ in range(self._workers):
+                self._work.put(None)
+
+    def _run(self) -> None:
+        """Run queued calls until shut down."""
+        while (item := self._work.get()) is not None:
+            future, call = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = call()
+                except BaseException as e:  # noqa: BLE001 - handed to the caller
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            self._idle.release()
+
+
+class _PrimedStream:
+    """Stream whose first chunk has already been received."""
+
+    def __init__(self, iterator: Iterator[str]) -> None:
+        """Receive the first chunk of a stream."""
+        self.iterator = iterator
+        self.first = next(iterator, None)
+
+    def close(self) -> None:
+        """Release the underlying stream."""
+        close = getattr(self.iterator, "close", None)
+        if close is not None:
+            close()
+
+
+class _Attempt(Generic[T]):
+    """Hedged attempts of one call racing for the first success."""
+
+    def __init__(self, pool: _DaemonThreadPool, call: Callable[[], T]) -> None:
+        """Start the primary attempt."""
+        self.pool = pool
+        self.call = call
+        self.pending: set[Future[T]] = {pool.submit(call)}
+
+    def hedge(self) -> None:
+        """Start a duplicate attempt."""
+        self.pending.add(self.pool.submit(self.call))
+
+    def first_success(self, request: LlmRequest) -> T:
+        """Wait for the first attempt to succeed and discard the others.
+
+        Raises:
+            LlmDeadlineExceededError: If the deadline passes first
+            LlmProviderError: Error of the last attempt when all failed
+        """
+        error: BaseException | None = None
+        while self.pending:
+            done, self.pending = wait(
+                self.pending,
+                timeout=_clamp(request.remaining_seconds()),
+                return_when=FIRST_COMPLETED,
+            )
+            if not done:
+                self.abandon()
+                raise LlmDeadlineExceededError
+            for future in done:
+                if future.exception() is None:
+                    self.abandon()
+                    return future.result()
+                error = future.exception()
+        raise error or LlmProviderError("no attempt completed")
+
+    def abandon(self) -> None:
+        """Cancel or release attempts whose result is no longer needed."""
+        for future in self.pending:
+            if not future.cancel():
+                future.add_done_callback(_release)
+        self.pending = set()
+
+
+def _release(future: Future[T]) -> None:
+    """Close the stream of an attempt that lost the race."""
+    if future.exception() is None:
+        result = future.result()
+        if isinstance(result, _PrimedStream):
+            result.close()
+
+
+def _clamp(remaining: float | None) -> float | None:
+    """Turn the time left until a deadline into a wait timeout."""
+    return None if remaining is None else max(remaining, 0.0)
+
+
+class ResilientLlmProvider:
+    """LLM provider protecting callers from a degraded upstream.
+
+    Calls go through a circuit breaker, so a failing endpoint is rejected
+    fast instead of piling up slow calls. Once enough latencies have been
+    observed, a call still unanswered after the p95 latency is hedged with
+    one duplicate and the first success wins; for streams the race is for
+    the first chunk. Request deadlines bound every wait.
+    """
+
+    def __init__(
+        self,
+        provider: LlmProvider,
+        circuit_breaker: CircuitBreaker,
+        logging_service: LoggingService,
+        *,
+        hedging: bool = True,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            provider: Provider receiving the calls
+            circuit_breaker: Breaker of the provider's endpoint
+            logging_service: Service logging hedged calls
+            hedging: Whether slow calls are hedged
+            max_workers: Threads available for attempts
+        """
+        self.provider = provider
+        self.circuit_breaker = circuit_breaker
+        self.logging_service = logging_service
+        self.hedging = hedging
+        self.complete_latencies = LatencyWindow()
+        self.first_chunk_latencies = LatencyWindow()
+        self._pool = _DaemonThreadPool(max_workers, "llm-attempt")
+
+    def complete(self, request: LlmRequest) -> LlmResponse:
+        """Send a request and return the first successful response."""
+        return self._call(
+            request, lambda: self.provider.complete(request), self.complete_latencies
+        )
+
+    def stream(self, request: LlmRequest) -> Iterator[str]:
+        """Send a request and yield the chunks of the first stream to start."""
+        primed = self._call(
+            request,
+            lambda: _PrimedStream(self.provider.stream(request)),
+            self.first_chunk_latencies,
+        )
+        try:
+            if primed.first is None:
+                return
+            yield primed.first
+            for chunk in primed.iterator:
+                remaining = request.remaining_seconds()
+                if remaining is not None and remaining <= 0:
+                    raise LlmDeadlineExceededError
+                yield chunk
+        finally:
+            primed.close()
+
+    def close(self) -> None:
+        """Stop the attempt threads once running attempts finish."""
+        self._pool.shutdown()
+
+    def _call(
+        self, request: LlmRequest, call: Callable[[], T], latencies: LatencyWindow
+    ) -> T:
+        """Run a call through the breaker, hedging it when it is slow."""
+        remaining = request.remaining_seconds()
+        if remaining is not None and remaining <= 0:
+            raise LlmDeadlineExceededError
+        self.circuit_breaker.before_call()
+
+        started = time.monotonic()
+        attempt = _Attempt(self._pool, call)
+        try:
+            with span("llm.call") as current:
+                current.set_attribute("llm.endpoint", self.circuit_breaker.endpoint)
+                self._maybe_hedge(attempt, request, latencies)
+                result = attempt.first_success(request)
+        except LlmDeadlineExceededError:
+            # A short caller deadline says nothing about the endpoint
+            self.circuit_breaker.release()
+            raise
+        except LlmProviderError as e:
+            # Errors the endpoint answered with, such as 400, prove it is up
+            if counts_as_upstream_failure(e):
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+            raise
+        except Exception:
+            self.circuit_breaker.record_failure()
+            raise
+        self.circuit_breaker.record_success()
+        latencies.record(time.monotonic() - started)
+        return result
+
+    def _maybe_hedge(
+        self, attempt: _Attempt[T], request: LlmRequest, latencies: LatencyWindow
+    ) -> None:
+        """Start a duplicate attempt if the primary outlives the p95 latency."""
+        delay = latencies.quantile(LlmConstants.HEDGE_QUANTILE)
+        if not self.hedging or delay is None:
+            return
+        remaining = request.remaining_seconds()
+        if remaining is not None and remaining <= delay:
+            return
+        done, _ = wait(attempt.pending, timeout=delay)
+        if not done:
+            self.logging_service.log_debug(
+                "Hedging LLM request",
+                fields={
+                    "endpoint": self.circuit_breaker.endpoint,
+                    "delay_ms": round(delay * 1000),
+                },
+            )
+            attempt.hedge()
@@ -0,0 +1,108 @@
+"""Measurement of the resources used by the running process."""
+
+import gc
+import os
+import sys
+import time
+from pathlib import Path
+
+from adraitools.services.models.resources import ResourceUsage
+
+if sys.platform != "win32":
+    import resource
+
+PROC_IO_FILE = Path("/proc/self/io")
+_PROC_IO_FIELDS = ("rchar", "wchar", "read_bytes", "write_bytes")
+
+
+def read_proc_io(path: Path = PROC_IO_FILE) -> dict[str, int]:
+    """Read the I/O counters of the process, empty where unavailable.
+
+    Examples:
+        >>> counters = read_proc_io(Path("/nonexistent/io"))
+        >>> counters
+        {}
+    """
+    try:
+        text = path.read_text(encoding="ascii")
+    except OSError:
+        return {}
+    counters: dict[str, int] = {}
+    for line in text.splitlines():
+        name, _, value = line.partition(":")
+        if name in _PROC_IO_FIELDS:
+            counters[name] = int(value)
+    return counters
+
+
+def peak_rss_bytes() -> int | None:
+    """Get the largest resident set size of the process so far."""
+    if sys.platform == "win32":
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class ResourceMonitor:
+    """Monitor of the resources the process uses while it is running.
+
+    CPU time and I/O counters are differences between start and stop, so
+    they only cover the monitored stretch; peak RSS is the high-water mark
+    of the whole process. Garbage collections are counted through
+    ``gc.callbacks``, which also times every pause.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a stopped monitor."""
+        self._wall = 0.0
+        self._cpu: os.times_result | None = None
+        self._io: dict[str, int] = {}
+        self._collections = [0] * len(gc.get_count())
+        self._gc_pause_ns = 0
+        self._gc_started = 0
+
+    def start(self) -> None:
+        """Take the baseline and start counting garbage collections."""
+        self._collections = [0] * len(gc.get_count())
+        self._gc_pause_ns = 0
+        if self._on_gc not in gc.callbacks:
+            gc.callbacks.append(self._on_gc)
+        self._io = read_proc_io()
+        self._cpu = os.times()
+        self._wall = time.perf_counter()
+
+    def stop(self) -> ResourceUsage:
+        """Stop counting and get the usage since start."""
+        wall = time.perf_counter()
+        cpu = os.times()
+        io = read_proc_io()
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        started = self._cpu or cpu
+        return ResourceUsage(
+            wall_ms=(wall - self._wall) * 1000,
+            cpu_user_ms=(cpu.user - started.user) * 1000,
+            cpu_system_ms=(cpu.system - started.system) * 1000,
+            peak_rss_bytes=peak_rss_bytes(),
+            read_chars=self._io_delta(io, "rchar"),
+            write_chars=self._io_delta(io, "wchar"),
+            read_bytes=self._io_delta(io, "read_bytes"),
+            write_bytes=self._io_delta(io, "write_bytes"),
+            gc_collections=list(self._collections),
+            gc_pause_ms=self._gc_pause_ns / 1_000_000,
+        )
+
+    def _io_delta(self, io: dict[str, int], name: str) -> int | None:
+        """Get the growth of an I/O counter, None if it is not reported."""
+        if name not in io or name not in self._io:
+            return None
+        return io[name] - self._io[name]
+
+    def _on_gc(self, phase: str, info: dict[str, int]) -> None:
+        """Count and time a garbage collection."""
+        if phase == "start":
+            self._gc_started = time.perf_counter_ns()
+            return
+        self._gc_pause_ns += time.perf_counter_ns() - self._gc_started
+        self._collections[info["generation"]] += 1
@@ -0,0 +1,245 @@
+"""Span timing of hot paths with monotonic nanosecond clocks."""
+
+import os
+import random
+import threading
+import time
+from collections.abc import Callable
+from functools import wraps
+from types import TracebackType
+from typing import NamedTuple, ParamSpec, Protocol, Self, TypeVar
+
+from adraitools.services.models.timing import SpanTiming
+
+P = ParamSpec("P")
+R = TypeVar("R")
+SpanPath = tuple[str, ...]
+AttributeValue = str | int | float | bool
+
+
+class FinishedSpan(NamedTuple):
+    """A span that ended, as handed to the exporter."""
+
+    name: str
+    span_id: int
+    parent_id: int | None
+    start_unix_ns: int
+    end_unix_ns: int
+    attributes: dict[str, AttributeValue]
+    error: str | None
+
+
+class SpanExporter(Protocol):
+    """Destination of finished spans."""
+
+    def export(self, span: FinishedSpan) -> None:
+        """Accept a finished span, typically into a buffer."""
+        ...
+
+    def flush(self) -> None:
+        """Write out the buffered spans."""
+        ...
+
+
+class Span:
+    """A timed block of code, nested in the span running when it starts."""
+
+    __slots__ = (
+        "_attributes",
+        "_name",
+        "_parent",
+        "_path",
+        "_recorder",
+        "_stack",
+        "_start_unix_ns",
+        "_started",
+        "span_id",
+    )
+
+    def __init__(self, recorder: "SpanRecorder | None", name: str) -> None:
+        """Initialize the span."""
+        self._recorder = recorder
+        self._name = name
+        self._attributes: dict[str, AttributeValue] | None = None
+        self._path: SpanPath = ()
+        self._parent: Span | None = None
+        self._stack: list[Span] = []
+        self._start_unix_ns = 0
+        self._started = 0
+        self.span_id = 0
+
+    @property
+    def path(self) -> SpanPath:
+        """Names of the enclosing spans and of this span."""
+        return self._path
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        """Describe the span, e.g. with file counts or bytes read."""
+        if self._recorder is None:
+            return
+        if self._attributes is None:
+            self._attributes = {}
+        self._attributes[key] = value
+
+    def __enter__(self) -> Self:
+        """Start timing and make the span the parent of nested spans."""
+        recorder = self._recorder
+        if recorder is None:
+            return self
+        self._stack = recorder.stack()
+        self._parent = self._stack[-1] if self._stack else None
+        self._path = (*(self._parent.path if self._parent else ()), self._name)
+        self.span_id = random.getrandbits(64) or 1
+        self._stack.append(self)
+        recorder.register(self._path)
+        self._start_unix_ns = time.time_ns()
+        self._started = time.perf_counter_ns()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop timing and record the span, also when raising."""
+        recorder = self._recorder
+        if recorder is None:
+            return
+        elapsed_ns = time.perf_counter_ns() - self._started
+        # Remove by identity: a generator may close its span late
+        if self._stack and self._stack[-1] is self:
+            self._stack.pop()
+        elif self in self._stack:
+            self._stack.remove(self)
+        recorder.record(self._path, elapsed_ns)
+        if recorder.exporter is not None:
+            recorder.exporter.export(
+                FinishedSpan(
+                    name=self._name,
+                    span_id=self.span_id,
+                    parent_id=self._parent.span_id if self._parent else None,
+                    start_unix_ns=self._start_unix_ns,
+                    end_unix_ns=self._start_unix_ns + elapsed_ns,
+                    attributes=self._attributes or {},
+                    error=None if exc_value is None else repr(exc_value),
+                )
+            )
+
+
+_DISABLED = Span(None, "")
+
+
+class SpanRecorder:
+    """Recorder aggregating span durations into a tree.
+
+    Spans are keyed by their path from the outermost span, so the same
+    operation reached from two callers is reported twice. Every thread
+    nests its spans separately; spans opened in worker threads are roots.
+    With an exporter, every finished span is also handed over one by one,
+    all with the trace ID of the recorder. While disabled, ``span``
+    returns a shared inert span, so instrumented code pays one attribute
+    check per span.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a disabled recorder."""
+        self.enabled = False
+        self.exporter: SpanExporter | None = None
+        self.trace_id = os.urandom(16).hex()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Insertion order is the order in which paths were first entered
+        self._totals: dict[SpanPath, list[int]] = {}
+
+    def span(self, name: str) -> Span:
+        """Time a block of code as a span nested in the running one."""
+        if not self.enabled:
+            return _DISABLED
+        return Span(self, name)
+
+    def stack(self) -> list[Span]:
+        """Get the running spans of this thread, innermost last."""
+        stack: list[Span] | None = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def current_path(self) -> SpanPath:
+        """Get the path of the innermost running span of this thread."""
+        stack = self.stack()
+        return stack[-1].path if stack else ()
+
+    def register(self, path: SpanPath) -> None:
+        """Remember when a span path was first entered."""
+        if path not in self._totals:
+            with self._lock:
+                self._totals.setdefault(path, [0, 0])
+
+    def record(self, path: SpanPath, elapsed_ns: int) -> None:
+        """Add the duration of a finished span to its path."""
+        with self._lock:
+            # A reset may have dropped the path while the span was running
+            totals = self._totals.setdefault(path, [0, 0])
+            totals[0] += 1
+            totals[1] += elapsed_ns
+
+    def report(self) -> list[SpanTiming]:
+        """Get the aggregated spans, every span followed by its children.
+
+        Siblings are listed in the order they first started.
+        """
+        with self._lock:
+            totals = dict(self._totals)
+        children: dict[SpanPath, list[SpanPath]] = {}
+        for path in totals:
+            children.setdefault(path[:-1], []).append(path)
+        timings: list[SpanTiming] = []
+        pending = list(reversed(children.get((), [])))
+        while pending:
+            path = pending.pop()
+            count, elapsed_ns = totals[path]
+            timings.append(
+                SpanTiming(
+                    name=path[-1],
+                    depth=len(path) - 1,
+                    count=count,
+                    total_ms=elapsed_ns / 1_000_000,
+                )
+            )
+            pending.extend(reversed(children.get(path, [])))
+        return timings
+
+    def reset(self) -> None:
+        """Forget every recorded span."""
+        with self._lock:
+            self._totals.clear()
+
+
+RECORDER = SpanRecorder()
+
+
+def span(name: str) -> Span:
+    """Time a block of code with the process-wide recorder.
+
+    Examples:
+        >>> with span("toml.load") as current:
+        ...     current.set_attribute("file.bytes", 120)
+    """
+    return RECORDER.span(name)
+
+
+def timed(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Time every call of a function as a span of the process-wide recorder."""
+
+    def decorate(func: Callable[P, R]) -> Callable[P, R]:
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not RECORDER.enabled:
+                return func(*args, **kwargs)
+            with RECORDER.span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
@@ -6,6 +6,8 @@ from typing import Any
 import tomli
 import tomli_w
 
+from adraitools.infrastructure.span_recorder import span, timed
+
 
 class TomlFileHandler:
     """Service for handling TOML file operations."""
@@ -27,10 +29,14 @@ class TomlFileHandler:
         if not file_path.exists():
             return {}
 
-        with file_path.open("rb") as f:
-            return tomli.load(f)
+        with span("toml.load") as current, file_path.open("rb") as f:
+            config = tomli.load(f)
+            current.set_attribute("file.path", str(file_path))
+            current.set_attribute("file.bytes", f.tell())
+            return config
 
     @staticmethod
+    @timed("toml.save")
     def save_config(config_data: dict[str, Any], file_path: Path) -> None:
         """Save configuration to TOML file with merge support.
 
@@ -0,0 +1,94 @@
+"""Memory-mapped vector index persistence."""
+
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import TypeAdapter
+
+from adraitools.infrastructure.span_recorder import span
+from adraitools.services.models.index import VectorIndexEntry, VectorSearchHit
+
+VECTORS_FILE = "vectors.npy"
+ENTRIES_FILE = "entries.json"
+_ENTRIES_ADAPTER = TypeAdapter(list[VectorIndexEntry])
+
+
+class VectorIndex:
+    """Chunk vectors with their metadata, searchable by cosine similarity."""
+
+    def __init__(
+        self, entries: list[VectorIndexEntry], matrix: NDArray[np.float32]
+    ) -> None:
+        """Initialize the index.
+
+        Args:
+            entries: Metadata of each matrix row
+            matrix: Unit-length float32 vectors, one row per entry
+        """
+        self.entries = entries
+        self.matrix = matrix
+
+    def search(self, vector: NDArray[np.float32], top_k: int) -> list[VectorSearchHit]:
+        """Return the rows most similar to a unit-length query vector."""
+        if not self.entries or top_k <= 0:
+            return []
+        with span("index.search") as current:
+            current.set_attribute("index.rows", len(self.entries))
+            current.set_attribute("index.top_k", top_k)
+            scores = self.matrix @ vector
+            count = min(top_k, len(scores))
+            best = np.argpartition(-scores, count - 1)[:count]
+            best = best[np.argsort(-scores[best], kind="stable")]
+        return [
+            VectorSearchHit(entry=self.entries[row], score=float(scores[row]))
+            for row in best
+        ]
+
+
+class VectorIndexStore:
+    """Service persisting the vector index as a memory-mappable file.
+
+    Vectors are stored in NumPy ``.npy`` format so readers can map them
+    with ``mmap_mode`` instead of loading the whole matrix; the row
+    metadata lives next to it as JSON.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize the store.
+
+        Args:
+            directory: Directory holding the index files
+        """
+        self.directory = directory
+
+    def exists(self) -> bool:
+        """Check whether an index has been saved."""
+        return (self.directory / VECTORS_FILE).exists() and (
+            self.directory / ENTRIES_FILE
+        ).exists()
+
+    def save(
+        self, entries: list[VectorIndexEntry], matrix: NDArray[np.float32]
+    ) -> None:
+        """Replace the saved index.
+
+        Files are written next to their destination and renamed into place,
+        so concurrent readers never see a partially written index.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        vectors_tmp = self.directory / f"{VECTORS_FILE}.tmp"
+        entries_tmp = self.directory / f"{ENTRIES_FILE}.tmp"
+        with vectors_tmp.open("wb") as f:
+            np.save(f, np.ascontiguousarray(matrix, dtype=np.float32))
+        entries_tmp.write_bytes(_ENTRIES_ADAPTER.dump_json(entries))
+        vectors_tmp.replace(self.directory / VECTORS_FILE)
+        entries_tmp.replace(self.directory / ENTRIES_FILE)
+
+    def load(self) -> VectorIndex:
+        """Open the saved index with the vectors memory-mapped read-only."""
+        matrix = np.load(self.directory / VECTORS_FILE, mmap_mode="r")
+        entries = _ENTRIES_ADAPTER.validate_json(
+            (self.directory / ENTRIES_FILE).read_bytes()
+        )
+        return VectorIndex(entries, matrix)
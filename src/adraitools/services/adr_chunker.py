@@ -0,0 +1,110 @@
+"""Section-aware ADR chunking service."""
+
+import hashlib
+
+from adraitools.services.models.adr import AdrChunk, AdrDocument
+
+DEFAULT_MAX_TOKENS = 200
+DEFAULT_OVERLAP_TOKENS = 40
+# Metadata sections carry no decision content and change independently of it
+METADATA_SECTIONS = frozenset({"Title", "Status", "Date"})
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text by counting words.
+
+    Examples:
+        >>> estimate_tokens("Adopt uv for dependency management.")
+        5
+    """
+    return len(text.split())
+
+
+class AdrChunker:
+    """Service splitting ADRs into chunks aligned with template sections.
+
+    Every content section of the ADR template is chunked on its own, so an
+    edit only changes the chunks of the edited section. Within a section,
+    paragraphs are packed into chunks of at most ``max_tokens`` words and
+    each chunk repeats the last ``overlap_tokens`` words of its predecessor.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+    ) -> None:
+        """Initialize the chunker.
+
+        Args:
+            max_tokens: Maximum number of words per chunk body
+            overlap_tokens: Words repeated from the previous chunk
+
+        Raises:
+            ValueError: If the overlap is not smaller than the chunk size
+        """
+        if not 0 <= overlap_tokens < max_tokens:
+            msg = "overlap_tokens must be between 0 and max_tokens - 1"
+            raise ValueError(msg)
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+
+    def chunk(self, document: AdrDocument) -> list[AdrChunk]:
+        """Split an ADR into chunks.
+
+        Args:
+            document: Parsed ADR
+
+        Returns:
+            Chunks in document order
+        """
+        chunks: list[AdrChunk] = []
+        for heading, body in document.sections.items():
+            if heading in METADATA_SECTIONS:
+                continue
+            for window in self._windows(body):
+                text = f"{document.title}\n{heading}\n{window}"
+                chunks.append(
+                    AdrChunk(
+                        document_path=document.path,
+                        section=heading,
+                        position=len(chunks),
+                        text=text,
+                        content_hash=hashlib.sha256(text.encode()).hexdigest(),
+                    )
+                )
+        return chunks
+
+    def _windows(self, body: str) -> list[str]:
+        """Pack the paragraphs of a section body into overlapping windows."""
+        windows: list[list[str]] = []
+        current: list[str] = []
+        for paragraph in body.split("\n\n"):
+            words = paragraph.split()
+            while words:
+                room = self.max_tokens - len(current)
+                if len(words) > room and len(current) > self._carried(windows):
+                    # Close the window at a paragraph boundary when possible
+                    windows.append(current)
+                    current = self._overlap(current)
+                    continue
+                current.extend(words[:room])
+                words = words[room:]
+                if words:
+                    windows.append(current)
+                    current = self._overlap(current)
+        if len(current) > self._carried(windows):
+            windows.append(current)
+        return [" ".join(window) for window in windows]
+
+    def _overlap(self, window: list[str]) -> list[str]:
+        """Get the words carried over from a closed window."""
+        if not self.overlap_tokens:
+            return []
+        return window[-self.overlap_tokens :]
+
+    def _carried(self, windows: list[list[str]]) -> int:
+        """Get how many words of the current window were carried over."""
+        if not windows:
+            return 0
+        return len(self._overlap(windows[-1]))
@@ -0,0 +1,81 @@
+"""ADR corpus loading service."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.infrastructure.memory_profiler import checkpoint
+from adraitools.infrastructure.span_recorder import span, timed
+from adraitools.services.adr_parser import AdrParser
+from adraitools.services.models.adr import AdrDocument
+
+MAX_READ_WORKERS = 32
+
+
+class AdrCorpusLoader:
+    """Service for loading every ADR of a directory."""
+
+    def __init__(
+        self, file_system_service: FileSystemService, adr_parser: AdrParser
+    ) -> None:
+        """Initialize the corpus loader."""
+        self.file_system_service = file_system_service
+        self.adr_parser = adr_parser
+
+    @timed("corpus.list")
+    def list_paths(self, directory: Path, exclude: Path | None = None) -> list[Path]:
+        """List the ADR files of a directory.
+
+        Args:
+            directory: ADR directory
+            exclude: File to leave out, typically the ADR template
+
+        Returns:
+            Sorted ADR file paths
+        """
+        paths = self.file_system_service.list_markdown_files(directory)
+        if exclude is None:
+            return paths
+        excluded = exclude.resolve()
+        resolved_directory = directory.resolve()
+        return [path for path in paths if resolved_directory / path.name != excluded]
+
+    def load(self, directory: Path, exclude: Path | None = None) -> list[AdrDocument]:
+        """Read and parse every ADR of a directory.
+
+        Files are read concurrently so that I/O latency overlaps with parsing.
+
+        Args:
+            directory: ADR directory
+            exclude: File to leave out, typically the ADR template
+
+        Returns:
+            Parsed documents in file name order
+        """
+        return self.load_paths(self.list_paths(directory, exclude))
+
+    def load_paths(self, paths: list[Path]) -> list[AdrDocument]:
+        """Read and parse ADR files concurrently.
+
+        Args:
+            paths: ADR files to load
+
+        Returns:
+            Parsed documents in the order of ``paths``
+        """
+        if not paths:
+            return []
+        workers = min(MAX_READ_WORKERS, (os.cpu_count() or 1) + 4, len(paths))
+        with (
+            span("corpus.load") as current,
+            ThreadPoolExecutor(max_workers=workers) as pool,
+        ):
+            current.set_attribute("adr.files", len(paths))
+            documents = list(pool.map(self.load_document, paths))
+        checkpoint("load")
+        return documents
+
+    def load_document(self, path: Path) -> AdrDocument:
+        """Read and parse a single ADR file."""
+        return self.adr_parser.parse(path, self.file_system_service.read_text(path))
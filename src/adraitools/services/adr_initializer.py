@@ -4,6 +4,7 @@ from pathlib import Path
 
 from adraitools.infrastructure.configuration_service import ConfigurationService
 from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.infrastructure.span_recorder import timed
 from adraitools.infrastructure.user_interaction_service import UserInteractionService
 from adraitools.services.models.result import InitializationResult
 
@@ -22,6 +23,7 @@ class AdrInitializer:
         self.user_interaction_service = user_interaction_service
         self.configuration_service = configuration_service
 
+    @timed("init.initialize")
     def initialize(self) -> InitializationResult:
         """Initialize ADR directory structure."""
         config = self.configuration_service.get_configuration()
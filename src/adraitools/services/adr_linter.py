@@ -0,0 +1,332 @@
+"""ADR template compliance linting service."""
+
+import hashlib
+import itertools
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+from pydantic import TypeAdapter
+
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.constants import TemplateConstants
+from adraitools.infrastructure.content_cache import ContentCache
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.infrastructure.span_recorder import timed
+from adraitools.services.adr_corpus_loader import MAX_READ_WORKERS
+from adraitools.services.adr_parser import AdrParser
+from adraitools.services.models.lint import (
+    LintDiagnostic,
+    LintFinding,
+    LintReport,
+    LintRules,
+)
+
+CACHE_NAMESPACE = "lint:v1"
+STATE_NAMESPACE = "lint-state"
+MISSING_SECTION = "ADR001"
+EMPTY_SECTION = "ADR002"
+PLACEHOLDER_SECTION = "ADR003"
+INVALID_STATUS = "ADR004"
+INVALID_DATE = "ADR005"
+# Below this many files to check, worker process start-up costs more than it saves
+PARALLEL_THRESHOLD = 1024
+LINT_CHUNK = 64
+READ_BATCH = 256
+_STATUS_CHOICES = re.compile(r"^\[(.+)\]$")
+_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_FINDINGS_ADAPTER = TypeAdapter(list[LintFinding])
+_FENCE = "```"
+_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+
+
+def parse_rules(template: str) -> LintRules:
+    r"""Derive the lint rules from an ADR template.
+
+    Every level-two section of the template is required. Allowed statuses
+    come from a ``[Proposed | Accepted | ...]`` line in its Status section.
+
+    Examples:
+        >>> rules = parse_rules("## Status\n[Proposed | Accepted]\n\n## Date\n")
+        >>> rules.sections, rules.statuses
+        (['Status', 'Date'], ['Proposed', 'Accepted'])
+    """
+    sections = AdrParser.split_sections(template)[1]
+    choices = _STATUS_CHOICES.match(AdrParser.first_line(sections.get("Status", "")))
+    statuses = (
+        [choice.strip() for choice in choices.group(1).split("|")] if choices else []
+    )
+    return LintRules(
+        sections=list(sections),
+        statuses=statuses,
+        placeholders={
+            heading: _first_text(body)
+            for heading, body in sections.items()
+            if _first_text(body)
+        },
+    )
+
+
+def _first_text(body: str) -> str:
+    """Get the first meaningful line of a section body that is not a heading."""
+    lines = (line for line in body.splitlines() if not line.lstrip().startswith("#"))
+    return AdrParser.first_line("\n".join(lines))
+
+
+def lint_text(text: str, rules: LintRules) -> list[LintFinding]:
+    """Check ADR content against the template rules.
+
+    Args:
+        text: Raw markdown content
+        rules: Rules derived from the template
+
+    Returns:
+        Findings ordered by line
+    """
+    sections = _scan_sections(text)
+    findings = [
+        LintFinding(line=1, code=MISSING_SECTION, message=f"missing section '{name}'")
+        for name in rules.sections
+        if name not in sections
+    ]
+    for name in rules.sections:
+        if name in sections:
+            line, body = sections[name]
+            findings += _check_section(name, _first_text(body), line, rules)
+    return sorted(findings, key=lambda finding: (finding.line, finding.code))
+
+
+def _scan_sections(text: str) -> dict[str, tuple[int, str]]:
+    """Get the heading line and comment-free body of each level-two section."""
+    sections: dict[str, tuple[int, list[str]]] = {}
+    current: list[str] | None = None
+    in_code = False
+    for number, line in enumerate(text.splitlines(), start=1):
+        if line.startswith(_FENCE):
+            in_code = not in_code
+        elif not in_code and line.startswith("## "):
+            heading = line[3:].strip()
+            current = sections.setdefault(heading, (number, []))[1]
+            continue
+        if current is not None:
+            current.append(line)
+    return {
+        heading: (number, _COMMENT.sub("", "\n".join(lines)))
+        for heading, (number, lines) in sections.items()
+    }
+
+
+def _check_section(
+    name: str, value: str, line: int, rules: LintRules
+) -> list[LintFinding]:
+    """Check the first meaningful line of a required section."""
+    if not value:
+        message = f"empty section '{name}'"
+        return [LintFinding(line=line, code=EMPTY_SECTION, message=message)]
+    if value == rules.placeholders.get(name):
+        message = f"section '{name}' still holds the template text"
+        return [LintFinding(line=line, code=PLACEHOLDER_SECTION, message=message)]
+    if name == "Status" and rules.statuses:
+        return _check_status(value, line, rules.statuses)
+    if name == "Date" and not _valid_date(value):
+        message = f"invalid date '{value}', expected YYYY-MM-DD"
+        return [LintFinding(line=line, code=INVALID_DATE, message=message)]
+    return []
+
+
+def _check_status(value: str, line: int, statuses: list[str]) -> list[LintFinding]:
+    """Check that a Status starts with one of the allowed statuses."""
+    word = value.split(maxsplit=1)[0].rstrip(".,:;")
+    if word.lower() in {status.lower() for status in statuses}:
+        return []
+    return [
+        LintFinding(
+            line=line,
+            code=INVALID_STATUS,
+            message=f"invalid status '{value}', expected one of {', '.join(statuses)}",
+        )
+    ]
+
+
+def _valid_date(value: str) -> bool:
+    """Check that a value is an existing calendar date in ISO format."""
+    if not _ISO_DATE.match(value):
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+class AdrLinter:
+    """Service checking ADRs against the configured template.
+
+    The template is parsed once into rules. Findings are cached by the
+    content hash of each file and the rules, so unchanged content is never
+    checked twice and editing the template re-checks everything. By
+    default, files that passed in a previous run and whose modification
+    time and size did not change are not even read. Files without cached
+    findings are checked across processes when there are many of them.
+    """
+
+    def __init__(
+        self,
+        configuration_service: ConfigurationService,
+        file_system_service: FileSystemService,
+        content_cache: ContentCache,
+    ) -> None:
+        """Initialize the linter."""
+        self.configuration_service = configuration_service
+        self.file_system_service = file_system_service
+        self.content_cache = content_cache
+        self._rules: LintRules | None = None
+
+    def rules(self) -> LintRules:
+        """Get the rules of the configured template, parsing it on first use.
+
+        Falls back to the built-in template when the file does not exist.
+        """
+        if self._rules is None:
+            template_file = self.configuration_service.get_paths().template_file
+            if template_file.is_file():
+                template = self.file_system_service.read_text(template_file)
+            else:
+                template = TemplateConstants.ADR_TEMPLATE
+            self._rules = parse_rules(template)
+        return self._rules
+
+    @timed("lint.run")
+    def lint(self, *, all_files: bool = False) -> LintReport:
+        """Lint the ADR directory.
+
+        Args:
+            all_files: Lint every ADR instead of only those changed since
+                they last passed
+
+        Returns:
+            Diagnostics of the linted files
+        """
+        config = self.configuration_service.get_paths()
+        directory = config.adr_directory.resolve()
+        template = config.template_file.resolve()
+        listing = self.file_system_service.fingerprint_markdown_files(directory)
+        fingerprints = {
+            name: fingerprint
+            for name, fingerprint in listing.items()
+            if directory / name != template
+        }
+        state_key = f"{directory}|{self.rules().key()}"
+        passed = {} if all_files else self._passed(state_key)
+        names = sorted(
+            name
+            for name, fingerprint in fingerprints.items()
+            if passed.get(name) != fingerprint
+        )
+
+        report = self.lint_files(
+            [config.adr_directory / name for name in names], files=len(fingerprints)
+        )
+        failed = {diagnostic.path.name for diagnostic in report.diagnostics}
+        passed = {
+            name: fingerprints[name]
+            for name in passed.keys() | set(names)
+            if name in fingerprints and name not in failed
+        }
+        self.content_cache.put(STATE_NAMESPACE, state_key, json.dumps(passed).encode())
+        return report
+
+    @timed("lint.files")
+    def lint_files(self, paths: list[Path], files: int | None = None) -> LintReport:
+        """Lint specific ADR files.
+
+        Args:
+            paths: Files to lint
+            files: Number of ADRs in the directory, ``len(paths)`` if None
+
+        Returns:
+            Diagnostics of the files
+        """
+        rules = self.rules()
+        contents = self._read(paths)
+        rules_key = rules.key()
+        keys = [
+            hashlib.sha256(rules_key.encode() + content).hexdigest()
+            for content in contents
+        ]
+        findings = {
+            key: _FINDINGS_ADAPTER.validate_json(value)
+            for key, value in self.content_cache.get_many(CACHE_NAMESPACE, keys).items()
+        }
+        cached = sum(key in findings for key in keys)
+
+        missing = {
+            key: content.decode("utf-8", errors="replace")
+            for key, content in zip(keys, contents, strict=True)
+            if key not in findings
+        }
+        fresh = dict(
+            zip(missing, self._lint_texts(list(missing.values()), rules), strict=True)
+        )
+        self.content_cache.put_many(
+            CACHE_NAMESPACE,
+            {key: _FINDINGS_ADAPTER.dump_json(value) for key, value in fresh.items()},
+        )
+        findings.update(fresh)
+
+        return LintReport(
+            files=len(paths) if files is None else files,
+            linted=len(paths),
+            cached=cached,
+            diagnostics=[
+                LintDiagnostic(
+                    path=path,
+                    line=finding.line,
+                    code=finding.code,
+                    message=finding.message,
+                )
+                for path, key in zip(paths, keys, strict=True)
+                for finding in findings[key]
+            ],
+        )
+
+    def _passed(self, state_key: str) -> dict[str, str]:
+        """Get the fingerprints of the files that passed previous runs."""
+        value = self.content_cache.get(STATE_NAMESPACE, state_key)
+        return json.loads(value) if value else {}
+
+    def _read(self, paths: list[Path]) -> list[bytes]:
+        """Read files concurrently, in batches."""
+        batches = [
+            paths[start : start + READ_BATCH]
+            for start in range(0, len(paths), READ_BATCH)
+        ]
+        if not batches:
+            return []
+        workers = min(MAX_READ_WORKERS, (os.cpu_count() or 1) + 4, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return [
+                content
+                for batch in pool.map(self._read_batch, batches)
+                for content in batch
+            ]
+
+    def _read_batch(self, paths: list[Path]) -> list[bytes]:
+        """Read a batch of files."""
+        return [self.file_system_service.read_bytes(path) for path in paths]
+
+    @staticmethod
+    def _lint_texts(texts: list[str], rules: LintRules) -> list[list[LintFinding]]:
+        """Lint texts, across processes for large batches."""
+        workers = os.cpu_count() or 1
+        if len(texts) < PARALLEL_THRESHOLD or workers <= 1:
+            return [lint_text(text, rules) for text in texts]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(
+                pool.map(
+                    lint_text, texts, itertools.repeat(rules), chunksize=LINT_CHUNK
+                )
+            )
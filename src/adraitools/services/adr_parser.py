@@ -0,0 +1,112 @@
+"""ADR markdown parsing service."""
+
+import hashlib
+import re
+from pathlib import Path
+
+from adraitools.services.models.adr import AdrDocument
+
+ADR_REFERENCE_PATTERN = re.compile(r"\bADR[- ]?(\d+)\b", re.IGNORECASE)
+_FILE_NUMBER_PATTERN = re.compile(r"^(\d+)[-_]")
+_HEADING_NUMBER_PATTERN = re.compile(r"^ADR[- ]?(\d+)\s*[:.-]?\s*", re.IGNORECASE)
+_CODE_FENCE = "```"
+_COMMENT_START = "<!--"
+
+
+class AdrParser:
+    """Service for parsing ADR markdown files into documents.
+
+    ADRs follow the template created by ``FileSystemService``: a level-one
+    heading followed by level-two sections such as Title, Status and Date.
+    Level-three headings stay part of their parent section.
+    """
+
+    def parse(self, path: Path, text: str) -> AdrDocument:
+        """Parse the content of an ADR file.
+
+        Args:
+            path: Path of the ADR file
+            text: Raw markdown content
+
+        Returns:
+            Parsed ADR document
+        """
+        heading, sections = self.split_sections(text)
+        heading_match = _HEADING_NUMBER_PATTERN.match(heading)
+        title = self.first_line(sections.get("Title", ""))
+        if not title and heading_match:
+            title = heading[heading_match.end() :]
+
+        return AdrDocument(
+            path=path,
+            number=self._number(path, heading_match),
+            title=title or heading or path.stem,
+            status=self.first_line(sections.get("Status", "")),
+            date=self.first_line(sections.get("Date", "")),
+            sections=sections,
+            content_hash=hashlib.sha256(text.encode()).hexdigest(),
+        )
+
+    @staticmethod
+    def split_sections(text: str) -> tuple[str, dict[str, str]]:
+        """Split markdown into its level-one heading and level-two sections.
+
+        Headings inside fenced code blocks are ignored.
+
+        Args:
+            text: Raw markdown content
+
+        Returns:
+            Tuple of the level-one heading text and section bodies by heading
+        """
+        heading = ""
+        sections: dict[str, list[str]] = {}
+        current: list[str] | None = None
+        in_code = False
+        for line in text.splitlines():
+            if line.startswith(_CODE_FENCE):
+                in_code = not in_code
+            elif not in_code and line.startswith("## "):
+                current = sections.setdefault(line[3:].strip(), [])
+                continue
+            elif not in_code and line.startswith("# ") and not heading:
+                heading = line[2:].strip()
+                continue
+            if current is not None:
+                current.append(line)
+        return heading, {
+            name: "\n".join(lines).strip() for name, lines in sections.items()
+        }
+
+    @staticmethod
+    def first_line(body: str) -> str:
+        """Get the first meaningful line of a section body.
+
+        Blank lines and HTML comments are skipped.
+        """
+        for line in body.splitlines():
+            stripped = line.strip()
+            if stripped and not stripped.startswith(_COMMENT_START):
+                return stripped
+        return ""
+
+    @staticmethod
+    def file_number(name: str) -> int | None:
+        """Get the ADR number from a file name such as ``0007-use-uv.md``.
+
+        Examples:
+            >>> AdrParser.file_number("0007-use-uv.md")
+            7
+            >>> AdrParser.file_number("README.md") is None
+            True
+        """
+        file_match = _FILE_NUMBER_PATTERN.match(name)
+        return int(file_match.group(1)) if file_match else None
+
+    @classmethod
+    def _number(cls, path: Path, heading_match: re.Match[str] | None) -> int | None:
+        """Get the ADR number from the file name or the heading."""
+        number = cls.file_number(path.name)
+        if number is None and heading_match:
+            return int(heading_match.group(1))
+        return number
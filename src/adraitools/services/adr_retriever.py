@@ -0,0 +1,91 @@
+"""Lexical ADR retrieval service."""
+
+import heapq
+import math
+import re
+from collections import Counter
+from collections.abc import Sequence
+
+from adraitools.services.models.adr import AdrDocument, AdrSearchHit
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_STOP_WORDS = frozenset(
+    {
+        "a", "an", "and", "are", "as", "at", "be", "by", "did", "do", "does",
+        "for", "from", "how", "in", "is", "it", "of", "on", "or", "our", "that",
+        "the", "this", "to", "us", "was", "we", "what", "when", "which", "why",
+        "with",
+    }
+)  # fmt: skip
+# Okapi BM25 parameters
+_K1 = 1.5
+_B = 0.75
+# Title terms count as many times as they appear in the body
+_TITLE_WEIGHT = 3
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase search terms without stop words.
+
+    Examples:
+        >>> tokenize("Why did we choose uv?")
+        ['choose', 'uv']
+    """
+    return [
+        token
+        for token in _TOKEN_PATTERN.findall(text.lower())
+        if token not in _STOP_WORDS
+    ]
+
+
+class AdrRetriever:
+    """Service ranking ADRs against free-text questions with BM25."""
+
+    def __init__(self, documents: Sequence[AdrDocument]) -> None:
+        """Build the term statistics for a set of documents."""
+        self.documents = documents
+        self._term_frequencies: list[Counter[str]] = []
+        self._document_frequencies: Counter[str] = Counter()
+        for document in documents:
+            terms = Counter(tokenize(" ".join(document.sections.values())))
+            for term in tokenize(document.title):
+                terms[term] += _TITLE_WEIGHT
+            self._term_frequencies.append(terms)
+            self._document_frequencies.update(terms.keys())
+        lengths = [sum(terms.values()) for terms in self._term_frequencies]
+        self._lengths = lengths
+        self._average_length = sum(lengths) / len(lengths) if lengths else 0.0
+
+    def search(self, query: str, top_k: int) -> list[AdrSearchHit]:
+        """Return the best matching documents for a query.
+
+        Args:
+            query: Free-text question
+            top_k: Maximum number of hits to return
+
+        Returns:
+            Hits with a positive score, best first
+        """
+        terms = set(tokenize(query))
+        count = len(self.documents)
+        scored: list[tuple[float, int]] = []
+        for index, frequencies in enumerate(self._term_frequencies):
+            score = 0.0
+            for term in terms:
+                frequency = frequencies.get(term, 0)
+                if not frequency:
+                    continue
+                document_frequency = self._document_frequencies[term]
+                idf = math.log(
+                    1 + (count - document_frequency + 0.5) / (document_frequency + 0.5)
+                )
+                norm = 1 - _B + _B * self._lengths[index] / self._average_length
+                score += idf * frequency * (_K1 + 1) / (frequency + _K1 * norm)
+            if score > 0:
+                scored.append((score, index))
+
+        best = heapq.nlargest(top_k, scored, key=lambda item: (item[0], -item[1]))
+        return [
+            AdrSearchHit(document=self.documents[index], score=score)
+            for score, index in best
+        ]
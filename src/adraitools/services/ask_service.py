@@ -0,0 +1,176 @@
+"""Service answering questions grounded in the ADR corpus."""
+
+import queue
+import threading
+import time
+from collections.abc import Iterator
+
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.constants import AskConstants
+from adraitools.infrastructure.llm_provider import LlmProvider
+from adraitools.infrastructure.span_recorder import span, timed
+from adraitools.services.adr_corpus_loader import AdrCorpusLoader
+from adraitools.services.adr_retriever import AdrRetriever
+from adraitools.services.models.adr import AdrSearchHit
+from adraitools.services.models.ask import AskTimings
+from adraitools.services.models.llm import LlmRequest
+
+MAX_CONTEXT_CHARACTERS = 12_000
+CONTEXT_SECTIONS = ("Context", "Decision", "Rationale", "Implications", "Alternatives")
+SYSTEM_PROMPT = (
+    "You answer questions about a project's Architecture Decision Records. "
+    "Use only the ADRs provided below. Cite the ADRs supporting each statement "
+    "with their identifier in square brackets, for example [ADR-0001]. "
+    "If the ADRs do not answer the question, say so."
+)
+
+
+def _elapsed_ms(start: float, end: float) -> float:
+    """Convert a perf counter interval to milliseconds."""
+    return (end - start) * 1000
+
+
+class AskSession:
+    """A question being answered.
+
+    The LLM call starts in a background thread as soon as the session is
+    created, so callers can present the sources while the first token is
+    still on its way.
+    """
+
+    def __init__(
+        self,
+        sources: list[AdrSearchHit],
+        request: LlmRequest | None,
+        llm_provider: LlmProvider,
+        phase_marks: tuple[float, float, float],
+    ) -> None:
+        """Initialize the session and start the LLM call.
+
+        Args:
+            sources: ADRs the answer is grounded in
+            request: Request to send, None when there is nothing to ask
+            llm_provider: Provider answering the request
+            phase_marks: Perf counter values at start, after retrieval and
+                after packing
+        """
+        self.sources = sources
+        self.timings: AskTimings | None = None
+        self._phase_marks = phase_marks
+        self._chunks: queue.Queue[str | Exception | None] = queue.Queue()
+        if request is None:
+            self._chunks.put(None)
+        else:
+            threading.Thread(
+                target=self._receive, args=(llm_provider, request), daemon=True
+            ).start()
+
+    def stream(self) -> Iterator[str]:
+        """Yield the answer text as it arrives and record the timings."""
+        started, retrieved, packed = self._phase_marks
+        first_token: float | None = None
+        while (chunk := self._chunks.get()) is not None:
+            if isinstance(chunk, Exception):
+                raise chunk
+            if first_token is None:
+                first_token = time.perf_counter()
+            yield chunk
+        finished = time.perf_counter()
+        self.timings = AskTimings(
+            retrieve_ms=_elapsed_ms(started, retrieved),
+            pack_ms=_elapsed_ms(retrieved, packed),
+            first_token_ms=_elapsed_ms(started, first_token or finished),
+            total_ms=_elapsed_ms(started, finished),
+        )
+
+    def _receive(self, llm_provider: LlmProvider, request: LlmRequest) -> None:
+        """Forward the provider stream into the chunk queue."""
+        try:
+            for chunk in llm_provider.stream(request):
+                self._chunks.put(chunk)
+        except Exception as e:  # noqa: BLE001 - re-raised by stream()
+            self._chunks.put(e)
+        self._chunks.put(None)
+
+
+class AskService:
+    """Service for retrieval-augmented questions over the ADR corpus."""
+
+    def __init__(
+        self,
+        configuration_service: ConfigurationService,
+        corpus_loader: AdrCorpusLoader,
+        llm_provider: LlmProvider,
+    ) -> None:
+        """Initialize the ask service."""
+        self.configuration_service = configuration_service
+        self.corpus_loader = corpus_loader
+        self.llm_provider = llm_provider
+
+    @timed("ask.prepare")
+    def ask(
+        self,
+        question: str,
+        top_k: int = AskConstants.DEFAULT_TOP_K,
+        deadline: float | None = None,
+    ) -> AskSession:
+        """Retrieve the relevant ADRs and start answering a question.
+
+        Args:
+            question: Free-text question
+            top_k: Maximum number of ADRs used as context
+            deadline: time.monotonic() value by which the answer must be
+                complete, None for no deadline
+
+        Returns:
+            Session streaming the answer; it has no sources and produces no
+            text when no ADR matches the question
+        """
+        started = time.perf_counter()
+        config = self.configuration_service.get_configuration()
+        documents = self.corpus_loader.load(
+            config.adr_directory, exclude=config.template_file
+        )
+        with span("ask.retrieve") as current:
+            sources = AdrRetriever(documents).search(question, top_k)
+            current.set_attribute("adr.documents", len(documents))
+            current.set_attribute("ask.sources", len(sources))
+        retrieved = time.perf_counter()
+
+        request = self.build_request(question, sources, deadline) if sources else None
+        packed = time.perf_counter()
+
+        return AskSession(
+            sources, request, self.llm_provider, (started, retrieved, packed)
+        )
+
+    @staticmethod
+    def build_request(
+        question: str, sources: list[AdrSearchHit], deadline: float | None = None
+    ) -> LlmRequest:
+        """Build a prompt grounded in the given ADRs.
+
+        The context budget is split evenly between the sources so that a
+        single long ADR cannot crowd out the others.
+        """
+        budget = MAX_CONTEXT_CHARACTERS // max(len(sources), 1)
+        blocks = []
+        for hit in sources:
+            document = hit.document
+            lines = [
+                f"[{document.identifier}] {document.title}",
+                f"Status: {document.status}",
+                f"Date: {document.date}",
+            ]
+            for heading in CONTEXT_SECTIONS:
+                body = document.section(heading)
+                if body:
+                    lines.append(f"{heading}:\n{body}")
+            blocks.append("\n".join(lines)[:budget])
+
+        context = "\n\n---\n\n".join(blocks)
+        return LlmRequest(
+            system_prompt=SYSTEM_PROMPT,
+            prompt=f"ADRs:\n\n{context}\n\nQuestion: {question}",
+            deadline=deadline,
+        )
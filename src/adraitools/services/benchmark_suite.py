@@ -0,0 +1,257 @@
+"""Standard benchmark suite of the ADR workflows."""
+
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+from adraitools import __version__
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.constants import PathConstants
+from adraitools.infrastructure.content_cache import ContentCache
+from adraitools.infrastructure.embedding_cache import EmbeddingCache
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.infrastructure.hashing_embedder import HashingEmbedder
+from adraitools.infrastructure.logging_service import LoggingService
+from adraitools.infrastructure.process_pool_embedder import ProcessPoolEmbedder
+from adraitools.infrastructure.resource_monitor import peak_rss_bytes
+from adraitools.infrastructure.user_interaction_service import UserInteractionService
+from adraitools.infrastructure.vector_index_store import VectorIndexStore
+from adraitools.services.adr_chunker import AdrChunker
+from adraitools.services.adr_corpus_loader import AdrCorpusLoader
+from adraitools.services.adr_initializer import AdrInitializer
+from adraitools.services.adr_linter import AdrLinter
+from adraitools.services.adr_parser import AdrParser
+from adraitools.services.embedding_indexer import EmbeddingIndexer
+from adraitools.services.llm_benchmark import percentile
+from adraitools.services.models.benchmark import (
+    BenchmarkRegression,
+    BenchmarkSuiteResult,
+)
+from adraitools.services.models.configuration import AdrConfiguration
+
+DEFAULT_REPEATS = 3
+DEFAULT_SEARCHES = 200
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+# Changes below one unit (1 ms, 1 MiB) are noise whatever their ratio
+MIN_REGRESSION_DELTA = 1.0
+SEARCH_TOP_K = 5
+_BYTES_PER_MIB = 1_048_576
+_COLD_START_COMMAND = (sys.executable, "-m", "adraitools.cli.cli", "--version")
+
+
+def find_regressions(
+    current: BenchmarkSuiteResult,
+    baseline: BenchmarkSuiteResult,
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+    min_delta: float = MIN_REGRESSION_DELTA,
+) -> list[BenchmarkRegression]:
+    """Compare a run with a baseline run of the suite.
+
+    A metric regresses when it grew by more than ``threshold`` relative to
+    the baseline and by more than ``min_delta`` in absolute terms. Metrics
+    missing from either run are not compared.
+
+    Args:
+        current: Run to check
+        baseline: Reference run, typically of the previous version
+        threshold: Tolerated relative increase, 0.2 for 20%
+        min_delta: Tolerated absolute increase
+
+    Returns:
+        Regressed metrics in the order of the current run
+    """
+    regressions: list[BenchmarkRegression] = []
+    for metric, value in current.metrics.items():
+        before = baseline.metrics.get(metric)
+        if before is None:
+            continue
+        delta = value - before
+        if delta <= min_delta or delta <= threshold * before:
+            continue
+        regressions.append(
+            BenchmarkRegression(
+                metric=metric,
+                baseline=before,
+                current=value,
+                change=delta / before if before > 0 else float("inf"),
+            )
+        )
+    return regressions
+
+
+class BenchmarkSuite:
+    """Service running the standard benchmark suite against an ADR corpus.
+
+    The suite covers CLI cold start, configuration resolution, ``init``,
+    parsing, a cold index build, search latency and ``lint``, and records
+    the peak memory of the process. Caches and indexes are created in a
+    scratch directory, so every run measures cold work and the project
+    caches are left alone. Scenarios are repeated and report their median.
+    """
+
+    def __init__(
+        self,
+        file_system_service: FileSystemService,
+        adr_parser: AdrParser,
+        logging_service: LoggingService,
+        repeats: int = DEFAULT_REPEATS,
+        workers: int | None = None,
+    ) -> None:
+        """Initialize the suite.
+
+        Args:
+            file_system_service: Service the ADRs are read with
+            adr_parser: Parser of the ADRs
+            logging_service: Logging service handed to the indexer
+            repeats: Runs of every scenario
+            workers: Embedding processes, CPU count if None
+        """
+        self.file_system_service = file_system_service
+        self.adr_parser = adr_parser
+        self.logging_service = logging_service
+        self.repeats = repeats
+        self.workers = workers
+
+    def run(
+        self,
+        corpus: Path,
+        scratch: Path,
+        description: str | None = None,
+        searches: int = DEFAULT_SEARCHES,
+    ) -> BenchmarkSuiteResult:
+        """Run every scenario against a corpus.
+
+        Args:
+            corpus: Directory of the ADRs, with the template if it has one
+            scratch: Empty directory for caches, indexes and ``init`` runs
+            description: How the corpus was made, the directory if None
+            searches: Queries timed for the search percentiles
+
+        Returns:
+            Median timings in milliseconds and peak memory in MiB
+        """
+        configuration = AdrConfiguration(
+            adr_directory=corpus,
+            template_file=corpus / PathConstants.DEFAULT_TEMPLATE_FILE.name,
+        )
+        corpus_loader = AdrCorpusLoader(self.file_system_service, self.adr_parser)
+        metrics = {
+            "cli_cold_start_ms": self._median(
+                lambda _: subprocess.run(  # noqa: S603
+                    _COLD_START_COMMAND, check=True, capture_output=True
+                )
+            ),
+            "config_resolve_ms": self._median(
+                lambda _: ConfigurationService().get_configuration()
+            ),
+            "init_ms": self._median(lambda run: self._init(scratch / f"init-{run}")),
+            "parse_ms": self._median(
+                lambda _: corpus_loader.load(
+                    corpus, exclude=configuration.template_file
+                )
+            ),
+            "index_build_ms": self._median(
+                lambda run: self._index(configuration, scratch / f"index-{run}")
+            ),
+        }
+        documents = corpus_loader.load(corpus, exclude=configuration.template_file)
+        metrics.update(
+            self._search(
+                scratch / f"index-{self.repeats - 1}",
+                [document.title for document in documents] or ["decision"],
+                searches,
+            )
+        )
+        metrics["lint_ms"] = self._median(
+            lambda run: self._lint(configuration, scratch / f"lint-{run}.db")
+        )
+        peak = peak_rss_bytes()
+        if peak is not None:
+            metrics["peak_rss_mib"] = peak / _BYTES_PER_MIB
+
+        return BenchmarkSuiteResult(
+            version=__version__,
+            python=platform.python_version(),
+            adrs=len(documents),
+            corpus=description or str(corpus),
+            metrics={name: round(value, 3) for name, value in metrics.items()},
+        )
+
+    def _median(self, scenario: Callable[[int], object]) -> float:
+        """Get the median duration of the repeated runs of a scenario."""
+        durations = []
+        for run in range(self.repeats):
+            started = time.perf_counter_ns()
+            scenario(run)
+            durations.append((time.perf_counter_ns() - started) / 1_000_000)
+        return statistics.median(durations)
+
+    def _init(self, project: Path) -> None:
+        """Initialize the ADR structure of a new project."""
+        adr_directory = project / PathConstants.DEFAULT_ADR_DIRECTORY
+        AdrInitializer(
+            file_system_service=self.file_system_service,
+            user_interaction_service=UserInteractionService(),
+            configuration_service=ConfigurationService(
+                AdrConfiguration(
+                    adr_directory=adr_directory,
+                    template_file=adr_directory
+                    / PathConstants.DEFAULT_TEMPLATE_FILE.name,
+                )
+            ),
+        ).initialize()
+
+    def _index(self, configuration: AdrConfiguration, directory: Path) -> None:
+        """Build the vector index of the corpus from an empty cache."""
+        content_cache = ContentCache(directory / PathConstants.CACHE_FILE)
+        try:
+            EmbeddingIndexer(
+                configuration_service=ConfigurationService(configuration),
+                corpus_loader=AdrCorpusLoader(
+                    self.file_system_service, self.adr_parser
+                ),
+                chunker=AdrChunker(),
+                embedder=ProcessPoolEmbedder(HashingEmbedder(), workers=self.workers),
+                embedding_cache=EmbeddingCache(content_cache),
+                vector_index_store=VectorIndexStore(directory),
+                logging_service=self.logging_service,
+            ).build()
+        finally:
+            content_cache.close()
+
+    @staticmethod
+    def _search(directory: Path, queries: list[str], searches: int) -> dict[str, float]:
+        """Time queries against a built index, embedding included."""
+        index = VectorIndexStore(directory).load()
+        embedder = HashingEmbedder()
+        latencies = []
+        for number in range(searches):
+            query = queries[number % len(queries)]
+            started = time.perf_counter_ns()
+            index.search(
+                np.asarray(embedder.embed_one(query), dtype=np.float32), SEARCH_TOP_K
+            )
+            latencies.append((time.perf_counter_ns() - started) / 1_000_000)
+        return {
+            "search_p50_ms": percentile(latencies, 50),
+            "search_p95_ms": percentile(latencies, 95),
+            "search_p99_ms": percentile(latencies, 99),
+        }
+
+    def _lint(self, configuration: AdrConfiguration, cache_file: Path) -> None:
+        """Lint every ADR of the corpus from an empty cache."""
+        content_cache = ContentCache(cache_file)
+        try:
+            AdrLinter(
+                configuration_service=ConfigurationService(configuration),
+                file_system_service=self.file_system_service,
+                content_cache=content_cache,
+            ).lint(all_files=True)
+        finally:
+            content_cache.close()
@@ -0,0 +1,287 @@
+"""LLM-assisted decision conflict detection service."""
+
+import hashlib
+import itertools
+import json
+import math
+from collections import Counter, defaultdict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+
+from adraitools.exceptions import LlmProviderError
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.content_cache import ContentCache
+from adraitools.infrastructure.embedder import Embedder
+from adraitools.infrastructure.llm_provider import LlmProvider
+from adraitools.infrastructure.span_recorder import timed
+from adraitools.services.adr_corpus_loader import AdrCorpusLoader
+from adraitools.services.adr_retriever import tokenize
+from adraitools.services.models.adr import AdrDocument
+from adraitools.services.models.analysis import (
+    ConflictReport,
+    ConflictVerdict,
+    DecisionConflict,
+)
+from adraitools.services.models.llm import LlmRequest
+
+CACHE_NAMESPACE = "conflicts:v1"
+ACTIVE_STATUSES = ("accepted", "proposed")
+KEY_TERMS = 8
+# Terms marking more than this share of the ADRs are too common to block on
+MAX_TERM_SHARE = 0.05
+NEIGHBOURS = 5
+MIN_NEIGHBOUR_SIMILARITY = 0.35
+_SIMILARITY_BLOCK = 1024
+BATCH_SIZE = 8
+CONCURRENCY = 4
+MAX_DECISION_CHARACTERS = 1500
+SYSTEM_PROMPT = (
+    "You review a project's Architecture Decision Records for decisions that "
+    "contradict each other, meaning both cannot be followed at the same time, "
+    "for example two ADRs choosing different message brokers for the same "
+    "purpose. Decisions about unrelated concerns do not conflict. For every "
+    'numbered pair, answer with one line of JSON: {"pair": <number>, '
+    '"conflict": true or false, "reason": "<one sentence>"}. '
+    "Answer with these lines only."
+)
+
+Pair = tuple[int, int]
+
+
+def decision_text(document: AdrDocument) -> str:
+    """Get the text a decision is compared on: its title and Decision."""
+    return f"{document.title}\n{document.section('Decision')}"
+
+
+class ConflictDetector:
+    """Service flagging ADRs whose decisions contradict each other.
+
+    Only accepted and proposed ADRs are compared. A blocking stage keeps the
+    pairs sharing one of their distinctive key terms or being among each
+    other's nearest embedding neighbours, which removes almost every pair
+    before a model is involved. Remaining pairs are verified by the LLM in
+    batches sent concurrently, and verdicts are cached by the content
+    hashes of both ADRs, so unchanged pairs are never asked about twice.
+    """
+
+    def __init__(
+        self,
+        configuration_service: ConfigurationService,
+        corpus_loader: AdrCorpusLoader,
+        embedder: Embedder,
+        llm_provider: LlmProvider,
+        content_cache: ContentCache,
+    ) -> None:
+        """Initialize the conflict detector."""
+        self.configuration_service = configuration_service
+        self.corpus_loader = corpus_loader
+        self.embedder = embedder
+        self.llm_provider = llm_provider
+        self.content_cache = content_cache
+
+    @timed("analyze.conflicts")
+    def find_conflicts(self, deadline: float | None = None) -> ConflictReport:
+        """Find contradicting decisions in the configured ADR directory.
+
+        Args:
+            deadline: time.monotonic() value by which every model call must
+                have finished, None for no deadline. Pairs whose batch missed
+                it are counted as without verdict.
+        """
+        config = self.configuration_service.get_configuration()
+        documents = self.corpus_loader.load(
+            config.adr_directory, exclude=config.template_file
+        )
+        active = [
+            document
+            for document in documents
+            if document.status.lower().startswith(ACTIVE_STATUSES)
+        ]
+        candidates = sorted(self.key_term_pairs(active) | self.neighbour_pairs(active))
+
+        model = f"{config.llm_provider}:{config.llm_model}"
+        keys = {pair: self._cache_key(model, active, pair) for pair in candidates}
+        verdicts = {
+            key: ConflictVerdict.model_validate_json(value)
+            for key, value in self.content_cache.get_many(
+                CACHE_NAMESPACE, keys.values()
+            ).items()
+        }
+        cached = sum(key in verdicts for key in keys.values())
+        pending = [pair for pair in candidates if keys[pair] not in verdicts]
+        batches = [
+            pending[start : start + BATCH_SIZE]
+            for start in range(0, len(pending), BATCH_SIZE)
+        ]
+        for batch, answers in self._verify(active, batches, deadline):
+            fresh = {keys[pair]: answers[pair] for pair in batch if pair in answers}
+            self.content_cache.put_many(
+                CACHE_NAMESPACE,
+                {
+                    key: verdict.model_dump_json().encode()
+                    for key, verdict in fresh.items()
+                },
+            )
+            verdicts.update(fresh)
+
+        conflicts = [
+            DecisionConflict(
+                first=active[first].path,
+                second=active[second].path,
+                reason=verdicts[keys[first, second]].reason,
+            )
+            for first, second in candidates
+            if keys[first, second] in verdicts
+            and verdicts[keys[first, second]].conflict
+        ]
+        return ConflictReport(
+            total_pairs=math.comb(len(documents), 2),
+            active_pairs=math.comb(len(active), 2),
+            candidate_pairs=len(candidates),
+            cached_pairs=cached,
+            verified_pairs=len(pending),
+            llm_calls=len(batches),
+            unanswered_pairs=sum(key not in verdicts for key in keys.values()),
+            conflicts=conflicts,
+        )
+
+    @staticmethod
+    def key_term_pairs(documents: Sequence[AdrDocument]) -> set[Pair]:
+        """Get the pairs of ADRs sharing one of their key terms.
+
+        Key terms of an ADR are the terms of its title and Decision with
+        the highest TF-IDF weight, among terms used by at least two ADRs
+        and at most MAX_TERM_SHARE of them.
+        """
+        term_counts = [Counter(tokenize(decision_text(d))) for d in documents]
+        frequencies: Counter[str] = Counter()
+        for terms in term_counts:
+            frequencies.update(terms.keys())
+        limit = max(2, int(MAX_TERM_SHARE * len(documents)))
+
+        holders: defaultdict[str, list[int]] = defaultdict(list)
+        for index, terms in enumerate(term_counts):
+            weighted = [
+                (count * math.log(len(documents) / frequencies[term]), term)
+                for term, count in terms.items()
+                if 2 <= frequencies[term] <= limit  # noqa: PLR2004 - a pair
+            ]
+            for _, term in sorted(weighted, reverse=True)[:KEY_TERMS]:
+                holders[term].append(index)
+        return {
+            pair
+            for indexes in holders.values()
+            for pair in itertools.combinations(indexes, 2)
+        }
+
+    def neighbour_pairs(self, documents: Sequence[AdrDocument]) -> set[Pair]:
+        """Get the pairs where one ADR is among the other's nearest neighbours.
+
+        Similarities are computed block by block, so memory stays bounded
+        for large corpora.
+        """
+        if len(documents) < 2:  # noqa: PLR2004 - a pair
+            return set()
+        vectors = np.asarray(
+            self.embedder.embed([decision_text(d) for d in documents]),
+            dtype=np.float32,
+        )
+        count = min(NEIGHBOURS, len(documents) - 1)
+        pairs: set[Pair] = set()
+        for start in range(0, len(documents), _SIMILARITY_BLOCK):
+            block = vectors[start : start + _SIMILARITY_BLOCK] @ vectors.T
+            own = np.arange(len(block))
+            block[own, own + start] = -np.inf
+            nearest = np.argpartition(-block, count - 1, axis=1)[:, :count]
+            close = (
+                np.take_along_axis(block, nearest, axis=1) >= MIN_NEIGHBOUR_SIMILARITY
+            )
+            rows, columns = np.nonzero(close)
+            neighbours = nearest[rows, columns]
+            pairs.update(
+                (min(first, second), max(first, second))
+                for first, second in zip(
+                    (rows + start).tolist(), neighbours.tolist(), strict=True
+                )
+            )
+        return pairs
+
+    def _verify(
+        self,
+        documents: Sequence[AdrDocument],
+        batches: list[list[Pair]],
+        deadline: float | None,
+    ) -> list[tuple[list[Pair], dict[Pair, ConflictVerdict]]]:
+        """Ask the model about batches of pairs concurrently.
+
+        Raises:
+            LlmProviderError: If every batch failed
+        """
+        results = []
+        error: LlmProviderError | None = None
+        with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+            futures = {
+                pool.submit(self._verify_batch, documents, batch, deadline): batch
+                for batch in batches
+            }
+            for future in as_completed(futures):
+                try:
+                    results.append((futures[future], future.result()))
+                except LlmProviderError as e:
+                    error = e
+        if error is not None and not results:
+            raise error
+        return results
+
+    def _verify_batch(
+        self,
+        documents: Sequence[AdrDocument],
+        batch: list[Pair],
+        deadline: float | None,
+    ) -> dict[Pair, ConflictVerdict]:
+        """Ask the model about one batch of pairs."""
+        blocks = []
+        for number, (first, second) in enumerate(batch, start=1):
+            blocks.append(
+                f"Pair {number}:\n{self._describe(documents[first])}\n---\n"
+                f"{self._describe(documents[second])}"
+            )
+        response = self.llm_provider.complete(
+            LlmRequest(
+                system_prompt=SYSTEM_PROMPT,
+                prompt="\n\n".join(blocks),
+                deadline=deadline,
+            )
+        )
+        verdicts: dict[Pair, ConflictVerdict] = {}
+        for line in response.text.splitlines():
+            try:
+                answer = json.loads(line.strip().strip("`"))
+                number = int(answer["pair"])
+                verdict = ConflictVerdict(
+                    conflict=bool(answer["conflict"]),
+                    reason=str(answer.get("reason", "")),
+                )
+            except (ValueError, TypeError, KeyError):
+                continue
+            if 1 <= number <= len(batch):
+                verdicts[batch[number - 1]] = verdict
+        return verdicts
+
+    @staticmethod
+    def _describe(document: AdrDocument) -> str:
+        """Describe an ADR decision for the prompt."""
+        decision = document.section("Decision")[:MAX_DECISION_CHARACTERS]
+        return (
+            f"[{document.identifier}] {document.title} ({document.status})\n"
+            f"Decision: {decision}"
+        )
+
+    @staticmethod
+    def _cache_key(model: str, documents: Sequence[AdrDocument], pair: Pair) -> str:
+        """Get the cache key of a pair's verdict, independent of pair order."""
+        hashes = sorted(documents[index].content_hash for index in pair)
+        material = "|".join([model, *hashes]).encode()
+        return hashlib.sha256(material).hexdigest()
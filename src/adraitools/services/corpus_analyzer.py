@@ -0,0 +1,331 @@
+"""Corpus statistics service."""
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+
+import numpy as np
+
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.constants import TemplateConstants
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.infrastructure.memory_profiler import checkpoint
+from adraitools.infrastructure.span_recorder import span, timed
+from adraitools.services.adr_corpus_loader import MAX_READ_WORKERS, AdrCorpusLoader
+from adraitools.services.adr_parser import AdrParser
+from adraitools.services.git_history_miner import GitHistoryMiner
+from adraitools.services.models.analysis import (
+    AdrActivity,
+    CorpusStatistics,
+    HistoryStatistics,
+)
+from adraitools.services.models.history import FileHistory
+
+SCAN_WINDOW = 2048
+HISTORY_TOP = 10
+READ_BATCH = 256
+UNKNOWN_STATUS = "(none)"
+# Labels and exclusive upper bounds in days of the age histogram buckets
+AGE_BUCKETS = (
+    ("< 30 days", 30),
+    ("30-89 days", 90),
+    ("90-179 days", 180),
+    ("180-364 days", 365),
+    ("1-2 years", 730),
+    ("2+ years", None),
+)
+_EPOCH = date(1970, 1, 1)
+_NO_DATE = np.iinfo(np.int64).min
+_MISSING = -1
+# Every pattern starts at a newline; each window is prefixed with one
+_HEADING = re.compile(rb"\n## ([^\n]*)")
+_FENCE = re.compile(rb"\n```")
+_LAST_ASCII_CONTROL = 32
+_METADATA_HEADINGS = frozenset((b"Status", b"Date"))
+
+
+def _day_number(value: str) -> int:
+    """Convert an ISO date to days since the epoch, _NO_DATE if invalid."""
+    try:
+        return (date.fromisoformat(value[:10]) - _EPOCH).days
+    except ValueError:
+        return int(_NO_DATE)
+
+
+class _Columns:
+    """Per-ADR columns filled by the scan, one row per ADR."""
+
+    def __init__(self, count: int, sections: int) -> None:
+        """Allocate the columns."""
+        self.statuses = np.full(count, UNKNOWN_STATUS, dtype=object)
+        self.days = np.full(count, _NO_DATE, dtype=np.int64)
+        self.words = np.zeros((count, sections), dtype=np.int32)
+
+
+class CorpusAnalyzer:
+    """Service computing corpus statistics in one streaming pass.
+
+    Files are read in windows; each window is concatenated into one buffer
+    and scanned as a whole: section headings and code fences are located
+    with a single regular expression pass, words are counted with NumPy on
+    the raw bytes, and every ADR ends up as one row of status, date and
+    per-section word count columns. Statistics are then aggregated on the
+    columns, so no per-ADR document objects are built. With a history
+    miner, staleness and churn from git are added.
+    """
+
+    def __init__(
+        self,
+        configuration_service: ConfigurationService,
+        corpus_loader: AdrCorpusLoader,
+        history_miner: GitHistoryMiner | None = None,
+    ) -> None:
+        """Initialize the corpus analyzer."""
+        self.configuration_service = configuration_service
+        self.corpus_loader = corpus_loader
+        self.history_miner = history_miner
+
+    @property
+    def file_system_service(self) -> FileSystemService:
+        """File system service of the corpus loader."""
+        return self.corpus_loader.file_system_service
+
+    def expected_sections(self) -> list[str]:
+        """Get the sections of the configured template, in template order.
+
+        Falls back to the built-in template when the file does not exist in
+        the file system the corpus is read from, e.g. at an older revision.
+        """
+        template_file = self.configuration_service.get_configuration().template_file
+        if self.file_system_service.path_exists(template_file):
+            text = self.file_system_service.read_text(template_file)
+        else:
+            text = TemplateConstants.ADR_TEMPLATE
+        return list(AdrParser.split_sections(text)[1])
+
+    @timed("analyze.statistics")
+    def analyze(self, today: date | None = None) -> CorpusStatistics:
+        """Compute the statistics of the configured ADR directory.
+
+        Args:
+            today: Reference date for ages, the current date if None
+
+        Returns:
+            Corpus statistics
+        """
+        config = self.configuration_service.get_configuration()
+        paths = self.corpus_loader.list_paths(
+            config.adr_directory, exclude=config.template_file
+        )
+        sections = self.expected_sections()
+        columns = _Columns(len(paths), len(sections))
+        with span("analyze.scan") as current:
+            scanned = self._scan(paths, sections, columns)
+            current.set_attribute("adr.files", len(paths))
+            current.set_attribute("adr.bytes", scanned)
+        checkpoint("parse")
+        today = today or datetime.now().astimezone().date()
+        statistics = self._aggregate(sections, columns, today)
+        if self.history_miner is None:
+            return statistics
+        history = self._history_statistics(paths, self.history_miner.history(), today)
+        return statistics.model_copy(update={"history": history})
+
+    def _scan(self, paths: list[Path], sections: list[str], columns: _Columns) -> int:
+        """Read the ADRs window by window and fill their column rows.
+
+        The next window is read in the background while the current one is
+        scanned; reads are batched so that thread hand-offs stay rare.
+
+        Returns:
+            Number of bytes read
+        """
+        scanned = 0
+        batches = [
+            paths[start : start + READ_BATCH]
+            for start in range(0, len(paths), READ_BATCH)
+        ]
+        per_window = SCAN_WINDOW // READ_BATCH
+        workers = min(MAX_READ_WORKERS, (os.cpu_count() or 1) + 4, per_window)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = [
+                pool.submit(self._read_batch, batch) for batch in batches[:per_window]
+            ]
+            for number, first_row in enumerate(range(0, len(paths), SCAN_WINDOW)):
+                texts = [text for future in pending for text in future.result()]
+                following = batches[
+                    (number + 1) * per_window : (number + 2) * per_window
+                ]
+                pending = [pool.submit(self._read_batch, batch) for batch in following]
+                self._scan_window(texts, first_row, sections, columns)
+                scanned += sum(len(text) for text in texts)
+        return scanned
+
+    def _read_batch(self, paths: list[Path]) -> list[bytes]:
+        """Read a batch of files."""
+        return [self.file_system_service.read_bytes(path) for path in paths]
+
+    @staticmethod
+    def _scan_window(
+        texts: list[bytes], first_row: int, sections: list[str], columns: _Columns
+    ) -> None:
+        """Fill the column rows of a window of ADR files."""
+        # Joining with newlines lets every heading and fence match "\n..."
+        buffer = b"\n" + b"\n".join(texts)
+        starts = np.cumsum([0] + [len(text) + 1 for text in texts], dtype=np.int64)
+
+        fences = np.array([m.start() for m in _FENCE.finditer(buffer)], np.int64)
+        matches = list(_HEADING.finditer(buffer))
+        heading_starts = np.array([m.start() for m in matches], dtype=np.int64)
+        body_starts = np.array([m.end() for m in matches], dtype=np.int64)
+        documents = np.searchsorted(starts, heading_starts, side="right") - 1
+
+        # Headings preceded by an odd number of fences in their file are code
+        fences_before = np.searchsorted(fences, heading_starts) - np.searchsorted(
+            fences, starts[documents]
+        )
+        real = fences_before % 2 == 0
+        matches = [match for match, keep in zip(matches, real, strict=True) if keep]
+        heading_starts = heading_starts[real]
+        body_starts = body_starts[real]
+        documents = documents[real]
+
+        # A section ends where the next heading of the same file starts
+        body_ends = starts[documents + 1]
+        same_file = documents[1:] == documents[:-1]
+        body_ends[:-1][same_file] = heading_starts[1:][same_file]
+
+        # Word starts: a non-whitespace byte after an ASCII whitespace byte
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        is_word = data > _LAST_ASCII_CONTROL
+        word_starts = np.flatnonzero(is_word[1:] > is_word[:-1]) + 1
+        words = np.searchsorted(word_starts, body_ends) - np.searchsorted(
+            word_starts, body_starts
+        )
+
+        names = [match.group(1).strip() for match in matches]
+        index = {heading.encode(): column for column, heading in enumerate(sections)}
+        section_columns = np.array(
+            [index.get(name, _MISSING) for name in names], dtype=np.int64
+        )
+        known = section_columns != _MISSING
+        np.add.at(
+            columns.words,
+            (first_row + documents[known], section_columns[known]),
+            words[known],
+        )
+
+        for position, name in enumerate(names):
+            if name not in _METADATA_HEADINGS:
+                continue
+            body = buffer[body_starts[position] : body_ends[position]]
+            value = AdrParser.first_line(body.decode("utf-8", errors="replace"))
+            row = first_row + int(documents[position])
+            if name == b"Status" and value:
+                columns.statuses[row] = value
+            elif name == b"Date":
+                columns.days[row] = _day_number(value)
+
+    @staticmethod
+    def _history_statistics(
+        paths: list[Path], history: dict[str, FileHistory], today: date
+    ) -> HistoryStatistics:
+        """Aggregate the commit activity of the analyzed ADRs."""
+        tracked = [(path, history[path.name]) for path in paths if path.name in history]
+        activities = [
+            AdrActivity(
+                path=path,
+                revisions=entry.revisions,
+                authors=len(entry.authors),
+                last_touched=datetime.fromtimestamp(entry.last_touched)
+                .astimezone()
+                .date(),
+            )
+            for path, entry in tracked
+        ]
+        ages = np.array(
+            [(today - activity.last_touched).days for activity in activities],
+            dtype=np.int64,
+        )
+        bounds = [bound for _, bound in AGE_BUCKETS if bound is not None]
+        buckets = np.bincount(
+            np.searchsorted(bounds, ages, side="right"), minlength=len(AGE_BUCKETS)
+        )
+        revisions = sum(activity.revisions for activity in activities)
+        return HistoryStatistics(
+            tracked=len(activities),
+            untracked=len(paths) - len(activities),
+            authors=len({author for _, entry in tracked for author in entry.authors}),
+            average_revisions=(
+                round(revisions / len(activities), 1) if activities else 0.0
+            ),
+            staleness_histogram={
+                label: int(total)
+                for (label, _), total in zip(AGE_BUCKETS, buckets, strict=True)
+            },
+            stalest=sorted(
+                activities, key=lambda activity: (activity.last_touched, activity.path)
+            )[:HISTORY_TOP],
+            most_revised=sorted(
+                activities, key=lambda activity: (-activity.revisions, activity.path)
+            )[:HISTORY_TOP],
+        )
+
+    @staticmethod
+    def _aggregate(
+        sections: list[str], columns: _Columns, today: date
+    ) -> CorpusStatistics:
+        """Aggregate the per-ADR columns into corpus statistics."""
+        status_names, status_totals = np.unique(
+            columns.statuses.astype(str), return_counts=True
+        )
+        by_frequency = np.argsort(-status_totals, kind="stable")
+
+        dated = columns.days[columns.days != _NO_DATE]
+        ages = (today - _EPOCH).days - dated
+        bounds = [bound for _, bound in AGE_BUCKETS if bound is not None]
+        buckets = np.bincount(
+            np.searchsorted(bounds, ages, side="right"), minlength=len(AGE_BUCKETS)
+        )
+
+        months, month_totals = np.unique(
+            dated.astype("datetime64[D]").astype("datetime64[M]"), return_counts=True
+        )
+
+        words = columns.words
+        present = words > 0
+        present_counts = present.sum(axis=0)
+        averages = np.divide(
+            words.sum(axis=0, dtype=np.int64),
+            present_counts,
+            out=np.zeros(len(sections), dtype=np.float64),
+            where=present_counts > 0,
+        )
+        missing = len(words) - present_counts
+
+        return CorpusStatistics(
+            total=len(words),
+            status_counts={
+                str(status_names[i]): int(status_totals[i]) for i in by_frequency
+            },
+            age_histogram={
+                label: int(total)
+                for (label, _), total in zip(AGE_BUCKETS, buckets, strict=True)
+            },
+            undated=len(words) - len(dated),
+            decisions_per_month={
+                str(month): int(total)
+                for month, total in zip(months, month_totals, strict=True)
+            },
+            average_section_words={
+                heading: round(float(average), 1)
+                for heading, average in zip(sections, averages, strict=True)
+            },
+            missing_sections={
+                heading: int(total)
+                for heading, total in zip(sections, missing, strict=True)
+            },
+            incomplete=int((~present).any(axis=1).sum()),
+        )
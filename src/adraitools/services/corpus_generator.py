@@ -0,0 +1,319 @@
+"""Synthetic ADR corpus generation for scale testing."""
+
+import hashlib
+import itertools
+import math
+import os
+import random
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+
+from adraitools.services.models.benchmark import GeneratedCorpus
+
+BLOCK_SIZE = 64
+BLOCKS_PER_TASK = 16
+FIRST_DATE = date(2015, 1, 1)
+DATE_SPAN_DAYS = 3650
+CHAIN_START_RATE = 0.08
+MAX_CHAIN_LENGTH = 4
+MAX_REFERENCES = 3
+MIN_SENTENCE_WORDS = 8
+MAX_SENTENCE_WORDS = 22
+
+_VERBS = ("Use", "Adopt", "Introduce", "Replace", "Standardize on", "Migrate to")
+_TECHNOLOGIES = (
+    "PostgreSQL",
+    "Kafka",
+    "Redis",
+    "gRPC",
+    "GraphQL",
+    "Terraform",
+    "Kubernetes",
+    "OpenTelemetry",
+    "event sourcing",
+    "feature flags",
+    "trunk-based development",
+    "a service mesh",
+    "contract tests",
+    "blue-green deployments",
+    "a monorepo",
+    "S3 object storage",
+)
+_AREAS = (
+    "billing",
+    "search",
+    "the mobile API",
+    "notifications",
+    "reporting",
+    "identity",
+    "the data platform",
+    "payments",
+    "onboarding",
+    "audit logging",
+    "inventory",
+    "pricing",
+)
+_STATUSES = (("Accepted", 0.7), ("Proposed", 0.15), ("Deprecated", 0.15))
+_VOCABULARY = (
+    "service latency throughput team cost risk migration schema queue cache "
+    "deployment incident consistency availability contract client request "
+    "storage retention encryption compliance budget roadmap dependency tooling "
+    "monitoring alert rollout rollback version interface boundary ownership "
+    "capacity load peak region failover backup audit customer partner release "
+    "pipeline build test review standard library framework vendor license "
+    "operational overhead complexity trade-off constraint requirement option "
+    "we need to keep the and a of for with without because while when this "
+    "that our current new existing proposed simpler faster cheaper safer"
+)
+# 256 words, so every random byte picks one; the first words come more often
+_WORDS = tuple(itertools.islice(itertools.cycle(_VOCABULARY.split()), 256))
+_SLUG_DROP = re.compile(r"[^a-z0-9]+")
+# Sentences per section, as (mu, sigma) of a log-normal distribution
+_SECTION_SENTENCES = {
+    "Context": (1.6, 0.5),
+    "Decision": (0.9, 0.4),
+    "Rationale": (1.3, 0.5),
+    "Positive Implications": (0.8, 0.4),
+    "Concerns": (0.8, 0.5),
+    "Alternatives": (1.1, 0.6),
+    "Future Direction": (0.6, 0.5),
+}
+
+
+def _digest(seed: int, *parts: object) -> int:
+    """Get a stable 64-bit number for a seed and some parts."""
+    material = ":".join(str(part) for part in (seed, *parts)).encode()
+    return int.from_bytes(hashlib.blake2b(material, digest_size=8).digest(), "big")
+
+
+def adr_title(seed: int, number: int) -> str:
+    """Get the title of a generated ADR without generating the ADR.
+
+    Titles only depend on the seed and the number, so any worker can link
+    to an ADR written by another one.
+
+    Examples:
+        >>> adr_title(0, 7) == adr_title(0, 7)
+        True
+    """
+    value = _digest(seed, "title", number)
+    value, verb = divmod(value, len(_VERBS))
+    value, technology = divmod(value, len(_TECHNOLOGIES))
+    area = value % len(_AREAS)
+    return f"{_VERBS[verb]} {_TECHNOLOGIES[technology]} for {_AREAS[area]}"
+
+
+def adr_file_name(seed: int, number: int, width: int) -> str:
+    """Get the file name of a generated ADR, e.g. ``0007-use-redis-for-search.md``.
+
+    Examples:
+        >>> adr_file_name(0, 7, 4).startswith("0007-")
+        True
+    """
+    slug = _SLUG_DROP.sub("-", adr_title(seed, number).lower()).strip("-")
+    return f"{number:0{width}d}-{slug}.md"
+
+
+def _plan_chains(
+    seed: int, block: int, first: int, last: int
+) -> tuple[dict[int, int], dict[int, int]]:
+    """Pick the supersession chains of the ADRs of one block.
+
+    Chains never leave their block, so every block can be written alone.
+
+    Returns:
+        Successor by superseded ADR number and predecessor by successor
+    """
+    rng = random.Random(_digest(seed, "chains", block))  # noqa: S311
+    successors: dict[int, int] = {}
+    predecessors: dict[int, int] = {}
+    for number in range(first, last + 1):
+        if number in predecessors or rng.random() >= CHAIN_START_RATE:
+            continue
+        current = number
+        for _ in range(rng.randint(1, MAX_CHAIN_LENGTH - 1)):
+            candidates = [
+                later
+                for later in range(current + 1, min(current + 9, last + 1))
+                if later not in predecessors and later not in successors
+            ]
+            if not candidates:
+                break
+            successor = rng.choice(candidates)
+            successors[current] = successor
+            predecessors[successor] = current
+            current = successor
+    return successors, predecessors
+
+
+class _AdrWriter:
+    """Writer of the ADRs of one block, sharing one random stream."""
+
+    def __init__(self, seed: int, count: int, width: int, block: int) -> None:
+        """Initialize the writer of a block."""
+        self.seed = seed
+        self.count = count
+        self.width = width
+        self.first = block * BLOCK_SIZE + 1
+        self.last = min(count, self.first + BLOCK_SIZE - 1)
+        self.rng = random.Random(_digest(seed, "block", block))  # noqa: S311
+        self.successors, self.predecessors = _plan_chains(
+            seed, block, self.first, self.last
+        )
+
+    def identifier(self, number: int) -> str:
+        """Get the ``ADR-0007`` style identifier of an ADR."""
+        return f"ADR-{number:04d}"
+
+    def link(self, number: int) -> str:
+        """Get a markdown link to an ADR file."""
+        return (
+            f"[{self.identifier(number)}]"
+            f"({adr_file_name(self.seed, number, self.width)})"
+        )
+
+    def paragraph(self, section: str) -> str:
+        """Get a paragraph of a log-normally distributed number of sentences."""
+        mu, sigma = _SECTION_SENTENCES[section]
+        sentences = max(1, round(self.rng.lognormvariate(mu, sigma)))
+        # One random byte per sentence length and per word
+        noise = self.rng.randbytes(sentences * (MAX_SENTENCE_WORDS + 1))
+        spread = MAX_SENTENCE_WORDS - MIN_SENTENCE_WORDS + 1
+        lines = []
+        position = 0
+        for _ in range(sentences):
+            words = MIN_SENTENCE_WORDS + noise[position] % spread
+            chosen = noise[position + 1 : position + 1 + words]
+            position += 1 + words
+            lines.append(" ".join(map(_WORDS.__getitem__, chosen)).capitalize() + ".")
+        return " ".join(lines)
+
+    def status(self, number: int) -> str:
+        """Get the Status body of an ADR."""
+        if number in self.successors:
+            return f"Superseded\nSuperseded by {self.link(self.successors[number])}"
+        value = self.rng.random()
+        for status, share in _STATUSES:
+            if value < share:
+                return status
+            value -= share
+        return _STATUSES[0][0]
+
+    def date(self, number: int) -> str:
+        """Get a date never decreasing with the number, so successors come later."""
+        days = math.floor(DATE_SPAN_DAYS * (number - 1) / self.count)
+        return (FIRST_DATE + timedelta(days=days)).isoformat()
+
+    def references(self, number: int) -> list[str]:
+        """Get the References lines: supersession and links to earlier ADRs."""
+        lines = []
+        if number in self.predecessors:
+            lines.append(f"- Supersedes {self.link(self.predecessors[number])}")
+        if number > 1:
+            for _ in range(self.rng.randint(0, MAX_REFERENCES)):
+                earlier = self.rng.randint(max(1, number - 500), number - 1)
+                lines.append(f"- Related to {self.link(earlier)}")
+        return lines or ["- Team discussions and meeting notes"]
+
+    def text(self, number: int) -> str:
+        """Get the markdown of an ADR following the default template."""
+        parts = [
+            "# Architecture Decision Record (ADR)",
+            f"## Title\n{adr_title(self.seed, number)}",
+            f"## Status\n{self.status(number)}",
+            f"## Date\n{self.date(number)}",
+            f"## Context\n{self.paragraph('Context')}",
+            f"## Decision\n{self.paragraph('Decision')}",
+            f"## Rationale\n{self.paragraph('Rationale')}",
+            (
+                "## Implications\n### Positive Implications\n"
+                f"{self.paragraph('Positive Implications')}\n\n"
+                f"### Concerns\n{self.paragraph('Concerns')}"
+            ),
+            f"## Alternatives\n{self.paragraph('Alternatives')}",
+            f"## Future Direction\n{self.paragraph('Future Direction')}",
+            "## References\n" + "\n".join(self.references(number)),
+        ]
+        return "\n\n".join(parts) + "\n"
+
+
+def _write_blocks(
+    directory: Path, seed: int, count: int, width: int, blocks: range
+) -> tuple[int, int, int]:
+    """Write the ADRs of some blocks.
+
+    Returns:
+        Files written, bytes written and ADRs superseded
+    """
+    files = written = superseded = 0
+    for block in blocks:
+        writer = _AdrWriter(seed, count, width, block)
+        for number in range(writer.first, writer.last + 1):
+            data = writer.text(number).encode()
+            (directory / adr_file_name(seed, number, width)).write_bytes(data)
+            files += 1
+            written += len(data)
+        superseded += len(writer.successors)
+    return files, written, superseded
+
+
+class CorpusGenerator:
+    """Service writing realistic synthetic ADR corpora.
+
+    ADRs follow the default template with log-normally distributed section
+    lengths, a mix of statuses, dates growing with the ADR number, links to
+    earlier ADRs and supersession chains. The corpus is cut into blocks of
+    ``BLOCK_SIZE`` ADRs, each generated from its own seeded random stream,
+    so the output only depends on the seed and the count, however many
+    worker processes write the blocks.
+    """
+
+    def __init__(self, workers: int | None = None) -> None:
+        """Initialize the generator.
+
+        Args:
+            workers: Number of worker processes, CPU count if None
+        """
+        self.workers = workers or os.cpu_count() or 1
+
+    def generate(self, directory: Path, count: int, seed: int = 0) -> GeneratedCorpus:
+        """Write a synthetic corpus, replacing generated files of the same name.
+
+        Args:
+            directory: Directory the ADRs are written to, created if missing
+            count: Number of ADRs
+            seed: Seed of all generated content
+
+        Returns:
+            Summary of the written corpus
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        width = max(4, len(str(count)))
+        blocks = math.ceil(count / BLOCK_SIZE)
+        tasks = [
+            range(start, min(blocks, start + BLOCKS_PER_TASK))
+            for start in range(0, blocks, BLOCKS_PER_TASK)
+        ]
+        if self.workers == 1 or len(tasks) <= 1:
+            results = [
+                _write_blocks(directory, seed, count, width, task) for task in tasks
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                results = list(
+                    pool.map(
+                        _write_blocks,
+                        [directory] * len(tasks),
+                        [seed] * len(tasks),
+                        [count] * len(tasks),
+                        [width] * len(tasks),
+                        tasks,
+                    )
+                )
+        return GeneratedCorpus(
+            files=sum(files for files, _, _ in results),
+            bytes=sum(written for _, written, _ in results),
+            superseded=sum(superseded for _, _, superseded in results),
+        )
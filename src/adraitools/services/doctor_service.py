@@ -4,6 +4,7 @@ from pydantic import ValidationError
 
 from adraitools.exceptions import ConfigurationFileCorruptedError
 from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.span_recorder import timed
 from adraitools.services.models.result import DiagnosisResult
 
 
@@ -14,6 +15,7 @@ class DoctorService:
         """Initialize the doctor service."""
         self.configuration_service = configuration_service
 
+    @timed("doctor.diagnose")
     def diagnose(self) -> DiagnosisResult:
         """Diagnose the configuration."""
         try:
@@ -0,0 +1,165 @@
+"""Near-duplicate ADR detection service."""
+
+import numpy as np
+from numpy.typing import NDArray
+
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.constants import AnalysisConstants
+from adraitools.infrastructure.minhash_store import MinHashStore
+from adraitools.infrastructure.span_recorder import timed
+from adraitools.services import minhash
+from adraitools.services.adr_corpus_loader import AdrCorpusLoader
+from adraitools.services.models.adr import AdrDocument
+from adraitools.services.models.analysis import DuplicateReport, NearDuplicate
+from adraitools.services.models.index import (
+    MinHashState,
+    SignatureEntry,
+    SimilarPair,
+)
+
+# Metadata sections are left out of the compared body
+_METADATA_SECTIONS = frozenset(("title", "status", "date"))
+
+
+def body_text(document: AdrDocument) -> str:
+    """Get the text an ADR is compared on: every section but the metadata."""
+    return "\n".join(
+        body
+        for heading, body in document.sections.items()
+        if heading.lower() not in _METADATA_SECTIONS
+    )
+
+
+class DuplicateDetector:
+    """Service finding near-duplicate ADRs with MinHash and LSH.
+
+    Every ADR gets a MinHash signature of its word shingles. Signatures are
+    persisted next to the vector index with the fingerprint of their file,
+    so a run only signs added or changed ADRs and looks each of them up in
+    the band tables of the others, one binary search per band. Candidate
+    pairs are verified with the exact Jaccard similarity of their shingles
+    and kept, so unchanged pairs are not verified again.
+    """
+
+    def __init__(
+        self,
+        configuration_service: ConfigurationService,
+        corpus_loader: AdrCorpusLoader,
+        minhash_store: MinHashStore,
+    ) -> None:
+        """Initialize the duplicate detector."""
+        self.configuration_service = configuration_service
+        self.corpus_loader = corpus_loader
+        self.minhash_store = minhash_store
+
+    @timed("analyze.duplicates")
+    def find_duplicates(
+        self, threshold: float = AnalysisConstants.DEFAULT_DUPLICATE_THRESHOLD
+    ) -> DuplicateReport:
+        """Find ADR pairs whose bodies are near-identical.
+
+        Args:
+            threshold: Minimum Jaccard similarity of reported pairs; LSH
+                finds pairs reliably from about 0.7
+
+        Returns:
+            Report of the near-duplicate pairs
+        """
+        config = self.configuration_service.get_configuration()
+        directory = config.adr_directory.resolve()
+        template = config.template_file.resolve()
+        file_system_service = self.corpus_loader.file_system_service
+        fingerprints = {
+            name: fingerprint
+            for name, fingerprint in file_system_service.fingerprint_markdown_files(
+                directory
+            ).items()
+            if directory / name != template
+        }
+
+        state, stored = self._stored()
+        kept = [
+            row
+            for row, entry in enumerate(state.entries)
+            if fingerprints.get(entry.name) == entry.fingerprint
+        ]
+        kept_names = [state.entries[row].name for row in kept]
+        known = set(kept_names)
+        changed = sorted(name for name in fingerprints if name not in known)
+
+        changed_shingles = self._shingles(changed)
+        changed_signatures = minhash.signatures(changed_shingles)
+        kept_signatures = stored[kept]
+
+        # Pairs among changed ADRs, then changed ADRs against the kept ones
+        candidates = [
+            (changed[first], changed[second])
+            for first, second in minhash.LshIndex(changed_signatures).candidate_pairs()
+        ]
+        kept_index = minhash.LshIndex(kept_signatures)
+        candidates += [
+            (kept_names[row], name)
+            for name, signature in zip(changed, changed_signatures, strict=True)
+            for row in kept_index.query(signature)
+        ]
+
+        shingle_sets = dict(zip(changed, changed_shingles, strict=True))
+        reread = sorted({first for first, _ in candidates} - shingle_sets.keys())
+        shingle_sets.update(zip(reread, self._shingles(reread), strict=True))
+        pairs = [
+            pair for pair in state.pairs if pair.first in known and pair.second in known
+        ]
+        pairs += [
+            SimilarPair(
+                first=min(first, second),
+                second=max(first, second),
+                similarity=round(
+                    minhash.jaccard(shingle_sets[first], shingle_sets[second]), 4
+                ),
+            )
+            for first, second in candidates
+        ]
+
+        if changed or len(kept) != len(state.entries):
+            self.minhash_store.save(
+                MinHashState(
+                    entries=[state.entries[row] for row in kept]
+                    + [
+                        SignatureEntry(name=name, fingerprint=fingerprints[name])
+                        for name in changed
+                    ],
+                    pairs=pairs,
+                ),
+                np.vstack((kept_signatures, changed_signatures)),
+            )
+
+        duplicates = sorted(
+            (pair for pair in pairs if pair.similarity >= threshold),
+            key=lambda pair: (-pair.similarity, pair.first, pair.second),
+        )
+        return DuplicateReport(
+            total=len(fingerprints),
+            signed=len(changed),
+            verified=len(candidates),
+            duplicates=[
+                NearDuplicate(
+                    first=config.adr_directory / pair.first,
+                    second=config.adr_directory / pair.second,
+                    similarity=pair.similarity,
+                )
+                for pair in duplicates
+            ],
+        )
+
+    def _stored(self) -> tuple[MinHashState, NDArray[np.uint32]]:
+        """Get the saved signatures, empty if none were saved."""
+        if self.minhash_store.exists():
+            return self.minhash_store.load()
+        empty = np.empty((0, minhash.NUM_PERMUTATIONS), dtype=np.uint32)
+        return MinHashState(), empty
+
+    def _shingles(self, names: list[str]) -> list[NDArray[np.uint64]]:
+        """Read ADR files and shingle their bodies."""
+        directory = self.configuration_service.get_configuration().adr_directory
+        documents = self.corpus_loader.load_paths([directory / name for name in names])
+        return [minhash.shingles(body_text(document)) for document in documents]
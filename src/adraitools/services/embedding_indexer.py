@@ -0,0 +1,109 @@
+"""Incremental embedding index service."""
+
+import numpy as np
+
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.embedding_cache import EmbeddingCache
+from adraitools.infrastructure.logging_service import LoggingService
+from adraitools.infrastructure.memory_profiler import checkpoint
+from adraitools.infrastructure.process_pool_embedder import ProcessPoolEmbedder
+from adraitools.infrastructure.span_recorder import span, timed
+from adraitools.infrastructure.vector_index_store import VectorIndexStore
+from adraitools.services.adr_chunker import AdrChunker
+from adraitools.services.adr_corpus_loader import AdrCorpusLoader
+from adraitools.services.models.index import VectorIndexEntry
+from adraitools.services.models.result import EmbeddingIndexResult
+
+
+class EmbeddingIndexer:
+    """Service embedding the ADR corpus chunk by chunk.
+
+    Embeddings are cached by chunk content hash, so after an edit only the
+    chunks whose text actually changed are sent to the embedder. Every build
+    rewrites the memory-mappable vector index from the cached vectors.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        configuration_service: ConfigurationService,
+        corpus_loader: AdrCorpusLoader,
+        chunker: AdrChunker,
+        embedder: ProcessPoolEmbedder,
+        embedding_cache: EmbeddingCache,
+        vector_index_store: VectorIndexStore,
+        logging_service: LoggingService,
+    ) -> None:
+        """Initialize the embedding indexer."""
+        self.configuration_service = configuration_service
+        self.corpus_loader = corpus_loader
+        self.chunker = chunker
+        self.embedder = embedder
+        self.embedding_cache = embedding_cache
+        self.vector_index_store = vector_index_store
+        self.logging_service = logging_service
+
+    @timed("index.build")
+    def build(self) -> EmbeddingIndexResult:
+        """Chunk the corpus, embed missing chunks and save the vector index."""
+        config = self.configuration_service.get_configuration()
+        documents = self.corpus_loader.load(
+            config.adr_directory, exclude=config.template_file
+        )
+        with span("index.chunk"):
+            per_document = [self.chunker.chunk(document) for document in documents]
+            chunks = [chunk for chunked in per_document for chunk in chunked]
+        checkpoint("chunk")
+        for document, chunked in zip(documents, per_document, strict=True):
+            if not chunked:
+                # Keyed, so a corpus of empty stubs can be rate limited
+                self.logging_service.log_warning(
+                    "ADR has no content to index",
+                    fields={"adr": document.identifier, "path": document.path},
+                    key="index.empty-adr",
+                )
+            self.logging_service.log_debug(
+                "Chunked ADR",
+                fields={
+                    "adr": document.identifier,
+                    "path": document.path,
+                    "chunks": len(chunked),
+                },
+            )
+
+        # Identical chunks (e.g. duplicated boilerplate) are embedded once
+        unique = {chunk.content_hash: chunk for chunk in chunks}
+        with span("index.cache"):
+            vectors = self.embedding_cache.get_many(self.embedder.name, unique)
+        missing = [chunk for key, chunk in unique.items() if key not in vectors]
+        reused = sum(chunk.content_hash in vectors for chunk in chunks)
+        with span("index.embed"):
+            computed = self.embedder.embed_matrix([chunk.text for chunk in missing])
+        checkpoint("embed")
+        fresh = {chunk.content_hash: computed[row] for row, chunk in enumerate(missing)}
+        with span("index.cache"):
+            self.embedding_cache.put_many(self.embedder.name, fresh)
+        vectors.update(fresh)
+
+        matrix = np.zeros((len(chunks), self.embedder.dimensions), dtype=np.float32)
+        for row, chunk in enumerate(chunks):
+            matrix[row] = vectors[chunk.content_hash]
+        with span("index.save"):
+            self.vector_index_store.save(
+                [
+                    VectorIndexEntry(
+                        document_path=chunk.document_path,
+                        section=chunk.section,
+                        content_hash=chunk.content_hash,
+                    )
+                    for chunk in chunks
+                ],
+                matrix,
+            )
+        checkpoint("index")
+
+        return EmbeddingIndexResult(
+            documents=len(documents),
+            chunks=len(chunks),
+            reused_chunks=reused,
+            recomputed_chunks=len(missing),
+        )
@@ -0,0 +1,146 @@
+"""Git history mining service for ADR staleness and churn."""
+
+from pydantic import ValidationError
+
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.content_cache import ContentCache
+from adraitools.infrastructure.git_service import GitCommit, GitService
+from adraitools.infrastructure.span_recorder import timed
+from adraitools.services.models.history import FileHistory, HistoryState
+
+CACHE_NAMESPACE = "git-history:v1"
+_DELETED = "D"
+_RENAMED = "R"
+
+
+class _Activity:
+    """Mutable commit activity of one file while the log is replayed."""
+
+    def __init__(self) -> None:
+        """Initialize activity without any commit."""
+        self.revisions = 0
+        self.authors: set[str] = set()
+        self.first_touched = 0
+        self.last_touched = 0
+        self.last_commit = ""
+
+    @classmethod
+    def restore(cls, history: FileHistory) -> "_Activity":
+        """Resume from persisted activity."""
+        activity = cls()
+        activity.revisions = history.revisions
+        activity.authors = set(history.authors)
+        activity.first_touched = history.first_touched
+        activity.last_touched = history.last_touched
+        activity.last_commit = history.last_commit
+        return activity
+
+    def record(self, commit: GitCommit) -> None:
+        """Count a commit that changed the file."""
+        if not self.revisions:
+            self.first_touched = commit.timestamp
+        self.revisions += 1
+        self.authors.add(commit.author)
+        self.last_touched = commit.timestamp
+        self.last_commit = commit.sha
+
+    def freeze(self) -> FileHistory:
+        """Get the persistable activity."""
+        return FileHistory(
+            revisions=self.revisions,
+            authors=sorted(self.authors),
+            first_touched=self.first_touched,
+            last_touched=self.last_touched,
+            last_commit=self.last_commit,
+        )
+
+
+class GitHistoryMiner:
+    """Service mining the commit activity of every ADR from git.
+
+    The whole ADR directory is covered by one streaming ``git log`` pass
+    instead of one log per file. The result is cached with the commit it
+    was mined up to: while HEAD does not move nothing is run, and when it
+    moves forward only the new commits are replayed. A rewritten history
+    that no longer contains the cached commit is mined again from scratch.
+    Renames carry the activity over to the new file name.
+    """
+
+    def __init__(
+        self,
+        configuration_service: ConfigurationService,
+        git_service: GitService,
+        content_cache: ContentCache,
+    ) -> None:
+        """Initialize the history miner."""
+        self.configuration_service = configuration_service
+        self.git_service = git_service
+        self.content_cache = content_cache
+
+    @timed("git.history")
+    def history(self) -> dict[str, FileHistory]:
+        """Get the commit activity of the configured ADR directory.
+
+        Returns:
+            Activity per markdown file name directly in the ADR directory,
+            without files never committed
+
+        Raises:
+            GitCommandError: If the ADR directory is not in a git repository
+        """
+        directory = self.configuration_service.get_configuration().adr_directory
+        if not directory.is_dir():
+            return {}
+        head = self.git_service.head(directory)
+        if head is None:
+            return {}
+        key = str(directory.resolve())
+        state = self._cached_state(key)
+        if state.head == head:
+            return state.files
+
+        since = state.head
+        if since is not None and not self.git_service.is_ancestor(
+            since, head, directory
+        ):
+            since = None
+        activities = (
+            {name: _Activity.restore(entry) for name, entry in state.files.items()}
+            if since
+            else {}
+        )
+        for commit in self.git_service.log_changes(directory, since=since):
+            self._replay(commit, activities)
+
+        files = {name: activity.freeze() for name, activity in activities.items()}
+        self.content_cache.put(
+            CACHE_NAMESPACE,
+            key,
+            HistoryState(head=head, files=files).model_dump_json().encode(),
+        )
+        return files
+
+    @staticmethod
+    def _replay(commit: GitCommit, activities: dict[str, _Activity]) -> None:
+        """Apply the changes of a commit to the activity of the ADR files."""
+        for change in commit.changes:
+            previous = (
+                activities.pop(change.previous_path, None)
+                if change.status == _RENAMED and change.previous_path
+                else None
+            )
+            if change.status == _DELETED:
+                activities.pop(change.path, None)
+            elif "/" not in change.path and change.path.endswith(".md"):
+                activity = activities.setdefault(change.path, previous or _Activity())
+                activity.record(commit)
+
+    def _cached_state(self, key: str) -> HistoryState:
+        """Get the persisted history, empty if absent or unreadable."""
+        value = self.content_cache.get(CACHE_NAMESPACE, key)
+        if value is None:
+            return HistoryState()
+        try:
+            return HistoryState.model_validate_json(value)
+        except ValidationError:
+            return HistoryState()
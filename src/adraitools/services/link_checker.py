@@ -0,0 +1,353 @@
+"""Markdown link checking service."""
+
+import hashlib
+import os
+import posixpath
+import re
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import unquote
+
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.content_cache import ContentCache
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.infrastructure.span_recorder import timed
+from adraitools.services.adr_corpus_loader import MAX_READ_WORKERS
+from adraitools.services.adr_parser import ADR_REFERENCE_PATTERN, AdrParser
+from adraitools.services.models.links import (
+    ExtractedLinks,
+    LinkProblem,
+    LinkReport,
+    MarkdownLink,
+)
+
+CACHE_NAMESPACE = "links:v1"
+READ_BATCH = 256
+# Below this many uncached files, worker process start-up costs more than it saves
+PARALLEL_THRESHOLD = 2048
+EXTRACT_CHUNK = 128
+MAX_EXTRACT_WORKERS = 8
+SKIPPED_DIRECTORIES = frozenset(
+    (
+        ".git",
+        ".hg",
+        ".venv",
+        "venv",
+        "node_modules",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".tox",
+        ".adr-ai-tools",
+    )
+)
+
+_FENCES = ("```", "~~~")
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)(?:\s+#+)?\s*$")
+_INLINE_LINK = re.compile(
+    r"\[(?:[^\]\\]|\\.)*\]\(\s*(<[^>]*>|[^)\s]+)"
+    r"(?:\s+(?:\"[^\"]*\"|'[^']*'|\([^)]*\)))?\s*\)"
+)
+_REFERENCE_DEFINITION = re.compile(r"^ {0,3}\[[^\]]+\]:\s*(<[^>]*>|\S+)")
+_HTML_ANCHOR = re.compile(
+    r"<a\s[^>]*?\b(?:id|name)\s*=\s*[\"']([^\"']+)[\"']", re.IGNORECASE
+)
+_CODE_SPAN = re.compile(r"`[^`]*`")
+_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_SCHEME = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*:")
+_SLUG_DROP = re.compile(r"[^\w\- ]")
+
+
+def slugify(heading: str) -> str:
+    """Get the anchor GitHub generates for a heading.
+
+    Examples:
+        >>> slugify("Use `uv` for Python!")
+        'use-uv-for-python'
+        >>> slugify("Context & Scope")
+        'context--scope'
+    """
+    return _SLUG_DROP.sub("", heading.strip().lower()).replace(" ", "-")
+
+
+def _blank_comment(match: re.Match[str]) -> str:
+    """Replace an HTML comment, keeping its line breaks."""
+    return "\n" * match.group().count("\n")
+
+
+def extract_links(text: str) -> ExtractedLinks:
+    """Extract the anchors, links and ADR references of a markdown file.
+
+    Fenced code blocks, code spans and HTML comments are ignored. Anchors
+    repeat GitHub's numbering of duplicate headings.
+
+    Args:
+        text: Raw markdown content
+
+    Returns:
+        Extracted anchors, links and references
+    """
+    anchors: list[str] = []
+    links: list[MarkdownLink] = []
+    references: list[MarkdownLink] = []
+    slugs: Counter[str] = Counter()
+    heading_number: int | None = None
+    in_code = False
+    for number, line in enumerate(
+        _COMMENT.sub(_blank_comment, text).splitlines(), start=1
+    ):
+        if line.lstrip().startswith(_FENCES):
+            in_code = not in_code
+            continue
+        if in_code:
+            continue
+        visible = _CODE_SPAN.sub("", line)
+        heading = _HEADING.match(visible)
+        if heading:
+            slug = slugify(heading.group(2))
+            anchors.append(f"{slug}-{slugs[slug]}" if slugs[slug] else slug)
+            slugs[slug] += 1
+            title_number = ADR_REFERENCE_PATTERN.match(heading.group(2))
+            if heading.group(1) == "#" and heading_number is None and title_number:
+                heading_number = int(title_number.group(1))
+        anchors += [anchor.lower() for anchor in _HTML_ANCHOR.findall(visible)]
+        definition = _REFERENCE_DEFINITION.match(visible)
+        targets = [definition.group(1)] if definition else []
+        targets += _INLINE_LINK.findall(visible)
+        links += [
+            MarkdownLink(line=number, target=target.strip("<>")) for target in targets
+        ]
+        identifiers = {
+            f"ADR-{int(match.group(1)):04d}"
+            for match in ADR_REFERENCE_PATTERN.finditer(visible)
+        }
+        references += [
+            MarkdownLink(line=number, target=identifier)
+            for identifier in sorted(identifiers)
+        ]
+    return ExtractedLinks(
+        anchors=anchors,
+        links=links,
+        adr_references=references,
+        heading_number=heading_number,
+    )
+
+
+class LinkChecker:
+    """Service checking the links and ADR references of the ADR corpus.
+
+    Files are read and hashed concurrently, and the links of each file are
+    cached by content hash, so unchanged files are never parsed twice;
+    large uncached batches are parsed across worker processes. Relative
+    targets are resolved against one listing of the project tree taken up
+    front instead of a file system call per link.
+    """
+
+    def __init__(
+        self,
+        configuration_service: ConfigurationService,
+        file_system_service: FileSystemService,
+        content_cache: ContentCache,
+        project_root: Path | None = None,
+    ) -> None:
+        """Initialize the link checker.
+
+        Args:
+            configuration_service: Service providing the ADR directory
+            file_system_service: Service reading files and listing the tree
+            content_cache: Cache of extracted links by content hash
+            project_root: Root intra-repo links resolve against, the
+                current directory if None
+        """
+        self.configuration_service = configuration_service
+        self.file_system_service = file_system_service
+        self.content_cache = content_cache
+        self.project_root = project_root
+
+    @timed("links.check")
+    def check(self, paths: list[Path] | None = None) -> LinkReport:
+        """Check the links of the configured ADR directory.
+
+        Args:
+            paths: ADR files to check, every ADR if None. A subset is checked
+                without listing the project tree: relative targets are looked
+                up one by one and other ADRs are known by file name only.
+
+        Returns:
+            Report of the broken links, dangling anchors and unknown ADRs
+        """
+        config = self.configuration_service.get_paths()
+        directory = config.adr_directory.resolve()
+        root = (self.project_root or Path.cwd()).resolve()
+        if not directory.is_relative_to(root):
+            root = directory
+        template = config.template_file.resolve()
+        listed = [
+            path
+            for path in self.file_system_service.list_markdown_files(directory)
+            if path != template
+        ]
+        known_adrs = {AdrParser.file_number(path.name) for path in listed}
+
+        exists: Callable[[str], bool]
+        if paths is None:
+            snapshot = self.file_system_service.snapshot_tree(root, SKIPPED_DIRECTORIES)
+            exists = snapshot.__contains__
+        else:
+            listed = [directory / path.name for path in paths]
+
+            def exists(relative: str) -> bool:
+                return self.file_system_service.path_exists(root / relative)
+
+        names = [path.name for path in listed]
+        extracted, cached = self._extract(listed)
+        prefix = directory.relative_to(root).as_posix()
+        sources = [posixpath.normpath(posixpath.join(prefix, name)) for name in names]
+        known_adrs |= {links.heading_number for links in extracted}
+        anchors = _AnchorLookup(
+            root, dict(zip(sources, extracted, strict=True)), self._extract
+        )
+
+        problems: list[LinkProblem] = []
+        checked = 0
+        for name, source, links in zip(names, sources, extracted, strict=True):
+            checked += len(links.links) + len(links.adr_references)
+            broken = [
+                (link, reason)
+                for link in links.links
+                if (reason := self._resolve(source, link.target, exists, anchors))
+            ]
+            broken += [
+                (reference, "no ADR with this number")
+                for reference in links.adr_references
+                if int(reference.target.removeprefix("ADR-")) not in known_adrs
+            ]
+            problems += [
+                LinkProblem(
+                    path=config.adr_directory / name,
+                    line=link.line,
+                    target=link.target,
+                    reason=reason,
+                )
+                for link, reason in sorted(broken, key=lambda item: item[0].line)
+            ]
+        return LinkReport(
+            files=len(names), cached=cached, links=checked, problems=problems
+        )
+
+    def _extract(self, paths: list[Path]) -> tuple[list[ExtractedLinks], int]:
+        """Get the links of files, from the cache where possible.
+
+        Returns:
+            Links of each file in the order of ``paths``, and how many of
+            them came from the cache
+        """
+        if not paths:
+            return [], 0
+        batches = [
+            paths[start : start + READ_BATCH]
+            for start in range(0, len(paths), READ_BATCH)
+        ]
+        workers = min(MAX_READ_WORKERS, (os.cpu_count() or 1) + 4, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            contents = [
+                content
+                for batch in pool.map(self._read_batch, batches)
+                for content in batch
+            ]
+        hashes = [hashlib.sha256(content).hexdigest() for content in contents]
+        cached = {
+            key: ExtractedLinks.model_validate_json(value)
+            for key, value in self.content_cache.get_many(
+                CACHE_NAMESPACE, hashes
+            ).items()
+        }
+
+        missing = {
+            key: content.decode("utf-8", errors="replace")
+            for key, content in zip(hashes, contents, strict=True)
+            if key not in cached
+        }
+        fresh = dict(
+            zip(missing, self._extract_texts(list(missing.values())), strict=True)
+        )
+        self.content_cache.put_many(
+            CACHE_NAMESPACE,
+            {key: links.model_dump_json().encode() for key, links in fresh.items()},
+        )
+        results = [cached.get(key) or fresh[key] for key in hashes]
+        return results, sum(key in cached for key in hashes)
+
+    def _read_batch(self, paths: list[Path]) -> list[bytes]:
+        """Read a batch of files."""
+        return [self.file_system_service.read_bytes(path) for path in paths]
+
+    @staticmethod
+    def _extract_texts(texts: list[str]) -> list[ExtractedLinks]:
+        """Extract links from texts, across processes for large batches."""
+        workers = min(MAX_EXTRACT_WORKERS, os.cpu_count() or 1)
+        if len(texts) < PARALLEL_THRESHOLD or workers <= 1:
+            return [extract_links(text) for text in texts]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(extract_links, texts, chunksize=EXTRACT_CHUNK))
+
+    @staticmethod
+    def _resolve(
+        source: str,
+        target: str,
+        exists: Callable[[str], bool],
+        anchors: "_AnchorLookup",
+    ) -> str | None:
+        """Check a link target from a file, both relative to the project root.
+
+        Returns:
+            Why the target does not resolve, None if it does or is external
+        """
+        if _SCHEME.match(target) or target.startswith("//"):
+            return None
+        location, _, anchor = target.partition("#")
+        location = unquote(location.partition("?")[0])
+        destination = source
+        if location:
+            base = "" if location.startswith("/") else posixpath.dirname(source)
+            destination = posixpath.normpath(posixpath.join(base, location.lstrip("/")))
+            parts = destination.split("/")
+            if parts[0] == ".." or SKIPPED_DIRECTORIES.intersection(parts):
+                return None
+            if destination != "." and not exists(destination):
+                return "file not found"
+        anchor = unquote(anchor).lower()
+        if (
+            anchor
+            and destination.endswith(".md")
+            and anchor not in anchors(destination)
+        ):
+            return f"anchor #{anchor} not found"
+        return None
+
+
+class _AnchorLookup:
+    """Anchors of markdown files, extracting files outside the corpus lazily."""
+
+    def __init__(
+        self,
+        root: Path,
+        known: dict[str, ExtractedLinks],
+        extract: Callable[[list[Path]], tuple[list[ExtractedLinks], int]],
+    ) -> None:
+        """Initialize the lookup with the already extracted ADR files."""
+        self.root = root
+        self.extract = extract
+        self._anchors = {
+            source: frozenset(links.anchors) for source, links in known.items()
+        }
+
+    def __call__(self, relative: str) -> frozenset[str]:
+        """Get the anchors of a markdown file relative to the project root."""
+        if relative not in self._anchors:
+            links = self.extract([self.root / relative])[0][0]
+            self._anchors[relative] = frozenset(links.anchors)
+        return self._anchors[relative]
@@ -0,0 +1,96 @@
+"""Throughput benchmark of the LLM-backed workflows."""
+
+import math
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+from adraitools.exceptions import LlmProviderError
+from adraitools.infrastructure.constants import AskConstants
+from adraitools.services.ask_service import AskService
+from adraitools.services.models.benchmark import LlmBenchmarkResult
+
+ASK_WORKFLOW = "ask"
+
+
+def percentile(values: Sequence[float], rank: float) -> float:
+    """Get a nearest-rank percentile, 0.0 for no values.
+
+    Examples:
+        >>> percentile([4.0, 1.0, 3.0, 2.0], 50)
+        2.0
+        >>> percentile([4.0, 1.0, 3.0, 2.0], 95)
+        4.0
+        >>> percentile([], 50)
+        0.0
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(math.ceil(rank / 100 * len(ordered)) - 1, 0)
+    return ordered[index]
+
+
+class LlmBenchmark:
+    """Service measuring end-to-end throughput of the ask workflow.
+
+    Meant to run against the mock LLM provider, so that results reflect the
+    pipeline and the simulated model rather than network conditions.
+    """
+
+    def __init__(self, ask_service: AskService) -> None:
+        """Initialize the benchmark."""
+        self.ask_service = ask_service
+
+    def run_ask(
+        self,
+        questions: Sequence[str],
+        requests: int,
+        concurrency: int,
+        top_k: int = AskConstants.DEFAULT_TOP_K,
+    ) -> LlmBenchmarkResult:
+        """Answer questions concurrently and measure the throughput.
+
+        Args:
+            questions: Questions asked in turn
+            requests: Total number of questions to answer
+            concurrency: Number of questions answered at the same time
+            top_k: Maximum number of ADRs used as context
+
+        Returns:
+            Throughput and latency percentiles of the run
+        """
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            samples = list(
+                pool.map(
+                    lambda number: self._ask(questions[number % len(questions)], top_k),
+                    range(requests),
+                )
+            )
+        elapsed = time.perf_counter() - started
+
+        completed = [sample for sample in samples if sample is not None]
+        return LlmBenchmarkResult(
+            workflow=ASK_WORKFLOW,
+            concurrency=concurrency,
+            requests=requests,
+            errors=requests - len(completed),
+            elapsed_ms=elapsed * 1000,
+            throughput_per_second=len(completed) / elapsed if elapsed else 0.0,
+            latency_p50_ms=percentile([total for total, _ in completed], 50),
+            latency_p95_ms=percentile([total for total, _ in completed], 95),
+            first_token_p50_ms=percentile([first for _, first in completed], 50),
+        )
+
+    def _ask(self, question: str, top_k: int) -> tuple[float, float] | None:
+        """Answer one question, returning total and first token latency."""
+        session = self.ask_service.ask(question, top_k=top_k)
+        try:
+            for _ in session.stream():
+                pass
+        except LlmProviderError:
+            return None
+        if session.timings is None:
+            return None
+        return session.timings.total_ms, session.timings.first_token_ms
@@ -0,0 +1,65 @@
+"""Overhead benchmark of the logging modes."""
+
+import time
+from pathlib import Path
+
+from adraitools.infrastructure.logging_service import LoggingService, OverflowPolicy
+from adraitools.services.models.benchmark import LoggingBenchmarkResult
+
+SYNC_MODE = "sync"
+
+
+class LoggingBenchmark:
+    """Service measuring what a debug record costs the code that logs it.
+
+    Records go to a log file only, so the numbers reflect the file path of
+    the logging pipeline rather than terminal speed. The configured logging
+    is replaced while the benchmark runs.
+    """
+
+    def __init__(self, logging_service: LoggingService) -> None:
+        """Initialize the benchmark."""
+        self.logging_service = logging_service
+
+    def run(
+        self,
+        log_file: Path,
+        records: int,
+        queue_size: int | None = None,
+        overflow: OverflowPolicy = "block",
+    ) -> LoggingBenchmarkResult:
+        """Log debug records to a file and time the logging calls.
+
+        Args:
+            log_file: File the records are written to
+            records: Number of records to log
+            queue_size: Size of the log queue, synchronous writes if None
+            overflow: Overflow policy of the log queue
+
+        Returns:
+            Per-record cost on the logging thread and the time needed to
+            write out what was still queued
+        """
+        self.logging_service.configure_logging(
+            level="DEBUG",
+            log_file=log_file,
+            quiet=True,
+            queue_size=queue_size,
+            overflow=overflow,
+        )
+        started = time.perf_counter_ns()
+        for number in range(records):
+            self.logging_service.log_debug(
+                "Benchmark record", fields={"number": number}
+            )
+        logged = time.perf_counter_ns()
+        self.logging_service.shutdown()
+        drained = time.perf_counter_ns()
+
+        return LoggingBenchmarkResult(
+            mode=SYNC_MODE if queue_size is None else f"queue-{overflow}",
+            records=records,
+            per_record_us=(logged - started) / records / 1000,
+            drain_ms=(drained - logged) / 1_000_000,
+            dropped=self.logging_service.dropped,
+        )
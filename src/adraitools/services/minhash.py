@@ -0,0 +1,263 @@
+"""MinHash signatures and locality-sensitive hashing of texts."""
+
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+NUM_PERMUTATIONS = 128
+BANDS = 16
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+SHINGLE_SIZE = 5
+# Signature value of a text without words; such texts are never candidates
+EMPTY = np.iinfo(np.uint32).max
+# Bytes of text hashed per NumPy pass, bounding temporary memory
+_WINDOW_BYTES = 1 << 23
+# Power tables start at this length and double as longer windows arrive
+_MIN_TABLE_LENGTH = 1 << 12
+_BIN_SHIFT = np.uint64(64 - (NUM_PERMUTATIONS.bit_length() - 1))
+_LOW_32 = np.uint64(0xFFFFFFFF)
+_BYTE_BASE = np.uint64(0x100000001B3)
+_BYTE_BASE_INVERSE = np.uint64(pow(0x100000001B3, -1, 2**64))
+_WORD_BASE = np.uint64(0x9E3779B97F4A7C15)
+_ROTATION_OFFSET = np.uint32(0x9E3779B1)
+# ASCII letters, digits and underscore, plus every non-ASCII UTF-8 byte
+_WORD_BYTES = np.zeros(256, dtype=bool)
+for _low, _high in ((b"0", b"9"), (b"a", b"z"), (b"A", b"Z"), (b"_", b"_")):
+    _WORD_BYTES[ord(_low) : ord(_high) + 1] = True
+_WORD_BYTES[0x80:] = True
+
+
+def _mix(values: NDArray[np.uint64]) -> NDArray[np.uint64]:
+    """Scramble 64-bit hashes with the SplitMix64 finalizer."""
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+def shingles(text: str) -> NDArray[np.uint64]:
+    """Hash the overlapping word n-grams of a text.
+
+    Examples:
+        >>> len(shingles("One two three four five One two three four five"))
+        6
+        >>> len(shingles("One two three four five six"))
+        2
+        >>> len(shingles("Too short"))
+        1
+    """
+    return shingle_sets([text])[0]
+
+
+def shingle_sets(texts: Sequence[str]) -> list[NDArray[np.uint64]]:
+    """Hash the overlapping word n-grams of several texts.
+
+    Texts are lowercased and processed in windows of concatenated bytes:
+    words are the runs of word bytes, hashed with polynomial prefix sums,
+    and each shingle hash is a polynomial over the hashes of its words, so
+    hashes are stable across runs without hashing word by word in Python.
+    A text shorter than a shingle is a single shingle.
+
+    Args:
+        texts: Texts to shingle
+
+    Returns:
+        Shingle hashes of each text, repeated shingles included, empty for
+        a text without words
+    """
+    encoded = [text.lower().encode() for text in texts]
+    result: list[NDArray[np.uint64]] = []
+    start = 0
+    while start < len(encoded):
+        end, size = start, 0
+        while end < len(encoded) and (end == start or size < _WINDOW_BYTES):
+            size += len(encoded[end]) + 1
+            end += 1
+        result += _shingle_window(encoded[start:end])
+        start = end
+    return result
+
+
+def _shingle_window(texts: list[bytes]) -> list[NDArray[np.uint64]]:
+    """Shingle a window of encoded texts in one pass."""
+    # A separator byte keeps words of consecutive texts apart
+    data = np.frombuffer(b" ".join(texts) + b" ", dtype=np.uint8)
+    text_starts = np.cumsum([0] + [len(text) + 1 for text in texts[:-1]])
+
+    is_word = _WORD_BYTES[data]
+    edges = np.flatnonzero(is_word[1:] != is_word[:-1]) + 1
+    if is_word[0]:
+        edges = np.concatenate(([0], edges))
+    word_starts, word_ends = edges[::2], edges[1::2]
+
+    powers, inverse = _power_tables(len(data))
+    prefix = np.concatenate(([np.uint64(0)], np.cumsum(data * powers[: len(data)])))
+    # Hash of data[start:end] independent of its position in the window
+    words = _mix((prefix[word_ends] - prefix[word_starts]) * inverse[word_starts])
+    word_texts = np.searchsorted(text_starts, word_starts, side="right") - 1
+    counts = np.bincount(word_texts, minlength=len(texts))
+
+    shingle_count = max(len(words) - SHINGLE_SIZE + 1, 0)
+    hashes = np.zeros(shingle_count, dtype=np.uint64)
+    for offset in range(SHINGLE_SIZE):
+        hashes = hashes * _WORD_BASE + words[offset : offset + shingle_count]
+    first_texts = word_texts[:shingle_count]
+    complete = first_texts == word_texts[SHINGLE_SIZE - 1 :]
+    hashes, first_texts = hashes[complete], first_texts[complete]
+    bounds = np.searchsorted(first_texts, np.arange(len(texts) + 1))
+
+    word_bounds = np.concatenate(([0], np.cumsum(counts)))
+    result = np.split(hashes, bounds[1:-1])
+    for index in np.flatnonzero((counts > 0) & (counts < SHINGLE_SIZE)).tolist():
+        short = 0
+        for word in words[word_bounds[index] : word_bounds[index + 1]].tolist():
+            short = (short * int(_WORD_BASE) + word) % 2**64
+        result[index] = np.array([short], dtype=np.uint64)
+    return result
+
+
+_power_table_cache: list[tuple[NDArray[np.uint64], NDArray[np.uint64]]] = []
+
+
+def _power_tables(length: int) -> tuple[NDArray[np.uint64], NDArray[np.uint64]]:
+    """Get at least ``length`` powers of the byte base and of its inverse.
+
+    Tables grow to the next power of two of the longest window so far and
+    are kept for the next call. Tables longer than twice the window size,
+    needed only for a single huge text, are not kept, so the cache never
+    holds more than two windows worth of powers.
+
+    Examples:
+        >>> powers, inverse = _power_tables(3)
+        >>> len(powers) >= 3
+        True
+        >>> (powers[:3] * inverse[:3]).tolist()
+        [1, 1, 1]
+    """
+    if _power_table_cache and len(_power_table_cache[0][0]) >= length:
+        return _power_table_cache[0]
+    size = max(_MIN_TABLE_LENGTH, 1 << (length - 1).bit_length())
+    powers = np.full(size, _BYTE_BASE, dtype=np.uint64).cumprod(dtype=np.uint64)
+    inverse = np.full(size, _BYTE_BASE_INVERSE, dtype=np.uint64).cumprod(
+        dtype=np.uint64
+    )
+    if size <= _WINDOW_BYTES * 2:
+        _power_table_cache[:] = [(powers, inverse)]
+    return powers, inverse
+
+
+def signatures(shingle_sets: Sequence[NDArray[np.uint64]]) -> NDArray[np.uint32]:
+    """Compute the MinHash signature of several shingle sets.
+
+    Uses one-permutation hashing: each shingle is hashed once and its hash
+    selects one of NUM_PERMUTATIONS bins, each keeping its minimum, which
+    costs one hash per shingle instead of one per shingle and permutation.
+    Empty bins borrow the value of the next non-empty bin (rotation
+    densification), keeping the collision probability of a pair equal to
+    its Jaccard similarity.
+
+    Args:
+        shingle_sets: Shingle hashes of each text
+
+    Returns:
+        One row of NUM_PERMUTATIONS values per text
+    """
+    count = len(shingle_sets)
+    if not count:
+        return np.empty((0, NUM_PERMUTATIONS), dtype=np.uint32)
+    lengths = [len(values) for values in shingle_sets]
+    mixed = _mix(np.concatenate(shingle_sets))
+    cells = np.repeat(np.arange(count, dtype=np.uint64), lengths)
+    cells = cells * np.uint64(NUM_PERMUTATIONS) + (mixed >> _BIN_SHIFT)
+    bins = np.full(count * NUM_PERMUTATIONS, EMPTY, dtype=np.uint32)
+    np.minimum.at(bins, cells, (mixed & _LOW_32).astype(np.uint32))
+    return _densify(bins.reshape(count, NUM_PERMUTATIONS))
+
+
+def _densify(bins: NDArray[np.uint32]) -> NDArray[np.uint32]:
+    """Fill empty bins from the next non-empty bin, wrapping around."""
+    doubled = np.concatenate((bins, bins), axis=1)
+    positions = np.arange(2 * NUM_PERMUTATIONS)
+    # Nearest non-empty position at or after each bin; 2N when none
+    candidates = np.where(doubled != EMPTY, positions, 2 * NUM_PERMUTATIONS)
+    following = np.minimum.accumulate(candidates[:, ::-1], axis=1)[:, ::-1]
+    following = following[:, :NUM_PERMUTATIONS]
+    filled = np.take_along_axis(doubled, following % (2 * NUM_PERMUTATIONS), axis=1)
+    distance = (following - positions[:NUM_PERMUTATIONS]).astype(np.uint32)
+    result = filled + distance * _ROTATION_OFFSET
+    result[following == 2 * NUM_PERMUTATIONS] = EMPTY
+    return result
+
+
+def jaccard(first: NDArray[np.uint64], second: NDArray[np.uint64]) -> float:
+    """Get the exact Jaccard similarity of two sets of shingle hashes.
+
+    Examples:
+        >>> jaccard(np.array([1, 2, 3], np.uint64), np.array([2, 3, 4], np.uint64))
+        0.5
+    """
+    first, second = np.unique(first), np.unique(second)
+    if not len(first) or not len(second):
+        return 0.0
+    common = len(np.intersect1d(first, second, assume_unique=True))
+    return common / (len(first) + len(second) - common)
+
+
+def band_hashes(signature_rows: NDArray[np.uint32]) -> NDArray[np.uint64]:
+    """Hash each band of rows of signatures into one value per band."""
+    bands = signature_rows.reshape(len(signature_rows), BANDS, ROWS_PER_BAND)
+    hashes = np.zeros((len(signature_rows), BANDS), dtype=np.uint64)
+    for row in range(ROWS_PER_BAND):
+        hashes = hashes * _WORD_BASE + bands[:, :, row].astype(np.uint64)
+    return hashes
+
+
+class LshIndex:
+    """Banded LSH tables over MinHash signatures.
+
+    Signatures sharing every row of at least one band are candidates; with
+    16 bands of 8 rows, pairs above about 0.7 Jaccard similarity almost
+    always collide and pairs below about 0.4 almost never do. Each band is
+    kept as a sorted array, so a lookup is one binary search per band.
+    """
+
+    def __init__(self, signature_rows: NDArray[np.uint32]) -> None:
+        """Build the band tables, leaving out signatures of empty texts."""
+        self.rows = np.flatnonzero((signature_rows != EMPTY).any(axis=1))
+        hashes = band_hashes(signature_rows[self.rows])
+        order = np.argsort(hashes, axis=0, kind="stable")
+        self._sorted = np.take_along_axis(hashes, order, axis=0)
+        self._rows = self.rows[order]
+
+    def query(self, signature: NDArray[np.uint32]) -> set[int]:
+        """Get the rows colliding with a signature in at least one band."""
+        if (signature == EMPTY).all() or not len(self.rows):
+            return set()
+        wanted = band_hashes(signature[None, :])[0]
+        found: set[int] = set()
+        for band in range(BANDS):
+            column = self._sorted[:, band]
+            first = np.searchsorted(column, wanted[band], side="left")
+            last = np.searchsorted(column, wanted[band], side="right")
+            found.update(self._rows[first:last, band].tolist())
+        return found
+
+    def candidate_pairs(self) -> set[tuple[int, int]]:
+        """Get every pair of rows colliding in at least one band."""
+        pairs: set[tuple[int, int]] = set()
+        for band in range(BANDS):
+            column = self._sorted[:, band]
+            boundaries = np.flatnonzero(column[1:] != column[:-1]) + 1
+            starts = np.concatenate(([0], boundaries))
+            ends = np.concatenate((boundaries, [len(column)]))
+            for start, end in zip(starts, ends, strict=True):
+                if end - start > 1:
+                    members = sorted(self._rows[start:end, band].tolist())
+                    pairs.update(
+                        (first, second)
+                        for index, first in enumerate(members)
+                        for second in members[index + 1 :]
+                    )
+        return pairs
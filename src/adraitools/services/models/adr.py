@@ -0,0 +1,73 @@
+"""ADR document models.
+
+Examples:
+    >>> document = AdrDocument(
+    ...     path=Path("docs/adr/0001-use-uv.md"),
+    ...     number=1,
+    ...     title="Use uv",
+    ...     status="Accepted",
+    ...     date="2025-07-01",
+    ...     sections={"Decision": "Use uv."},
+    ...     content_hash="abc",
+    ... )
+    >>> document.identifier
+    'ADR-0001'
+    >>> document.section("decision")
+    'Use uv.'
+    >>> document.section("Context")
+    ''
+"""
+
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class BaseAdrModel(BaseModel):
+    """Base class for ADR models."""
+
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True, defer_build=True)
+
+
+class AdrDocument(BaseAdrModel):
+    """A parsed Architecture Decision Record."""
+
+    path: Path = Field(description="Path of the ADR markdown file")
+    number: int | None = Field(description="ADR number, None if it has none")
+    title: str = Field(description="Decision title")
+    status: str = Field(description="First line of the Status section")
+    date: str = Field(description="First line of the Date section")
+    sections: dict[str, str] = Field(description="Section bodies keyed by heading")
+    content_hash: str = Field(description="SHA-256 of the raw file content")
+
+    @property
+    def identifier(self) -> str:
+        """Get the display identifier, e.g. ``ADR-0007``."""
+        if self.number is None:
+            return self.path.stem
+        return f"ADR-{self.number:04d}"
+
+    def section(self, heading: str) -> str:
+        """Get a section body by case-insensitive heading, empty if missing."""
+        wanted = heading.lower()
+        for name, body in self.sections.items():
+            if name.lower() == wanted:
+                return body
+        return ""
+
+
+class AdrSearchHit(BaseAdrModel):
+    """An ADR matched by a search query."""
+
+    document: AdrDocument = Field(description="Matched ADR")
+    score: float = Field(description="Relevance score, higher is better")
+
+
+class AdrChunk(BaseAdrModel):
+    """A section-aligned piece of an ADR used for embedding."""
+
+    document_path: Path = Field(description="Path of the ADR the chunk belongs to")
+    section: str = Field(description="Heading of the section the chunk comes from")
+    position: int = Field(description="Index of the chunk within its ADR")
+    text: str = Field(description="Chunk text sent to the embedder")
+    content_hash: str = Field(description="SHA-256 of the chunk text")
@@ -0,0 +1,112 @@
+"""Corpus analysis models."""
+
+from datetime import date
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class BaseAnalysisModel(BaseModel):
+    """Base class for analysis models."""
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+
+class AdrActivity(BaseAnalysisModel):
+    """Commit activity of one ADR."""
+
+    path: Path = Field(description="Path of the ADR")
+    revisions: int = Field(description="Commits that changed the ADR")
+    authors: int = Field(description="Distinct commit authors")
+    last_touched: date = Field(description="Date of the latest commit")
+
+
+class HistoryStatistics(BaseAnalysisModel):
+    """Staleness and churn of an ADR corpus, from its git history."""
+
+    tracked: int = Field(description="ADRs with at least one commit")
+    untracked: int = Field(description="ADRs never committed")
+    authors: int = Field(description="Distinct authors across the ADRs")
+    average_revisions: float = Field(description="Mean commits per tracked ADR")
+    staleness_histogram: dict[str, int] = Field(
+        description="Tracked ADRs per time since their latest commit"
+    )
+    stalest: list[AdrActivity] = Field(
+        description="ADRs untouched for the longest, stalest first"
+    )
+    most_revised: list[AdrActivity] = Field(
+        description="ADRs with the most commits, most revised first"
+    )
+
+
+class CorpusStatistics(BaseAnalysisModel):
+    """Aggregate statistics of an ADR corpus."""
+
+    total: int = Field(description="Number of ADRs analyzed")
+    status_counts: dict[str, int] = Field(
+        description="ADRs per status, most frequent first"
+    )
+    age_histogram: dict[str, int] = Field(description="ADRs per age bucket")
+    undated: int = Field(description="ADRs without a valid ISO date")
+    decisions_per_month: dict[str, int] = Field(
+        description="ADRs per YYYY-MM of their date, in calendar order"
+    )
+    average_section_words: dict[str, float] = Field(
+        description="Mean words per expected section, over ADRs having it"
+    )
+    missing_sections: dict[str, int] = Field(
+        description="ADRs lacking each expected section or leaving it empty"
+    )
+    incomplete: int = Field(description="ADRs missing at least one section")
+    history: HistoryStatistics | None = Field(
+        default=None, description="Staleness and churn, if history was mined"
+    )
+
+
+class NearDuplicate(BaseAnalysisModel):
+    """Two ADRs with near-identical bodies."""
+
+    first: Path = Field(description="Path of the first ADR")
+    second: Path = Field(description="Path of the second ADR")
+    similarity: float = Field(description="Jaccard similarity of word shingles")
+
+
+class DuplicateReport(BaseAnalysisModel):
+    """Near-duplicate ADRs of a corpus."""
+
+    total: int = Field(description="Number of ADRs compared")
+    signed: int = Field(description="ADRs whose signature had to be computed")
+    verified: int = Field(description="Candidate pairs verified in this run")
+    duplicates: list[NearDuplicate] = Field(
+        description="Pairs at or above the threshold, most similar first"
+    )
+
+
+class ConflictVerdict(BaseAnalysisModel):
+    """Model verdict on whether two ADRs contradict each other."""
+
+    conflict: bool = Field(description="Whether the decisions contradict")
+    reason: str = Field(default="", description="One-sentence explanation")
+
+
+class DecisionConflict(BaseAnalysisModel):
+    """Two ADRs whose decisions contradict each other."""
+
+    first: Path = Field(description="Path of the first ADR")
+    second: Path = Field(description="Path of the second ADR")
+    reason: str = Field(description="Why the decisions contradict")
+
+
+class ConflictReport(BaseAnalysisModel):
+    """Contradicting ADRs with the pairs left after each pruning stage."""
+
+    total_pairs: int = Field(description="Pairs of ADRs in the corpus")
+    active_pairs: int = Field(description="Pairs of accepted or proposed ADRs")
+    candidate_pairs: int = Field(description="Active pairs left after blocking")
+    cached_pairs: int = Field(description="Candidates answered from the cache")
+    verified_pairs: int = Field(description="Candidates sent to the model")
+    llm_calls: int = Field(description="Batched model calls made")
+    unanswered_pairs: int = Field(
+        description="Candidates without a usable verdict, retried next run"
+    )
+    conflicts: list[DecisionConflict] = Field(description="Contradicting pairs")
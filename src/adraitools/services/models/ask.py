@@ -0,0 +1,14 @@
+"""Models for answering questions over the ADR corpus."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class AskTimings(BaseModel):
+    """Per-phase latency breakdown of an answered question, in milliseconds."""
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    retrieve_ms: float = Field(description="Loading the corpus and ranking ADRs")
+    pack_ms: float = Field(description="Building the grounded prompt")
+    first_token_ms: float = Field(description="From start until the first token")
+    total_ms: float = Field(description="From start until the answer completed")
@@ -0,0 +1,66 @@
+"""Benchmark result models."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class BaseBenchmarkModel(BaseModel):
+    """Base class for benchmark models."""
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+
+class LlmBenchmarkResult(BaseBenchmarkModel):
+    """Throughput and latency of a workflow at one concurrency level."""
+
+    workflow: str = Field(description="Name of the benchmarked workflow")
+    concurrency: int = Field(description="Number of requests in flight at once")
+    requests: int = Field(description="Number of requests issued")
+    errors: int = Field(description="Requests that failed with a provider error")
+    elapsed_ms: float = Field(description="Wall time of the whole run")
+    throughput_per_second: float = Field(description="Completed requests per second")
+    latency_p50_ms: float = Field(description="Median end-to-end latency")
+    latency_p95_ms: float = Field(description="95th percentile end-to-end latency")
+    first_token_p50_ms: float = Field(description="Median time to first token")
+
+
+class LoggingBenchmarkResult(BaseBenchmarkModel):
+    """Cost of logging in one logging mode."""
+
+    mode: str = Field(description="Name of the logging mode")
+    records: int = Field(description="Number of records logged")
+    per_record_us: float = Field(
+        description="Mean time the logging thread spent per record"
+    )
+    drain_ms: float = Field(description="Time taken to write out queued records")
+    dropped: int = Field(description="Records discarded because the queue was full")
+
+
+class GeneratedCorpus(BaseBenchmarkModel):
+    """Summary of a generated synthetic ADR corpus."""
+
+    files: int = Field(description="Number of ADR files written")
+    bytes: int = Field(description="Total size of the written files")
+    superseded: int = Field(description="ADRs superseded by a later ADR")
+
+
+class BenchmarkSuiteResult(BaseBenchmarkModel):
+    """Measurements of one run of the standard benchmark suite.
+
+    Every metric is lower-is-better; its name ends with its unit, e.g.
+    ``parse_ms`` or ``peak_rss_mib``.
+    """
+
+    version: str = Field(description="Version of adr-ai-tools that was measured")
+    python: str = Field(description="Python version the suite ran on")
+    adrs: int = Field(description="Number of ADRs in the benchmarked corpus")
+    corpus: str = Field(description="Benchmarked directory, or how it was generated")
+    metrics: dict[str, float] = Field(description="Measurements by metric name")
+
+
+class BenchmarkRegression(BaseBenchmarkModel):
+    """A metric that got worse than its baseline beyond the threshold."""
+
+    metric: str = Field(description="Name of the metric")
+    baseline: float = Field(description="Value in the baseline run")
+    current: float = Field(description="Value in the current run")
+    change: float = Field(description="Relative increase, 0.25 for 25% worse")
@@ -2,7 +2,9 @@
 
 from pathlib import Path
 from tomllib import TOMLDecodeError
+from typing import Literal
 
+from pydantic import Field
 from pydantic_settings import (
     BaseSettings,
     PydanticBaseSettingsSource,
@@ -11,7 +13,12 @@ from pydantic_settings import (
 )
 
 from adraitools.exceptions import ConfigurationFileCorruptedError
-from adraitools.infrastructure.constants import PathConstants
+from adraitools.infrastructure.constants import LlmConstants, PathConstants
+from adraitools.services.models.llm import LatencyDistribution, MockLlmSettings
+from adraitools.services.models.log_file import (
+    DEFAULT_FLUSH_INTERVAL_SECONDS,
+    LogFileSettings,
+)
 
 
 class AdrConfiguration(BaseSettings):
@@ -68,3 +75,54 @@ class AdrConfiguration(BaseSettings):
     adr_directory: Path = PathConstants.DEFAULT_ADR_DIRECTORY
     template_file: Path = PathConstants.DEFAULT_TEMPLATE_FILE
     author_name: str = ""
+    llm_base_url: str = LlmConstants.DEFAULT_BASE_URL
+    llm_model: str = LlmConstants.DEFAULT_MODEL
+    llm_api_key: str = ""
+    llm_provider: Literal["openai", "mock"] = "openai"
+    llm_circuit_failure_threshold: int = Field(
+        default=LlmConstants.DEFAULT_CIRCUIT_FAILURE_THRESHOLD, ge=1
+    )
+    llm_circuit_reset_seconds: float = Field(
+        default=LlmConstants.DEFAULT_CIRCUIT_RESET_SECONDS, gt=0
+    )
+    llm_hedging: bool = True
+    mock_llm_seed: int = 0
+    mock_llm_latency_distribution: LatencyDistribution = "constant"
+    mock_llm_latency_ms: float = Field(default=50.0, ge=0)
+    mock_llm_tokens_per_second: float = Field(default=100.0, gt=0)
+    mock_llm_response_tokens: int = Field(default=48, ge=1)
+    mock_llm_rate_limit_rate: float = Field(default=0.0, ge=0, le=1)
+    mock_llm_server_error_rate: float = Field(default=0.0, ge=0, le=1)
+    mock_llm_timeout_rate: float = Field(default=0.0, ge=0, le=1)
+    mock_llm_timeout_ms: float = Field(default=1000.0, ge=0)
+    log_max_bytes: int = Field(default=0, ge=0)
+    log_backup_count: int = Field(default=5, ge=0)
+    log_compress: bool = False
+    log_buffer_records: int = Field(default=0, ge=0)
+    log_flush_interval_seconds: float = Field(
+        default=DEFAULT_FLUSH_INTERVAL_SECONDS, gt=0
+    )
+
+    def mock_llm_settings(self) -> MockLlmSettings:
+        """Get the settings of the mock LLM provider."""
+        return MockLlmSettings(
+            seed=self.mock_llm_seed,
+            latency_distribution=self.mock_llm_latency_distribution,
+            latency_ms=self.mock_llm_latency_ms,
+            tokens_per_second=self.mock_llm_tokens_per_second,
+            response_tokens=self.mock_llm_response_tokens,
+            rate_limit_rate=self.mock_llm_rate_limit_rate,
+            server_error_rate=self.mock_llm_server_error_rate,
+            timeout_rate=self.mock_llm_timeout_rate,
+            timeout_ms=self.mock_llm_timeout_ms,
+        )
+
+    def log_file_settings(self) -> LogFileSettings:
+        """Get the rotation and buffering of the log file."""
+        return LogFileSettings(
+            max_bytes=self.log_max_bytes,
+            backup_count=self.log_backup_count,
+            compress=self.log_compress,
+            buffer_records=self.log_buffer_records,
+            flush_interval_seconds=self.log_flush_interval_seconds,
+        )
@@ -0,0 +1,38 @@
+"""Supersession graph models."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class BaseGraphModel(BaseModel):
+    """Base class for graph models."""
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+
+class AdrLinks(BaseGraphModel):
+    """Supersession links declared by one ADR."""
+
+    identifier: str = Field(description="Identifier of the ADR, e.g. ADR-0007")
+    title: str = Field(description="Decision title")
+    status: str = Field(description="First line of the Status section")
+    supersedes: list[str] = Field(description="ADRs this ADR declares it replaces")
+    superseded_by: list[str] = Field(description="ADRs declared to replace this ADR")
+
+
+class GraphFileEntry(BaseGraphModel):
+    """Cached links of one ADR file with the fingerprint they were read at."""
+
+    fingerprint: str = Field(description="Modification time and size of the file")
+    links: AdrLinks = Field(description="Links read from the file")
+
+
+class SupersessionGraphState(BaseGraphModel):
+    """Persisted graph: links per file name and memoized closures."""
+
+    files: dict[str, GraphFileEntry] = Field(default_factory=dict)
+    descendants: dict[str, list[str]] = Field(
+        default_factory=dict, description="Memoized transitive supersedes sets"
+    )
+    ancestors: dict[str, list[str]] = Field(
+        default_factory=dict, description="Memoized transitive replacements"
+    )
@@ -0,0 +1,30 @@
+"""Git history models."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class BaseHistoryModel(BaseModel):
+    """Base class for git history models."""
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+
+class FileHistory(BaseHistoryModel):
+    """Commit activity of one ADR file."""
+
+    revisions: int = Field(description="Commits that changed the file")
+    authors: list[str] = Field(description="Distinct commit authors, sorted")
+    first_touched: int = Field(description="Unix time of the first commit")
+    last_touched: int = Field(description="Unix time of the latest commit")
+    last_commit: str = Field(description="SHA of the latest commit")
+
+
+class HistoryState(BaseHistoryModel):
+    """Persisted history of an ADR directory as of one commit."""
+
+    head: str | None = Field(
+        default=None, description="Commit the history was mined up to"
+    )
+    files: dict[str, FileHistory] = Field(
+        default_factory=dict, description="Activity per ADR file name"
+    )
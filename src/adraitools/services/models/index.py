@@ -0,0 +1,50 @@
+"""Vector index models."""
+
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class BaseIndexModel(BaseModel):
+    """Base class for index models."""
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+
+class VectorIndexEntry(BaseIndexModel):
+    """Metadata of one row of the vector index matrix."""
+
+    document_path: Path = Field(description="Path of the ADR the chunk belongs to")
+    section: str = Field(description="Heading of the section the chunk comes from")
+    content_hash: str = Field(description="SHA-256 of the chunk text")
+
+
+class VectorSearchHit(BaseIndexModel):
+    """A chunk matched by a vector query."""
+
+    entry: VectorIndexEntry = Field(description="Matched index row")
+    score: float = Field(description="Cosine similarity with the query")
+
+
+class SignatureEntry(BaseIndexModel):
+    """Metadata of one row of the MinHash signature matrix."""
+
+    name: str = Field(description="File name of the ADR")
+    fingerprint: str = Field(description="Modification time and size of the file")
+
+
+class SimilarPair(BaseIndexModel):
+    """Two ADRs whose candidate pair was verified, with their similarity."""
+
+    first: str = Field(description="File name of the first ADR")
+    second: str = Field(description="File name of the second ADR")
+    similarity: float = Field(description="Exact Jaccard similarity of shingles")
+
+
+class MinHashState(BaseIndexModel):
+    """Persisted metadata of the MinHash signatures."""
+
+    entries: list[SignatureEntry] = Field(default_factory=list)
+    pairs: list[SimilarPair] = Field(
+        default_factory=list, description="Verified candidate pairs"
+    )
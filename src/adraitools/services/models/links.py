@@ -0,0 +1,54 @@
+"""Markdown link checking models."""
+
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class BaseLinkModel(BaseModel):
+    """Base class for link models."""
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+
+class MarkdownLink(BaseLinkModel):
+    """A link or ADR reference found in a markdown file."""
+
+    line: int = Field(description="1-based line number of the link")
+    target: str = Field(description="Link destination or referenced ADR identifier")
+
+
+class ExtractedLinks(BaseLinkModel):
+    """Everything the link checker needs from one markdown file."""
+
+    anchors: list[str] = Field(description="Anchors defined by the file's headings")
+    links: list[MarkdownLink] = Field(description="Inline and reference links")
+    adr_references: list[MarkdownLink] = Field(
+        description="Textual ADR references such as ADR-0007"
+    )
+    heading_number: int | None = Field(
+        description="ADR number given by the level-one heading, if any"
+    )
+
+
+class LinkProblem(BaseLinkModel):
+    """A broken link or dangling reference."""
+
+    path: Path = Field(description="File containing the link")
+    line: int = Field(description="1-based line number of the link")
+    target: str = Field(description="Link destination or referenced ADR")
+    reason: str = Field(description="Why the link does not resolve")
+
+
+class LinkReport(BaseLinkModel):
+    """Result of checking the links of the ADR corpus."""
+
+    files: int = Field(description="Number of ADR files checked")
+    cached: int = Field(description="Files whose links came from the cache")
+    links: int = Field(description="Number of links and ADR references checked")
+    problems: list[LinkProblem] = Field(description="Links that do not resolve")
+
+    @property
+    def success(self) -> bool:
+        """Whether every link resolves."""
+        return not self.problems
@@ -0,0 +1,57 @@
+"""ADR lint models."""
+
+import hashlib
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class BaseLintModel(BaseModel):
+    """Base class for lint models."""
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+
+class LintRules(BaseLintModel):
+    """Requirements derived from the ADR template."""
+
+    sections: list[str] = Field(description="Required level-two sections")
+    statuses: list[str] = Field(description="Allowed first words of the Status")
+    placeholders: dict[str, str] = Field(
+        description="First line of each template section, flagged if left as is"
+    )
+
+    def key(self) -> str:
+        """Get a hash identifying the rules, used in cache keys."""
+        return hashlib.sha256(self.model_dump_json().encode()).hexdigest()
+
+
+class LintFinding(BaseLintModel):
+    """A problem found in ADR content, independent of the file's path."""
+
+    line: int = Field(description="1-based line number, 1 for whole-file problems")
+    code: str = Field(description="Stable diagnostic code, e.g. ADR001")
+    message: str = Field(description="Human-readable description")
+
+
+class LintDiagnostic(BaseLintModel):
+    """A problem found in an ADR file."""
+
+    path: Path = Field(description="Linted file")
+    line: int = Field(description="1-based line number, 1 for whole-file problems")
+    code: str = Field(description="Stable diagnostic code, e.g. ADR001")
+    message: str = Field(description="Human-readable description")
+
+
+class LintReport(BaseLintModel):
+    """Result of linting ADR files."""
+
+    files: int = Field(description="ADR files in the directory")
+    linted: int = Field(description="Files checked in this run")
+    cached: int = Field(description="Checked files answered from the cache")
+    diagnostics: list[LintDiagnostic] = Field(description="Problems found")
+
+    @property
+    def success(self) -> bool:
+        """Whether no problem was found."""
+        return not self.diagnostics
@@ -0,0 +1,108 @@
+"""LLM request and response models.
+
+Examples:
+    >>> first = LlmRequest(prompt="Why  did we choose uv?")
+    >>> second = LlmRequest(prompt=" Why did we   choose uv? ")
+    >>> first.normalized_key() == second.normalized_key()
+    True
+    >>> LlmRequest(prompt="Other").normalized_key() == first.normalized_key()
+    False
+"""
+
+import hashlib
+import json
+import time
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+LatencyDistribution = Literal["constant", "uniform", "exponential", "lognormal"]
+
+
+class BaseLlmModel(BaseModel):
+    """Base class for LLM models."""
+
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True, defer_build=True)
+
+
+class LlmRequest(BaseLlmModel):
+    """A single request sent to an LLM provider."""
+
+    prompt: str = Field(description="User prompt sent to the model")
+    system_prompt: str = Field(default="", description="Optional system prompt")
+    model: str = Field(default="", description="Model name, provider default if empty")
+    max_tokens: int = Field(default=1024, description="Maximum tokens to generate")
+    temperature: float = Field(default=0.0, description="Sampling temperature")
+    deadline: float | None = Field(
+        default=None,
+        description="time.monotonic() value by which the call must have finished",
+    )
+
+    def remaining_seconds(self) -> float | None:
+        """Get the time left until the deadline, None without a deadline."""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def normalized_key(self) -> str:
+        """Return a key identifying semantically identical requests.
+
+        Whitespace runs in the prompts are collapsed and the model name is
+        compared case-insensitively, so requests that only differ in
+        formatting share the same key. The deadline is not part of the key.
+        """
+        payload = {
+            "prompt": " ".join(self.prompt.split()),
+            "system_prompt": " ".join(self.system_prompt.split()),
+            "model": self.model.lower(),
+            "max_tokens": self.max_tokens,
+            "temperature": round(self.temperature, 3),
+        }
+        encoded = json.dumps(payload, sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+
+class LlmResponse(BaseLlmModel):
+    """Completed response returned by an LLM provider."""
+
+    text: str = Field(description="Generated text")
+    model: str = Field(default="", description="Model that produced the response")
+
+
+class CoalescingMetrics(BaseLlmModel):
+    """Snapshot of request coalescing counters."""
+
+    issued_calls: int = Field(description="Calls forwarded to the upstream provider")
+    coalesced_calls: int = Field(description="Calls served by an in-flight call")
+    cancelled_waiters: int = Field(description="Waiters that left before a result")
+    in_flight: int = Field(description="Upstream calls currently in flight")
+
+
+class MockLlmSettings(BaseLlmModel):
+    """Behaviour of the offline mock LLM provider."""
+
+    seed: int = Field(default=0, description="Seed of all simulated randomness")
+    latency_distribution: LatencyDistribution = Field(
+        default="constant", description="Distribution of the time to first token"
+    )
+    latency_ms: float = Field(
+        default=50.0, ge=0, description="Mean time to first token in milliseconds"
+    )
+    tokens_per_second: float = Field(
+        default=100.0, gt=0, description="Rate at which tokens are generated"
+    )
+    response_tokens: int = Field(
+        default=48, ge=1, description="Tokens per response, capped by max_tokens"
+    )
+    rate_limit_rate: float = Field(
+        default=0.0, ge=0, le=1, description="Share of requests failing with 429"
+    )
+    server_error_rate: float = Field(
+        default=0.0, ge=0, le=1, description="Share of requests failing with 500"
+    )
+    timeout_rate: float = Field(
+        default=0.0, ge=0, le=1, description="Share of requests timing out"
+    )
+    timeout_ms: float = Field(
+        default=1000.0, ge=0, description="Time a simulated timeout takes"
+    )
@@ -0,0 +1,47 @@
+"""Log file settings models."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 5.0
+
+
+class LogFileSettings(BaseModel):
+    """Rotation and buffering of the log file.
+
+    Examples:
+        >>> settings = LogFileSettings(max_bytes=1_000_000, buffer_records=100)
+        >>> settings.rotates, settings.buffers
+        (True, True)
+        >>> LogFileSettings().rotates
+        False
+    """
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    max_bytes: int = Field(
+        default=0, ge=0, description="Size at which the file is rotated, 0 to never"
+    )
+    backup_count: int = Field(
+        default=5, ge=0, description="Rotated files kept next to the log file"
+    )
+    compress: bool = Field(default=False, description="Gzip rotated files")
+    buffer_records: int = Field(
+        default=0,
+        ge=0,
+        description="Records held in memory between writes, 0 to write each one",
+    )
+    flush_interval_seconds: float = Field(
+        default=DEFAULT_FLUSH_INTERVAL_SECONDS,
+        gt=0,
+        description="Longest time a buffered record waits to be written",
+    )
+
+    @property
+    def rotates(self) -> bool:
+        """Whether the log file is rotated by size."""
+        return self.max_bytes > 0
+
+    @property
+    def buffers(self) -> bool:
+        """Whether records are buffered in memory before being written."""
+        return self.buffer_records > 0
@@ -0,0 +1,48 @@
+"""Models of tracemalloc memory profiles."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class BaseMemoryModel(BaseModel):
+    """Base class for memory profile models."""
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+
+class ModuleAllocations(BaseMemoryModel):
+    """Memory allocated on behalf of one adraitools module.
+
+    An allocation counts for the innermost adraitools frame of its
+    traceback, so memory allocated inside the standard library or a
+    dependency counts for the module that called it.
+    """
+
+    module: str = Field(
+        description="Dotted module name, (other) without an adraitools frame"
+    )
+    size_bytes: int = Field(description="Allocated bytes, or their change")
+    blocks: int = Field(description="Allocated memory blocks, or their change")
+    line: int = Field(description="Line of the module allocating the most")
+
+
+class StageMemory(BaseMemoryModel):
+    """Traced memory when a pipeline stage ended, compared to the one before."""
+
+    stage: str = Field(description="Stage name, e.g. load or index")
+    traced_bytes: int = Field(description="Memory held when the stage ended")
+    change_bytes: int = Field(description="Change since the previous stage")
+    peak_bytes: int = Field(description="Most memory held during the stage")
+    growth: list[ModuleAllocations] = Field(
+        description="Modules whose memory grew most during the stage"
+    )
+
+
+class MemoryProfile(BaseMemoryModel):
+    """Allocation profile of a command, stage by stage."""
+
+    peak_bytes: int = Field(description="Most memory held during the command")
+    stages: list[StageMemory] = Field(description="Stages in the order they ended")
+    fullest_stage: str = Field(description="Stage that ended holding the most memory")
+    top_modules: list[ModuleAllocations] = Field(
+        description="Modules holding the most memory when the fullest stage ended"
+    )
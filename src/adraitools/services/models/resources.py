@@ -0,0 +1,51 @@
+"""Resource usage models."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ResourceUsage(BaseModel):
+    """Resources a process used between two points in time.
+
+    Values the platform does not report are None: I/O counters come from
+    ``/proc/self/io`` and are only available on Linux.
+
+    Examples:
+        >>> usage = ResourceUsage(wall_ms=200.0, cpu_user_ms=120.0, cpu_system_ms=30.0)
+        >>> usage.cpu_ms, usage.cpu_utilization
+        (150.0, 0.75)
+    """
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    wall_ms: float = Field(description="Elapsed wall-clock time")
+    cpu_user_ms: float = Field(description="CPU time spent in user mode")
+    cpu_system_ms: float = Field(description="CPU time spent in the kernel")
+    peak_rss_bytes: int | None = Field(
+        default=None, description="Largest resident set size of the process so far"
+    )
+    read_chars: int | None = Field(
+        default=None, description="Bytes passed to read system calls"
+    )
+    write_chars: int | None = Field(
+        default=None, description="Bytes passed to write system calls"
+    )
+    read_bytes: int | None = Field(
+        default=None, description="Bytes fetched from storage, page cache misses"
+    )
+    write_bytes: int | None = Field(default=None, description="Bytes sent to storage")
+    gc_collections: list[int] = Field(
+        default_factory=list, description="Garbage collections per generation"
+    )
+    gc_pause_ms: float = Field(
+        default=0.0, description="Time spent in garbage collections"
+    )
+
+    @property
+    def cpu_ms(self) -> float:
+        """CPU time in user mode and in the kernel."""
+        return self.cpu_user_ms + self.cpu_system_ms
+
+    @property
+    def cpu_utilization(self) -> float:
+        """CPU time per wall time, above 1 when several cores were busy."""
+        return self.cpu_ms / self.wall_ms if self.wall_ms else 0.0
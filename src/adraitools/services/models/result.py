@@ -26,7 +26,7 @@ from pydantic import BaseModel, ConfigDict, Field
 class BaseResultModel(BaseModel):
     """Base class for result models."""
 
-    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True, defer_build=True)
 
 
 class InitializationResult(BaseResultModel):
@@ -41,3 +41,12 @@ class DiagnosisResult(BaseResultModel):
 
     success: bool = Field(description="Whether the diagnosis was successful")
     message: str = Field(description="Human-readable message describing the result")
+
+
+class EmbeddingIndexResult(BaseResultModel):
+    """Result of an embedding index build."""
+
+    documents: int = Field(description="Number of ADRs indexed")
+    chunks: int = Field(description="Number of chunks produced")
+    reused_chunks: int = Field(description="Chunks whose embedding was cached")
+    recomputed_chunks: int = Field(description="Chunks embedded during this run")
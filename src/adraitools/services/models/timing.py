@@ -0,0 +1,14 @@
+"""Models of span timing reports."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SpanTiming(BaseModel):
+    """Aggregated durations of one span at one place in the span tree."""
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    name: str = Field(description="Span name, e.g. config.resolve")
+    depth: int = Field(description="Number of enclosing spans")
+    count: int = Field(description="Number of times the span ran")
+    total_ms: float = Field(description="Summed duration of every run")
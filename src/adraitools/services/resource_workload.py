@@ -0,0 +1,55 @@
+"""Canned workload measuring the resources of ADR processing."""
+
+from pathlib import Path
+
+from adraitools.infrastructure.constants import ResourceConstants, TemplateConstants
+from adraitools.infrastructure.resource_monitor import ResourceMonitor
+from adraitools.services.adr_chunker import AdrChunker
+from adraitools.services.adr_corpus_loader import AdrCorpusLoader
+from adraitools.services.models.resources import ResourceUsage
+
+_TEMPLATE_TITLE = "Short title of the architectural decision"
+
+
+class ResourceWorkload:
+    """Service running a fixed ADR workload under a resource monitor.
+
+    ADRs are written from the default template, then read, parsed and
+    chunked like ``index`` does, so numbers taken on two machines or with
+    two versions can be compared.
+    """
+
+    def __init__(
+        self,
+        corpus_loader: AdrCorpusLoader,
+        chunker: AdrChunker,
+        resource_monitor: ResourceMonitor,
+    ) -> None:
+        """Initialize the workload."""
+        self.corpus_loader = corpus_loader
+        self.chunker = chunker
+        self.resource_monitor = resource_monitor
+
+    def run(
+        self, directory: Path, documents: int = ResourceConstants.DEFAULT_WORKLOAD_ADRS
+    ) -> ResourceUsage:
+        """Write, load and chunk a synthetic corpus.
+
+        Args:
+            directory: Empty directory the ADRs are written to
+            documents: Number of ADRs in the corpus
+
+        Returns:
+            Resources used by the whole workload
+        """
+        self.resource_monitor.start()
+        for number in range(1, documents + 1):
+            text = TemplateConstants.ADR_TEMPLATE.replace(
+                _TEMPLATE_TITLE, f"Decision {number}"
+            )
+            (directory / f"{number:04d}-decision-{number}.md").write_text(
+                text, encoding="utf-8"
+            )
+        for document in self.corpus_loader.load(directory):
+            self.chunker.chunk(document)
+        return self.resource_monitor.stop()
@@ -0,0 +1,202 @@
+"""Supersession graph of the ADR corpus."""
+
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+
+from adraitools.services.models.graph import (
+    AdrLinks,
+    GraphFileEntry,
+    SupersessionGraphState,
+)
+
+Edge = tuple[str, str]
+
+
+def _reachable(start: str, adjacency: dict[str, set[str]]) -> set[str]:
+    """Get the nodes reachable from a node, excluding it unless on a cycle."""
+    seen: set[str] = set()
+    stack = list(adjacency.get(start, ()))
+    while stack:
+        node = stack.pop()
+        if node not in seen:
+            seen.add(node)
+            stack.extend(adjacency.get(node, ()))
+    return seen
+
+
+class SupersessionGraph:
+    """Directed graph with an edge from every ADR to each ADR it supersedes.
+
+    An edge is present while at least one side declares it: the newer ADR
+    with "Supersedes ADR-0003", or the older one with "Superseded by
+    ADR-0012". Transitive closures are memoized per node. Replacing the
+    links of one file only drops the memoized closures that the changed
+    edges can affect, so the rest survive between updates.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty graph."""
+        self.files: dict[str, GraphFileEntry] = {}
+        self._children: dict[str, set[str]] = defaultdict(set)
+        self._parents: dict[str, set[str]] = defaultdict(set)
+        self._edge_declarations: Counter[Edge] = Counter()
+        self._descendants: dict[str, frozenset[str]] = {}
+        self._ancestors: dict[str, frozenset[str]] = {}
+        self.modified = False
+
+    @classmethod
+    def from_state(cls, state: SupersessionGraphState) -> "SupersessionGraph":
+        """Restore a graph, including its memoized closures."""
+        graph = cls()
+        for name, entry in state.files.items():
+            graph.put(name, entry)
+        graph._descendants = {
+            node: frozenset(nodes) for node, nodes in state.descendants.items()
+        }
+        graph._ancestors = {
+            node: frozenset(nodes) for node, nodes in state.ancestors.items()
+        }
+        graph.modified = False
+        return graph
+
+    def to_state(self) -> SupersessionGraphState:
+        """Get the persistable state of the graph."""
+        return SupersessionGraphState(
+            files=dict(self.files),
+            descendants={
+                node: sorted(nodes) for node, nodes in self._descendants.items()
+            },
+            ancestors={node: sorted(nodes) for node, nodes in self._ancestors.items()},
+        )
+
+    @property
+    def nodes(self) -> dict[str, AdrLinks]:
+        """Links of every ADR in the graph by identifier."""
+        return {entry.links.identifier: entry.links for entry in self.files.values()}
+
+    def put(self, name: str, entry: GraphFileEntry) -> None:
+        """Add or replace the links read from one ADR file."""
+        self.remove(name)
+        self.files[name] = entry
+        self.modified = True
+        for edge in self._declared_edges(entry.links):
+            self._edge_declarations[edge] += 1
+            if self._edge_declarations[edge] == 1:
+                new, old = edge
+                self._children[new].add(old)
+                self._parents[old].add(new)
+                self._invalidate(edge)
+
+    def remove(self, name: str) -> None:
+        """Remove the links of one ADR file, if present."""
+        entry = self.files.pop(name, None)
+        if entry is None:
+            return
+        self.modified = True
+        for edge in self._declared_edges(entry.links):
+            self._edge_declarations[edge] -= 1
+            if self._edge_declarations[edge] == 0:
+                del self._edge_declarations[edge]
+                self._invalidate(edge)
+                new, old = edge
+                self._children[new].discard(old)
+                self._parents[old].discard(new)
+
+    def supersedes(self, identifier: str) -> frozenset[str]:
+        """Get every ADR an ADR transitively supersedes."""
+        if identifier not in self._descendants:
+            self._descendants[identifier] = frozenset(
+                _reachable(identifier, self._children)
+            )
+            self.modified = True
+        return self._descendants[identifier]
+
+    def superseded_by(self, identifier: str) -> frozenset[str]:
+        """Get every ADR that transitively supersedes an ADR."""
+        if identifier not in self._ancestors:
+            self._ancestors[identifier] = frozenset(
+                _reachable(identifier, self._parents)
+            )
+            self.modified = True
+        return self._ancestors[identifier]
+
+    def current(self, identifier: str) -> list[str]:
+        """Get the ADRs currently replacing an ADR.
+
+        Returns:
+            The replacements that are not superseded themselves, empty when
+            the ADR is current or its replacements form a cycle
+        """
+        return sorted(
+            node
+            for node in self.superseded_by(identifier)
+            if not self._parents.get(node)
+        )
+
+    def cycles(self) -> list[list[str]]:
+        """Find groups of ADRs that supersede each other in a cycle.
+
+        Returns:
+            Sorted members of every strongly connected component with more
+            than one ADR; self-references are ignored when reading links
+        """
+        index: dict[str, int] = {}
+        low: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+        components: list[list[str]] = []
+
+        for root in sorted(self._children):
+            if root in index:
+                continue
+            # Iterative Tarjan: frames of node and its remaining children
+            work = [(root, iter(sorted(self._children.get(root, ()))))]
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, children = work[-1]
+                child = next(children, None)
+                if child is None:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == index[node]:
+                        component = self._pop_component(node, stack, on_stack)
+                        if len(component) > 1:
+                            components.append(sorted(component))
+                elif child not in index:
+                    index[child] = low[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(sorted(self._children.get(child, ())))))
+                elif child in on_stack:
+                    low[node] = min(low[node], index[child])
+        return sorted(components)
+
+    @staticmethod
+    def _pop_component(node: str, stack: list[str], on_stack: set[str]) -> list[str]:
+        """Pop a strongly connected component rooted at a node off the stack."""
+        component = []
+        while True:
+            member = stack.pop()
+            on_stack.discard(member)
+            component.append(member)
+            if member == node:
+                return component
+
+    @staticmethod
+    def _declared_edges(links: AdrLinks) -> Iterable[Edge]:
+        """Get the edges declared by one ADR, without self-references."""
+        edges = {(links.identifier, old) for old in links.supersedes}
+        edges |= {(new, links.identifier) for new in links.superseded_by}
+        return sorted(edge for edge in edges if edge[0] != edge[1])
+
+    def _invalidate(self, edge: Edge) -> None:
+        """Drop the memoized closures an added or removed edge can change."""
+        new, old = edge
+        for node in {new} | _reachable(new, self._parents):
+            self._descendants.pop(node, None)
+        for node in {old} | _reachable(old, self._children):
+            self._ancestors.pop(node, None)
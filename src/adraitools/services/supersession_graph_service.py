@@ -0,0 +1,169 @@
+"""Service maintaining the cached supersession graph of the corpus."""
+
+import re
+
+from pydantic import ValidationError
+
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.content_cache import ContentCache
+from adraitools.infrastructure.span_recorder import timed
+from adraitools.services.adr_corpus_loader import AdrCorpusLoader
+from adraitools.services.adr_parser import ADR_REFERENCE_PATTERN
+from adraitools.services.models.adr import AdrDocument
+from adraitools.services.models.graph import (
+    AdrLinks,
+    GraphFileEntry,
+    SupersessionGraphState,
+)
+from adraitools.services.supersession_graph import SupersessionGraph
+
+CACHE_NAMESPACE = "supersession-graph"
+LINK_SECTIONS = ("Status", "References")
+_FILE_REFERENCE = re.compile(r"\]\((?:\./)?(\d+)[-_][^)\s]*\.md")
+_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_SUPERSEDED_BY = re.compile(r"\b(superseded|replaced)\s+by\b", re.IGNORECASE)
+_SUPERSEDES = re.compile(r"\b(supersedes|replaces)\b", re.IGNORECASE)
+
+
+def normalize_identifier(reference: str) -> str:
+    """Normalize an ADR reference such as ``7`` or ``adr-7`` to ``ADR-0007``.
+
+    Examples:
+        >>> normalize_identifier("adr-7")
+        'ADR-0007'
+        >>> normalize_identifier("21")
+        'ADR-0021'
+        >>> normalize_identifier("design-notes")
+        'design-notes'
+    """
+    match = ADR_REFERENCE_PATTERN.fullmatch(reference.strip()) or re.fullmatch(
+        r"(\d+)", reference.strip()
+    )
+    if match is None:
+        return reference.strip()
+    return f"ADR-{int(match.group(1)):04d}"
+
+
+def _references(text: str) -> list[str]:
+    """Get the ADR identifiers referenced in a piece of text."""
+    numbers = [m.group(1) for m in ADR_REFERENCE_PATTERN.finditer(text)]
+    numbers += [m.group(1) for m in _FILE_REFERENCE.finditer(text)]
+    return sorted({f"ADR-{int(number):04d}" for number in numbers})
+
+
+class SupersessionGraphService:
+    """Service building the supersession graph with per-file caching.
+
+    The graph is persisted together with the modification time and size of
+    every ADR file. Loading it only re-reads files whose fingerprint
+    changed, so queries on an unchanged corpus read no ADR at all.
+    """
+
+    def __init__(
+        self,
+        configuration_service: ConfigurationService,
+        corpus_loader: AdrCorpusLoader,
+        content_cache: ContentCache,
+    ) -> None:
+        """Initialize the graph service."""
+        self.configuration_service = configuration_service
+        self.corpus_loader = corpus_loader
+        self.content_cache = content_cache
+
+    @timed("graph.load")
+    def load(self) -> SupersessionGraph:
+        """Get the graph of the configured ADR directory.
+
+        The cached graph is brought up to date by re-reading only the files
+        added or changed since it was saved, and dropping removed ones.
+        """
+        config = self.configuration_service.get_configuration()
+        directory = config.adr_directory.resolve()
+        graph = SupersessionGraph.from_state(self._cached_state(str(directory)))
+
+        file_system_service = self.corpus_loader.file_system_service
+        template = config.template_file.resolve()
+        fingerprints = {
+            name: fingerprint
+            for name, fingerprint in file_system_service.fingerprint_markdown_files(
+                directory
+            ).items()
+            if directory / name != template
+        }
+
+        for name in [name for name in graph.files if name not in fingerprints]:
+            graph.remove(name)
+        changed = [
+            name
+            for name, fingerprint in fingerprints.items()
+            if name not in graph.files or graph.files[name].fingerprint != fingerprint
+        ]
+        documents = self.corpus_loader.load_paths(
+            [directory / name for name in changed]
+        )
+        for name, document in zip(changed, documents, strict=True):
+            graph.put(
+                name,
+                GraphFileEntry(
+                    fingerprint=fingerprints[name], links=self.extract_links(document)
+                ),
+            )
+        return graph
+
+    def save(self, graph: SupersessionGraph) -> None:
+        """Persist the graph with its memoized closures if it was modified.
+
+        Call after answering queries, so closures computed for them are
+        reused by later runs.
+        """
+        if not graph.modified:
+            return
+        directory = self.configuration_service.get_configuration().adr_directory
+        self.content_cache.put(
+            CACHE_NAMESPACE,
+            str(directory.resolve()),
+            graph.to_state().model_dump_json().encode(),
+        )
+        graph.modified = False
+
+    @staticmethod
+    def extract_links(document: AdrDocument) -> AdrLinks:
+        """Read the supersession links of an ADR.
+
+        A Status starting with "Superseded" links to every ADR referenced in
+        the Status section. Anywhere in Status or References, a line saying
+        "superseded by" or "replaced by" links to the ADRs it mentions as
+        replacements, and a line saying "supersedes" or "replaces" links to
+        the ADRs it mentions as replaced. References are ``ADR-0007`` style
+        identifiers or links to ``0007-*.md`` files.
+        """
+        supersedes: set[str] = set()
+        superseded_by: set[str] = set()
+        status_body = _COMMENT.sub("", document.section("Status"))
+        if document.status.lower().startswith("superseded"):
+            superseded_by.update(_references(status_body))
+        for heading in LINK_SECTIONS:
+            for line in _COMMENT.sub("", document.section(heading)).splitlines():
+                if _SUPERSEDED_BY.search(line):
+                    superseded_by.update(_references(line))
+                elif _SUPERSEDES.search(line):
+                    supersedes.update(_references(line))
+
+        identifier = document.identifier
+        return AdrLinks(
+            identifier=identifier,
+            title=document.title,
+            status=document.status,
+            supersedes=sorted(supersedes - {identifier}),
+            superseded_by=sorted(superseded_by - {identifier}),
+        )
+
+    def _cached_state(self, key: str) -> SupersessionGraphState:
+        """Get the persisted graph state, empty if absent or unreadable."""
+        value = self.content_cache.get(CACHE_NAMESPACE, key)
+        if value is None:
+            return SupersessionGraphState()
+        try:
+            return SupersessionGraphState.model_validate_json(value)
+        except ValidationError:
+            return SupersessionGraphState()
@@ -80,3 +80,39 @@ def isolated_e2e_env(mocker: MockerFixture) -> Generator[Path, None, None]:
         tmp_path = Path(tmpdir)
         mocker.patch.dict("os.environ", {"HOME": str(tmp_path)})
         yield tmp_path
+
+
+class AdrFileFactory(Protocol):
+    """Protocol for ADR file factory."""
+
+    def __call__(
+        self,
+        path: Path,
+        title: str,
+        status: str = "Accepted",
+        date: str = "2025-01-01",
+        sections: dict[str, str] | None = None,
+    ) -> Path:
+        """Create an ADR markdown file following the ADR template."""
+        ...
+
+
+@pytest.fixture
+def adr_file_factory() -> AdrFileFactory:
+    """Factory for creating test ADR files."""
+
+    def _create_adr_file(
+        path: Path,
+        title: str,
+        status: str = "Accepted",
+        date: str = "2025-01-01",
+        sections: dict[str, str] | None = None,
+    ) -> Path:
+        """Create an ADR markdown file following the ADR template."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        body = {"Title": title, "Status": status, "Date": date, **(sections or {})}
+        content = "\n\n".join(f"## {name}\n{text}" for name, text in body.items())
+        path.write_text(f"# Architecture Decision Record (ADR)\n\n{content}\n")
+        return path
+
+    return _create_adr_file
@@ -0,0 +1,119 @@
+"""End-to-end benchmark of the pre-commit hook on a large repository."""
+
+import os
+import shutil
+import statistics
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from adraitools.infrastructure.constants import TemplateConstants
+
+ADR_COUNT = 10_000
+# End-to-end time the hook may take; slow CI machines scale it up
+HOOK_BUDGET_SECONDS = 0.2 * float(os.environ.get("ADR_HOOK_BUDGET_SCALE", "1"))
+RUNS = 5
+ADR = """# ADR-{number:04d}: Decision {number}
+
+## Title
+Decision {number}
+
+## Status
+Accepted
+
+## Date
+2025-01-01
+
+## Context
+Context of decision {number}.
+
+## Decision
+We decide {number}.
+
+## Rationale
+Because {number}.
+
+## Implications
+Implications of {number}.
+
+## Alternatives
+None.
+
+## Future Direction
+None.
+
+## References
+None.
+"""
+
+
+def _git(repository: Path, *arguments: str) -> None:
+    """Run a git command in a repository."""
+    subprocess.run(  # noqa: S603
+        ["git", "-c", "user.name=Test", "-c", "user.email=t@example.com", *arguments],  # noqa: S607
+        cwd=repository,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def large_repository(isolated_e2e_env: Path) -> Path:
+    """Create a committed repository of 10k ADRs with one staged edit."""
+    adr_dir = isolated_e2e_env / "docs" / "adr"
+    adr_dir.mkdir(parents=True)
+    (adr_dir / "0000-adr-template.md").write_text(TemplateConstants.ADR_TEMPLATE)
+    for number in range(1, ADR_COUNT + 1):
+        (adr_dir / f"{number:05d}-decision.md").write_text(ADR.format(number=number))
+    _git(isolated_e2e_env, "init", "-q")
+    _git(isolated_e2e_env, "add", ".")
+    _git(isolated_e2e_env, "commit", "-q", "-m", "Add ADRs")
+    edited = adr_dir / "05000-decision.md"
+    edited.write_text(edited.read_text().replace("We decide", "We now decide"))
+    _git(isolated_e2e_env, "add", str(edited))
+    return isolated_e2e_env
+
+
+def _median_seconds(
+    executable: str, repository: Path, *arguments: str
+) -> tuple[float, str]:
+    """Run the CLI a few times.
+
+    Returns:
+        Median wall-clock duration and the output of the last run
+    """
+    durations = []
+    output = ""
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        result = subprocess.run(  # noqa: S603
+            [executable, *arguments],
+            cwd=repository,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        durations.append(time.perf_counter() - started)
+        assert result.returncode == 0, result.stdout
+        output = result.stdout
+    return statistics.median(durations), output
+
+
+@pytest.mark.e2e
+@pytest.mark.slow
+@pytest.mark.parametrize("command", ["lint", "doctor"])
+def test_staged_hook_fits_budget(large_repository: Path, command: str) -> None:
+    """Test that the staged check of 10k ADRs runs within 200ms end to end.
+
+    The wall time includes starting the CLI. Set ``ADR_HOOK_BUDGET_SCALE``
+    to multiply the budget on machines slower than a developer laptop.
+    """
+    executable = shutil.which("adr-ai-tools")
+    assert executable is not None, "adr-ai-tools not found in PATH"
+
+    hook, output = _median_seconds(executable, large_repository, command, "--staged")
+
+    assert "1 ADRs" in output
+    assert hook < HOOK_BUDGET_SECONDS
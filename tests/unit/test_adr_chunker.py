@@ -0,0 +1,98 @@
+"""Unit tests for ADR chunker."""
+
+from pathlib import Path
+
+import pytest
+
+from adraitools.services.adr_chunker import AdrChunker, estimate_tokens
+from adraitools.services.adr_parser import AdrParser
+from adraitools.services.models.adr import AdrDocument
+
+
+def _document(sections: dict[str, str]) -> AdrDocument:
+    """Create a parsed ADR with the given sections."""
+    text = "\n\n".join(f"## {name}\n{body}" for name, body in sections.items())
+    return AdrParser().parse(Path("0001-use-uv.md"), text)
+
+
+def test_chunk_creates_one_chunk_per_content_section() -> None:
+    """Test that short sections become one chunk each and metadata is skipped."""
+    # Arrange
+    chunker = AdrChunker(max_tokens=50, overlap_tokens=5)
+    document = _document(
+        {
+            "Title": "Use uv",
+            "Status": "Accepted",
+            "Date": "2025-01-01",
+            "Context": "Dependency management is slow.",
+            "Decision": "Use uv.",
+        }
+    )
+
+    # Act
+    chunks = chunker.chunk(document)
+
+    # Assert
+    assert [chunk.section for chunk in chunks] == ["Context", "Decision"]
+    assert [chunk.position for chunk in chunks] == [0, 1]
+    assert chunks[1].text == "Use uv\nDecision\nUse uv."
+
+
+def test_chunk_splits_long_sections_with_overlap() -> None:
+    """Test that long sections are split into overlapping windows."""
+    # Arrange
+    chunker = AdrChunker(max_tokens=10, overlap_tokens=3)
+    words = [f"w{index}" for index in range(25)]
+    document = _document({"Context": " ".join(words)})
+
+    # Act
+    chunks = chunker.chunk(document)
+
+    # Assert
+    bodies = [chunk.text.splitlines()[-1].split() for chunk in chunks]
+    assert all(len(body) <= 10 for body in bodies)  # noqa: PLR2004
+    assert bodies[1][:3] == bodies[0][-3:]
+    assert bodies[-1][-1] == "w24"
+
+
+def test_chunk_prefers_paragraph_boundaries() -> None:
+    """Test that a paragraph which does not fit starts a new window."""
+    # Arrange
+    chunker = AdrChunker(max_tokens=6, overlap_tokens=0)
+    document = _document({"Context": "one two three four\n\nfive six seven"})
+
+    # Act
+    chunks = chunker.chunk(document)
+
+    # Assert
+    assert [chunk.text.splitlines()[-1] for chunk in chunks] == [
+        "one two three four",
+        "five six seven",
+    ]
+
+
+def test_editing_one_section_only_changes_its_chunks() -> None:
+    """Test that chunk hashes of untouched sections are stable across edits."""
+    # Arrange
+    chunker = AdrChunker()
+    original = _document({"Context": "Builds are slow.", "Decision": "Use uv."})
+    edited = _document({"Context": "Builds are very slow.", "Decision": "Use uv."})
+
+    # Act
+    before = {chunk.section: chunk.content_hash for chunk in chunker.chunk(original)}
+    after = {chunk.section: chunk.content_hash for chunk in chunker.chunk(edited)}
+
+    # Assert
+    assert before["Decision"] == after["Decision"]
+    assert before["Context"] != after["Context"]
+
+
+def test_overlap_must_be_smaller_than_chunk_size() -> None:
+    """Test that an overlap as large as the chunk size is rejected."""
+    with pytest.raises(ValueError, match="overlap_tokens"):
+        AdrChunker(max_tokens=10, overlap_tokens=10)
+
+
+def test_estimate_tokens_counts_words() -> None:
+    """Test that tokens are estimated from whitespace-separated words."""
+    assert estimate_tokens("a b\nc") == 3  # noqa: PLR2004
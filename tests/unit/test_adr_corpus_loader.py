@@ -0,0 +1,39 @@
+"""Unit tests for ADR corpus loader."""
+
+from pathlib import Path
+
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.services.adr_corpus_loader import AdrCorpusLoader
+from adraitools.services.adr_parser import AdrParser
+from tests.conftest import AdrFileFactory
+
+
+def test_load_parses_all_adrs_except_template(
+    tmp_path: Path, adr_file_factory: AdrFileFactory
+) -> None:
+    """Test that load returns every ADR in name order without the template."""
+    # Arrange
+    adr_dir = tmp_path / "docs" / "adr"
+    template = adr_file_factory(adr_dir / "0000-adr-template.md", "Template")
+    adr_file_factory(adr_dir / "0002-second.md", "Second")
+    adr_file_factory(adr_dir / "0001-first.md", "First")
+    (adr_dir / "notes.txt").write_text("not an ADR")
+    loader = AdrCorpusLoader(FileSystemService(), AdrParser())
+
+    # Act
+    documents = loader.load(adr_dir, exclude=template)
+
+    # Assert
+    assert [document.title for document in documents] == ["First", "Second"]
+
+
+def test_load_returns_empty_list_for_missing_directory(tmp_path: Path) -> None:
+    """Test that a missing ADR directory yields no documents."""
+    # Arrange
+    loader = AdrCorpusLoader(FileSystemService(), AdrParser())
+
+    # Act
+    documents = loader.load(tmp_path / "missing")
+
+    # Assert
+    assert documents == []
@@ -0,0 +1,111 @@
+"""Unit tests for ADR linter."""
+
+from pathlib import Path
+
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.constants import TemplateConstants
+from adraitools.infrastructure.content_cache import ContentCache
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.services.adr_linter import AdrLinter, lint_text, parse_rules
+from adraitools.services.models.configuration import AdrConfiguration
+
+VALID_ADR = (
+    "# ADR-0001: Title\n"
+    "## Title\nTitle\n"
+    "## Status\nAccepted\n"
+    "## Date\n2024-05-01\n"
+    "## Context\nWhy.\n"
+    "## Decision\nWhat.\n"
+    "## Rationale\nBecause.\n"
+    "## Implications\n### Positive Implications\nFaster.\n"
+    "## Alternatives\nOthers.\n"
+    "## Future Direction\nNone.\n"
+    "## References\nNone.\n"
+)
+
+
+def test_parse_rules_reads_sections_and_statuses_from_template() -> None:
+    """Test rules derived from the built-in template."""
+    # Act
+    rules = parse_rules(TemplateConstants.ADR_TEMPLATE)
+
+    # Assert
+    assert rules.sections[:3] == ["Title", "Status", "Date"]
+    assert rules.placeholders["Implications"].startswith("List the benefits")
+    assert "Accepted" in rules.statuses
+    assert "Superseded" in rules.statuses
+
+
+def test_lint_text_reports_template_violations() -> None:
+    """Test missing sections, placeholders, statuses and dates."""
+    # Arrange
+    rules = parse_rules(TemplateConstants.ADR_TEMPLATE)
+    text = (
+        VALID_ADR.replace("Accepted", "Approved")
+        .replace("2024-05-01", "2024-02-30")
+        .replace("## References\nNone.\n", "")
+        .replace("Why.", rules.placeholders["Context"])
+    )
+
+    # Act
+    findings = lint_text(text, rules)
+
+    # Assert
+    assert [(finding.line, finding.code) for finding in findings] == [
+        (1, "ADR001"),
+        (4, "ADR004"),
+        (6, "ADR005"),
+        (8, "ADR003"),
+    ]
+
+
+def _linter(tmp_path: Path, cache: ContentCache) -> AdrLinter:
+    """Create a linter over tmp_path/adr."""
+    configuration_service = ConfigurationService(
+        AdrConfiguration(
+            adr_directory=tmp_path / "adr",
+            template_file=tmp_path / "adr" / "0000-adr-template.md",
+        )
+    )
+    return AdrLinter(configuration_service, FileSystemService(), cache)
+
+
+def test_lint_skips_files_unchanged_since_they_passed(tmp_path: Path) -> None:
+    """Test that default runs only re-read changed or failing files."""
+    # Arrange
+    adr_dir = tmp_path / "adr"
+    adr_dir.mkdir()
+    (adr_dir / "0001-ok.md").write_text(VALID_ADR)
+    (adr_dir / "0002-bad.md").write_text(VALID_ADR.replace("Accepted", "Maybe"))
+    cache = ContentCache(tmp_path / "cache.sqlite3")
+    _linter(tmp_path, cache).lint()
+
+    # Act
+    report = _linter(tmp_path, cache).lint()
+
+    # Assert
+    assert report.files == 2  # noqa: PLR2004
+    assert report.linted == 1
+    assert report.cached == 1
+    assert [(d.path.name, d.code) for d in report.diagnostics] == [
+        ("0002-bad.md", "ADR004")
+    ]
+    assert not report.success
+
+
+def test_lint_all_files_uses_cached_findings(tmp_path: Path) -> None:
+    """Test that full runs check every file, reusing cached findings."""
+    # Arrange
+    adr_dir = tmp_path / "adr"
+    adr_dir.mkdir()
+    (adr_dir / "0001-ok.md").write_text(VALID_ADR)
+    cache = ContentCache(tmp_path / "cache.sqlite3")
+    _linter(tmp_path, cache).lint()
+
+    # Act
+    report = _linter(tmp_path, cache).lint(all_files=True)
+
+    # Assert
+    assert report.linted == 1
+    assert report.cached == 1
+    assert report.success
@@ -0,0 +1,100 @@
+"""Unit tests for ADR parser."""
+
+from pathlib import Path
+
+from adraitools.services.adr_parser import AdrParser
+
+NUMBERED_ADR = """# ADR-0034: Custom Exception Strategy
+
+## Title
+Custom Exception Strategy
+
+## Status
+Accepted
+
+## Date
+2025-09-17
+
+## Decision
+Adopt custom exceptions.
+
+## Implications
+
+### Positive Implications
+- Clear errors
+"""
+
+
+def test_parse_reads_metadata_and_sections() -> None:
+    """Test that parse extracts number, title, status, date and sections."""
+    # Arrange
+    parser = AdrParser()
+    path = Path("docs/adr/0034-custom-exception-strategy.md")
+
+    # Act
+    document = parser.parse(path, NUMBERED_ADR)
+
+    # Assert
+    assert document.number == 34  # noqa: PLR2004
+    assert document.identifier == "ADR-0034"
+    assert document.title == "Custom Exception Strategy"
+    assert document.status == "Accepted"
+    assert document.date == "2025-09-17"
+    assert document.section("Decision") == "Adopt custom exceptions."
+    assert "### Positive Implications" in document.section("Implications")
+
+
+def test_parse_uses_heading_when_title_section_is_missing() -> None:
+    """Test that the level-one heading provides number and title as fallback."""
+    # Arrange
+    parser = AdrParser()
+    text = "# ADR-0012: Adopt Pydantic\n\n## Status\nProposed\n"
+
+    # Act
+    document = parser.parse(Path("pydantic.md"), text)
+
+    # Assert
+    assert document.number == 12  # noqa: PLR2004
+    assert document.title == "Adopt Pydantic"
+    assert document.status == "Proposed"
+
+
+def test_parse_skips_comments_in_status() -> None:
+    """Test that HTML comments do not become the status."""
+    # Arrange
+    parser = AdrParser()
+    text = "## Status\n<!-- pick one -->\nSuperseded by ADR-0040\n"
+
+    # Act
+    document = parser.parse(Path("0007-old.md"), text)
+
+    # Assert
+    assert document.status == "Superseded by ADR-0040"
+
+
+def test_parse_ignores_headings_in_code_blocks() -> None:
+    """Test that headings inside fenced code blocks do not start sections."""
+    # Arrange
+    parser = AdrParser()
+    text = "## Decision\nUse this:\n```\n## Not a section\n```\n"
+
+    # Act
+    document = parser.parse(Path("0001-code.md"), text)
+
+    # Assert
+    assert list(document.sections) == ["Decision"]
+    assert "## Not a section" in document.section("Decision")
+
+
+def test_parse_hashes_content() -> None:
+    """Test that documents with different content have different hashes."""
+    # Arrange
+    parser = AdrParser()
+    path = Path("0001-a.md")
+
+    # Act
+    first = parser.parse(path, "## Status\nAccepted\n")
+    second = parser.parse(path, "## Status\nRejected\n")
+
+    # Assert
+    assert first.content_hash != second.content_hash
@@ -0,0 +1,59 @@
+"""Unit tests for ADR retriever."""
+
+from pathlib import Path
+
+from adraitools.services.adr_parser import AdrParser
+from adraitools.services.adr_retriever import AdrRetriever
+from adraitools.services.models.adr import AdrDocument
+
+
+def _document(name: str, title: str, decision: str) -> AdrDocument:
+    """Create a parsed ADR with a title and decision."""
+    text = f"## Title\n{title}\n\n## Decision\n{decision}\n"
+    return AdrParser().parse(Path(name), text)
+
+
+def test_search_ranks_matching_adr_first() -> None:
+    """Test that the most relevant ADR is ranked first."""
+    # Arrange
+    documents = [
+        _document("0001-uv.md", "Use uv as dependency manager", "We use uv."),
+        _document("0002-ruff.md", "Adopt ruff", "Ruff lints and formats code."),
+        _document("0003-mypy.md", "Adopt mypy", "Mypy checks types, not uv."),
+    ]
+    retriever = AdrRetriever(documents)
+
+    # Act
+    hits = retriever.search("Why did we choose uv?", top_k=2)
+
+    # Assert
+    assert [hit.document.number for hit in hits] == [1, 3]
+    assert hits[0].score > hits[1].score
+
+
+def test_search_limits_hits_to_top_k() -> None:
+    """Test that at most top_k hits are returned."""
+    # Arrange
+    documents = [
+        _document(f"000{index}-tool.md", f"Tool {index}", "tooling")
+        for index in range(1, 5)
+    ]
+    retriever = AdrRetriever(documents)
+
+    # Act
+    hits = retriever.search("tooling", top_k=3)
+
+    # Assert
+    assert len(hits) == 3  # noqa: PLR2004
+
+
+def test_search_returns_nothing_without_matching_terms() -> None:
+    """Test that unrelated queries produce no hits."""
+    # Arrange
+    retriever = AdrRetriever([_document("0001-uv.md", "Use uv", "We use uv.")])
+
+    # Act
+    hits = retriever.search("kubernetes", top_k=3)
+
+    # Assert
+    assert hits == []
@@ -0,0 +1,38 @@
+"""Unit tests for allocation sites."""
+
+from adraitools.infrastructure.allocation_sites import AllocationSites
+
+
+def test_by_module_sums_sites_and_names_the_largest_line() -> None:
+    """Test that sites are summed per module, largest module first."""
+    # Arrange
+    sites = {
+        ("adraitools.services.adr_parser", 40): (300, 3),
+        ("adraitools.services.adr_parser", 87): (900, 1),
+        ("adraitools.services.adr_chunker", 68): (1000, 10),
+    }
+
+    # Act
+    modules = AllocationSites.by_module(sites)
+
+    # Assert
+    assert [module.module for module in modules] == [
+        "adraitools.services.adr_parser",
+        "adraitools.services.adr_chunker",
+    ]
+    assert modules[0].size_bytes == 1200  # noqa: PLR2004
+    assert modules[0].blocks == 4  # noqa: PLR2004
+    assert modules[0].line == 87  # noqa: PLR2004
+
+
+def test_diff_covers_sites_that_appeared_and_disappeared() -> None:
+    """Test that the change of every site of either snapshot is reported."""
+    # Arrange
+    before = {("a", 1): (100, 1), ("b", 2): (50, 5)}
+    after = {("a", 1): (160, 2), ("c", 3): (10, 1)}
+
+    # Act
+    change = AllocationSites.diff(before, after)
+
+    # Assert
+    assert change == {("a", 1): (60, 1), ("b", 2): (-50, -5), ("c", 3): (10, 1)}
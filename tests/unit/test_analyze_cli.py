@@ -0,0 +1,219 @@
+"""Unit tests for analyze CLI command."""
+
+import json
+from datetime import date
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+from typer.testing import CliRunner
+
+from adraitools.cli.cli import app
+from adraitools.services.models.analysis import (
+    AdrActivity,
+    ConflictReport,
+    CorpusStatistics,
+    DecisionConflict,
+    DuplicateReport,
+    HistoryStatistics,
+    NearDuplicate,
+)
+
+STATISTICS = CorpusStatistics(
+    total=2,
+    status_counts={"Accepted": 2},
+    age_histogram={"< 30 days": 2},
+    undated=0,
+    decisions_per_month={"2025-06": 2},
+    average_section_words={"Context": 12.5},
+    missing_sections={"Context": 0, "Rationale": 1},
+    incomplete=1,
+)
+
+
+def test_analyze_command_prints_text_report(mocker: MockerFixture) -> None:
+    """Test that analyze prints every statistics table."""
+    # Arrange
+    runner = CliRunner()
+    mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mock_analyzer_class = mocker.patch(
+        "adraitools.services.corpus_analyzer.CorpusAnalyzer"
+    )
+    mock_analyzer_class.return_value.analyze.return_value = STATISTICS
+
+    # Act
+    result = runner.invoke(app, ["analyze"])
+
+    # Assert
+    assert result.exit_code == 0
+    assert "ADRs: 2" in result.output
+    assert "Decisions per month:" in result.output
+    assert "Rationale" in result.output
+    assert "ADRs missing sections: 1" in result.output
+
+
+def test_analyze_command_prints_json(mocker: MockerFixture) -> None:
+    """Test that --json prints the statistics as a JSON document."""
+    # Arrange
+    runner = CliRunner()
+    mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mock_analyzer_class = mocker.patch(
+        "adraitools.services.corpus_analyzer.CorpusAnalyzer"
+    )
+    mock_analyzer_class.return_value.analyze.return_value = STATISTICS
+
+    # Act
+    result = runner.invoke(app, ["analyze", "--json"])
+
+    # Assert
+    assert result.exit_code == 0
+    assert json.loads(result.output) == STATISTICS.model_dump()
+
+
+def test_analyze_command_duplicates_prints_pairs(mocker: MockerFixture) -> None:
+    """Test that --duplicates prints the near-duplicate pairs."""
+    # Arrange
+    runner = CliRunner()
+    mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mock_detector_class = mocker.patch(
+        "adraitools.services.duplicate_detector.DuplicateDetector"
+    )
+    mock_detector_class.return_value.find_duplicates.return_value = DuplicateReport(
+        total=3,
+        signed=1,
+        verified=2,
+        duplicates=[
+            NearDuplicate(
+                first=Path("docs/adr/0001-a.md"),
+                second=Path("docs/adr/0003-c.md"),
+                similarity=0.93,
+            )
+        ],
+    )
+
+    # Act
+    result = runner.invoke(app, ["analyze", "--duplicates", "--threshold", "0.9"])
+
+    # Assert
+    assert result.exit_code == 0
+    assert "0.93  docs/adr/0001-a.md  docs/adr/0003-c.md" in result.output
+    assert "1 near-duplicate pair(s) among 3 ADRs" in result.output
+    mock_detector_class.return_value.find_duplicates.assert_called_once_with(0.9)
+
+
+def test_analyze_command_conflicts_prints_stages(mocker: MockerFixture) -> None:
+    """Test that --conflicts prints conflicts and the pairs pruned per stage."""
+    # Arrange
+    runner = CliRunner()
+    mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mocker.patch("adraitools.infrastructure.llm_provider_factory.LlmProviderFactory")
+    mocker.patch("adraitools.cli.cli.ContentCache")
+    mock_detector_class = mocker.patch(
+        "adraitools.services.conflict_detector.ConflictDetector"
+    )
+    mock_detector_class.return_value.find_conflicts.return_value = ConflictReport(
+        total_pairs=100,
+        active_pairs=60,
+        candidate_pairs=5,
+        cached_pairs=2,
+        verified_pairs=3,
+        llm_calls=1,
+        unanswered_pairs=0,
+        conflicts=[
+            DecisionConflict(
+                first=Path("docs/adr/0001-a.md"),
+                second=Path("docs/adr/0002-b.md"),
+                reason="Different brokers",
+            )
+        ],
+    )
+
+    # Act
+    result = runner.invoke(app, ["analyze", "--conflicts"])
+
+    # Assert
+    assert result.exit_code == 0
+    assert "docs/adr/0001-a.md  docs/adr/0002-b.md" in result.output
+    assert "Different brokers" in result.output
+    lines = {
+        line.rsplit(maxsplit=1)[0]: line.split()[-1]
+        for line in result.output.splitlines()
+        if line and not line.startswith(" ")
+    }
+    assert lines["Pruned: not accepted or proposed"] == "40"
+    assert lines["Pruned: no shared key term or neighbour"] == "55"
+    assert lines["Verified by the model (1 calls)"] == "3"
+    mock_detector_class.return_value.find_conflicts.assert_called_once_with(None)
+
+
+def test_analyze_command_conflicts_passes_the_deadline(mocker: MockerFixture) -> None:
+    """Test that --deadline bounds the model calls of --conflicts."""
+    # Arrange
+    runner = CliRunner()
+    mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mocker.patch("adraitools.infrastructure.llm_provider_factory.LlmProviderFactory")
+    mocker.patch("adraitools.cli.cli.ContentCache")
+    mocker.patch("adraitools.cli.cli.time.monotonic", return_value=100.0)
+    mock_detector_class = mocker.patch(
+        "adraitools.services.conflict_detector.ConflictDetector"
+    )
+    mock_detector_class.return_value.find_conflicts.return_value = ConflictReport(
+        total_pairs=0,
+        active_pairs=0,
+        candidate_pairs=0,
+        cached_pairs=0,
+        verified_pairs=0,
+        llm_calls=0,
+        unanswered_pairs=0,
+        conflicts=[],
+    )
+
+    # Act
+    result = runner.invoke(app, ["analyze", "--conflicts", "--deadline", "2.5"])
+
+    # Assert
+    assert result.exit_code == 0
+    mock_detector_class.return_value.find_conflicts.assert_called_once_with(102.5)
+
+
+def test_analyze_command_history_prints_staleness(mocker: MockerFixture) -> None:
+    """Test that --history mines git and prints staleness and churn."""
+    # Arrange
+    runner = CliRunner()
+    mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mocker.patch("adraitools.cli.cli.ContentCache")
+    mock_miner_class = mocker.patch(
+        "adraitools.services.git_history_miner.GitHistoryMiner"
+    )
+    mock_analyzer_class = mocker.patch(
+        "adraitools.services.corpus_analyzer.CorpusAnalyzer"
+    )
+    activity = AdrActivity(
+        path=Path("docs/adr/0001-a.md"),
+        revisions=3,
+        authors=2,
+        last_touched=date(2024, 1, 2),
+    )
+    mock_analyzer_class.return_value.analyze.return_value = STATISTICS.model_copy(
+        update={
+            "history": HistoryStatistics(
+                tracked=1,
+                untracked=1,
+                authors=2,
+                average_revisions=3.0,
+                staleness_histogram={"< 30 days": 0, "1-2 years": 1},
+                stalest=[activity],
+                most_revised=[activity],
+            )
+        }
+    )
+
+    # Act
+    result = runner.invoke(app, ["analyze", "--history"])
+
+    # Assert
+    assert result.exit_code == 0
+    assert mock_analyzer_class.call_args.kwargs["history_miner"] is (
+        mock_miner_class.return_value
+    )
+    assert "Git history: 1 tracked ADRs, 1 never committed" in result.output
+    assert "2024-01-02      3 revision(s)" in result.output
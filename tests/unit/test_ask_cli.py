@@ -0,0 +1,130 @@
+"""Unit tests for ask CLI command."""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+from pytest_mock import MockerFixture
+from typer.testing import CliRunner
+
+from adraitools.cli.cli import app
+from adraitools.exceptions import LlmProviderError
+from adraitools.services.adr_parser import AdrParser
+from adraitools.services.ask_service import AskSession
+from adraitools.services.models.adr import AdrSearchHit
+from adraitools.services.models.ask import AskTimings
+
+
+def _session(mocker: MockerFixture, chunks: list[str]) -> Mock:
+    """Create a session mock with one source streaming the given chunks."""
+    document = AdrParser().parse(Path("0001-use-uv.md"), "## Title\nUse uv\n")
+    session: Mock = mocker.Mock(spec=AskSession)
+    session.sources = [AdrSearchHit(document=document, score=1.0)]
+    session.stream.return_value = iter(chunks)
+    session.timings = AskTimings(
+        retrieve_ms=1.0, pack_ms=0.1, first_token_ms=5.0, total_ms=9.0
+    )
+    return session
+
+
+def test_ask_command_streams_answer_with_sources(mocker: MockerFixture) -> None:
+    """Test that ask prints the sources and the streamed answer."""
+    # Arrange
+    runner = CliRunner()
+    mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mocker.patch("adraitools.infrastructure.llm_provider_factory.LlmProviderFactory")
+    mock_ask_service_class = mocker.patch("adraitools.services.ask_service.AskService")
+    session = _session(mocker, ["We chose ", "uv [ADR-0001]."])
+    mock_ask_service_class.return_value.ask.return_value = session
+
+    # Act
+    result = runner.invoke(app, ["ask", "Why uv?", "--top-k", "2"])
+
+    # Assert
+    assert result.exit_code == 0
+    assert "[ADR-0001] Use uv" in result.output
+    assert "We chose uv [ADR-0001]." in result.output
+    mock_ask_service_class.return_value.ask.assert_called_once_with(
+        "Why uv?", top_k=2, deadline=None
+    )
+
+
+def test_ask_command_logs_timings_when_verbose(mocker: MockerFixture) -> None:
+    """Test that the latency breakdown is logged at debug level."""
+    # Arrange
+    runner = CliRunner()
+    mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mocker.patch("adraitools.infrastructure.llm_provider_factory.LlmProviderFactory")
+    mock_ask_service_class = mocker.patch("adraitools.services.ask_service.AskService")
+    mock_ask_service_class.return_value.ask.return_value = _session(mocker, ["ok"])
+    log_debug = mocker.patch(
+        "adraitools.cli.cli.LoggingService.log_debug", autospec=True
+    )
+
+    # Act
+    result = runner.invoke(app, ["--verbose", "ask", "Why uv?"])
+
+    # Assert
+    assert result.exit_code == 0
+    timings = [
+        call.kwargs["fields"]
+        for call in log_debug.call_args_list
+        if call.args[1] == "Ask timings"
+    ]
+    assert timings[0]["first_token_ms"] == 5.0  # noqa: PLR2004
+
+
+def test_ask_command_without_sources(mocker: MockerFixture) -> None:
+    """Test that ask reports when no ADR matches."""
+    # Arrange
+    runner = CliRunner()
+    mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mocker.patch("adraitools.infrastructure.llm_provider_factory.LlmProviderFactory")
+    mock_ask_service_class = mocker.patch("adraitools.services.ask_service.AskService")
+    mock_ask_service_class.return_value.ask.return_value.sources = []
+
+    # Act
+    result = runner.invoke(app, ["ask", "kubernetes?"])
+
+    # Assert
+    assert result.exit_code == 0
+    assert "No relevant ADRs found." in result.output
+
+
+def test_ask_command_reports_provider_errors(mocker: MockerFixture) -> None:
+    """Test that provider failures exit with an error message."""
+    # Arrange
+    runner = CliRunner()
+    mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mocker.patch("adraitools.infrastructure.llm_provider_factory.LlmProviderFactory")
+    mock_ask_service_class = mocker.patch("adraitools.services.ask_service.AskService")
+    session = _session(mocker, [])
+    session.stream.side_effect = LlmProviderError("Unauthorized", status_code=401)
+    mock_ask_service_class.return_value.ask.return_value = session
+
+    # Act
+    result = runner.invoke(app, ["ask", "Why uv?"])
+
+    # Assert
+    assert result.exit_code == 1
+    assert "status 401" in result.output
+
+
+def test_ask_command_turns_deadline_into_monotonic_deadline(
+    mocker: MockerFixture,
+) -> None:
+    """Test that --deadline is passed down as an absolute monotonic time."""
+    # Arrange
+    runner = CliRunner()
+    mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mocker.patch("adraitools.infrastructure.llm_provider_factory.LlmProviderFactory")
+    mocker.patch("adraitools.cli.cli.time.monotonic", return_value=100.0)
+    mock_ask_service_class = mocker.patch("adraitools.services.ask_service.AskService")
+    mock_ask_service_class.return_value.ask.return_value = _session(mocker, ["ok"])
+
+    # Act
+    result = runner.invoke(app, ["ask", "Why uv?", "--deadline", "2.5"])
+
+    # Assert
+    assert result.exit_code == 0
+    ask_call = mock_ask_service_class.return_value.ask.call_args
+    assert ask_call.kwargs["deadline"] == 102.5  # noqa: PLR2004
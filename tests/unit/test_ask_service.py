@@ -0,0 +1,129 @@
+"""Unit tests for ask service."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.services.adr_corpus_loader import AdrCorpusLoader
+from adraitools.services.adr_parser import AdrParser
+from adraitools.services.ask_service import AskService
+from adraitools.services.models.configuration import AdrConfiguration
+from adraitools.services.models.llm import LlmRequest, LlmResponse
+from tests.conftest import AdrFileFactory
+
+
+class RecordingProvider:
+    """Provider streaming a fixed answer and recording requests."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        """Initialize the provider."""
+        self.requests: list[LlmRequest] = []
+        self.error = error
+
+    def complete(self, request: LlmRequest) -> LlmResponse:
+        """Return the fixed answer."""
+        return LlmResponse(text="".join(self.stream(request)))
+
+    def stream(self, request: LlmRequest) -> Iterator[str]:
+        """Yield the fixed answer in two chunks."""
+        self.requests.append(request)
+        if self.error is not None:
+            raise self.error
+        yield from ["We chose uv ", "[ADR-0001]."]
+
+
+@pytest.fixture
+def ask_corpus(tmp_path: Path, adr_file_factory: AdrFileFactory) -> Mock:
+    """Create a small corpus and a configuration service pointing at it."""
+    adr_dir = tmp_path / "adr"
+    adr_file_factory(
+        adr_dir / "0001-use-uv.md",
+        "Use uv as dependency manager",
+        sections={"Decision": "Adopt uv for dependency management."},
+    )
+    adr_file_factory(
+        adr_dir / "0002-adopt-ruff.md",
+        "Adopt ruff",
+        sections={"Decision": "Adopt ruff for linting."},
+    )
+    configuration_service = Mock(spec=ConfigurationService)
+    configuration_service.get_configuration.return_value = AdrConfiguration(
+        adr_directory=adr_dir, template_file=adr_dir / "0000-adr-template.md"
+    )
+    return configuration_service
+
+
+def _service(configuration_service: Mock, provider: RecordingProvider) -> AskService:
+    """Create an ask service reading the real corpus."""
+    return AskService(
+        configuration_service=configuration_service,
+        corpus_loader=AdrCorpusLoader(FileSystemService(), AdrParser()),
+        llm_provider=provider,
+    )
+
+
+def test_ask_streams_grounded_answer(ask_corpus: Mock) -> None:
+    """Test that ask retrieves sources and streams the provider answer."""
+    # Arrange
+    provider = RecordingProvider()
+    service = _service(ask_corpus, provider)
+
+    # Act
+    session = service.ask("Why did we choose uv?", top_k=1)
+    answer = "".join(session.stream())
+
+    # Assert
+    assert [hit.document.identifier for hit in session.sources] == ["ADR-0001"]
+    assert answer == "We chose uv [ADR-0001]."
+    prompt = provider.requests[0].prompt
+    assert "[ADR-0001] Use uv as dependency manager" in prompt
+    assert "Question: Why did we choose uv?" in prompt
+    assert "ruff" not in prompt
+
+
+def test_ask_records_phase_timings(ask_corpus: Mock) -> None:
+    """Test that timings are available once the answer was streamed."""
+    # Arrange
+    service = _service(ask_corpus, RecordingProvider())
+
+    # Act
+    session = service.ask("uv")
+    list(session.stream())
+
+    # Assert
+    assert session.timings is not None
+    assert session.timings.retrieve_ms <= session.timings.first_token_ms
+    assert session.timings.first_token_ms <= session.timings.total_ms
+
+
+def test_ask_without_matching_adrs_skips_llm_call(ask_corpus: Mock) -> None:
+    """Test that no LLM call is made when no ADR matches."""
+    # Arrange
+    provider = RecordingProvider()
+    service = _service(ask_corpus, provider)
+
+    # Act
+    session = service.ask("kubernetes")
+    answer = list(session.stream())
+
+    # Assert
+    assert session.sources == []
+    assert answer == []
+    assert provider.requests == []
+
+
+def test_ask_reraises_provider_errors(ask_corpus: Mock) -> None:
+    """Test that provider failures surface when streaming."""
+    # Arrange
+    service = _service(ask_corpus, RecordingProvider(ConnectionError("down")))
+
+    # Act
+    session = service.ask("uv")
+
+    # Assert
+    with pytest.raises(ConnectionError, match="down"):
+        list(session.stream())
@@ -0,0 +1,190 @@
+"""Unit tests for bench CLI commands."""
+
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+from typer.testing import CliRunner
+
+from adraitools.cli.cli import app
+from adraitools.services.models.benchmark import (
+    BenchmarkSuiteResult,
+    GeneratedCorpus,
+    LlmBenchmarkResult,
+    LoggingBenchmarkResult,
+)
+
+
+def test_bench_llm_runs_each_concurrency_level(mocker: MockerFixture) -> None:
+    """Test that bench llm prints one result row per concurrency level."""
+    # Arrange
+    runner = CliRunner()
+    mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mocker.patch("adraitools.services.ask_service.AskService")
+    mock_benchmark_class = mocker.patch(
+        "adraitools.services.llm_benchmark.LlmBenchmark"
+    )
+    mock_benchmark_class.return_value.run_ask.side_effect = [
+        LlmBenchmarkResult(
+            workflow="ask",
+            concurrency=level,
+            requests=10,
+            errors=0,
+            elapsed_ms=100.0,
+            throughput_per_second=10.0 * level,
+            latency_p50_ms=50.0,
+            latency_p95_ms=80.0,
+            first_token_p50_ms=20.0,
+        )
+        for level in (2, 8)
+    ]
+
+    # Act
+    result = runner.invoke(
+        app, ["bench", "llm", "-n", "10", "--concurrency", "2", "--concurrency", "8"]
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    rows = result.output.splitlines()[1:]
+    assert [row.split()[1] for row in rows] == ["2", "8"]
+    assert rows[1].split()[4] == "80.0"
+    calls = mock_benchmark_class.return_value.run_ask.call_args_list
+    assert [call.kwargs["concurrency"] for call in calls] == [2, 8]
+
+
+def test_bench_logging_compares_sync_and_queued_modes(mocker: MockerFixture) -> None:
+    """Test that bench logging prints one row per logging mode."""
+    # Arrange
+    runner = CliRunner()
+    mock_benchmark_class = mocker.patch(
+        "adraitools.services.logging_benchmark.LoggingBenchmark"
+    )
+    mock_benchmark_class.return_value.run.side_effect = [
+        LoggingBenchmarkResult(
+            mode=mode, records=100, per_record_us=cost, drain_ms=1.0, dropped=0
+        )
+        for mode, cost in (("sync", 9.0), ("queue-block", 2.0), ("queue-drop", 1.5))
+    ]
+
+    # Act
+    result = runner.invoke(app, ["bench", "logging", "-n", "100", "--queue-size", "8"])
+
+    # Assert
+    assert result.exit_code == 0
+    rows = result.output.splitlines()[1:]
+    assert [row.split()[0] for row in rows] == ["sync", "queue-block", "queue-drop"]
+    calls = mock_benchmark_class.return_value.run.call_args_list
+    assert [call.kwargs["queue_size"] for call in calls] == [None, 8, 8]
+    assert [call.kwargs["overflow"] for call in calls] == ["block", "block", "drop"]
+
+
+def test_bench_generate_writes_the_requested_corpus(mocker: MockerFixture) -> None:
+    """Test that bench generate passes count, seed and workers on."""
+    # Arrange
+    runner = CliRunner()
+    mock_generator_class = mocker.patch(
+        "adraitools.services.corpus_generator.CorpusGenerator"
+    )
+    mock_generator_class.return_value.generate.return_value = GeneratedCorpus(
+        files=200, bytes=629_145, superseded=21
+    )
+
+    # Act
+    result = runner.invoke(
+        app,
+        [
+            "bench",
+            "generate",
+            "--count",
+            "200",
+            "-o",
+            "big",
+            "--seed",
+            "7",
+            "--workers",
+            "2",
+        ],
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    mock_generator_class.assert_called_once_with(workers=2)
+    mock_generator_class.return_value.generate.assert_called_once_with(
+        Path("big"), 200, seed=7
+    )
+    assert "Generated 200 ADRs (0.6 MiB, 21 superseded) in big" in result.output
+
+
+def _suite_result(parse_ms: float) -> BenchmarkSuiteResult:
+    """Create a suite result of a 100 ADR corpus."""
+    return BenchmarkSuiteResult(
+        version="0.1.0",
+        python="3.12.0",
+        adrs=100,
+        corpus="synthetic",
+        metrics={"parse_ms": parse_ms, "lint_ms": 50.0},
+    )
+
+
+def test_bench_suite_writes_results_to_json(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """Test that bench suite runs on a generated corpus and saves the results."""
+    # Arrange
+    runner = CliRunner()
+    mock_generator_class = mocker.patch(
+        "adraitools.services.corpus_generator.CorpusGenerator"
+    )
+    mock_suite_class = mocker.patch(
+        "adraitools.services.benchmark_suite.BenchmarkSuite"
+    )
+    mock_suite_class.return_value.run.return_value = _suite_result(20.0)
+    output = tmp_path / "results.json"
+
+    # Act
+    result = runner.invoke(
+        app, ["bench", "suite", "-n", "100", "--seed", "3", "-o", str(output)]
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    generate = mock_generator_class.return_value.generate
+    assert generate.call_args.args[1:] == (100,)
+    assert generate.call_args.kwargs == {"seed": 3}
+    saved = BenchmarkSuiteResult.model_validate_json(output.read_bytes())
+    assert saved.metrics == {"parse_ms": 20.0, "lint_ms": 50.0}
+    assert "Regression" not in result.output
+
+
+def test_bench_suite_fails_on_regression(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test that bench suite exits with 1 when slower than the baseline."""
+    # Arrange
+    runner = CliRunner()
+    mock_suite_class = mocker.patch(
+        "adraitools.services.benchmark_suite.BenchmarkSuite"
+    )
+    mock_suite_class.return_value.run.return_value = _suite_result(30.0)
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(_suite_result(20.0).model_dump_json(), encoding="utf-8")
+
+    # Act
+    result = runner.invoke(
+        app,
+        [
+            "bench",
+            "suite",
+            "--corpus",
+            str(tmp_path),
+            "-o",
+            str(tmp_path / "results.json"),
+            "--baseline",
+            str(baseline),
+            "--threshold",
+            "0.25",
+        ],
+    )
+
+    # Assert
+    assert result.exit_code == 1
+    assert "Regression: parse_ms 20.00 -> 30.00 (+50%)" in result.output
+    assert mock_suite_class.return_value.run.call_args.args[0] == tmp_path
@@ -0,0 +1,79 @@
+"""Unit tests for benchmark suite."""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+from pytest_mock import MockerFixture
+
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.infrastructure.logging_service import LoggingService
+from adraitools.services.adr_parser import AdrParser
+from adraitools.services.benchmark_suite import BenchmarkSuite, find_regressions
+from adraitools.services.corpus_generator import CorpusGenerator
+from adraitools.services.models.benchmark import BenchmarkSuiteResult
+
+
+def _result(**metrics: float) -> BenchmarkSuiteResult:
+    """Create a suite result with some metrics."""
+    return BenchmarkSuiteResult(
+        version="0.1.0", python="3.12.0", adrs=10, corpus="test", metrics=metrics
+    )
+
+
+def test_find_regressions_flags_metrics_beyond_the_threshold() -> None:
+    """Test that only metrics slower by more than the threshold regress."""
+    # Arrange
+    baseline = _result(parse_ms=100.0, lint_ms=100.0, index_build_ms=100.0)
+    current = _result(parse_ms=130.0, lint_ms=115.0, index_build_ms=60.0)
+
+    # Act
+    regressions = find_regressions(current, baseline, threshold=0.2)
+
+    # Assert
+    assert [regression.metric for regression in regressions] == ["parse_ms"]
+    assert regressions[0].baseline == 100.0  # noqa: PLR2004
+    assert regressions[0].change == 0.3  # noqa: PLR2004
+
+
+def test_find_regressions_ignores_noise_and_unknown_metrics() -> None:
+    """Test that sub-unit changes and metrics missing from the baseline pass."""
+    # Arrange
+    baseline = _result(search_p50_ms=0.2)
+    current = _result(search_p50_ms=0.9, peak_rss_mib=80.0)
+
+    # Act
+    regressions = find_regressions(current, baseline)
+
+    # Assert
+    assert regressions == []
+
+
+def test_run_measures_every_scenario(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test that a run reports every metric of the suite for the corpus."""
+    # Arrange
+    mock_run = mocker.patch("adraitools.services.benchmark_suite.subprocess.run")
+    corpus = tmp_path / "corpus"
+    CorpusGenerator(workers=1).generate(corpus, 5)
+    suite = BenchmarkSuite(
+        FileSystemService(), AdrParser(), Mock(spec=LoggingService), workers=1
+    )
+
+    # Act
+    result = suite.run(corpus, tmp_path / "scratch", searches=20)
+
+    # Assert
+    assert result.adrs == 5  # noqa: PLR2004
+    assert result.corpus == str(corpus)
+    assert set(result.metrics) >= {
+        "cli_cold_start_ms",
+        "config_resolve_ms",
+        "init_ms",
+        "parse_ms",
+        "index_build_ms",
+        "search_p50_ms",
+        "search_p95_ms",
+        "search_p99_ms",
+        "lint_ms",
+    }
+    assert mock_run.call_count == suite.repeats
+    assert (tmp_path / "scratch" / "init-0" / "docs" / "adr").is_dir()
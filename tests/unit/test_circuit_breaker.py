@@ -0,0 +1,116 @@
+"""Unit tests for circuit breaker."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from adraitools.exceptions import CircuitOpenError
+from adraitools.infrastructure.circuit_breaker import CircuitBreaker
+from adraitools.infrastructure.logging_service import LoggingService
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def _breaker(clock: FakeClock, logging_service: Mock) -> CircuitBreaker:
+    """Create a breaker opening after two failures for ten seconds."""
+    return CircuitBreaker(
+        "https://llm.example/v1/chat/completions",
+        logging_service,
+        failure_threshold=2,
+        reset_timeout=10.0,
+        clock=clock,
+    )
+
+
+def test_consecutive_failures_open_the_circuit() -> None:
+    """Test that reaching the threshold rejects further calls."""
+    # Arrange
+    logging_service = Mock(spec=LoggingService)
+    breaker = _breaker(FakeClock(), logging_service)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    # Act
+    breaker.record_failure()
+
+    # Assert
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError, match=r"retry in 10\.0s"):
+        breaker.before_call()
+    message = logging_service.log_warning.call_args.args[0]
+    assert "closed -> open" in message
+
+
+def test_half_open_admits_a_single_probe() -> None:
+    """Test that after the reset timeout only one probe goes through."""
+    # Arrange
+    clock = FakeClock()
+    breaker = _breaker(clock, Mock(spec=LoggingService))
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now = 10.0
+
+    # Act
+    breaker.before_call()
+
+    # Assert
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+@pytest.mark.parametrize(
+    ("probe_succeeds", "expected_state"), [(True, "closed"), (False, "open")]
+)
+def test_probe_outcome_decides_next_state(
+    *, probe_succeeds: bool, expected_state: str
+) -> None:
+    """Test that the probe closes or reopens the circuit."""
+    # Arrange
+    clock = FakeClock()
+    logging_service = Mock(spec=LoggingService)
+    breaker = _breaker(clock, logging_service)
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now = 10.0
+    breaker.before_call()
+
+    # Act
+    if probe_succeeds:
+        breaker.record_success()
+    else:
+        breaker.record_failure()
+
+    # Assert
+    assert breaker.state == expected_state
+    info_messages = [call.args[0] for call in logging_service.log_info.call_args_list]
+    assert any("open -> half_open" in message for message in info_messages)
+
+
+def test_released_probe_lets_the_next_call_probe() -> None:
+    """Test that an abandoned probe neither opens nor closes the circuit."""
+    # Arrange
+    clock = FakeClock()
+    breaker = _breaker(clock, Mock(spec=LoggingService))
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now = 10.0
+    breaker.before_call()
+
+    # Act
+    breaker.release()
+
+    # Assert
+    assert breaker.state == "half_open"
+    breaker.before_call()
@@ -1,11 +1,14 @@
 """Unit tests for CLI interface."""
 
+import subprocess
+import sys
 from pathlib import Path
 
 from pytest_mock import MockerFixture
 from typer.testing import CliRunner
 
 from adraitools.cli.cli import app
+from adraitools.services.models.log_file import LogFileSettings
 from adraitools.services.models.result import InitializationResult
 
 
@@ -15,7 +18,9 @@ def test_init_command_success(mocker: MockerFixture) -> None:
     runner = CliRunner()
 
     # Mock the AdrInitializer class
-    mock_initializer_class = mocker.patch("adraitools.cli.cli.AdrInitializer")
+    mock_initializer_class = mocker.patch(
+        "adraitools.services.adr_initializer.AdrInitializer"
+    )
     mock_initializer = mock_initializer_class.return_value
     success_result = InitializationResult(
         success=True, message="ADR directory structure initialized successfully"
@@ -47,7 +52,9 @@ def test_init_command_cancelled(mocker: MockerFixture) -> None:
     runner = CliRunner()
 
     # Mock the AdrInitializer class
-    mock_initializer_class = mocker.patch("adraitools.cli.cli.AdrInitializer")
+    mock_initializer_class = mocker.patch(
+        "adraitools.services.adr_initializer.AdrInitializer"
+    )
     mock_initializer = mock_initializer_class.return_value
     cancelled_result = InitializationResult(
         success=False, message="Initialization cancelled"
@@ -68,7 +75,9 @@ def test_init_command_error(mocker: MockerFixture) -> None:
     runner = CliRunner()
 
     # Mock the AdrInitializer class
-    mock_initializer_class = mocker.patch("adraitools.cli.cli.AdrInitializer")
+    mock_initializer_class = mocker.patch(
+        "adraitools.services.adr_initializer.AdrInitializer"
+    )
     mock_initializer = mock_initializer_class.return_value
     error_result = InitializationResult(
         success=False, message="Permission denied: Cannot create directory"
@@ -119,7 +128,7 @@ def test_verbose_flag_enables_debug_logging(mocker: MockerFixture) -> None:
     mock_logging_instance = mock_logging_service.return_value
 
     # Mock init command dependencies to avoid actual execution
-    mocker.patch("adraitools.cli.cli.AdrInitializer")
+    mocker.patch("adraitools.services.adr_initializer.AdrInitializer")
     mocker.patch("adraitools.cli.cli.ConfigurationService")
 
     # Act - Use init command to trigger callback
@@ -130,7 +139,13 @@ def test_verbose_flag_enables_debug_logging(mocker: MockerFixture) -> None:
     # Should create LoggingService and configure with debug level
     mock_logging_service.assert_called_once()
     mock_logging_instance.configure_logging.assert_called_once_with(
-        level="DEBUG", log_file=None, quiet=False
+        level="DEBUG",
+        log_file=None,
+        quiet=False,
+        queue_size=None,
+        overflow="block",
+        log_format="text",
+        file_settings=None,
     )
 
 
@@ -142,7 +157,7 @@ def test_quiet_flag_accepted(mocker: MockerFixture) -> None:
     mock_logging_instance = mock_logging_service.return_value
 
     # Mock init command dependencies to avoid actual execution
-    mocker.patch("adraitools.cli.cli.AdrInitializer")
+    mocker.patch("adraitools.services.adr_initializer.AdrInitializer")
     mocker.patch("adraitools.cli.cli.ConfigurationService")
 
     # Act - Use init command to trigger callback
@@ -153,7 +168,13 @@ def test_quiet_flag_accepted(mocker: MockerFixture) -> None:
     # Should create LoggingService and configure with critical level for quiet
     mock_logging_service.assert_called_once()
     mock_logging_instance.configure_logging.assert_called_once_with(
-        level="INFO", log_file=None, quiet=True
+        level="INFO",
+        log_file=None,
+        quiet=True,
+        queue_size=None,
+        overflow="block",
+        log_format="text",
+        file_settings=None,
     )
 
 
@@ -165,8 +186,11 @@ def test_log_file_option_accepted(mocker: MockerFixture) -> None:
     mock_logging_instance = mock_logging_service.return_value
 
     # Mock init command dependencies to avoid actual execution
-    mocker.patch("adraitools.cli.cli.AdrInitializer")
-    mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mocker.patch("adraitools.services.adr_initializer.AdrInitializer")
+    configuration = mocker.patch(
+        "adraitools.cli.cli.ConfigurationService"
+    ).return_value.get_configuration.return_value
+    configuration.log_file_settings.return_value = LogFileSettings()
 
     # Act - Use init command to trigger callback
     result = runner.invoke(app, ["--log-file", "debug.log", "init"])
@@ -176,5 +200,162 @@ def test_log_file_option_accepted(mocker: MockerFixture) -> None:
     # Should create LoggingService and configure with log file
     mock_logging_service.assert_called_once()
     mock_logging_instance.configure_logging.assert_called_once_with(
-        level="INFO", log_file=Path("debug.log"), quiet=False
+        level="INFO",
+        log_file=Path("debug.log"),
+        quiet=False,
+        queue_size=None,
+        overflow="block",
+        log_format="text",
+        file_settings=LogFileSettings(),
+    )
+
+
+def test_cli_import_does_not_load_numpy() -> None:
+    """Test that commands needing NumPy import it on use, keeping start-up fast."""
+    # Act
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, adraitools.cli.cli; print('numpy' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Assert
+    assert result.stdout.strip() == "False"
+
+
+def test_cli_import_does_not_load_optional_features() -> None:
+    """Test that modules of opt-in options and commands are imported on use."""
+    # Arrange
+    deferred = [
+        "adraitools.infrastructure.otlp_trace_exporter",
+        "adraitools.infrastructure.resource_monitor",
+        "adraitools.services.resource_workload",
+        "adraitools.services.corpus_generator",
+        "adraitools.services.models.memory",
+        "adraitools.infrastructure.mock_llm_provider",
+        "adraitools.infrastructure.hashing_embedder",
+        "adraitools.services.models.configuration",
+        "adraitools.infrastructure.llm_provider_factory",
+        "adraitools.services.ask_service",
+        "adraitools.services.doctor_service",
+    ]
+    script = (
+        "import sys, adraitools.cli.cli; "
+        f"print([name for name in {deferred!r} if name in sys.modules])"
+    )
+
+    # Act
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Assert
+    assert result.stdout.strip() == "[]"
+
+
+def test_log_queue_options_accepted(mocker: MockerFixture) -> None:
+    """Test that --log-queue and --log-overflow configure queued file logging."""
+    # Arrange
+    runner = CliRunner()
+    mock_logging_service = mocker.patch("adraitools.cli.cli.LoggingService")
+    mocker.patch("adraitools.services.adr_initializer.AdrInitializer")
+    configuration = mocker.patch(
+        "adraitools.cli.cli.ConfigurationService"
+    ).return_value.get_configuration.return_value
+    configuration.log_file_settings.return_value = LogFileSettings()
+
+    # Act
+    result = runner.invoke(
+        app,
+        [
+            "--log-file",
+            "debug.log",
+            "--log-queue",
+            "500",
+            "--log-overflow",
+            "drop",
+            "init",
+        ],
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    mock_logging_service.return_value.configure_logging.assert_called_once_with(
+        level="INFO",
+        log_file=Path("debug.log"),
+        quiet=False,
+        queue_size=500,
+        overflow="drop",
+        log_format="text",
+        file_settings=LogFileSettings(),
+    )
+
+
+def test_log_file_options_override_configured_settings(mocker: MockerFixture) -> None:
+    """Test that rotation and buffering options replace configured values."""
+    # Arrange
+    runner = CliRunner()
+    mock_logging_service = mocker.patch("adraitools.cli.cli.LoggingService")
+    mocker.patch("adraitools.services.adr_initializer.AdrInitializer")
+    configuration = mocker.patch(
+        "adraitools.cli.cli.ConfigurationService"
+    ).return_value.get_configuration.return_value
+    configuration.log_file_settings.return_value = LogFileSettings(
+        max_bytes=1_000, backup_count=2, flush_interval_seconds=30.0
+    )
+
+    # Act
+    result = runner.invoke(
+        app,
+        [
+            "--log-file",
+            "daemon.log",
+            "--log-max-bytes",
+            "1048576",
+            "--log-compress",
+            "--log-buffer",
+            "200",
+            "init",
+        ],
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    file_settings = mock_logging_service.return_value.configure_logging.call_args[1][
+        "file_settings"
+    ]
+    assert file_settings == LogFileSettings(
+        max_bytes=1_048_576,
+        backup_count=2,
+        compress=True,
+        buffer_records=200,
+        flush_interval_seconds=30.0,
+    )
+
+
+def test_log_limit_options_configure_limits(mocker: MockerFixture) -> None:
+    """Test that rate limiting and sampling options reach the logging service."""
+    # Arrange
+    runner = CliRunner()
+    mock_logging_service = mocker.patch("adraitools.cli.cli.LoggingService")
+    mocker.patch("adraitools.services.adr_initializer.AdrInitializer")
+    mocker.patch("adraitools.cli.cli.ConfigurationService")
+
+    # Act
+    result = runner.invoke(
+        app, ["--log-rate-limit", "5", "--log-debug-sample", "0.25", "init"]
     )
+
+    # Assert
+    assert result.exit_code == 0
+    logging_instance = mock_logging_service.return_value
+    logging_instance.configure_limits.assert_called_once_with(5, debug_sample_rate=0.25)
+    logging_instance.report_suppressed.assert_called_once_with()
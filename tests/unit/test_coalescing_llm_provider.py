@@ -0,0 +1,267 @@
+"""Unit tests for the coalescing LLM provider."""
+
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from adraitools.exceptions import LlmDeadlineExceededError
+from adraitools.infrastructure.coalescing_llm_provider import CoalescingLlmProvider
+from adraitools.services.models.llm import LlmRequest, LlmResponse
+
+
+class GatedProvider:
+    """Provider that blocks every call until the gate is opened."""
+
+    def __init__(self) -> None:
+        """Initialize the provider."""
+        self.gate = threading.Event()
+        self.started = threading.Event()
+        self.resume = threading.Event()
+        self.complete_calls: list[LlmRequest] = []
+        self.stream_calls: list[LlmRequest] = []
+        self.error: Exception | None = None
+
+    def complete(self, request: LlmRequest) -> LlmResponse:
+        """Return the prompt once the gate is open."""
+        self.complete_calls.append(request)
+        self.started.set()
+        self.gate.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return LlmResponse(text=f"answer to {request.prompt}")
+
+    def stream(self, request: LlmRequest) -> Iterator[str]:
+        """Yield one chunk once the gate is open and the rest once resumed."""
+        self.stream_calls.append(request)
+        self.started.set()
+        self.gate.wait(timeout=5)
+        yield "a"
+        self.resume.wait(timeout=5)
+        yield from ["b", "c"]
+
+
+@pytest.fixture
+def provider() -> GatedProvider:
+    """Create a gated provider."""
+    return GatedProvider()
+
+
+def test_identical_requests_share_one_upstream_call(provider: GatedProvider) -> None:
+    """Test that concurrent identical requests issue a single upstream call."""
+    # Arrange
+    coalescing = CoalescingLlmProvider(provider)
+    request = LlmRequest(prompt="Why uv?")
+
+    # Act
+    first = coalescing.submit(request)
+    second = coalescing.submit(LlmRequest(prompt="  Why   uv?"))
+    provider.gate.set()
+
+    # Assert
+    assert first.result(timeout=5) == LlmResponse(text="answer to Why uv?")
+    assert second.result(timeout=5) == first.result(timeout=5)
+    assert len(provider.complete_calls) == 1
+    metrics = coalescing.metrics
+    assert metrics.issued_calls == 1
+    assert metrics.coalesced_calls == 1
+    assert metrics.in_flight == 0
+
+
+def test_different_requests_are_not_coalesced(provider: GatedProvider) -> None:
+    """Test that different requests each issue an upstream call."""
+    # Arrange
+    coalescing = CoalescingLlmProvider(provider)
+    requests = [LlmRequest(prompt="one"), LlmRequest(prompt="two")]
+    provider.gate.set()
+
+    # Act
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        answers = list(pool.map(coalescing.complete, requests))
+
+    # Assert
+    assert [answer.text for answer in answers] == ["answer to one", "answer to two"]
+    assert coalescing.metrics.issued_calls == len(requests)
+    assert coalescing.metrics.coalesced_calls == 0
+
+
+def test_cancelled_waiter_does_not_affect_other_waiters(
+    provider: GatedProvider,
+) -> None:
+    """Test that one waiter leaving keeps the shared call alive."""
+    # Arrange
+    coalescing = CoalescingLlmProvider(provider)
+    request = LlmRequest(prompt="Why uv?")
+    leaving = coalescing.submit(request)
+    staying = coalescing.submit(request)
+
+    # Act
+    leaving.cancel()
+    provider.gate.set()
+
+    # Assert
+    assert staying.result(timeout=5).text == "answer to Why uv?"
+    assert coalescing.metrics.cancelled_waiters == 1
+
+
+def test_last_waiter_leaving_cancels_pending_call(provider: GatedProvider) -> None:
+    """Test that a queued upstream call is cancelled when nobody waits for it."""
+    # Arrange
+    coalescing = CoalescingLlmProvider(provider, max_workers=1)
+    running = coalescing.submit(LlmRequest(prompt="running"))
+    assert provider.started.wait(timeout=5)
+    queued = coalescing.submit(LlmRequest(prompt="queued"))
+
+    # Act
+    queued.cancel()
+    provider.gate.set()
+
+    # Assert
+    assert running.result(timeout=5).text == "answer to running"
+    with pytest.raises(CancelledError):
+        queued.result(timeout=5)
+    assert [call.prompt for call in provider.complete_calls] == ["running"]
+    assert coalescing.metrics.in_flight == 0
+
+
+def test_upstream_error_is_raised_for_every_waiter(provider: GatedProvider) -> None:
+    """Test that an upstream failure reaches all waiters."""
+    # Arrange
+    coalescing = CoalescingLlmProvider(provider)
+    provider.error = ConnectionError("gateway down")
+    request = LlmRequest(prompt="Why uv?")
+    first = coalescing.submit(request)
+    second = coalescing.submit(request)
+
+    # Act
+    provider.gate.set()
+
+    # Assert
+    for handle in (first, second):
+        with pytest.raises(ConnectionError, match="gateway down"):
+            handle.result(timeout=5)
+
+
+def test_identical_streams_fan_out_all_chunks(provider: GatedProvider) -> None:
+    """Test that stream subscribers share one upstream stream."""
+    # Arrange
+    coalescing = CoalescingLlmProvider(provider)
+    request = LlmRequest(prompt="Why uv?")
+    first = coalescing.stream(request)
+    second = coalescing.stream(request)
+
+    # Act
+    provider.gate.set()
+    provider.resume.set()
+
+    # Assert
+    assert list(first) == ["a", "b", "c"]
+    assert list(second) == ["a", "b", "c"]
+    assert len(provider.stream_calls) == 1
+    assert coalescing.metrics.coalesced_calls == 1
+
+
+def test_closing_one_stream_subscriber_keeps_others(provider: GatedProvider) -> None:
+    """Test that a subscriber closing early does not truncate other streams."""
+    # Arrange
+    coalescing = CoalescingLlmProvider(provider)
+    request = LlmRequest(prompt="Why uv?")
+    leaving = coalescing.stream(request)
+    staying = coalescing.stream(request)
+    provider.gate.set()
+
+    # Act
+    assert next(iter(leaving)) == "a"
+    leaving.close()
+    provider.resume.set()
+
+    # Assert
+    assert list(staying) == ["a", "b", "c"]
+    assert coalescing.metrics.cancelled_waiters == 1
+
+
+def test_unstarted_stream_subscriber_can_leave(provider: GatedProvider) -> None:
+    """Test that closing a never iterated subscriber still detaches it."""
+    # Arrange
+    coalescing = CoalescingLlmProvider(provider)
+    request = LlmRequest(prompt="Why uv?")
+    leaving = coalescing.stream(request)
+    staying = coalescing.stream(request)
+
+    # Act
+    leaving.close()
+    provider.gate.set()
+    provider.resume.set()
+
+    # Assert
+    assert list(staying) == ["a", "b", "c"]
+    assert coalescing.metrics.cancelled_waiters == 1
+
+
+def test_stream_error_is_raised_for_every_subscriber() -> None:
+    """Test that a failing upstream stream call reaches all subscribers."""
+    # Arrange
+    upstream = Mock()
+    upstream.stream.side_effect = ConnectionError("gateway down")
+    coalescing = CoalescingLlmProvider(upstream)
+    request = LlmRequest(prompt="Why uv?")
+    subscribers = [coalescing.stream(request), coalescing.stream(request)]
+
+    # Act & Assert
+    for subscriber in subscribers:
+        with pytest.raises(ConnectionError, match="gateway down"):
+            list(subscriber)
+
+
+def test_waiter_gives_up_at_its_deadline(provider: GatedProvider) -> None:
+    """Test that a waiter stops waiting for the shared call at its deadline."""
+    # Arrange
+    coalescing = CoalescingLlmProvider(provider)
+    request = LlmRequest(prompt="Why uv?", deadline=time.monotonic() + 0.05)
+
+    # Act & Assert
+    with pytest.raises(LlmDeadlineExceededError):
+        coalescing.complete(request)
+    provider.gate.set()
+
+
+def test_joiner_without_deadline_outlives_the_leader_deadline(
+    provider: GatedProvider,
+) -> None:
+    """Test that the first waiter's deadline does not fail later joiners."""
+    # Arrange
+    coalescing = CoalescingLlmProvider(provider)
+    leader = LlmRequest(prompt="Why uv?", deadline=time.monotonic() + 0.05)
+    joiner = coalescing.submit(LlmRequest(prompt="Why uv?"))
+
+    # Act
+    with pytest.raises(LlmDeadlineExceededError):
+        coalescing.complete(leader)
+    time.sleep(0.05)
+    provider.gate.set()
+
+    # Assert
+    assert joiner.result(timeout=5) == LlmResponse(text="answer to Why uv?")
+    assert provider.complete_calls[0].deadline is None
+
+
+def test_stream_subscriber_gives_up_at_its_deadline(provider: GatedProvider) -> None:
+    """Test that a stream subscriber stops waiting for chunks at its deadline."""
+    # Arrange
+    coalescing = CoalescingLlmProvider(provider)
+    request = LlmRequest(prompt="Why uv?", deadline=time.monotonic() + 0.05)
+    other = coalescing.stream(LlmRequest(prompt="Why uv?"))
+    subscriber = coalescing.stream(request)
+
+    # Act
+    with pytest.raises(LlmDeadlineExceededError):
+        next(subscriber)
+    provider.gate.set()
+    provider.resume.set()
+
+    # Assert
+    assert list(other) == ["a", "b", "c"]
+    assert provider.stream_calls[0].deadline is None
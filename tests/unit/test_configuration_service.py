@@ -263,3 +263,61 @@ def test_configuration_service_set_value_global_flag_defaults_to_false(
             config_data = tomli.load(f)
 
         assert config_data["adr_directory"] == "project/adr"
+
+
+def test_configuration_service_serves_a_fixed_configuration(tmp_path: Path) -> None:
+    """Test that a configuration given to the service is used as is."""
+    # Arrange
+    configuration = AdrConfiguration(adr_directory=tmp_path / "adr")
+
+    # Act
+    service = ConfigurationService(configuration)
+
+    # Assert
+    assert service.get_configuration() is configuration
+    assert service.get_value("adr_directory") == str(tmp_path / "adr")
+
+
+def test_get_paths_matches_configuration_precedence(
+    mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that get_paths resolves the paths like the configuration model."""
+    # Arrange
+    project, home = tmp_path / "project", tmp_path / "home"
+    (project / ".adr-ai-tools").mkdir(parents=True)
+    (project / ".adr-ai-tools" / "config.toml").write_text(
+        'template_file = "project/template.md"\n'
+    )
+    (home / ".config" / "adr-ai-tools").mkdir(parents=True)
+    (home / ".config" / "adr-ai-tools" / "config.toml").write_text(
+        'adr_directory = "global/adr"\ntemplate_file = "global/template.md"\n'
+    )
+    mocker.patch("pathlib.Path.cwd", return_value=project)
+    mocker.patch("pathlib.Path.home", return_value=home)
+    monkeypatch.setenv("adrai_adr_directory", "env/adr")
+
+    # Act
+    paths = ConfigurationService().get_paths()
+
+    # Assert
+    configuration = AdrConfiguration()
+    assert paths == (configuration.adr_directory, configuration.template_file)
+    assert paths == (Path("env/adr"), Path("project/template.md"))
+
+
+@pytest.mark.usefixtures("_mock_home_directory", "_mock_current_working_directory")
+def test_get_paths_does_not_build_the_configuration_model(
+    mocker: MockerFixture,
+) -> None:
+    """Test that get_paths falls back to the defaults without pydantic-settings."""
+    # Arrange
+    model = mocker.patch(
+        "adraitools.services.models.configuration.AdrConfiguration", autospec=True
+    )
+
+    # Act
+    paths = ConfigurationService().get_paths()
+
+    # Assert
+    assert paths == (Path("docs/adr"), Path("docs/adr/0000-adr-template.md"))
+    model.assert_not_called()
@@ -0,0 +1,174 @@
+"""Unit tests for conflict detector."""
+
+import json
+import re
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.content_cache import ContentCache
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.infrastructure.hashing_embedder import HashingEmbedder
+from adraitools.services.adr_corpus_loader import AdrCorpusLoader
+from adraitools.services.adr_parser import AdrParser
+from adraitools.services.conflict_detector import ConflictDetector
+from adraitools.services.models.configuration import AdrConfiguration
+from adraitools.services.models.llm import LlmRequest, LlmResponse
+from tests.conftest import AdrFileFactory
+
+
+class BrokerJudge:
+    """Fake model flagging pairs where both ADRs pick a message broker."""
+
+    def __init__(self, reply: str | None = None) -> None:
+        """Initialize the judge, optionally with a fixed reply."""
+        self.reply = reply
+        self.requests: list[LlmRequest] = []
+
+    def complete(self, request: LlmRequest) -> LlmResponse:
+        """Answer one JSON line per pair of the prompt."""
+        self.requests.append(request)
+        if self.reply is not None:
+            return LlmResponse(text=self.reply)
+        lines = []
+        for number, body in re.findall(
+            r"Pair (\d+):\n(.*?)(?=\n\nPair |\Z)", request.prompt, re.DOTALL
+        ):
+            conflict = body.count("broker") >= 2  # noqa: PLR2004
+            lines.append(
+                json.dumps(
+                    {"pair": int(number), "conflict": conflict, "reason": "brokers"}
+                )
+            )
+        return LlmResponse(text="\n".join(lines))
+
+    def stream(self, request: LlmRequest) -> Iterator[str]:
+        """Stream the complete answer as one chunk."""
+        yield self.complete(request).text
+
+
+@pytest.fixture
+def adr_dir(tmp_path: Path, adr_file_factory: AdrFileFactory) -> Path:
+    """Create a corpus with two contradicting broker decisions."""
+    adr_dir = tmp_path / "adr"
+    decisions = [
+        (
+            "0001-rabbitmq.md",
+            "Use RabbitMQ",
+            "Accepted",
+            "RabbitMQ is our message broker for events.",
+        ),
+        (
+            "0002-kafka.md",
+            "Use Kafka",
+            "Accepted",
+            "Kafka is our message broker for events.",
+        ),
+        (
+            "0003-logging.md",
+            "Structured logging",
+            "Accepted",
+            "Log JSON lines to stdout.",
+        ),
+        (
+            "0004-sqs.md",
+            "Use SQS",
+            "Superseded",
+            "SQS is our message broker for events.",
+        ),
+    ]
+    for name, title, status, decision in decisions:
+        adr_file_factory(
+            adr_dir / name, title, status=status, sections={"Decision": decision}
+        )
+    return adr_dir
+
+
+def _detector(
+    adr_dir: Path, judge: BrokerJudge, cache: ContentCache
+) -> ConflictDetector:
+    """Create a detector over a corpus directory."""
+    configuration_service = Mock(spec=ConfigurationService)
+    configuration_service.get_configuration.return_value = AdrConfiguration(
+        adr_directory=adr_dir, template_file=adr_dir / "0000-adr-template.md"
+    )
+    return ConflictDetector(
+        configuration_service,
+        AdrCorpusLoader(FileSystemService(), AdrParser()),
+        HashingEmbedder(),
+        judge,
+        cache,
+    )
+
+
+def test_find_conflicts_prunes_then_verifies_candidates(
+    adr_dir: Path, tmp_path: Path
+) -> None:
+    """Test stage counts and the flagged pair."""
+    # Arrange
+    judge = BrokerJudge()
+    detector = _detector(adr_dir, judge, ContentCache(tmp_path / "cache.sqlite3"))
+
+    # Act
+    report = detector.find_conflicts()
+
+    # Assert
+    assert report.total_pairs == 6  # noqa: PLR2004
+    assert report.active_pairs == 3  # noqa: PLR2004
+    assert report.candidate_pairs >= 1
+    assert report.verified_pairs == report.candidate_pairs
+    assert report.llm_calls == len(judge.requests) == 1
+    assert [(c.first.name, c.second.name) for c in report.conflicts] == [
+        ("0001-rabbitmq.md", "0002-kafka.md")
+    ]
+
+
+def test_find_conflicts_sends_the_deadline_with_every_call(
+    adr_dir: Path, tmp_path: Path
+) -> None:
+    """Test that the caller's deadline bounds the model calls."""
+    # Arrange
+    judge = BrokerJudge()
+    detector = _detector(adr_dir, judge, ContentCache(tmp_path / "cache.sqlite3"))
+    deadline = time.monotonic() + 30
+
+    # Act
+    detector.find_conflicts(deadline)
+
+    # Assert
+    assert judge.requests
+    assert {request.deadline for request in judge.requests} == {deadline}
+
+
+def test_find_conflicts_reuses_cached_verdicts(adr_dir: Path, tmp_path: Path) -> None:
+    """Test that a second run asks the model nothing."""
+    # Arrange
+    cache = ContentCache(tmp_path / "cache.sqlite3")
+    _detector(adr_dir, BrokerJudge(), cache).find_conflicts()
+    judge = BrokerJudge()
+
+    # Act
+    report = _detector(adr_dir, judge, cache).find_conflicts()
+
+    # Assert
+    assert judge.requests == []
+    assert report.cached_pairs == report.candidate_pairs
+    assert len(report.conflicts) == 1
+
+
+def test_find_conflicts_counts_unusable_answers(adr_dir: Path, tmp_path: Path) -> None:
+    """Test that pairs without a parsable verdict are reported, not cached."""
+    # Arrange
+    cache = ContentCache(tmp_path / "cache.sqlite3")
+    detector = _detector(adr_dir, BrokerJudge(reply="I cannot tell."), cache)
+
+    # Act
+    report = detector.find_conflicts()
+
+    # Assert
+    assert report.unanswered_pairs == report.candidate_pairs
+    assert report.conflicts == []
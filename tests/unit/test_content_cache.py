@@ -0,0 +1,60 @@
+"""Unit tests for content cache."""
+
+from pathlib import Path
+
+from adraitools.infrastructure.content_cache import ContentCache
+
+
+def test_put_and_get_round_trip(tmp_path: Path) -> None:
+    """Test that stored values are returned by key."""
+    # Arrange
+    cache = ContentCache(tmp_path / "cache" / "cache.sqlite3")
+
+    # Act
+    cache.put("lint", "abc", b"ok")
+
+    # Assert
+    assert cache.get("lint", "abc") == b"ok"
+    assert cache.get("lint", "missing") is None
+
+
+def test_namespaces_are_isolated(tmp_path: Path) -> None:
+    """Test that equal keys in different namespaces do not collide."""
+    # Arrange
+    cache = ContentCache(tmp_path / "cache.sqlite3")
+    cache.put("first", "key", b"1")
+
+    # Act
+    value = cache.get("second", "key")
+
+    # Assert
+    assert value is None
+
+
+def test_get_many_returns_only_cached_keys(tmp_path: Path) -> None:
+    """Test that get_many handles more keys than fit in one query."""
+    # Arrange
+    cache = ContentCache(tmp_path / "cache.sqlite3")
+    cache.put_many("ns", {f"key{index}": b"v" for index in range(0, 1200, 2)})
+
+    # Act
+    found = cache.get_many("ns", [f"key{index}" for index in range(1200)])
+
+    # Assert
+    assert len(found) == 600  # noqa: PLR2004
+    assert "key1" not in found
+
+
+def test_values_persist_across_instances(tmp_path: Path) -> None:
+    """Test that values survive reopening the database."""
+    # Arrange
+    path = tmp_path / "cache.sqlite3"
+    first = ContentCache(path)
+    first.put("ns", "key", b"value")
+    first.close()
+
+    # Act
+    value = ContentCache(path).get("ns", "key")
+
+    # Assert
+    assert value == b"value"
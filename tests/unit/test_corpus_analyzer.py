@@ -0,0 +1,204 @@
+"""Unit tests for corpus analyzer."""
+
+from datetime import UTC, date, datetime
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.services import corpus_analyzer
+from adraitools.services.adr_corpus_loader import AdrCorpusLoader
+from adraitools.services.adr_parser import AdrParser
+from adraitools.services.corpus_analyzer import CorpusAnalyzer
+from adraitools.services.git_history_miner import GitHistoryMiner
+from adraitools.services.models.configuration import AdrConfiguration
+from adraitools.services.models.history import FileHistory
+from tests.conftest import AdrFileFactory
+
+TODAY = date(2025, 6, 30)
+
+
+@pytest.fixture
+def adr_dir(tmp_path: Path, adr_file_factory: AdrFileFactory) -> Path:
+    """Create a corpus with varied statuses, dates and sections."""
+    adr_dir = tmp_path / "adr"
+    adr_file_factory(
+        adr_dir / "0001-uv.md",
+        "Use uv",
+        date="2025-06-20",
+        sections={"Context": "We need a fast installer.", "Decision": "Use uv."},
+    )
+    adr_file_factory(
+        adr_dir / "0002-ruff.md",
+        "Adopt ruff",
+        status="Proposed",
+        date="2024-01-15",
+        sections={"Context": "Linting is slow.\n\n```\n## Decision\n```\n"},
+    )
+    adr_file_factory(
+        adr_dir / "0003-mypy.md",
+        "Adopt mypy",
+        date="someday",
+        sections={"Decision": "Use mypy strict."},
+    )
+    return adr_dir
+
+
+def _analyzer(adr_dir: Path) -> CorpusAnalyzer:
+    """Create an analyzer over a corpus directory without template file."""
+    configuration_service = Mock(spec=ConfigurationService)
+    configuration_service.get_configuration.return_value = AdrConfiguration(
+        adr_directory=adr_dir, template_file=adr_dir / "0000-adr-template.md"
+    )
+    return CorpusAnalyzer(
+        configuration_service, AdrCorpusLoader(FileSystemService(), AdrParser())
+    )
+
+
+def test_analyze_counts_statuses_dates_and_months(adr_dir: Path) -> None:
+    """Test the status distribution, age buckets and monthly counts."""
+    # Arrange
+    analyzer = _analyzer(adr_dir)
+
+    # Act
+    statistics = analyzer.analyze(today=TODAY)
+
+    # Assert
+    assert statistics.total == 3  # noqa: PLR2004
+    assert statistics.status_counts == {"Accepted": 2, "Proposed": 1}
+    assert statistics.age_histogram["< 30 days"] == 1
+    assert statistics.age_histogram["1-2 years"] == 1
+    assert statistics.undated == 1
+    assert statistics.decisions_per_month == {"2024-01": 1, "2025-06": 1}
+
+
+def test_analyze_ignores_headings_inside_code_fences(adr_dir: Path) -> None:
+    """Test that section statistics match the parser's view of the ADRs."""
+    # Arrange
+    analyzer = _analyzer(adr_dir)
+
+    # Act
+    statistics = analyzer.analyze(today=TODAY)
+
+    # Assert
+    assert statistics.missing_sections["Decision"] == 1
+    assert statistics.missing_sections["Rationale"] == 3  # noqa: PLR2004
+    assert statistics.incomplete == 3  # noqa: PLR2004
+    documents = AdrCorpusLoader(FileSystemService(), AdrParser()).load(adr_dir)
+    context_words = [len(d.section("Context").split()) for d in documents]
+    expected = sum(context_words) / sum(1 for words in context_words if words)
+    assert statistics.average_section_words["Context"] == round(expected, 1)
+
+
+def test_analyze_spans_several_scan_windows(
+    tmp_path: Path, adr_file_factory: AdrFileFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that rows land in place when the corpus spans several windows."""
+    # Arrange
+    monkeypatch.setattr(corpus_analyzer, "SCAN_WINDOW", 4)
+    monkeypatch.setattr(corpus_analyzer, "READ_BATCH", 2)
+    adr_dir = tmp_path / "adr"
+    for number in range(1, 12):
+        adr_file_factory(
+            adr_dir / f"{number:04d}-adr.md",
+            f"Decision {number}",
+            status="Accepted" if number % 2 else "Rejected",
+            date=f"2024-{number:02d}-01",
+            sections={"Context": " ".join(["word"] * number)},
+        )
+
+    # Act
+    statistics = _analyzer(adr_dir).analyze(today=TODAY)
+
+    # Assert
+    assert statistics.status_counts == {"Accepted": 6, "Rejected": 5}
+    assert len(statistics.decisions_per_month) == 11  # noqa: PLR2004
+    assert statistics.average_section_words["Context"] == 6.0  # noqa: PLR2004
+
+
+def test_expected_sections_follow_the_template_file(
+    tmp_path: Path, adr_file_factory: AdrFileFactory
+) -> None:
+    """Test that a custom template defines the expected sections."""
+    # Arrange
+    adr_dir = tmp_path / "adr"
+    adr_file_factory(adr_dir / "0001-uv.md", "Use uv")
+    (adr_dir / "0000-adr-template.md").write_text(
+        "# ADR\n\n## Title\n\n## Status\n\n## Consequences\n"
+    )
+
+    # Act
+    sections = _analyzer(adr_dir).expected_sections()
+
+    # Assert
+    assert sections == ["Title", "Status", "Consequences"]
+
+
+def test_expected_sections_ask_the_corpus_file_system_for_the_template(
+    tmp_path: Path, adr_file_factory: AdrFileFactory
+) -> None:
+    """Test that a template missing where the corpus is read is not read."""
+    # Arrange
+    adr_dir = tmp_path / "adr"
+    adr_file_factory(adr_dir / "0001-uv.md", "Use uv")
+    (adr_dir / "0000-adr-template.md").write_text("# ADR\n\n## Consequences\n")
+    file_system_service = Mock(spec=FileSystemService)
+    file_system_service.path_exists.return_value = False
+    analyzer = _analyzer(adr_dir)
+    analyzer.corpus_loader = AdrCorpusLoader(file_system_service, AdrParser())
+
+    # Act
+    sections = analyzer.expected_sections()
+
+    # Assert
+    assert sections[:2] == ["Title", "Status"]
+    file_system_service.read_text.assert_not_called()
+
+
+def test_analyze_adds_git_staleness_and_churn(adr_dir: Path) -> None:
+    """Test history statistics over the analyzed ADRs only."""
+    # Arrange
+    analyzer = _analyzer(adr_dir)
+    day = 86400
+    old = int(datetime(2024, 6, 1, 12, tzinfo=UTC).timestamp())
+    analyzer.history_miner = Mock(spec=GitHistoryMiner)
+    analyzer.history_miner.history.return_value = {
+        "0001-uv.md": FileHistory(
+            revisions=4,
+            authors=["Ann", "Bob"],
+            first_touched=old,
+            last_touched=old + 380 * day,
+            last_commit="b",
+        ),
+        "0002-ruff.md": FileHistory(
+            revisions=1,
+            authors=["Ann"],
+            first_touched=old,
+            last_touched=old,
+            last_commit="a",
+        ),
+        "0009-deleted.md": FileHistory(
+            revisions=9,
+            authors=["Zed"],
+            first_touched=old,
+            last_touched=old,
+            last_commit="a",
+        ),
+    }
+
+    # Act
+    history = analyzer.analyze(today=TODAY).history
+
+    # Assert
+    assert history is not None
+    assert (history.tracked, history.untracked, history.authors) == (2, 1, 2)
+    assert history.average_revisions == 2.5  # noqa: PLR2004
+    assert history.staleness_histogram["< 30 days"] == 1
+    assert history.staleness_histogram["1-2 years"] == 1
+    assert [activity.path.name for activity in history.stalest] == [
+        "0002-ruff.md",
+        "0001-uv.md",
+    ]
+    assert history.most_revised[0].revisions == 4  # noqa: PLR2004
@@ -0,0 +1,78 @@
+"""Unit tests for corpus generator."""
+
+from pathlib import Path
+
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.services.adr_corpus_loader import AdrCorpusLoader
+from adraitools.services.adr_parser import AdrParser
+from adraitools.services.corpus_generator import BLOCK_SIZE, CorpusGenerator
+from adraitools.services.supersession_graph_service import SupersessionGraphService
+
+TEMPLATE_SECTIONS = [
+    "Title",
+    "Status",
+    "Date",
+    "Context",
+    "Decision",
+    "Rationale",
+    "Implications",
+    "Alternatives",
+    "Future Direction",
+    "References",
+]
+
+
+def _contents(directory: Path) -> dict[str, bytes]:
+    return {path.name: path.read_bytes() for path in directory.iterdir()}
+
+
+def test_generate_is_deterministic_across_worker_counts(tmp_path: Path) -> None:
+    """Test that the seed alone decides the corpus, not the parallelism."""
+    # Arrange
+    count = BLOCK_SIZE * 20 + 5
+
+    # Act
+    serial = CorpusGenerator(workers=1).generate(tmp_path / "a", count, seed=3)
+    parallel = CorpusGenerator(workers=2).generate(tmp_path / "b", count, seed=3)
+    CorpusGenerator(workers=1).generate(tmp_path / "c", count, seed=4)
+
+    # Assert
+    assert serial == parallel
+    assert serial.files == count
+    assert _contents(tmp_path / "a") == _contents(tmp_path / "b")
+    assert _contents(tmp_path / "a") != _contents(tmp_path / "c")
+
+
+def test_generated_adrs_follow_the_template_and_link_consistently(
+    tmp_path: Path,
+) -> None:
+    """Test that ADRs parse with every section and chains link both ways."""
+    # Arrange
+    corpus = CorpusGenerator(workers=1).generate(tmp_path, 300, seed=1)
+
+    # Act
+    documents = AdrCorpusLoader(FileSystemService(), AdrParser()).load(tmp_path)
+
+    # Assert
+    assert [document.number for document in documents] == list(range(1, 301))
+    assert all(list(document.sections) == TEMPLATE_SECTIONS for document in documents)
+    dates = [document.date for document in documents]
+    assert dates == sorted(dates)
+    assert dates[0] == "2015-01-01"
+    links = {
+        document.identifier: SupersessionGraphService.extract_links(document)
+        for document in documents
+    }
+    superseded = [entry for entry in links.values() if entry.superseded_by]
+    assert len(superseded) == corpus.superseded > 0
+    for entry in superseded:
+        (successor,) = entry.superseded_by
+        assert links[successor].supersedes == [entry.identifier]
+    names = {path.name for path in tmp_path.iterdir()}
+    for document in documents:
+        for target in (
+            AdrParser()
+            .split_sections(document.path.read_text(encoding="utf-8"))[1]["References"]
+            .split("(")[1:]
+        ):
+            assert target.split(")")[0] in names
@@ -1,9 +1,18 @@
 """Unit tests for doctor CLI command."""
 
+import json
+import tracemalloc
+from pathlib import Path
+
 from pytest_mock import MockerFixture
 from typer.testing import CliRunner
 
 from adraitools.cli.cli import app
+from adraitools.infrastructure.configuration_service import AdrPaths
+from adraitools.infrastructure.git_index_file_system import GitIndexFileSystem
+from adraitools.infrastructure.span_recorder import SpanRecorder
+from adraitools.services.models.links import LinkProblem, LinkReport
+from adraitools.services.models.resources import ResourceUsage
 from adraitools.services.models.result import DiagnosisResult
 
 
@@ -13,7 +22,9 @@ def test_doctor_command_success(mocker: MockerFixture) -> None:
     runner = CliRunner()
 
     # Mock DoctorService and its dependencies
-    mock_doctor_service_class = mocker.patch("adraitools.cli.cli.DoctorService")
+    mock_doctor_service_class = mocker.patch(
+        "adraitools.services.doctor_service.DoctorService"
+    )
     mock_doctor_service = mock_doctor_service_class.return_value
     success_result = DiagnosisResult(success=True, message="Configuration is valid")
     mock_doctor_service.diagnose.return_value = success_result
@@ -44,7 +55,9 @@ def test_doctor_command_invalid_config(mocker: MockerFixture) -> None:
     runner = CliRunner()
 
     # Mock DoctorService and its dependencies
-    mock_doctor_service_class = mocker.patch("adraitools.cli.cli.DoctorService")
+    mock_doctor_service_class = mocker.patch(
+        "adraitools.services.doctor_service.DoctorService"
+    )
     mock_doctor_service = mock_doctor_service_class.return_value
     error_result = DiagnosisResult(success=False, message="Invalid configuration")
     mock_doctor_service.diagnose.return_value = error_result
@@ -67,3 +80,204 @@ def test_doctor_command_invalid_config(mocker: MockerFixture) -> None:
 
     # Verify diagnose was called with correct subcommand
     mock_doctor_service.diagnose.assert_called_once_with()
+
+
+def test_doctor_command_links_reports_problems(mocker: MockerFixture) -> None:
+    """Test that doctor --links prints broken links and exits with 1."""
+    # Arrange
+    runner = CliRunner()
+    mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mocker.patch("adraitools.cli.cli.ContentCache")
+    mock_doctor_service_class = mocker.patch(
+        "adraitools.services.doctor_service.DoctorService"
+    )
+    mock_doctor_service_class.return_value.diagnose.return_value = DiagnosisResult(
+        success=True, message="Configuration is valid"
+    )
+    mock_link_checker_class = mocker.patch("adraitools.cli.cli.LinkChecker")
+    mock_link_checker_class.return_value.check.return_value = LinkReport(
+        files=2,
+        cached=1,
+        links=5,
+        problems=[
+            LinkProblem(
+                path=Path("docs/adr/0002-b.md"),
+                line=4,
+                target="0009-gone.md",
+                reason="file not found",
+            )
+        ],
+    )
+
+    # Act
+    result = runner.invoke(app, ["doctor", "--links"])
+
+    # Assert
+    assert result.exit_code == 1
+    assert "docs/adr/0002-b.md:4: 0009-gone.md (file not found)" in result.output
+    assert "Checked 5 links in 2 ADRs (1 cached): 1 problem(s)" in result.output
+
+
+def test_doctor_command_staged_checks_staged_adrs(mocker: MockerFixture) -> None:
+    """Test that doctor --staged checks the links of staged ADRs only."""
+    # Arrange
+    runner = CliRunner()
+    config = mocker.patch("adraitools.cli.cli.ConfigurationService").return_value
+    config.get_paths.return_value = AdrPaths(
+        Path("docs/adr"), Path("docs/adr/0000-adr-template.md")
+    )
+    mocker.patch("adraitools.cli.cli.ContentCache")
+    mock_doctor_service_class = mocker.patch(
+        "adraitools.services.doctor_service.DoctorService"
+    )
+    mock_doctor_service_class.return_value.diagnose.return_value = DiagnosisResult(
+        success=True, message="Configuration is valid"
+    )
+    git_service = mocker.patch("adraitools.cli.cli.GitService").return_value
+    git_service.staged_blobs.return_value = {Path("docs/adr/0003-c.md"): "c3"}
+    link_checker_class = mocker.patch("adraitools.cli.cli.LinkChecker")
+    link_checker = link_checker_class.return_value
+    link_checker.check.return_value = LinkReport(
+        files=1, cached=0, links=2, problems=[]
+    )
+
+    # Act
+    result = runner.invoke(app, ["doctor", "--staged"])
+
+    # Assert
+    assert result.exit_code == 0
+    link_checker.check.assert_called_once_with([Path("docs/adr/0003-c.md")])
+    file_system_service = link_checker_class.call_args.kwargs["file_system_service"]
+    assert isinstance(file_system_service, GitIndexFileSystem)
+    assert "Checked 2 links in 1 ADRs (0 cached): 0 problem(s)" in result.output
+
+
+def test_timings_option_prints_span_tree(mocker: MockerFixture) -> None:
+    """Test that --timings prints the instrumented spans at exit."""
+    # Arrange
+    runner = CliRunner()
+    recorder = SpanRecorder()
+    mocker.patch("adraitools.infrastructure.span_recorder.RECORDER", recorder)
+    mocker.patch("adraitools.infrastructure.logging_service.RECORDER", recorder)
+    mock_configuration_service = mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mock_configuration_service.return_value.get_configuration.return_value = (
+        mocker.Mock()
+    )
+
+    # Act
+    result = runner.invoke(app, ["--timings", "doctor"])
+
+    # Assert
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert lines[0] == "Configuration is valid"
+    assert lines[1].split() == ["span", "count", "total", "ms"]
+    assert lines[2].split()[:2] == ["doctor.diagnose", "1"]
+
+
+def test_trace_file_option_exports_command_spans(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """Test that --trace-file writes the spans under a command root span."""
+    # Arrange
+    runner = CliRunner()
+    recorder = SpanRecorder()
+    mocker.patch("adraitools.infrastructure.span_recorder.RECORDER", recorder)
+    mocker.patch("adraitools.infrastructure.logging_service.RECORDER", recorder)
+    mock_configuration_service = mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mock_configuration_service.return_value.get_configuration.return_value = (
+        mocker.Mock()
+    )
+    trace_file = tmp_path / "trace.jsonl"
+
+    # Act
+    result = runner.invoke(app, ["--trace-file", str(trace_file), "doctor"])
+
+    # Assert
+    assert result.exit_code == 0
+    (line,) = trace_file.read_text(encoding="utf-8").splitlines()
+    (resource_spans,) = json.loads(line)["resourceSpans"]
+    assert {
+        "key": "adraitools.command",
+        "value": {"stringValue": "doctor"},
+    } in resource_spans["resource"]["attributes"]
+    diagnose, command = resource_spans["scopeSpans"][0]["spans"]
+    assert command["name"] == "command doctor"
+    assert "parentSpanId" not in command
+    assert diagnose["name"] == "doctor.diagnose"
+    assert diagnose["parentSpanId"] == command["spanId"]
+    assert diagnose["traceId"] == command["traceId"] == recorder.trace_id
+
+
+def test_resource_report_option_prints_usage_as_json(mocker: MockerFixture) -> None:
+    """Test that --resource-report json prints the usage of the command."""
+    # Arrange
+    runner = CliRunner()
+    mock_configuration_service = mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mock_configuration_service.return_value.get_configuration.return_value = (
+        mocker.Mock()
+    )
+
+    # Act
+    result = runner.invoke(app, ["--resource-report", "json", "doctor"])
+
+    # Assert
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert lines[0] == "Configuration is valid"
+    usage = ResourceUsage.model_validate_json(lines[1])
+    assert usage.wall_ms > 0
+    assert len(usage.gc_collections) == 3  # noqa: PLR2004
+
+
+def test_doctor_resources_option_reports_the_canned_workload(
+    mocker: MockerFixture,
+) -> None:
+    """Test that doctor --resources prints the usage of the workload."""
+    # Arrange
+    runner = CliRunner()
+    mock_configuration_service = mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mock_configuration_service.return_value.get_configuration.return_value = (
+        mocker.Mock()
+    )
+    mock_workload = mocker.patch(
+        "adraitools.services.resource_workload.ResourceWorkload"
+    )
+    mock_workload.return_value.run.return_value = ResourceUsage(
+        wall_ms=200.0,
+        cpu_user_ms=120.0,
+        cpu_system_ms=30.0,
+        peak_rss_bytes=52_428_800,
+        gc_collections=[11, 1, 0],
+        gc_pause_ms=2.5,
+    )
+
+    # Act
+    result = runner.invoke(app, ["doctor", "--resources"])
+
+    # Assert
+    assert result.exit_code == 0
+    assert "cpu time        150.0 ms (120.0 user, 30.0 system, 75%)" in result.output
+    assert "peak rss        50.0 MiB" in result.output
+    assert "read            n/a (n/a from storage)" in result.output
+    assert "gc collections  11 / 1 / 0 (by generation)" in result.output
+
+
+def test_profile_memory_option_prints_the_stages(mocker: MockerFixture) -> None:
+    """Test that --profile-memory traces the command and reports at exit."""
+    # Arrange
+    runner = CliRunner()
+    mock_configuration_service = mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mock_configuration_service.return_value.get_configuration.return_value = (
+        mocker.Mock()
+    )
+
+    # Act
+    result = runner.invoke(app, ["--profile-memory", "doctor"])
+
+    # Assert
+    assert result.exit_code == 0
+    assert "Traced memory peak:" in result.output
+    stages = [line.split()[0] for line in result.output.splitlines()[3:5]]
+    assert stages == ["start", "exit"]
+    assert not tracemalloc.is_tracing()
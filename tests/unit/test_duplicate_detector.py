@@ -0,0 +1,88 @@
+"""Unit tests for duplicate detector."""
+
+import random
+from pathlib import Path
+from unittest.mock import Mock
+
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.infrastructure.minhash_store import MinHashStore
+from adraitools.services.adr_corpus_loader import AdrCorpusLoader
+from adraitools.services.adr_parser import AdrParser
+from adraitools.services.duplicate_detector import DuplicateDetector
+from adraitools.services.models.configuration import AdrConfiguration
+from tests.conftest import AdrFileFactory
+
+VOCABULARY = [f"term{number}" for number in range(3000)]
+
+
+def _context(seed: int) -> str:
+    """Create a random section body."""
+    return " ".join(random.Random(seed).choices(VOCABULARY, k=300))  # noqa: S311
+
+
+def _detector(adr_dir: Path, index_dir: Path) -> DuplicateDetector:
+    """Create a detector over a corpus directory."""
+    configuration_service = Mock(spec=ConfigurationService)
+    configuration_service.get_configuration.return_value = AdrConfiguration(
+        adr_directory=adr_dir, template_file=adr_dir / "0000-adr-template.md"
+    )
+    return DuplicateDetector(
+        configuration_service,
+        AdrCorpusLoader(FileSystemService(), AdrParser()),
+        MinHashStore(index_dir),
+    )
+
+
+def test_find_duplicates_reports_near_identical_bodies(
+    tmp_path: Path, adr_file_factory: AdrFileFactory
+) -> None:
+    """Test that a re-filed ADR is found despite another title and edits."""
+    # Arrange
+    adr_dir = tmp_path / "adr"
+    for number in range(1, 6):
+        adr_file_factory(
+            adr_dir / f"000{number}-a.md",
+            f"ADR {number}",
+            sections={"Context": _context(number)},
+        )
+    adr_file_factory(
+        adr_dir / "0006-again.md",
+        "Re-filed",
+        status="Proposed",
+        sections={"Context": _context(2) + " with one more sentence"},
+    )
+
+    # Act
+    report = _detector(adr_dir, tmp_path / "index").find_duplicates()
+
+    # Assert
+    assert report.total == 6  # noqa: PLR2004
+    assert [(d.first.name, d.second.name) for d in report.duplicates] == [
+        ("0002-a.md", "0006-again.md")
+    ]
+    assert report.duplicates[0].similarity > 0.9  # noqa: PLR2004
+
+
+def test_find_duplicates_signs_only_new_adrs(
+    tmp_path: Path, adr_file_factory: AdrFileFactory
+) -> None:
+    """Test that persisted signatures are reused and pairs kept."""
+    # Arrange
+    adr_dir = tmp_path / "adr"
+    adr_file_factory(adr_dir / "0001-a.md", "A", sections={"Context": _context(1)})
+    adr_file_factory(adr_dir / "0002-b.md", "B", sections={"Context": _context(1)})
+    adr_file_factory(adr_dir / "0003-c.md", "C", sections={"Context": _context(3)})
+    _detector(adr_dir, tmp_path / "index").find_duplicates()
+    adr_file_factory(adr_dir / "0004-d.md", "D", sections={"Context": _context(3)})
+
+    # Act
+    report = _detector(adr_dir, tmp_path / "index").find_duplicates()
+
+    # Assert
+    assert report.signed == 1
+    assert report.verified == 1
+    assert [(d.first.name, d.second.name) for d in report.duplicates] == [
+        ("0001-a.md", "0002-b.md"),
+        ("0003-c.md", "0004-d.md"),
+    ]
@@ -0,0 +1,172 @@
+"""Unit tests for embedding indexer."""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.content_cache import ContentCache
+from adraitools.infrastructure.embedding_cache import EmbeddingCache
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.infrastructure.hashing_embedder import HashingEmbedder
+from adraitools.infrastructure.logging_service import LoggingService
+from adraitools.infrastructure.process_pool_embedder import ProcessPoolEmbedder
+from adraitools.infrastructure.vector_index_store import VectorIndexStore
+from adraitools.services.adr_chunker import AdrChunker
+from adraitools.services.adr_corpus_loader import AdrCorpusLoader
+from adraitools.services.adr_parser import AdrParser
+from adraitools.services.embedding_indexer import EmbeddingIndexer
+from adraitools.services.models.configuration import AdrConfiguration
+from adraitools.services.models.result import EmbeddingIndexResult
+from tests.conftest import AdrFileFactory
+
+
+@pytest.fixture
+def adr_dir(tmp_path: Path, adr_file_factory: AdrFileFactory) -> Path:
+    """Create a corpus of two ADRs with two content sections each."""
+    adr_dir = tmp_path / "adr"
+    for number, tool in ((1, "uv"), (2, "ruff")):
+        adr_file_factory(
+            adr_dir / f"000{number}-{tool}.md",
+            f"Use {tool}",
+            sections={"Context": f"We need {tool}.", "Decision": f"Use {tool}."},
+        )
+    return adr_dir
+
+
+def _indexer(
+    adr_dir: Path, cache_file: Path, logging_service: LoggingService | None = None
+) -> EmbeddingIndexer:
+    """Create an indexer over a corpus directory."""
+    configuration_service = Mock(spec=ConfigurationService)
+    configuration_service.get_configuration.return_value = AdrConfiguration(
+        adr_directory=adr_dir, template_file=adr_dir / "0000-adr-template.md"
+    )
+    return EmbeddingIndexer(
+        configuration_service=configuration_service,
+        corpus_loader=AdrCorpusLoader(FileSystemService(), AdrParser()),
+        chunker=AdrChunker(),
+        embedder=ProcessPoolEmbedder(HashingEmbedder(dimensions=16), workers=1),
+        embedding_cache=EmbeddingCache(ContentCache(cache_file)),
+        vector_index_store=VectorIndexStore(cache_file.parent / "index"),
+        logging_service=logging_service or Mock(spec=LoggingService),
+    )
+
+
+def test_first_build_embeds_every_chunk(adr_dir: Path, tmp_path: Path) -> None:
+    """Test that a cold cache recomputes all chunks."""
+    # Arrange
+    indexer = _indexer(adr_dir, tmp_path / "cache.sqlite3")
+
+    # Act
+    result = indexer.build()
+
+    # Assert
+    assert result == EmbeddingIndexResult(
+        documents=2, chunks=4, reused_chunks=0, recomputed_chunks=4
+    )
+
+
+def test_duplicated_chunks_on_a_cold_cache_are_not_reused(
+    adr_dir: Path, tmp_path: Path, adr_file_factory: AdrFileFactory
+) -> None:
+    """Test that chunks repeated within one build are not counted as reused."""
+    # Arrange
+    adr_file_factory(
+        adr_dir / "0003-uv.md",
+        "Use uv",
+        sections={"Context": "We need uv.", "Decision": "Use uv."},
+    )
+    indexer = _indexer(adr_dir, tmp_path / "cache.sqlite3")
+
+    # Act
+    result = indexer.build()
+
+    # Assert
+    assert result == EmbeddingIndexResult(
+        documents=3, chunks=6, reused_chunks=0, recomputed_chunks=4
+    )
+
+
+def test_rebuild_after_edit_only_embeds_changed_chunks(
+    adr_dir: Path, tmp_path: Path
+) -> None:
+    """Test that editing one section only recomputes that section's chunk."""
+    # Arrange
+    cache_file = tmp_path / "cache.sqlite3"
+    _indexer(adr_dir, cache_file).build()
+    adr_file = adr_dir / "0001-uv.md"
+    adr_file.write_text(adr_file.read_text().replace("We need uv.", "We want uv."))
+
+    # Act
+    result = _indexer(adr_dir, cache_file).build()
+
+    # Assert
+    assert result.reused_chunks == 3  # noqa: PLR2004
+    assert result.recomputed_chunks == 1
+
+
+def test_embeddings_are_stored_per_chunk_hash(adr_dir: Path, tmp_path: Path) -> None:
+    """Test that the cached vectors can be read back by chunk hash."""
+    # Arrange
+    cache = EmbeddingCache(ContentCache(tmp_path / "cache.sqlite3"))
+    document = AdrParser().parse(
+        adr_dir / "0001-uv.md", (adr_dir / "0001-uv.md").read_text()
+    )
+    chunk = AdrChunker().chunk(document)[0]
+    embedder = HashingEmbedder(dimensions=16)
+
+    # Act
+    _indexer(adr_dir, tmp_path / "cache.sqlite3").build()
+
+    # Assert
+    stored = cache.get_many(embedder.name, [chunk.content_hash])
+    assert stored[chunk.content_hash] == pytest.approx(embedder.embed_one(chunk.text))
+
+
+def test_build_saves_vector_index_in_corpus_order(
+    adr_dir: Path, tmp_path: Path
+) -> None:
+    """Test that the saved index holds one searchable row per chunk."""
+    # Arrange
+    indexer = _indexer(adr_dir, tmp_path / "cache.sqlite3")
+    query = HashingEmbedder(dimensions=16).embed_one("Use ruff\nDecision\nUse ruff.")
+
+    # Act
+    indexer.build()
+
+    # Assert
+    index = VectorIndexStore(tmp_path / "index").load()
+    assert [entry.document_path.name for entry in index.entries] == [
+        "0001-uv.md",
+        "0001-uv.md",
+        "0002-ruff.md",
+        "0002-ruff.md",
+    ]
+    hit = index.search(np.asarray(query, dtype=np.float32), top_k=1)[0]
+    assert (hit.entry.document_path.name, hit.entry.section) == (
+        "0002-ruff.md",
+        "Decision",
+    )
+
+
+def test_build_warns_about_adrs_without_content_by_message_key(
+    adr_dir: Path, tmp_path: Path, adr_file_factory: AdrFileFactory
+) -> None:
+    """Test that empty ADRs are logged under one rate-limitable key."""
+    # Arrange
+    adr_file_factory(adr_dir / "0003-stub.md", "Stub", sections={})
+    logging_service = Mock(spec=LoggingService)
+    indexer = _indexer(adr_dir, tmp_path / "cache.db", logging_service)
+
+    # Act
+    indexer.build()
+
+    # Assert
+    logging_service.log_warning.assert_called_once_with(
+        "ADR has no content to index",
+        fields={"adr": "ADR-0003", "path": adr_dir / "0003-stub.md"},
+        key="index.empty-adr",
+    )
@@ -140,3 +140,46 @@ def test_create_template_file_overwrites_existing_file() -> None:
         content = template_path.read_text()
         assert "old content" not in content
         assert "# Architecture Decision Record (ADR)" in content
+
+
+def test_list_markdown_files_returns_sorted_markdown_files(tmp_path: Path) -> None:
+    """Test that list_markdown_files only returns markdown files, sorted."""
+    # Arrange
+    service = FileSystemService()
+    (tmp_path / "0002-b.md").write_text("b")
+    (tmp_path / "0001-a.md").write_text("a")
+    (tmp_path / "notes.txt").write_text("c")
+
+    # Act
+    result = service.list_markdown_files(tmp_path)
+
+    # Assert
+    assert result == [tmp_path / "0001-a.md", tmp_path / "0002-b.md"]
+
+
+def test_list_markdown_files_returns_empty_list_for_missing_directory() -> None:
+    """Test that a missing directory has no markdown files."""
+    # Arrange
+    service = FileSystemService()
+
+    # Act
+    result = service.list_markdown_files(Path("/nonexistent/directory"))
+
+    # Assert
+    assert result == []
+
+
+def test_snapshot_tree_lists_files_and_directories(tmp_path: Path) -> None:
+    """Test that snapshot_tree walks the tree once, skipping named folders."""
+    # Arrange
+    service = FileSystemService()
+    (tmp_path / "docs" / "adr").mkdir(parents=True)
+    (tmp_path / "docs" / "adr" / "0001-a.md").write_text("a")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "HEAD").write_text("ref")
+
+    # Act
+    result = service.snapshot_tree(tmp_path, skipped=frozenset((".git",)))
+
+    # Assert
+    assert result == {"docs", "docs/adr", "docs/adr/0001-a.md", ".git"}
@@ -0,0 +1,92 @@
+"""Unit tests for git history miner."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import Mock
+
+from pytest_mock import MockerFixture
+
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.content_cache import ContentCache
+from adraitools.infrastructure.git_service import GitService
+from adraitools.services.git_history_miner import GitHistoryMiner
+from adraitools.services.models.configuration import AdrConfiguration
+
+
+def _commit(repository: Path, message: str, author: str) -> None:
+    """Stage everything and commit it."""
+    for arguments in (["add", "-A"], ["commit", "-q", "-m", message]):
+        command = ["git", "-c", f"user.name={author}", "-c", "user.email=t@x.org"]
+        subprocess.run(  # noqa: S603
+            [*command, *arguments],
+            cwd=repository,
+            check=True,
+            capture_output=True,
+        )
+
+
+def _miner(tmp_path: Path, git_service: GitService) -> GitHistoryMiner:
+    """Create a miner over tmp_path/adr."""
+    configuration_service = Mock(spec=ConfigurationService)
+    configuration_service.get_configuration.return_value = AdrConfiguration(
+        adr_directory=tmp_path / "adr",
+        template_file=tmp_path / "adr" / "0000-adr-template.md",
+    )
+    return GitHistoryMiner(
+        configuration_service,
+        git_service,
+        ContentCache(tmp_path / "cache.sqlite3"),
+    )
+
+
+def test_history_counts_revisions_authors_and_follows_renames(
+    tmp_path: Path,
+) -> None:
+    """Test activity mined from one pass over the directory's history."""
+    # Arrange
+    adr_dir = tmp_path / "adr"
+    adr_dir.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)  # noqa: S607
+    (adr_dir / "0001-a.md").write_text("# A\n")
+    (adr_dir / "0002-b.md").write_text("# B\n")
+    _commit(tmp_path, "Add", "Ann")
+    (adr_dir / "0001-a.md").write_text("# A\n\nMore.\n")
+    (adr_dir / "0002-b.md").unlink()
+    _commit(tmp_path, "Edit", "Bob")
+    (adr_dir / "0001-a.md").rename(adr_dir / "0001-first.md")
+    _commit(tmp_path, "Rename", "Bob")
+
+    # Act
+    history = _miner(tmp_path, GitService(tmp_path)).history()
+
+    # Assert
+    assert list(history) == ["0001-first.md"]
+    assert history["0001-first.md"].revisions == 3  # noqa: PLR2004
+    assert history["0001-first.md"].authors == ["Ann", "Bob"]
+
+
+def test_history_replays_only_new_commits(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """Test that runs at the cached HEAD skip git log and later ones resume."""
+    # Arrange
+    adr_dir = tmp_path / "adr"
+    adr_dir.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)  # noqa: S607
+    (adr_dir / "0001-a.md").write_text("# A\n")
+    _commit(tmp_path, "Add", "Ann")
+    git_service = GitService(tmp_path)
+    first_head = git_service.head()
+    _miner(tmp_path, git_service).history()
+    log_changes = mocker.spy(git_service, "log_changes")
+    _miner(tmp_path, git_service).history()
+    (adr_dir / "0001-a.md").write_text("# A\n\nMore.\n")
+    _commit(tmp_path, "Edit", "Cid")
+
+    # Act
+    history = _miner(tmp_path, git_service).history()
+
+    # Assert
+    log_changes.assert_called_once_with(adr_dir, since=first_head)
+    assert history["0001-a.md"].revisions == 2  # noqa: PLR2004
+    assert history["0001-a.md"].authors == ["Ann", "Cid"]
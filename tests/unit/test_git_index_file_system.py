@@ -0,0 +1,36 @@
+"""Unit tests for git index file system."""
+
+import subprocess
+from pathlib import Path
+
+from adraitools.infrastructure.git_index_file_system import GitIndexFileSystem
+from adraitools.infrastructure.git_service import GitService
+
+
+def _git(repository: Path, *arguments: str) -> None:
+    """Run a git command in a repository."""
+    command = ["git", "-c", "user.name=Test", "-c", "user.email=t@x.org"]
+    subprocess.run(  # noqa: S603
+        [*command, *arguments], cwd=repository, check=True, capture_output=True
+    )
+
+
+def test_partially_staged_file_is_read_as_staged(tmp_path: Path) -> None:
+    """Test that staged files read their index blob and others the disk."""
+    # Arrange
+    _git(tmp_path, "init", "-q")
+    staged = tmp_path / "0001-database.md"
+    staged.write_text("# Use PostgreSQL\n")
+    _git(tmp_path, "add", ".")
+    staged.write_text("# Use PostgreSQL\n\nUnstaged edit\n")
+    unstaged = tmp_path / "0002-draft.md"
+    unstaged.write_text("# Draft\n")
+    git_service = GitService(tmp_path)
+    blobs = {tmp_path / path: sha for path, sha in git_service.staged_blobs().items()}
+    file_system = GitIndexFileSystem(git_service, blobs)
+
+    # Act
+    contents = [file_system.read_text(path) for path in (staged, unstaged)]
+
+    # Assert
+    assert contents == ["# Use PostgreSQL\n", "# Draft\n"]
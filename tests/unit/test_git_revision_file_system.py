@@ -0,0 +1,84 @@
+"""Unit tests for git revision file system."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from adraitools.infrastructure.git_revision_file_system import GitRevisionFileSystem
+from adraitools.infrastructure.git_service import GitService
+from adraitools.services.adr_corpus_loader import AdrCorpusLoader
+from adraitools.services.adr_parser import AdrParser
+
+
+def _git(repository: Path, *arguments: str) -> None:
+    """Run a git command in a repository."""
+    command = ["git", "-c", "user.name=Test", "-c", "user.email=t@x.org"]
+    subprocess.run(  # noqa: S603
+        [*command, *arguments], cwd=repository, check=True, capture_output=True
+    )
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> Path:
+    """Create a repository with a release tag followed by more ADR changes."""
+    adr_dir = tmp_path / "docs" / "adr"
+    adr_dir.mkdir(parents=True)
+    _git(tmp_path, "init", "-q")
+    (adr_dir / "0001-database.md").write_text("# Use PostgreSQL\n")
+    (adr_dir / "0002-queue.md").write_text("# Use RabbitMQ\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "Release")
+    _git(tmp_path, "tag", "v1")
+    (adr_dir / "0002-queue.md").write_text("# Use Kafka\n")
+    (adr_dir / "0003-cache.md").write_text("# Use Redis\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "Next")
+    return tmp_path
+
+
+def test_corpus_loader_reads_adrs_as_of_a_tag(repository: Path) -> None:
+    """Test loading the corpus of a tag while the working tree moved on."""
+    # Arrange
+    adr_dir = repository / "docs" / "adr"
+    (adr_dir / "0004-uncommitted.md").write_text("# Draft\n")
+    file_system = GitRevisionFileSystem(GitService(repository), "v1")
+    loader = AdrCorpusLoader(file_system, AdrParser())
+
+    # Act
+    documents = loader.load(adr_dir)
+
+    # Assert
+    assert [document.title for document in documents] == [
+        "Use PostgreSQL",
+        "Use RabbitMQ",
+    ]
+    assert documents[0].path == adr_dir / "0001-database.md"
+    assert file_system.path_exists(adr_dir / "0002-queue.md")
+    assert not file_system.path_exists(adr_dir / "0003-cache.md")
+
+
+def test_fingerprints_are_shared_by_unchanged_files(repository: Path) -> None:
+    """Test that a file unchanged between revisions keeps its fingerprint."""
+    # Arrange
+    adr_dir = repository / "docs" / "adr"
+    git_service = GitService(repository)
+
+    # Act
+    old = GitRevisionFileSystem(git_service, "v1").fingerprint_markdown_files(adr_dir)
+    new = GitRevisionFileSystem(git_service, "HEAD").fingerprint_markdown_files(adr_dir)
+
+    # Assert
+    assert old["0001-database.md"] == new["0001-database.md"]
+    assert old["0002-queue.md"] != new["0002-queue.md"]
+    assert "0003-cache.md" not in old
+
+
+def test_read_bytes_of_file_absent_at_revision_raises(repository: Path) -> None:
+    """Test that files added after the revision cannot be read."""
+    # Arrange
+    file_system = GitRevisionFileSystem(GitService(repository), "v1")
+
+    # Act & Assert
+    with pytest.raises(FileNotFoundError, match=r"0003-cache\.md"):
+        file_system.read_bytes(repository / "docs" / "adr" / "0003-cache.md")
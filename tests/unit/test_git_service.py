@@ -0,0 +1,158 @@
+"""Unit tests for git service."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from adraitools.exceptions import GitCommandError
+from adraitools.infrastructure.git_service import GitChange, GitService
+
+
+def _git(repository: Path, *arguments: str, author: str = "Test") -> None:
+    """Run a git command in a repository."""
+    command = ["git", "-c", f"user.name={author}", "-c", "user.email=t@x.org"]
+    subprocess.run(  # noqa: S603
+        [*command, *arguments],
+        cwd=repository,
+        check=True,
+        capture_output=True,
+    )
+
+
+def test_staged_files_lists_staged_paths_under_pathspec(tmp_path: Path) -> None:
+    """Test that only staged, non-deleted files under the pathspec are listed."""
+    # Arrange
+    adr_dir = tmp_path / "docs" / "adr"
+    adr_dir.mkdir(parents=True)
+    _git(tmp_path, "init", "-q")
+    (adr_dir / "0001-old.md").write_text("# Old\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "Initial")
+    (adr_dir / "0002-new adr.md").write_text("# New\n")
+    (adr_dir / "0003-unstaged.md").write_text("# Unstaged\n")
+    (tmp_path / "README.md").write_text("# Readme\n")
+    _git(tmp_path, "add", "docs/adr/0002-new adr.md", "README.md")
+    _git(tmp_path, "rm", "-q", "docs/adr/0001-old.md")
+
+    # Act
+    staged = GitService(tmp_path).staged_files(Path("docs/adr"))
+
+    # Assert
+    assert staged == [Path("docs/adr/0002-new adr.md")]
+
+
+def test_staged_blobs_name_the_index_content(tmp_path: Path) -> None:
+    """Test that staged blobs are the index version, not the working tree."""
+    # Arrange
+    _git(tmp_path, "init", "-q")
+    adr = tmp_path / "0001-partial.md"
+    adr.write_text("# Staged\n")
+    _git(tmp_path, "add", ".")
+    adr.write_text("# Unstaged edit\n")
+    service = GitService(tmp_path)
+
+    # Act
+    blobs = service.staged_blobs()
+
+    # Assert
+    assert list(blobs) == [Path("0001-partial.md")]
+    assert dict(service.read_blobs(list(blobs.values()))) == {
+        blobs[Path("0001-partial.md")]: b"# Staged\n"
+    }
+
+
+def test_staged_files_outside_repository_raises(tmp_path: Path) -> None:
+    """Test that git failures surface as a domain error."""
+    # Arrange
+    service = GitService(tmp_path)
+
+    # Act & Assert
+    with pytest.raises(GitCommandError, match="git diff failed"):
+        service.staged_files()
+
+
+def test_log_changes_streams_commits_oldest_first(tmp_path: Path) -> None:
+    """Test one log pass listing changes relative to the directory."""
+    # Arrange
+    adr_dir = tmp_path / "docs" / "adr"
+    adr_dir.mkdir(parents=True)
+    _git(tmp_path, "init", "-q")
+    (adr_dir / "0001-a.md").write_text("# A\n")
+    (tmp_path / "README.md").write_text("# Readme\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "Add A", author="Ann")
+    _git(tmp_path, "mv", "docs/adr/0001-a.md", "docs/adr/0001-first.md")
+    _git(tmp_path, "commit", "-q", "-m", "Rename A", author="Bob")
+    service = GitService(tmp_path)
+    first = service.head()
+
+    # Act
+    commits = list(service.log_changes(adr_dir))
+    since_first = list(service.log_changes(adr_dir, since=first))
+
+    # Assert
+    assert [commit.author for commit in commits] == ["Ann", "Bob"]
+    assert commits[0].changes == [GitChange("A", "0001-a.md", None)]
+    assert commits[1].changes == [GitChange("R", "0001-first.md", "0001-a.md")]
+    assert since_first == []
+
+
+def test_head_is_none_before_first_commit(tmp_path: Path) -> None:
+    """Test that an unborn HEAD is reported as no commit."""
+    # Arrange
+    _git(tmp_path, "init", "-q")
+
+    # Act
+    head = GitService(tmp_path).head()
+
+    # Assert
+    assert head is None
+
+
+def test_list_tree_and_read_blobs_read_a_past_revision(tmp_path: Path) -> None:
+    """Test reading files of an older commit without checking it out."""
+    # Arrange
+    adr_dir = tmp_path / "docs" / "adr"
+    (adr_dir / "sub").mkdir(parents=True)
+    _git(tmp_path, "init", "-q")
+    (adr_dir / "0001-a.md").write_text("# A\n")
+    (adr_dir / "sub" / "x.md").write_text("# X\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "Add A")
+    _git(tmp_path, "tag", "v1")
+    (adr_dir / "0001-a.md").write_text("# A changed\n")
+    _git(tmp_path, "commit", "-q", "-am", "Change A")
+    service = GitService(tmp_path)
+
+    # Act
+    commit = service.resolve_commit("v1")
+    tree = service.list_tree(commit, Path("docs/adr"))
+    blobs = dict(service.read_blobs(list(tree.values())))
+
+    # Assert
+    assert commit != service.head()
+    assert list(tree) == ["0001-a.md"]
+    assert blobs == {tree["0001-a.md"]: b"# A\n"}
+
+
+def test_resolve_commit_rejects_unknown_revision(tmp_path: Path) -> None:
+    """Test that a revision naming no commit is a domain error."""
+    # Arrange
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "Initial")
+
+    # Act & Assert
+    with pytest.raises(GitCommandError, match="unknown revision 'v9'"):
+        GitService(tmp_path).resolve_commit("v9")
+
+
+def test_read_blobs_raises_for_missing_object(tmp_path: Path) -> None:
+    """Test that a blob absent from the repository is reported."""
+    # Arrange
+    _git(tmp_path, "init", "-q")
+    missing = "0" * 40
+
+    # Act & Assert
+    with pytest.raises(GitCommandError, match=f"{missing} missing"):
+        list(GitService(tmp_path).read_blobs([missing]))
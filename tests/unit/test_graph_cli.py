@@ -0,0 +1,115 @@
+"""Unit tests for graph CLI commands."""
+
+from pytest_mock import MockerFixture
+from typer.testing import CliRunner
+
+from adraitools.cli.cli import app
+from adraitools.services.models.graph import AdrLinks, GraphFileEntry
+from adraitools.services.supersession_graph import SupersessionGraph
+
+
+def _graph(*links: AdrLinks) -> SupersessionGraph:
+    """Create a graph from ADR links."""
+    graph = SupersessionGraph()
+    for link in links:
+        graph.put(f"{link.identifier}.md", GraphFileEntry(fingerprint="1", links=link))
+    return graph
+
+
+def _links(
+    identifier: str, status: str = "Accepted", supersedes: list[str] | None = None
+) -> AdrLinks:
+    """Create ADR links."""
+    return AdrLinks(
+        identifier=identifier,
+        title=f"Title {identifier[-1]}",
+        status=status,
+        supersedes=supersedes or [],
+        superseded_by=[],
+    )
+
+
+def _mock_service(mocker: MockerFixture, graph: SupersessionGraph) -> None:
+    """Patch the graph service to return a graph."""
+    mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mocker.patch("adraitools.cli.cli.ContentCache")
+    service_class = mocker.patch(
+        "adraitools.services.supersession_graph_service.SupersessionGraphService"
+    )
+    service_class.return_value.load.return_value = graph
+
+
+def test_graph_current_prints_replacement(mocker: MockerFixture) -> None:
+    """Test that graph current follows the chain to the current ADR."""
+    # Arrange
+    _mock_service(
+        mocker,
+        _graph(
+            _links("ADR-0007", "Superseded"),
+            _links("ADR-0020", "Superseded", supersedes=["ADR-0007"]),
+            _links("ADR-0031", supersedes=["ADR-0020"]),
+        ),
+    )
+
+    # Act
+    result = CliRunner().invoke(app, ["graph", "current", "7"])
+
+    # Assert
+    assert result.exit_code == 0
+    assert "ADR-0007 is superseded by:" in result.output
+    assert "ADR-0031 Title 1 (Accepted)" in result.output
+
+
+def test_graph_current_rejects_unknown_adr(mocker: MockerFixture) -> None:
+    """Test that an unknown ADR is reported as an error."""
+    # Arrange
+    _mock_service(mocker, _graph(_links("ADR-0001")))
+
+    # Act
+    result = CliRunner().invoke(app, ["graph", "current", "ADR-0042"])
+
+    # Assert
+    assert result.exit_code == 1
+    assert "Error: ADR-0042 not found" in result.output
+
+
+def test_graph_supersedes_lists_transitive_adrs(mocker: MockerFixture) -> None:
+    """Test that graph supersedes lists the whole replaced chain."""
+    # Arrange
+    _mock_service(
+        mocker,
+        _graph(
+            _links("ADR-0001", "Superseded"),
+            _links("ADR-0002", "Superseded", supersedes=["ADR-0001"]),
+            _links("ADR-0003", supersedes=["ADR-0002"]),
+        ),
+    )
+
+    # Act
+    result = CliRunner().invoke(app, ["graph", "supersedes", "ADR-0003"])
+
+    # Assert
+    assert result.exit_code == 0
+    assert result.output.splitlines() == [
+        "ADR-0001 Title 1 (Superseded)",
+        "ADR-0002 Title 2 (Superseded)",
+    ]
+
+
+def test_graph_cycles_exits_with_error_on_cycle(mocker: MockerFixture) -> None:
+    """Test that graph cycles prints cycles and fails."""
+    # Arrange
+    _mock_service(
+        mocker,
+        _graph(
+            _links("ADR-0001", supersedes=["ADR-0002"]),
+            _links("ADR-0002", supersedes=["ADR-0001"]),
+        ),
+    )
+
+    # Act
+    result = CliRunner().invoke(app, ["graph", "cycles"])
+
+    # Assert
+    assert result.exit_code == 1
+    assert "Cycle: ADR-0001, ADR-0002" in result.output
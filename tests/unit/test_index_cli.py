@@ -0,0 +1,83 @@
+"""Unit tests for index CLI command."""
+
+from pytest_mock import MockerFixture
+from typer.testing import CliRunner
+
+from adraitools.cli.cli import app
+from adraitools.services.models.result import EmbeddingIndexResult
+
+
+def test_index_command_reports_reused_and_recomputed_chunks(
+    mocker: MockerFixture,
+) -> None:
+    """Test that index prints the chunk reuse report."""
+    # Arrange
+    runner = CliRunner()
+    mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mocker.patch("adraitools.cli.cli.ContentCache")
+    mock_indexer_class = mocker.patch(
+        "adraitools.services.embedding_indexer.EmbeddingIndexer"
+    )
+    mock_indexer_class.return_value.build.return_value = EmbeddingIndexResult(
+        documents=3, chunks=12, reused_chunks=11, recomputed_chunks=1
+    )
+
+    # Act
+    result = runner.invoke(
+        app, ["index", "--max-tokens", "100", "--overlap", "10", "--workers", "3"]
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    assert "Indexed 3 ADRs into 12 chunks" in result.output
+    assert "Embeddings reused: 11, recomputed: 1" in result.output
+    chunker = mock_indexer_class.call_args.kwargs["chunker"]
+    assert (chunker.max_tokens, chunker.overlap_tokens) == (100, 10)
+    assert mock_indexer_class.call_args.kwargs["embedder"].workers == 3  # noqa: PLR2004
+
+
+def test_index_command_rejects_invalid_overlap(mocker: MockerFixture) -> None:
+    """Test that an overlap not smaller than the chunk size is an error."""
+    # Arrange
+    runner = CliRunner()
+    mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mocker.patch("adraitools.cli.cli.ContentCache")
+
+    # Act
+    result = runner.invoke(app, ["index", "--max-tokens", "10", "--overlap", "10"])
+
+    # Assert
+    assert result.exit_code == 1
+    assert "overlap_tokens" in result.output
+
+
+def test_index_command_with_revision_uses_revision_index(
+    mocker: MockerFixture,
+) -> None:
+    """Test that --rev reads the revision and saves a separate index."""
+    # Arrange
+    runner = CliRunner()
+    mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mocker.patch("adraitools.cli.cli.ContentCache")
+    mock_git_service = mocker.patch("adraitools.cli.cli.GitService")
+    mock_git_service.return_value.resolve_commit.return_value = "abc123"
+    mock_store_class = mocker.patch(
+        "adraitools.infrastructure.vector_index_store.VectorIndexStore"
+    )
+    mock_indexer_class = mocker.patch(
+        "adraitools.services.embedding_indexer.EmbeddingIndexer"
+    )
+    mock_indexer_class.return_value.build.return_value = EmbeddingIndexResult(
+        documents=1, chunks=2, reused_chunks=2, recomputed_chunks=0
+    )
+
+    # Act
+    result = runner.invoke(app, ["index", "--rev", "v1.0"])
+
+    # Assert
+    assert result.exit_code == 0
+    mock_git_service.return_value.resolve_commit.assert_called_once_with("v1.0")
+    directory = mock_store_class.call_args.args[0]
+    assert directory.parts[-2:] == ("revisions", "abc123")
+    loader = mock_indexer_class.call_args.kwargs["corpus_loader"]
+    assert loader.file_system_service.commit == "abc123"
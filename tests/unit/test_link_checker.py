@@ -0,0 +1,116 @@
+"""Unit tests for link checker."""
+
+from pathlib import Path
+
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.content_cache import ContentCache
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.services.link_checker import LinkChecker, extract_links
+from adraitools.services.models.configuration import AdrConfiguration
+
+
+def test_extract_links_skips_code_and_numbers_duplicate_anchors() -> None:
+    """Test extraction of anchors, links and ADR references."""
+    # Arrange
+    text = (
+        "# ADR-0003: Title\n"
+        "## Notes\n"
+        "See [ADR-1](0001-a.md#context) and `ADR-0009`.\n"
+        "## Notes\n"
+        "```\n[code](missing.md) ADR-0008\n```\n"
+        "<!-- [hidden](hidden.md) -->\n"
+        "[docs]: ../../README.md\n"
+    )
+
+    # Act
+    result = extract_links(text)
+
+    # Assert
+    assert result.anchors == ["adr-0003-title", "notes", "notes-1"]
+    assert [(link.line, link.target) for link in result.links] == [
+        (3, "0001-a.md#context"),
+        (9, "../../README.md"),
+    ]
+    assert [ref.target for ref in result.adr_references] == ["ADR-0003", "ADR-0001"]
+    assert result.heading_number == 3  # noqa: PLR2004
+
+
+def _checker(root: Path, cache: ContentCache) -> LinkChecker:
+    """Create a link checker over root/docs/adr."""
+    configuration_service = ConfigurationService(
+        AdrConfiguration(
+            adr_directory=root / "docs" / "adr",
+            template_file=root / "docs" / "adr" / "0000-adr-template.md",
+        )
+    )
+    return LinkChecker(configuration_service, FileSystemService(), cache, root)
+
+
+def test_check_reports_broken_links_anchors_and_adrs(tmp_path: Path) -> None:
+    """Test that only unresolvable intra-repo targets are reported."""
+    # Arrange
+    adr_dir = tmp_path / "docs" / "adr"
+    adr_dir.mkdir(parents=True)
+    (tmp_path / "README.md").write_text("# Readme\n## Setup\n")
+    (adr_dir / "0000-adr-template.md").write_text("[x](nowhere.md)\n")
+    (adr_dir / "0001-a.md").write_text("# A\n## Context\nSee ADR-0002.\n")
+    (adr_dir / "0002-b.md").write_text(
+        "# B\n"
+        "[ok](0001-a.md#context) [web](https://example.com) [self](#b)\n"
+        "[setup](/README.md#setup) [src](../../src/)\n"
+        "[gone](0009-gone.md) [anchor](0001-a.md#decision) ADR-0042\n"
+    )
+    (tmp_path / "src").mkdir()
+
+    # Act
+    report = _checker(tmp_path, ContentCache(tmp_path / "cache.sqlite3")).check()
+
+    # Assert
+    assert report.files == 2  # noqa: PLR2004
+    assert [(p.path.name, p.line, p.target, p.reason) for p in report.problems] == [
+        ("0002-b.md", 4, "0009-gone.md", "file not found"),
+        ("0002-b.md", 4, "0001-a.md#decision", "anchor #decision not found"),
+        ("0002-b.md", 4, "ADR-0042", "no ADR with this number"),
+    ]
+
+
+def test_check_reuses_links_cached_by_content_hash(tmp_path: Path) -> None:
+    """Test that unchanged files are served from the cache."""
+    # Arrange
+    adr_dir = tmp_path / "docs" / "adr"
+    adr_dir.mkdir(parents=True)
+    (adr_dir / "0001-a.md").write_text("# A\n")
+    (adr_dir / "0002-b.md").write_text("# B\nSee ADR-0001.\n")
+    cache = ContentCache(tmp_path / "cache.sqlite3")
+    _checker(tmp_path, cache).check()
+    (adr_dir / "0002-b.md").write_text("# B\nSee ADR-0007.\n")
+
+    # Act
+    report = _checker(tmp_path, cache).check()
+
+    # Assert
+    assert report.cached == 1
+    assert [problem.target for problem in report.problems] == ["ADR-0007"]
+
+
+def test_check_paths_checks_only_given_adrs(tmp_path: Path) -> None:
+    """Test that a subset is checked against files looked up one by one."""
+    # Arrange
+    adr_dir = tmp_path / "docs" / "adr"
+    adr_dir.mkdir(parents=True)
+    (tmp_path / "README.md").write_text("# Readme\n")
+    (adr_dir / "0001-a.md").write_text("# A\n[gone](missing.md)\n")
+    (adr_dir / "0002-b.md").write_text(
+        "# B\n[ok](/README.md) [a](0001-a.md#a) [gone](0009.md) ADR-0001 ADR-0005\n"
+    )
+    checker = _checker(tmp_path, ContentCache(tmp_path / "cache.sqlite3"))
+
+    # Act
+    report = checker.check([Path("docs/adr/0002-b.md")])
+
+    # Assert
+    assert report.files == 1
+    assert [(p.path.name, p.target) for p in report.problems] == [
+        ("0002-b.md", "0009.md"),
+        ("0002-b.md", "ADR-0005"),
+    ]
@@ -0,0 +1,95 @@
+"""Unit tests for lint CLI command."""
+
+import json
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+from typer.testing import CliRunner
+
+from adraitools.cli.cli import app
+from adraitools.infrastructure.configuration_service import AdrPaths
+from adraitools.infrastructure.git_index_file_system import GitIndexFileSystem
+from adraitools.services.models.lint import LintDiagnostic, LintReport
+
+
+def _mock_linter(mocker: MockerFixture, report: LintReport) -> None:
+    """Patch the linter to return a report."""
+    mocker.patch("adraitools.cli.cli.ConfigurationService")
+    mocker.patch("adraitools.cli.cli.ContentCache")
+    linter_class = mocker.patch("adraitools.cli.cli.AdrLinter")
+    linter_class.return_value.lint.return_value = report
+
+
+def test_lint_prints_diagnostics_and_exits_one(mocker: MockerFixture) -> None:
+    """Test text output and exit code when problems are found."""
+    # Arrange
+    _mock_linter(
+        mocker,
+        LintReport(
+            files=3,
+            linted=2,
+            cached=1,
+            diagnostics=[
+                LintDiagnostic(
+                    path=Path("adr/0002-b.md"),
+                    line=3,
+                    code="ADR004",
+                    message="invalid status 'Maybe'",
+                )
+            ],
+        ),
+    )
+
+    # Act
+    result = CliRunner().invoke(app, ["lint"])
+
+    # Assert
+    assert result.exit_code == 1
+    assert "adr/0002-b.md:3: ADR004 invalid status 'Maybe'" in result.output
+    assert "Linted 2 of 3 ADRs (1 cached): 1 problem(s)" in result.output
+
+
+def test_lint_json_prints_report(mocker: MockerFixture) -> None:
+    """Test machine-readable output of a clean run."""
+    # Arrange
+    _mock_linter(mocker, LintReport(files=1, linted=1, cached=0, diagnostics=[]))
+
+    # Act
+    result = CliRunner().invoke(app, ["lint", "--all", "--json"])
+
+    # Assert
+    assert result.exit_code == 0
+    assert json.loads(result.output)["diagnostics"] == []
+
+
+def test_lint_staged_lints_only_staged_adrs(mocker: MockerFixture) -> None:
+    """Test that --staged lints the staged ADR files without the template."""
+    # Arrange
+    mocker.patch("adraitools.cli.cli.ContentCache")
+    config = mocker.patch("adraitools.cli.cli.ConfigurationService").return_value
+    config.get_paths.return_value = AdrPaths(
+        Path("docs/adr"), Path("docs/adr/0000-adr-template.md")
+    )
+    git_service = mocker.patch("adraitools.cli.cli.GitService").return_value
+    git_service.staged_blobs.return_value = {
+        Path("docs/adr/0000-adr-template.md"): "a1",
+        Path("docs/adr/0004-d.md"): "b2",
+        Path("docs/adr/notes/todo.md"): "c3",
+        Path("docs/adr/image.png"): "d4",
+    }
+    linter_class = mocker.patch("adraitools.cli.cli.AdrLinter")
+    linter = linter_class.return_value
+    linter.lint_files.return_value = LintReport(
+        files=1, linted=1, cached=0, diagnostics=[]
+    )
+
+    # Act
+    result = CliRunner().invoke(app, ["lint", "--staged"])
+
+    # Assert
+    assert result.exit_code == 0
+    git_service.staged_blobs.assert_called_once_with(Path("docs/adr"))
+    linter.lint_files.assert_called_once_with([Path("docs/adr/0004-d.md")])
+    linter.lint.assert_not_called()
+    file_system_service = linter_class.call_args.kwargs["file_system_service"]
+    assert isinstance(file_system_service, GitIndexFileSystem)
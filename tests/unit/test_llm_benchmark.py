@@ -0,0 +1,68 @@
+"""Unit tests for LLM benchmark."""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.infrastructure.mock_llm_provider import MockLlmProvider
+from adraitools.services.adr_corpus_loader import AdrCorpusLoader
+from adraitools.services.adr_parser import AdrParser
+from adraitools.services.ask_service import AskService
+from adraitools.services.llm_benchmark import LlmBenchmark
+from adraitools.services.models.configuration import AdrConfiguration
+from adraitools.services.models.llm import MockLlmSettings
+from tests.conftest import AdrFileFactory
+
+
+def _benchmark(
+    tmp_path: Path, adr_file_factory: AdrFileFactory, settings: MockLlmSettings
+) -> LlmBenchmark:
+    """Create a benchmark over a one-ADR corpus and a mock provider."""
+    adr_dir = tmp_path / "adr"
+    adr_file_factory(adr_dir / "0001-use-uv.md", "Use uv")
+    configuration_service = Mock(spec=ConfigurationService)
+    configuration_service.get_configuration.return_value = AdrConfiguration(
+        adr_directory=adr_dir, template_file=adr_dir / "0000-adr-template.md"
+    )
+    return LlmBenchmark(
+        AskService(
+            configuration_service=configuration_service,
+            corpus_loader=AdrCorpusLoader(FileSystemService(), AdrParser()),
+            llm_provider=MockLlmProvider(settings, sleep=lambda _: None),
+        )
+    )
+
+
+def test_run_ask_reports_completed_requests(
+    tmp_path: Path, adr_file_factory: AdrFileFactory
+) -> None:
+    """Test that every request is answered and measured."""
+    # Arrange
+    benchmark = _benchmark(tmp_path, adr_file_factory, MockLlmSettings())
+
+    # Act
+    result = benchmark.run_ask(["Why uv?"], requests=12, concurrency=4)
+
+    # Assert
+    assert (result.workflow, result.concurrency, result.requests) == ("ask", 4, 12)
+    assert result.errors == 0
+    assert result.throughput_per_second > 0
+    assert result.latency_p95_ms >= result.latency_p50_ms
+
+
+def test_run_ask_counts_provider_errors(
+    tmp_path: Path, adr_file_factory: AdrFileFactory
+) -> None:
+    """Test that failed requests are counted instead of aborting the run."""
+    # Arrange
+    benchmark = _benchmark(
+        tmp_path, adr_file_factory, MockLlmSettings(rate_limit_rate=1.0)
+    )
+
+    # Act
+    result = benchmark.run_ask(["Why uv?"], requests=5, concurrency=2)
+
+    # Assert
+    assert result.errors == 5  # noqa: PLR2004
+    assert result.latency_p50_ms == 0.0
@@ -0,0 +1,22 @@
+"""Unit tests for logging benchmark."""
+
+from pathlib import Path
+
+from adraitools.infrastructure.logging_service import LoggingService
+from adraitools.services.logging_benchmark import LoggingBenchmark
+
+
+def test_run_measures_sync_and_queued_modes(tmp_path: Path) -> None:
+    """Test that both modes log every record to their file."""
+    # Arrange
+    benchmark = LoggingBenchmark(LoggingService())
+
+    # Act
+    sync = benchmark.run(tmp_path / "sync.log", 50)
+    queued = benchmark.run(tmp_path / "queued.log", 50, queue_size=100)
+
+    # Assert
+    assert (sync.mode, queued.mode) == ("sync", "queue-block")
+    assert sync.per_record_us > 0
+    assert queued.dropped == 0
+    assert (tmp_path / "queued.log").read_text().count("Benchmark record") == 50  # noqa: PLR2004
@@ -1,10 +1,16 @@
 """Unit tests for logging service."""
 
+import gzip
+import json
 import logging
 import tempfile
+import time
 from pathlib import Path
 
+import pytest
+
 from adraitools.infrastructure.logging_service import LoggingService
+from adraitools.services.models.log_file import LogFileSettings
 
 
 def test_configure_logging_sets_default_level() -> None:
@@ -108,3 +114,278 @@ def test_log_critical_calls_logger_critical() -> None:
 
     # Act & Assert - Should not raise an exception
     service.log_critical("Test critical message")
+
+
+def test_queued_file_logging_writes_every_record_by_shutdown(tmp_path: Path) -> None:
+    """Test that the blocking policy loses no record of a tiny queue."""
+    # Arrange
+    service = LoggingService()
+    log_file = tmp_path / "queued.log"
+    service.configure_logging(log_file=log_file, quiet=True, queue_size=2)
+
+    # Act
+    for number in range(200):
+        service.log_debug(f"Record {number}")
+    service.shutdown()
+
+    # Assert
+    lines = log_file.read_text().splitlines()
+    assert len(lines) == 200  # noqa: PLR2004
+    assert lines[-1].endswith("Record 199")
+    assert service.dropped == 0
+
+
+def test_queued_file_logging_counts_dropped_records(tmp_path: Path) -> None:
+    """Test that every record is either written or reported as dropped."""
+    # Arrange
+    service = LoggingService()
+    log_file = tmp_path / "queued.log"
+    service.configure_logging(
+        log_file=log_file, quiet=True, queue_size=1, overflow="drop"
+    )
+
+    # Act
+    for number in range(500):
+        service.log_debug(f"Record {number}")
+    service.shutdown()
+    service.log_info("After shutdown")
+
+    # Assert
+    lines = log_file.read_text().splitlines()
+    written = [line for line in lines if "Record" in line]
+    assert len(written) + service.dropped == 500  # noqa: PLR2004
+    assert any(f"Dropped {service.dropped} log records" in line for line in lines) == (
+        service.dropped > 0
+    )
+    assert lines[-1].endswith("After shutdown")
+
+
+def test_json_format_writes_context_and_fields(tmp_path: Path) -> None:
+    """Test that JSON records carry the service context and record fields."""
+    # Arrange
+    service = LoggingService()
+    log_file = tmp_path / "structured.log"
+    service.configure_logging(log_file=log_file, quiet=True, log_format="json")
+    service.set_context("command", "lint")
+
+    # Act
+    service.log_info("Linted ADR", fields={"adr": "ADR-0007", "problems": 2})
+
+    # Assert
+    entry = json.loads(log_file.read_text().splitlines()[-1])
+    assert entry["message"] == "Linted ADR"
+    assert entry["level"] == "INFO"
+    assert (entry["command"], entry["adr"], entry["problems"]) == (
+        "lint",
+        "ADR-0007",
+        2,
+    )
+    assert entry["elapsed_ms"] >= 0
+
+
+def test_lazy_fields_are_only_evaluated_for_written_records(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that callable fields of filtered-out records are never called."""
+    # Arrange
+    service = LoggingService()
+    service.configure_logging(level="INFO")
+    calls: list[str] = []
+
+    def expensive() -> str:
+        calls.append("called")
+        return "value"
+
+    # Act
+    service.log_debug("Hidden", fields={"detail": expensive})
+    service.log_info("Shown", fields={"detail": expensive, "count": 3})
+
+    # Assert
+    assert calls == ["called"]
+    assert "INFO: Shown detail=value count=3" in capsys.readouterr().err
+
+
+def test_lazy_fields_are_resolved_when_logged_not_when_written(
+    tmp_path: Path,
+) -> None:
+    """Test that buffered records keep the field values of the logging moment."""
+    # Arrange
+    service = LoggingService()
+    log_file = tmp_path / "buffered.log"
+    service.configure_logging(
+        log_file=log_file,
+        quiet=True,
+        file_settings=LogFileSettings(buffer_records=10, flush_interval_seconds=60),
+    )
+    state = {"phase": "logged"}
+
+    # Act
+    service.log_info("Finished", fields={"phase": lambda: state["phase"]})
+    state["phase"] = "written"
+    service.configure_logging()
+
+    # Assert
+    assert log_file.read_text().splitlines()[-1].endswith("Finished phase=logged")
+
+
+def test_rotating_file_logging_compresses_backups(tmp_path: Path) -> None:
+    """Test that the log file rotates by size into a bounded set of gzip files."""
+    # Arrange
+    service = LoggingService()
+    log_file = tmp_path / "daemon.log"
+    service.configure_logging(
+        log_file=log_file,
+        quiet=True,
+        file_settings=LogFileSettings(max_bytes=500, backup_count=2, compress=True),
+    )
+
+    # Act
+    for number in range(100):
+        service.log_info(f"Record {number}")
+    service.configure_logging()
+
+    # Assert
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "daemon.log",
+        "daemon.log.1.gz",
+        "daemon.log.2.gz",
+    ]
+    assert log_file.stat().st_size <= 500  # noqa: PLR2004
+    backup = gzip.decompress((tmp_path / "daemon.log.1.gz").read_bytes()).decode()
+    current = log_file.read_text().splitlines()
+    last_backed_up = int(backup.splitlines()[-1].rsplit(" ", 1)[1])
+    assert current[0].endswith(f"Record {last_backed_up + 1}")
+    assert current[-1].endswith("Record 99")
+
+
+def test_buffered_file_logging_flushes_on_size_and_error(tmp_path: Path) -> None:
+    """Test that buffered records are written when full or an error arrives."""
+    # Arrange
+    service = LoggingService()
+    log_file = tmp_path / "batch.log"
+    service.configure_logging(
+        log_file=log_file,
+        quiet=True,
+        file_settings=LogFileSettings(buffer_records=3, flush_interval_seconds=60),
+    )
+
+    # Act
+    service.log_info("First")
+    service.log_info("Second")
+    held = log_file.read_text()
+    service.log_info("Third")
+    full = log_file.read_text().splitlines()
+    service.log_error("Failed")
+    failed = log_file.read_text().splitlines()
+
+    # Assert
+    assert held == ""
+    assert [line.rsplit(": ", 1)[1] for line in full] == ["First", "Second", "Third"]
+    assert failed[-1].endswith("Failed")
+
+
+def test_buffered_file_logging_flushes_on_interval(tmp_path: Path) -> None:
+    """Test that a quiet process still gets its buffered records written."""
+    # Arrange
+    service = LoggingService()
+    log_file = tmp_path / "batch.log"
+    service.configure_logging(
+        log_file=log_file,
+        quiet=True,
+        file_settings=LogFileSettings(
+            buffer_records=1_000, flush_interval_seconds=0.01
+        ),
+    )
+
+    # Act
+    service.log_info("Idle")
+    deadline = time.monotonic() + 5
+    while not log_file.read_text() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # Assert
+    assert log_file.read_text().rstrip().endswith("Idle")
+
+
+def test_rate_limit_suppresses_records_per_key_and_summarizes(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that each key is limited separately and suppressions are counted."""
+    # Arrange
+    service = LoggingService()
+    service.configure_logging()
+    service.configure_limits(rate_limit=2)
+
+    # Act
+    for number in range(50):
+        service.log_warning(
+            "ADR has no title", fields={"adr": number}, key="parse.no-title"
+        )
+    service.log_warning("ADR has no date", fields={"adr": 7}, key="parse.no-date")
+    service.log_warning("Unkeyed warning")
+    service.log_warning("Unkeyed warning")
+    service.log_warning("Unkeyed warning")
+    suppressed = service.suppressed
+    service.report_suppressed()
+
+    # Assert
+    lines = capsys.readouterr().err.splitlines()
+    assert suppressed == 48  # noqa: PLR2004
+    assert lines == [
+        "WARNING: ADR has no title adr=0",
+        "WARNING: ADR has no title adr=1",
+        "WARNING: ADR has no date adr=7",
+        "WARNING: Unkeyed warning",
+        "WARNING: Unkeyed warning",
+        "WARNING: Unkeyed warning",
+        "WARNING: Suppressed 48 similar warnings key=parse.no-title",
+    ]
+    assert service.suppressed == 0
+
+
+def test_rate_limit_window_starts_again_after_its_period(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that a key is written again once its window has passed."""
+    # Arrange
+    now = [100.0]
+    monkeypatch.setattr(
+        "adraitools.infrastructure.logging_service.time.monotonic", lambda: now[0]
+    )
+    service = LoggingService()
+    service.configure_logging()
+    service.configure_limits(rate_limit=1, period_seconds=10)
+
+    # Act
+    service.log_error("Timeout", key="llm.timeout")
+    service.log_error("Timeout", key="llm.timeout")
+    now[0] += 10
+    service.log_error("Timeout", key="llm.timeout")
+
+    # Assert
+    assert capsys.readouterr().err.count("ERROR: Timeout") == 2  # noqa: PLR2004
+    assert service.suppressed == 1
+
+
+def test_debug_sampling_writes_a_share_of_debug_records(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that only DEBUG records are sampled and the rest are counted."""
+    # Arrange
+    service = LoggingService()
+    service.configure_logging(level="DEBUG")
+    capsys.readouterr()
+    service.configure_limits(debug_sample_rate=0.1, seed=7)
+
+    # Act
+    for number in range(1_000):
+        service.log_debug(f"Chunked ADR {number}")
+    service.log_info("Indexed")
+    service.report_suppressed()
+
+    # Assert
+    lines = capsys.readouterr().err.splitlines()
+    written = [line for line in lines if "Chunked ADR" in line]
+    assert 50 < len(written) < 150  # noqa: PLR2004
+    assert "INFO: Indexed" in lines
+    assert lines[-1] == f"DEBUG: Sampled out {1_000 - len(written):,} debug records"
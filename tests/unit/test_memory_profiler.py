@@ -0,0 +1,44 @@
+"""Unit tests for memory profiler."""
+
+import tracemalloc
+
+from adraitools.infrastructure.hashing_embedder import HashingEmbedder
+from adraitools.infrastructure.memory_profiler import MemoryProfiler
+
+
+def test_checkpoint_does_nothing_while_stopped() -> None:
+    """Test that a stopped profiler neither traces nor snapshots."""
+    # Arrange
+    profiler = MemoryProfiler()
+
+    # Act
+    profiler.checkpoint("load")
+
+    # Assert
+    assert not tracemalloc.is_tracing()
+    assert not profiler.enabled
+
+
+def test_stop_attributes_stage_growth_to_adraitools_modules() -> None:
+    """Test that memory allocated in a stage is diffed and grouped by module."""
+    # Arrange
+    profiler = MemoryProfiler()
+    embedder = HashingEmbedder(dimensions=100_000)
+
+    # Act
+    profiler.start()
+    vector = embedder.embed_one("use uv")
+    profiler.checkpoint("embed")
+    del vector
+    profile = profiler.stop()
+
+    # Assert
+    assert not tracemalloc.is_tracing()
+    assert [stage.stage for stage in profile.stages] == ["start", "embed", "exit"]
+    growth = profile.stages[1].growth[0]
+    assert growth.module == "adraitools.infrastructure.hashing_embedder"
+    assert growth.size_bytes >= 800_000  # noqa: PLR2004
+    assert profile.stages[2].change_bytes < 0
+    assert profile.fullest_stage == "embed"
+    assert profile.top_modules[0].module == growth.module
+    assert profile.peak_bytes >= growth.size_bytes
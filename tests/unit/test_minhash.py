@@ -0,0 +1,83 @@
+"""Unit tests for MinHash signatures and LSH."""
+
+import random
+
+import numpy as np
+
+from adraitools.services import minhash
+
+
+def _texts() -> tuple[str, str, str]:
+    """Create a text, a lightly edited copy and an unrelated text."""
+    generator = random.Random(7)  # noqa: S311
+    vocabulary = [f"word{number}" for number in range(2000)]
+    words = generator.choices(vocabulary, k=400)
+    edited = list(words)
+    edited[100] = "changed"
+    return (
+        " ".join(words),
+        " ".join(edited),
+        " ".join(generator.choices(vocabulary, k=400)),
+    )
+
+
+def test_shingle_sets_are_stable_and_case_insensitive() -> None:
+    """Test that shingle hashes do not depend on case or batching."""
+    # Arrange
+    text, _, other = _texts()
+
+    # Act
+    alone = minhash.shingles(text)
+    batched = minhash.shingle_sets([other, text.upper(), ""])
+
+    # Assert
+    assert np.array_equal(alone, batched[1])
+    assert len(batched[2]) == 0
+
+
+def test_signatures_estimate_jaccard_similarity() -> None:
+    """Test that equal signature values track the exact similarity."""
+    # Arrange
+    shingle_sets = minhash.shingle_sets(list(_texts()))
+
+    # Act
+    signatures = minhash.signatures(shingle_sets)
+
+    # Assert
+    similar = float((signatures[0] == signatures[1]).mean())
+    unrelated = float((signatures[0] == signatures[2]).mean())
+    expected = minhash.jaccard(shingle_sets[0], shingle_sets[1])
+    assert abs(similar - expected) < 0.15  # noqa: PLR2004
+    assert unrelated < 0.1  # noqa: PLR2004
+
+
+def test_lsh_index_pairs_only_similar_signatures() -> None:
+    """Test candidate pairs and lookups of the band tables."""
+    # Arrange
+    signatures = minhash.signatures(
+        minhash.shingle_sets([*_texts(), "", "unrelated words of a short text"])
+    )
+
+    # Act
+    index = minhash.LshIndex(signatures)
+
+    # Assert
+    assert index.candidate_pairs() == {(0, 1)}
+    assert index.query(signatures[1]) == {0, 1}
+    assert index.query(signatures[3]) == set()
+
+
+def test_power_tables_grow_with_the_longest_window() -> None:
+    """Test that short texts keep the power tables small."""
+    # Arrange
+    minhash._power_table_cache.clear()  # noqa: SLF001
+
+    # Act
+    minhash.shingles("Too short")
+    small = len(minhash._power_table_cache[0][0])  # noqa: SLF001
+    minhash.shingles("word " * 2000)
+    grown = len(minhash._power_table_cache[0][0])  # noqa: SLF001
+
+    # Assert
+    assert small == minhash._MIN_TABLE_LENGTH  # noqa: SLF001
+    assert grown == 1 << 14
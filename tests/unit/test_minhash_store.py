@@ -0,0 +1,29 @@
+"""Unit tests for MinHash store."""
+
+from pathlib import Path
+
+import numpy as np
+
+from adraitools.infrastructure.minhash_store import MinHashStore
+from adraitools.services.models.index import MinHashState, SignatureEntry, SimilarPair
+
+
+def test_saved_signatures_round_trip(tmp_path: Path) -> None:
+    """Test that the state and signature matrix are read back."""
+    # Arrange
+    store = MinHashStore(tmp_path / "index")
+    state = MinHashState(
+        entries=[SignatureEntry(name="0001.md", fingerprint="1-2")],
+        pairs=[SimilarPair(first="0001.md", second="0002.md", similarity=0.9)],
+    )
+    signatures = np.arange(128, dtype=np.uint32).reshape(1, 128)
+
+    # Act
+    exists_before = store.exists()
+    store.save(state, signatures)
+    loaded_state, loaded_signatures = store.load()
+
+    # Assert
+    assert not exists_before
+    assert loaded_state == state
+    assert np.array_equal(loaded_signatures, signatures)
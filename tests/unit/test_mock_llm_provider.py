@@ -0,0 +1,128 @@
+"""Unit tests for mock LLM provider."""
+
+import pytest
+
+from adraitools.exceptions import LlmProviderError
+from adraitools.infrastructure.coalescing_llm_provider import CoalescingLlmProvider
+from adraitools.infrastructure.llm_provider_factory import LlmProviderFactory
+from adraitools.infrastructure.mock_llm_provider import MockLlmProvider
+from adraitools.infrastructure.resilient_llm_provider import ResilientLlmProvider
+from adraitools.services.models.configuration import AdrConfiguration
+from adraitools.services.models.llm import LlmRequest, MockLlmSettings
+
+
+class RecordingSleep:
+    """Sleep replacement recording the requested delays."""
+
+    def __init__(self) -> None:
+        """Initialize the recorder."""
+        self.delays: list[float] = []
+
+    def __call__(self, seconds: float) -> None:
+        """Record a delay instead of waiting."""
+        self.delays.append(seconds)
+
+
+def test_same_seed_produces_same_answers() -> None:
+    """Test that two providers with equal settings answer identically."""
+    # Arrange
+    settings = MockLlmSettings(seed=7, latency_distribution="exponential")
+    first = MockLlmProvider(settings, sleep=RecordingSleep())
+    second = MockLlmProvider(settings, sleep=RecordingSleep())
+    request = LlmRequest(prompt="Why uv?")
+
+    # Act
+    answers = [first.complete(request).text for _ in range(3)]
+    replayed = [second.complete(request).text for _ in range(3)]
+
+    # Assert
+    assert answers == replayed
+    assert len(set(answers)) == len(answers)
+
+
+def test_stream_paces_tokens_at_configured_rate() -> None:
+    """Test that streaming waits the latency, then one interval per token."""
+    # Arrange
+    sleep = RecordingSleep()
+    settings = MockLlmSettings(latency_ms=20, tokens_per_second=50)
+    provider = MockLlmProvider(settings, sleep=sleep)
+
+    # Act
+    chunks = list(provider.stream(LlmRequest(prompt="Why uv?", max_tokens=5)))
+
+    # Assert
+    assert len(chunks) == 5  # noqa: PLR2004
+    assert sleep.delays == pytest.approx([0.02, 0.02, 0.02, 0.02, 0.02])
+
+
+@pytest.mark.parametrize(
+    ("settings", "status_code"),
+    [
+        (MockLlmSettings(rate_limit_rate=1.0), 429),
+        (MockLlmSettings(server_error_rate=1.0), 500),
+        (MockLlmSettings(timeout_rate=1.0, timeout_ms=250), None),
+    ],
+)
+def test_injected_errors_raise_provider_errors(
+    settings: MockLlmSettings, status_code: int | None
+) -> None:
+    """Test that every injected failure surfaces as an LlmProviderError."""
+    # Arrange
+    sleep = RecordingSleep()
+    provider = MockLlmProvider(settings, sleep=sleep)
+
+    # Act / Assert
+    with pytest.raises(LlmProviderError) as exc_info:
+        provider.complete(LlmRequest(prompt="Why uv?"))
+    assert exc_info.value.status_code == status_code
+    assert sleep.delays == ([0.25] if status_code is None else [])
+
+
+def test_error_rate_fails_a_share_of_requests() -> None:
+    """Test that a partial error rate fails roughly that share of requests."""
+    # Arrange
+    provider = MockLlmProvider(
+        MockLlmSettings(server_error_rate=0.5), sleep=RecordingSleep()
+    )
+    failures = 0
+
+    # Act
+    for number in range(200):
+        try:
+            provider.complete(LlmRequest(prompt=f"Question {number}"))
+        except LlmProviderError:
+            failures += 1
+
+    # Assert
+    assert 70 < failures < 130  # noqa: PLR2004
+
+
+def test_factory_creates_mock_provider_from_configuration() -> None:
+    """Test that llm_provider = mock selects the wrapped mock provider."""
+    # Arrange
+    configuration = AdrConfiguration(llm_provider="mock", mock_llm_seed=3)
+
+    # Act
+    provider = LlmProviderFactory.create(configuration)
+
+    # Assert
+    assert isinstance(provider, CoalescingLlmProvider)
+    resilient = provider.provider
+    assert isinstance(resilient, ResilientLlmProvider)
+    assert isinstance(resilient.provider, MockLlmProvider)
+    assert resilient.provider.settings.seed == 3  # noqa: PLR2004
+
+
+def test_configuration_passes_every_mock_setting() -> None:
+    """Test that each mock knob can be set through the configuration."""
+    # Arrange
+    configuration = AdrConfiguration(
+        mock_llm_response_tokens=12, mock_llm_timeout_ms=250.0
+    )
+
+    # Act
+    settings = configuration.mock_llm_settings()
+
+    # Assert
+    assert settings.response_tokens == 12  # noqa: PLR2004
+    assert settings.timeout_ms == 250.0  # noqa: PLR2004
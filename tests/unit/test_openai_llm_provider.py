@@ -0,0 +1,81 @@
+"""Unit tests for OpenAI-compatible LLM provider."""
+
+import io
+import json
+import urllib.error
+from email.message import Message
+
+import pytest
+from pytest_mock import MockerFixture
+
+from adraitools.exceptions import LlmProviderError
+from adraitools.infrastructure.openai_llm_provider import OpenAiCompatibleLlmProvider
+from adraitools.services.models.llm import LlmRequest, LlmResponse
+
+URLOPEN = "adraitools.infrastructure.openai_llm_provider.urllib.request.urlopen"
+
+
+def test_complete_posts_chat_completion(mocker: MockerFixture) -> None:
+    """Test that complete sends the request and parses the message."""
+    # Arrange
+    body = {"model": "gpt-test", "choices": [{"message": {"content": "Use uv."}}]}
+    urlopen = mocker.patch(URLOPEN, return_value=io.BytesIO(json.dumps(body).encode()))
+    provider = OpenAiCompatibleLlmProvider(
+        "https://llm.example/v1/", model="gpt-test", api_key="secret"
+    )
+
+    # Act
+    response = provider.complete(LlmRequest(prompt="Why uv?", system_prompt="Be brief"))
+
+    # Assert
+    assert response == LlmResponse(text="Use uv.", model="gpt-test")
+    http_request = urlopen.call_args.args[0]
+    assert http_request.full_url == "https://llm.example/v1/chat/completions"
+    assert http_request.get_header("Authorization") == "Bearer secret"
+    payload = json.loads(http_request.data)
+    assert payload["messages"] == [
+        {"role": "system", "content": "Be brief"},
+        {"role": "user", "content": "Why uv?"},
+    ]
+    assert payload["stream"] is False
+
+
+def test_stream_yields_server_sent_deltas(mocker: MockerFixture) -> None:
+    """Test that stream parses server-sent events until DONE."""
+    # Arrange
+    events = [
+        {"choices": [{"delta": {"role": "assistant"}}]},
+        {"choices": [{"delta": {"content": "Use "}}]},
+        {"choices": [{"delta": {"content": "uv."}}]},
+    ]
+    lines = [f"data: {json.dumps(event)}\n\n" for event in events]
+    stream_body = ("".join(lines) + "data: [DONE]\n\n").encode()
+    mocker.patch(URLOPEN, return_value=io.BytesIO(stream_body))
+    provider = OpenAiCompatibleLlmProvider("http://localhost:8080/v1", "local")
+
+    # Act
+    chunks = list(provider.stream(LlmRequest(prompt="Why uv?")))
+
+    # Assert
+    assert chunks == ["Use ", "uv."]
+
+
+def test_http_error_raises_provider_error(mocker: MockerFixture) -> None:
+    """Test that HTTP errors are reported with their status code."""
+    # Arrange
+    error = urllib.error.HTTPError(
+        "https://llm.example/v1", 429, "Too Many Requests", Message(), None
+    )
+    mocker.patch(URLOPEN, side_effect=error)
+    provider = OpenAiCompatibleLlmProvider("https://llm.example/v1", "gpt-test")
+
+    # Act & Assert
+    with pytest.raises(LlmProviderError, match="status 429") as exc_info:
+        provider.complete(LlmRequest(prompt="Why uv?"))
+    assert exc_info.value.status_code == 429  # noqa: PLR2004
+
+
+def test_rejects_non_http_base_url() -> None:
+    """Test that only http(s) base URLs are accepted."""
+    with pytest.raises(ValueError, match="http"):
+        OpenAiCompatibleLlmProvider("file:///etc/passwd", "gpt-test")
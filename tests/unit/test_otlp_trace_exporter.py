@@ -0,0 +1,77 @@
+"""Unit tests for OTLP/JSON trace file exporter."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+from adraitools.infrastructure.otlp_trace_exporter import OtlpJsonFileExporter
+from adraitools.infrastructure.span_recorder import FinishedSpan
+
+TRACE_ID = "0af7651916cd43dd8448eb211c80319c"
+
+
+def _span(name: str, span_id: int, parent_id: int | None = None) -> FinishedSpan:
+    return FinishedSpan(
+        name=name,
+        span_id=span_id,
+        parent_id=parent_id,
+        start_unix_ns=1_700_000_000_000_000_000,
+        end_unix_ns=1_700_000_000_000_500_000,
+        attributes={"adr.files": 2, "file.path": "adr.toml"},
+        error=None,
+    )
+
+
+def test_encode_builds_otlp_json_trace_request(tmp_path: Path) -> None:
+    """Test that spans are encoded with hex IDs and string timestamps."""
+    # Arrange
+    exporter = OtlpJsonFileExporter(
+        tmp_path / "trace.jsonl", TRACE_ID, resource={"service.name": "adr-ai-tools"}
+    )
+    failed = _span("index.save", 2, parent_id=1)._replace(error="OSError('disk')")
+
+    # Act
+    request: Any = exporter.encode([_span("command index", 1), failed])
+
+    # Assert
+    (resource_spans,) = request["resourceSpans"]
+    assert resource_spans["resource"]["attributes"] == [
+        {"key": "service.name", "value": {"stringValue": "adr-ai-tools"}}
+    ]
+    root, child = resource_spans["scopeSpans"][0]["spans"]
+    assert root == {
+        "traceId": TRACE_ID,
+        "spanId": "0000000000000001",
+        "name": "command index",
+        "kind": 1,
+        "startTimeUnixNano": "1700000000000000000",
+        "endTimeUnixNano": "1700000000000500000",
+        "attributes": [
+            {"key": "adr.files", "value": {"intValue": "2"}},
+            {"key": "file.path", "value": {"stringValue": "adr.toml"}},
+        ],
+    }
+    assert child["parentSpanId"] == "0000000000000001"
+    assert child["status"] == {"code": 2, "message": "OSError('disk')"}
+
+
+def test_export_writes_one_line_per_full_batch(tmp_path: Path) -> None:
+    """Test that spans are buffered and written a batch per line."""
+    # Arrange
+    trace_file = tmp_path / "traces" / "trace.jsonl"
+    exporter = OtlpJsonFileExporter(trace_file, TRACE_ID, resource={}, batch_size=2)
+
+    # Act
+    for span_id in range(1, 4):
+        exporter.export(_span("corpus.load", span_id))
+    written_before_flush = trace_file.read_text(encoding="utf-8").splitlines()
+    exporter.flush()
+    exporter.flush()
+
+    # Assert
+    lines = trace_file.read_text(encoding="utf-8").splitlines()
+    assert len(written_before_flush) == 1
+    assert [
+        len(json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"])
+        for line in lines
+    ] == [2, 1]
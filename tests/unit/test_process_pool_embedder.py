@@ -0,0 +1,76 @@
+"""Unit tests for process pool embedder."""
+
+import subprocess
+import sys
+
+import numpy as np
+from pytest_mock import MockerFixture
+
+from adraitools.infrastructure.hashing_embedder import HashingEmbedder
+from adraitools.infrastructure.process_pool_embedder import ProcessPoolEmbedder
+
+
+def test_pool_matrix_matches_in_process_embedding() -> None:
+    """Test that workers fill every row of the shared matrix in order."""
+    # Arrange
+    embedder = HashingEmbedder(dimensions=32)
+    texts = [f"decision number {index}" for index in range(25)]
+    pool_embedder = ProcessPoolEmbedder(embedder, workers=2, batch_size=4)
+
+    # Act
+    matrix = pool_embedder.embed_matrix(texts)
+
+    # Assert
+    assert matrix.shape == (len(texts), 32)
+    assert matrix.dtype == np.float32
+    np.testing.assert_allclose(matrix, embedder.embed(texts), rtol=1e-6)
+
+
+def test_single_batch_is_embedded_without_workers(mocker: MockerFixture) -> None:
+    """Test that inputs fitting one batch do not start a process pool."""
+    # Arrange
+    pool_class = mocker.patch(
+        "adraitools.infrastructure.process_pool_embedder.ProcessPoolExecutor"
+    )
+    pool_embedder = ProcessPoolEmbedder(HashingEmbedder(dimensions=8), workers=4)
+
+    # Act
+    vectors = pool_embedder.embed(["use uv", "use ruff"])
+
+    # Assert
+    assert len(vectors) == len(["use uv", "use ruff"])
+    pool_class.assert_not_called()
+
+
+def test_empty_input_returns_empty_matrix() -> None:
+    """Test that embedding nothing yields a zero-row matrix."""
+    # Arrange
+    pool_embedder = ProcessPoolEmbedder(HashingEmbedder(dimensions=8), workers=2)
+
+    # Act
+    matrix = pool_embedder.embed_matrix([])
+
+    # Assert
+    assert matrix.shape == (0, 8)
+
+
+def test_pool_leaves_no_resource_tracker_errors() -> None:
+    """Test that unlinking the shared matrix does not upset the tracker."""
+    # Arrange
+    script = (
+        "from adraitools.infrastructure.hashing_embedder import HashingEmbedder\n"
+        "from adraitools.infrastructure.process_pool_embedder import "
+        "ProcessPoolEmbedder\n"
+        "texts = [f'decision {index}' for index in range(40)]\n"
+        "ProcessPoolEmbedder(HashingEmbedder(), workers=4, batch_size=4)"
+        ".embed_matrix(texts)\n"
+    )
+
+    # Act
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script], capture_output=True, text=True, check=False
+    )
+
+    # Assert
+    assert completed.returncode == 0
+    assert completed.stderr == ""
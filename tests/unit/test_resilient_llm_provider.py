@@ -0,0 +1,179 @@
+"""Unit tests for resilient LLM provider."""
+
+import threading
+import time
+from collections.abc import Iterator
+from unittest.mock import Mock
+
+import pytest
+
+from adraitools.exceptions import (
+    CircuitOpenError,
+    LlmDeadlineExceededError,
+    LlmProviderError,
+)
+from adraitools.infrastructure.circuit_breaker import CircuitBreaker
+from adraitools.infrastructure.logging_service import LoggingService
+from adraitools.infrastructure.resilient_llm_provider import ResilientLlmProvider
+from adraitools.services.models.llm import LlmRequest, LlmResponse
+
+
+class ScriptedProvider:
+    """Provider whose calls follow a script of delays and errors."""
+
+    def __init__(self, delays: list[float], error: Exception | None = None) -> None:
+        """Initialize the provider with per-call delays."""
+        self.delays = delays
+        self.error = error
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def complete(self, request: LlmRequest) -> LlmResponse:  # noqa: ARG002
+        """Answer after the scripted delay of this call."""
+        with self._lock:
+            number = self.calls
+            self.calls += 1
+        time.sleep(self.delays[min(number, len(self.delays) - 1)])
+        if self.error is not None:
+            raise self.error
+        return LlmResponse(text=f"answer {number}")
+
+    def stream(self, request: LlmRequest) -> Iterator[str]:
+        """Stream the completed answer in two chunks."""
+        text = self.complete(request).text
+        yield from [f"{text} ", "done"]
+
+
+def _provider(
+    upstream: ScriptedProvider, failure_threshold: int = 5
+) -> ResilientLlmProvider:
+    """Wrap a scripted provider with a fresh breaker."""
+    logging_service = Mock(spec=LoggingService)
+    breaker = CircuitBreaker(
+        "scripted", logging_service, failure_threshold=failure_threshold
+    )
+    return ResilientLlmProvider(upstream, breaker, logging_service)
+
+
+def test_slow_call_is_hedged_and_first_response_wins() -> None:
+    """Test that a call slower than the p95 latency gets a duplicate."""
+    # Arrange
+    upstream = ScriptedProvider(delays=[0.0] * 20 + [1.5, 0.0])
+    provider = _provider(upstream)
+    for _ in range(20):
+        provider.complete(LlmRequest(prompt="warm up"))
+
+    # Act
+    started = time.monotonic()
+    response = provider.complete(LlmRequest(prompt="Why uv?"))
+
+    # Assert
+    assert response.text == "answer 21"
+    assert time.monotonic() - started < 1.0
+    provider.close()
+
+
+def test_stream_yields_chunks_of_the_winning_attempt() -> None:
+    """Test that streaming forwards every chunk."""
+    # Arrange
+    provider = _provider(ScriptedProvider(delays=[0.0]))
+
+    # Act
+    chunks = list(provider.stream(LlmRequest(prompt="Why uv?")))
+
+    # Assert
+    assert chunks == ["answer 0 ", "done"]
+
+
+def test_deadline_bounds_the_wait() -> None:
+    """Test that a call still running at its deadline is abandoned."""
+    # Arrange
+    provider = _provider(ScriptedProvider(delays=[0.5]))
+    request = LlmRequest(prompt="Why uv?", deadline=time.monotonic() + 0.05)
+
+    # Act / Assert
+    with pytest.raises(LlmDeadlineExceededError):
+        provider.complete(request)
+
+
+def test_expired_deadline_skips_the_call() -> None:
+    """Test that nothing is sent once the deadline has passed."""
+    # Arrange
+    upstream = ScriptedProvider(delays=[0.0])
+    provider = _provider(upstream)
+
+    # Act / Assert
+    with pytest.raises(LlmDeadlineExceededError):
+        provider.complete(LlmRequest(prompt="Why?", deadline=time.monotonic() - 1))
+    assert upstream.calls == 0
+
+
+def test_server_errors_open_the_circuit() -> None:
+    """Test that repeated upstream failures reject calls without sending."""
+    # Arrange
+    upstream = ScriptedProvider(
+        delays=[0.0], error=LlmProviderError("unavailable", status_code=503)
+    )
+    provider = _provider(upstream, failure_threshold=2)
+    for _ in range(2):
+        with pytest.raises(LlmProviderError):
+            provider.complete(LlmRequest(prompt="Why uv?"))
+
+    # Act / Assert
+    with pytest.raises(CircuitOpenError):
+        provider.complete(LlmRequest(prompt="Why uv?"))
+    assert upstream.calls == 2  # noqa: PLR2004
+
+
+def test_client_errors_do_not_open_the_circuit() -> None:
+    """Test that errors caused by the request leave the circuit closed."""
+    # Arrange
+    upstream = ScriptedProvider(
+        delays=[0.0], error=LlmProviderError("bad request", status_code=400)
+    )
+    provider = _provider(upstream, failure_threshold=1)
+
+    # Act
+    with pytest.raises(LlmProviderError):
+        provider.complete(LlmRequest(prompt="Why uv?"))
+
+    # Assert
+    assert provider.circuit_breaker.state == "closed"
+
+
+def test_caller_deadlines_do_not_open_the_circuit() -> None:
+    """Test that calls abandoned at a short deadline are not endpoint failures."""
+    # Arrange
+    upstream = ScriptedProvider(delays=[0.2, 0.0])
+    provider = _provider(upstream, failure_threshold=1)
+
+    # Act
+    with pytest.raises(LlmDeadlineExceededError):
+        provider.complete(
+            LlmRequest(prompt="Why uv?", deadline=time.monotonic() + 0.01)
+        )
+
+    # Assert
+    assert provider.circuit_breaker.state == "closed"
+    assert provider.complete(LlmRequest(prompt="Why uv?")).text == "answer 1"
+
+
+def test_abandoned_attempts_run_on_daemon_threads() -> None:
+    """Test that an attempt outliving its deadline cannot block exit."""
+    # Arrange
+    provider = _provider(ScriptedProvider(delays=[0.5]))
+    request = LlmRequest(prompt="Why uv?", deadline=time.monotonic() + 0.01)
+
+    # Act
+    with pytest.raises(LlmDeadlineExceededError):
+        provider.complete(request)
+
+    # Assert
+    attempts = [
+        thread
+        for thread in threading.enumerate()
+        if thread.name.startswith("llm-attempt")
+    ]
+    assert attempts
+    assert all(thread.daemon for thread in attempts)
+    provider.close()
@@ -0,0 +1,47 @@
+"""Unit tests for resource monitor."""
+
+import gc
+from pathlib import Path
+
+from adraitools.infrastructure.resource_monitor import ResourceMonitor, read_proc_io
+
+
+def test_read_proc_io_parses_the_io_counters(tmp_path: Path) -> None:
+    """Test that the byte counters are read and the others ignored."""
+    # Arrange
+    io_file = tmp_path / "io"
+    io_file.write_text(
+        "rchar: 3980\nwchar: 120\nsyscr: 9\nsyscw: 2\n"
+        "read_bytes: 4096\nwrite_bytes: 8192\ncancelled_write_bytes: 0\n",
+        encoding="ascii",
+    )
+
+    # Act
+    counters = read_proc_io(io_file)
+
+    # Assert
+    assert counters == {
+        "rchar": 3980,
+        "wchar": 120,
+        "read_bytes": 4096,
+        "write_bytes": 8192,
+    }
+
+
+def test_monitor_counts_garbage_collections_until_stopped() -> None:
+    """Test that collections are counted by generation and timed."""
+    # Arrange
+    monitor = ResourceMonitor()
+
+    # Act
+    monitor.start()
+    gc.collect()
+    usage = monitor.stop()
+    gc.collect()
+
+    # Assert
+    assert usage.gc_collections[2] == 1
+    assert usage.gc_pause_ms > 0
+    assert usage.wall_ms > 0
+    assert usage.cpu_ms >= 0
+    assert monitor.stop().gc_collections[2] == 1
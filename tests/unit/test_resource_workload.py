@@ -0,0 +1,36 @@
+"""Unit tests for resource workload."""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.infrastructure.resource_monitor import ResourceMonitor
+from adraitools.services.adr_chunker import AdrChunker
+from adraitools.services.adr_corpus_loader import AdrCorpusLoader
+from adraitools.services.adr_parser import AdrParser
+from adraitools.services.models.resources import ResourceUsage
+from adraitools.services.resource_workload import ResourceWorkload
+
+
+def test_run_processes_a_synthetic_corpus_under_the_monitor(tmp_path: Path) -> None:
+    """Test that the corpus is written and parsed between start and stop."""
+    # Arrange
+    usage = ResourceUsage(wall_ms=10.0, cpu_user_ms=8.0, cpu_system_ms=1.0)
+    monitor = Mock(spec=ResourceMonitor)
+    monitor.stop.return_value = usage
+    corpus_loader = AdrCorpusLoader(FileSystemService(), AdrParser())
+    workload = ResourceWorkload(corpus_loader, AdrChunker(), monitor)
+
+    # Act
+    result = workload.run(tmp_path, documents=3)
+
+    # Assert
+    assert result == usage
+    monitor.start.assert_called_once_with()
+    documents = corpus_loader.load(tmp_path)
+    assert [document.path.name for document in documents] == [
+        "0001-decision-1.md",
+        "0002-decision-2.md",
+        "0003-decision-3.md",
+    ]
+    assert all(document.sections for document in documents)
@@ -0,0 +1,131 @@
+"""Unit tests for span recorder."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from adraitools.infrastructure import span_recorder
+from adraitools.infrastructure.span_recorder import SpanRecorder, timed
+
+
+def test_report_aggregates_nested_spans_as_a_tree() -> None:
+    """Test that repeated spans are counted under their parent path."""
+    # Arrange
+    recorder = SpanRecorder()
+    recorder.enabled = True
+
+    # Act
+    with recorder.span("index.build"):
+        for _ in range(3):
+            with recorder.span("index.cache"):
+                pass
+        with recorder.span("index.save"):
+            pass
+    with recorder.span("index.cache"):
+        pass
+
+    # Assert
+    report = recorder.report()
+    assert [(timing.name, timing.depth, timing.count) for timing in report] == [
+        ("index.build", 0, 1),
+        ("index.cache", 1, 3),
+        ("index.save", 1, 1),
+        ("index.cache", 0, 1),
+    ]
+    assert report[0].total_ms >= report[1].total_ms + report[2].total_ms
+
+
+def test_disabled_recorder_records_nothing() -> None:
+    """Test that spans are no-ops until the recorder is enabled."""
+    # Arrange
+    recorder = SpanRecorder()
+
+    # Act
+    with recorder.span("config.resolve"):
+        pass
+
+    # Assert
+    assert recorder.report() == []
+
+
+def test_span_records_duration_when_the_block_raises() -> None:
+    """Test that a failing block is still timed and leaves no open span."""
+    # Arrange
+    recorder = SpanRecorder()
+    recorder.enabled = True
+
+    # Act
+    with pytest.raises(ValueError, match="boom"), recorder.span("toml.load"):
+        raise ValueError("boom")  # noqa: EM101
+
+    # Assert
+    assert recorder.report()[0].count == 1
+    assert recorder.current_path() == ()
+
+
+def test_span_open_across_a_reset_is_recorded() -> None:
+    """Test that a span exiting after a reset records instead of failing."""
+    # Arrange
+    recorder = SpanRecorder()
+    recorder.enabled = True
+
+    # Act
+    with recorder.span("index.build"):
+        recorder.reset()
+
+    # Assert
+    assert [(timing.name, timing.count) for timing in recorder.report()] == [
+        ("index.build", 1)
+    ]
+
+
+def test_timed_decorator_uses_the_process_wide_recorder(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that decorated functions are timed only while enabled."""
+    # Arrange
+    recorder = SpanRecorder()
+    monkeypatch.setattr(span_recorder, "RECORDER", recorder)
+
+    @timed("doctor.diagnose")
+    def diagnose() -> str:
+        return "ok"
+
+    # Act
+    diagnose()
+    recorder.enabled = True
+    result = diagnose()
+
+    # Assert
+    assert result == "ok"
+    assert [(timing.name, timing.count) for timing in recorder.report()] == [
+        ("doctor.diagnose", 1)
+    ]
+
+
+def test_exporter_receives_finished_spans_with_parents_and_attributes() -> None:
+    """Test that exported spans carry their parent ID, attributes and error."""
+    # Arrange
+    recorder = SpanRecorder()
+    exporter = Mock()
+    recorder.exporter = exporter
+    recorder.enabled = True
+
+    # Act
+    with recorder.span("command index") as root:
+        with recorder.span("corpus.load") as current:
+            current.set_attribute("adr.files", 3)
+        with pytest.raises(OSError, match="disk"), recorder.span("index.save"):
+            raise OSError("disk")  # noqa: EM101
+
+    # Assert
+    load, save, command = [call.args[0] for call in exporter.export.call_args_list]
+    assert (load.name, load.parent_id, load.attributes) == (
+        "corpus.load",
+        root.span_id,
+        {"adr.files": 3},
+    )
+    assert save.error == "OSError('disk')"
+    assert command.parent_id is None
+    assert command.start_unix_ns <= load.start_unix_ns <= load.end_unix_ns
+    assert load.end_unix_ns <= command.end_unix_ns
@@ -0,0 +1,113 @@
+"""Unit tests for supersession graph."""
+
+from adraitools.services.models.graph import AdrLinks, GraphFileEntry
+from adraitools.services.supersession_graph import SupersessionGraph
+
+
+def _entry(
+    identifier: str,
+    supersedes: list[str] | None = None,
+    superseded_by: list[str] | None = None,
+) -> GraphFileEntry:
+    """Create a graph entry for an ADR."""
+    return GraphFileEntry(
+        fingerprint="1-1",
+        links=AdrLinks(
+            identifier=identifier,
+            title=f"Title of {identifier}",
+            status="Accepted",
+            supersedes=supersedes or [],
+            superseded_by=superseded_by or [],
+        ),
+    )
+
+
+def _chain() -> SupersessionGraph:
+    """Create a graph where ADR-0003 supersedes ADR-0002 supersedes ADR-0001."""
+    graph = SupersessionGraph()
+    graph.put("0001.md", _entry("ADR-0001", superseded_by=["ADR-0002"]))
+    graph.put("0002.md", _entry("ADR-0002"))
+    graph.put("0003.md", _entry("ADR-0003", supersedes=["ADR-0002"]))
+    return graph
+
+
+def test_closures_follow_links_declared_on_either_side() -> None:
+    """Test transitive closures over edges declared by old and new ADRs."""
+    # Arrange
+    graph = _chain()
+
+    # Act
+    supersedes = graph.supersedes("ADR-0003")
+    superseded_by = graph.superseded_by("ADR-0001")
+
+    # Assert
+    assert supersedes == {"ADR-0001", "ADR-0002"}
+    assert superseded_by == {"ADR-0002", "ADR-0003"}
+    assert graph.current("ADR-0001") == ["ADR-0003"]
+    assert graph.current("ADR-0003") == []
+
+
+def test_put_invalidates_only_affected_closures() -> None:
+    """Test that a new edge drops the memos it changes and keeps the others."""
+    # Arrange
+    graph = _chain()
+    graph.put("0010.md", _entry("ADR-0010"))
+    graph.supersedes("ADR-0003")
+    graph.supersedes("ADR-0010")
+    graph.superseded_by("ADR-0001")
+
+    # Act
+    graph.put("0004.md", _entry("ADR-0004", supersedes=["ADR-0003"]))
+
+    # Assert
+    assert "ADR-0010" in graph._descendants  # noqa: SLF001
+    assert "ADR-0001" not in graph._ancestors  # noqa: SLF001
+    assert graph.current("ADR-0001") == ["ADR-0004"]
+
+
+def test_remove_drops_edges_no_longer_declared() -> None:
+    """Test that an edge disappears once no file declares it."""
+    # Arrange
+    graph = _chain()
+    graph.put("0002.md", _entry("ADR-0002", supersedes=["ADR-0001"]))
+    graph.superseded_by("ADR-0001")
+
+    # Act
+    graph.remove("0001.md")
+    still_linked = graph.superseded_by("ADR-0001")
+    graph.remove("0002.md")
+
+    # Assert
+    assert still_linked == {"ADR-0002", "ADR-0003"}
+    assert graph.superseded_by("ADR-0001") == set()
+
+
+def test_cycles_reports_strongly_connected_groups() -> None:
+    """Test cycle detection ignoring acyclic chains."""
+    # Arrange
+    graph = _chain()
+    graph.put("0005.md", _entry("ADR-0005", supersedes=["ADR-0006"]))
+    graph.put("0006.md", _entry("ADR-0006", supersedes=["ADR-0007"]))
+    graph.put("0007.md", _entry("ADR-0007", supersedes=["ADR-0005"]))
+
+    # Act
+    cycles = graph.cycles()
+
+    # Assert
+    assert cycles == [["ADR-0005", "ADR-0006", "ADR-0007"]]
+    assert graph.current("ADR-0005") == []
+
+
+def test_state_round_trip_keeps_memoized_closures() -> None:
+    """Test that a restored graph is unmodified and reuses its memos."""
+    # Arrange
+    graph = _chain()
+    graph.supersedes("ADR-0003")
+
+    # Act
+    restored = SupersessionGraph.from_state(graph.to_state())
+
+    # Assert
+    assert not restored.modified
+    assert restored.supersedes("ADR-0003") == {"ADR-0001", "ADR-0002"}
+    assert not restored.modified
@@ -0,0 +1,131 @@
+"""Unit tests for supersession graph service."""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from adraitools.infrastructure.configuration_service import ConfigurationService
+from adraitools.infrastructure.content_cache import ContentCache
+from adraitools.infrastructure.file_system_service import FileSystemService
+from adraitools.services.adr_corpus_loader import AdrCorpusLoader
+from adraitools.services.adr_parser import AdrParser
+from adraitools.services.models.adr import AdrDocument
+from adraitools.services.models.configuration import AdrConfiguration
+from adraitools.services.supersession_graph_service import SupersessionGraphService
+from tests.conftest import AdrFileFactory
+
+
+@pytest.fixture
+def adr_dir(tmp_path: Path, adr_file_factory: AdrFileFactory) -> Path:
+    """Create a corpus where ADR-0003 replaces ADR-0002 replacing ADR-0001."""
+    adr_dir = tmp_path / "adr"
+    adr_file_factory(
+        adr_dir / "0001-first.md",
+        "First",
+        status="Superseded by ADR-0002",
+    )
+    adr_file_factory(
+        adr_dir / "0002-second.md",
+        "Second",
+        status="Superseded",
+        sections={"References": "- Replaced by [ADR-3](0003-third.md)"},
+    )
+    adr_file_factory(adr_dir / "0003-third.md", "Third")
+    return adr_dir
+
+
+def _service(adr_dir: Path, cache_file: Path) -> SupersessionGraphService:
+    """Create a graph service over a corpus directory."""
+    configuration_service = Mock(spec=ConfigurationService)
+    configuration_service.get_configuration.return_value = AdrConfiguration(
+        adr_directory=adr_dir, template_file=adr_dir / "0000-adr-template.md"
+    )
+    return SupersessionGraphService(
+        configuration_service,
+        AdrCorpusLoader(FileSystemService(), AdrParser()),
+        ContentCache(cache_file),
+    )
+
+
+def test_extract_links_reads_status_and_references() -> None:
+    """Test links from a Superseded status and a Supersedes reference."""
+    # Arrange
+    document = AdrDocument(
+        path=Path("0012-new.md"),
+        number=12,
+        title="New",
+        status="Superseded by ADR-0020",
+        date="2025-01-01",
+        sections={
+            "Status": "Superseded by ADR-0020\n<!-- See ADR-0099 -->",
+            "References": "- Supersedes [ADR-3](./0003-old.md) and ADR-0012",
+        },
+        content_hash="abc",
+    )
+
+    # Act
+    links = SupersessionGraphService.extract_links(document)
+
+    # Assert
+    assert links.identifier == "ADR-0012"
+    assert links.superseded_by == ["ADR-0020"]
+    assert links.supersedes == ["ADR-0003"]
+
+
+def test_load_builds_graph_from_corpus(adr_dir: Path, tmp_path: Path) -> None:
+    """Test the graph built from a corpus directory."""
+    # Arrange
+    service = _service(adr_dir, tmp_path / "cache.sqlite3")
+
+    # Act
+    graph = service.load()
+
+    # Assert
+    assert graph.current("ADR-0001") == ["ADR-0003"]
+    assert graph.supersedes("ADR-0003") == {"ADR-0001", "ADR-0002"}
+
+
+def test_load_rereads_only_changed_files(
+    adr_dir: Path,
+    tmp_path: Path,
+    adr_file_factory: AdrFileFactory,
+    mocker: MockerFixture,
+) -> None:
+    """Test that saved graphs are reused and only changed files re-read."""
+    # Arrange
+    cache_file = tmp_path / "cache.sqlite3"
+    first = _service(adr_dir, cache_file)
+    first.save(first.load())
+    adr_file_factory(
+        adr_dir / "0003-third.md",
+        "Third",
+        status="Superseded by ADR-0004",
+    )
+    (adr_dir / "0001-first.md").unlink()
+    service = _service(adr_dir, cache_file)
+    spy = mocker.spy(service.corpus_loader, "load_document")
+
+    # Act
+    graph = service.load()
+
+    # Assert
+    assert [call.args[0].name for call in spy.call_args_list] == ["0003-third.md"]
+    assert "ADR-0001" not in graph.nodes
+    assert graph.current("ADR-0002") == ["ADR-0004"]
+
+
+def test_save_skips_unmodified_graph(adr_dir: Path, tmp_path: Path) -> None:
+    """Test that an unchanged graph is not written again."""
+    # Arrange
+    service = _service(adr_dir, tmp_path / "cache.sqlite3")
+    service.save(service.load())
+    graph = service.load()
+    service.content_cache = Mock(spec=ContentCache)
+
+    # Act
+    service.save(graph)
+
+    # Assert
+    service.content_cache.put.assert_not_called()
@@ -0,0 +1,59 @@
+"""Unit tests for vector index store."""
+
+from pathlib import Path
+
+import numpy as np
+
+from adraitools.infrastructure.vector_index_store import VectorIndex, VectorIndexStore
+from adraitools.services.models.index import VectorIndexEntry
+
+
+def _entry(name: str) -> VectorIndexEntry:
+    """Create an index entry for a chunk of an ADR file."""
+    return VectorIndexEntry(
+        document_path=Path(name), section="Decision", content_hash=name
+    )
+
+
+def test_saved_index_is_loaded_memory_mapped(tmp_path: Path) -> None:
+    """Test that entries and vectors round-trip with the matrix mapped."""
+    # Arrange
+    store = VectorIndexStore(tmp_path / "index")
+    entries = [_entry("0001.md"), _entry("0002.md")]
+    matrix = np.eye(2, dtype=np.float32)
+
+    # Act
+    store.save(entries, matrix)
+    index = store.load()
+
+    # Assert
+    assert store.exists()
+    assert index.entries == entries
+    assert isinstance(index.matrix, np.memmap)
+    np.testing.assert_array_equal(index.matrix, matrix)
+
+
+def test_search_orders_hits_by_similarity() -> None:
+    """Test that the closest rows are returned best first."""
+    # Arrange
+    entries = [_entry("0001.md"), _entry("0002.md"), _entry("0003.md")]
+    matrix = np.array([[1, 0], [0.6, 0.8], [0, 1]], dtype=np.float32)
+    index = VectorIndex(entries, matrix)
+
+    # Act
+    hits = index.search(np.array([0, 1], dtype=np.float32), top_k=2)
+
+    # Assert
+    assert [hit.entry.document_path.name for hit in hits] == ["0003.md", "0002.md"]
+
+
+def test_search_on_empty_index_returns_nothing() -> None:
+    """Test that an empty index yields no hits."""
+    # Arrange
+    index = VectorIndex([], np.zeros((0, 2), dtype=np.float32))
+
+    # Act
+    hits = index.search(np.array([1, 0], dtype=np.float32), top_k=3)
+
+    # Assert
+    assert hits == []